@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ROLE: engine-vendored — DO NOT edit here. `scitex-writer update-project`
+# overwrites this file on every re-vendor; fix it upstream in the
+# scitex-writer package instead (local edits are lost, and update-project
+# may set it read-only in the consumer workspace after vendoring).
+# File: scripts/python/_lint_model.py
+# Purpose: Shared, load-once project model for the pre-compile checks.
+#
+#          Every check_*.py used to re-glob and re-read the same .tex / .bib
+#          sources and run its own regex pass over them (check_references
+#          alone read each file four times: refs, labels, cites, headings).
+#          This module is the one place they are read and tokenized:
+#
+#            read_text(path)  -> decoded text, read once per content version
+#            scan_tex(path)   -> TexScan: labels / refs / cites / headings /
+#                                vclaims with line numbers, one pass per file
+#            ProjectModel     -> per-document labels, refs, cites, floats,
+#                                captions, plus the bib entry keys
+#
+#          Both caches are process-wide and keyed by (mtime_ns, size), so a
+#          file edited (or repaired by check_paper_symlink) between two
+#          lookups is re-read. Standalone check runs get the same answers as
+#          before; lint_engine.py runs every check in one process, where the
+#          caches are shared by all of them.
+#
+#          When scitex-writer is importable, ProjectModel.load() also seeds
+#          the scan cache from the persistent project index
+#          (.scitex/writer/runtime/project_index.sqlite), so across compiles
+#          only the sources that changed are tokenized again.
+#
+# Self-contained: stdlib only (the persistent index is used when the
+# scitex-writer package is installed). Imported by the sibling check_*.py
+# standalones.
+
+import os
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+DOC_DIRS = {
+    "manuscript": "01_manuscript",
+    "supplementary": "02_supplementary",
+    "revision": "03_revision",
+}
+
+# Patterns shared by every check that reads LaTeX sources. They are matched
+# per line on the text before the first "%" (the checks' comment rule).
+REF_RE = re.compile(r"\\ref\{([^}]+)\}")
+LABEL_RE = re.compile(r"\\label\{([^}]+)\}")
+CITE_RE = re.compile(r"\\(?:cite|citep|citet|citealt|citeauthor|citeyear)\{([^}]+)\}")
+HEADING_RE = re.compile(r"\\(?:sub)?section\*?\{([^}]+)\}")
+VCLAIM_RE = re.compile(r"\\vclaim(?:\[[^\]]*\])?\{([^}]+)\}")
+BIB_KEY_RE = re.compile(r"@\w+\{([^,\s]+)")
+
+# Generated / archived sources that are never linted.
+_SKIP_SOURCE_RE = re.compile(r"_v\d+\.tex$|_diff\.tex$")
+_PANEL_RE = re.compile(r"^\d+[a-zA-Z]_")
+
+# Project-index token kinds -> TexScan attributes.
+_INDEX_KINDS = {
+    "label": "labels",
+    "ref": "refs",
+    "cite": "cites",
+    "heading": "headings",
+    "vclaim": "vclaims",
+}
+
+_lock = threading.Lock()
+_texts = {}
+_scans = {}
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def read_text(path):
+    """Text of ``path`` (UTF-8, undecodable bytes replaced), cached.
+
+    Raises OSError like ``Path.read_text`` when the file cannot be read.
+    """
+    key = os.fspath(path)
+    stamp = _stamp(key)
+    with _lock:
+        hit = _texts.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    text = Path(key).read_text(encoding="utf-8", errors="replace")
+    with _lock:
+        _texts[key] = (stamp, text)
+    return text
+
+
+class TexScan:
+    """Tokens of one .tex source: ``[(key, line_no), ...]`` per kind."""
+
+    __slots__ = ("labels", "refs", "cites", "headings", "vclaims")
+
+    def __init__(self):
+        self.labels = []
+        self.refs = []
+        self.cites = []
+        self.headings = []
+        self.vclaims = []
+
+
+def _tokenize(text):
+    scan = TexScan()
+    for line_no, line in enumerate(text.splitlines(), 1):
+        stripped = line.split("%")[0] if "%" in line else line
+        if "\\" not in stripped:
+            continue
+        for m in LABEL_RE.finditer(stripped):
+            scan.labels.append((m.group(1), line_no))
+        for m in REF_RE.finditer(stripped):
+            scan.refs.append((m.group(1), line_no))
+        for m in CITE_RE.finditer(stripped):
+            for key in m.group(1).split(","):
+                key = key.strip()
+                if key:
+                    scan.cites.append((key, line_no))
+        for m in HEADING_RE.finditer(stripped):
+            title = m.group(1).strip()
+            if title:
+                scan.headings.append((title, line_no))
+        for m in VCLAIM_RE.finditer(stripped):
+            scan.vclaims.append((m.group(1).strip(), line_no))
+    return scan
+
+
+def scan_tex(path):
+    """:class:`TexScan` of ``path``, tokenized once per content version."""
+    key = os.fspath(path)
+    stamp = _stamp(key)
+    with _lock:
+        hit = _scans.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    scan = _tokenize(read_text(key))
+    with _lock:
+        _scans[key] = (stamp, scan)
+    return scan
+
+
+def clear_cache():
+    """Forget every cached text and scan."""
+    with _lock:
+        _texts.clear()
+        _scans.clear()
+
+
+def collect_tex_files(doc_dir):
+    """SOURCE .tex files of a document (not generated/compiled files).
+
+    Scans: contents/*.tex, caption_and_media/*.tex, base.tex
+    Skips: manuscript.tex, manuscript_diff.tex, *_v<N>.tex (auto-generated)
+    """
+    files = []
+    content_dir = doc_dir / "contents"
+    if content_dir.exists():
+        for f in content_dir.glob("*.tex"):
+            if not _SKIP_SOURCE_RE.search(f.name):
+                files.append(f)
+        for subdir in ["figures/caption_and_media", "tables/caption_and_media"]:
+            d = content_dir / subdir
+            if d.exists():
+                files.extend(d.glob("*.tex"))
+    base = doc_dir / "base.tex"
+    if base.exists():
+        files.append(base)
+    return list(set(files))
+
+
+def index_tokens(tex_files, kind):
+    """``{key: [(file, line_no), ...]}`` for one token kind across files."""
+    found = defaultdict(list)
+    for f in tex_files:
+        for key, line_no in getattr(scan_tex(f), kind):
+            found[key].append((f, line_no))
+    return dict(found)
+
+
+def float_labels(doc_dir):
+    """Labels the compile derives from caption_and_media filenames.
+
+    ``fig:STEM`` / ``tab:STEM`` for each ``[0-9]*.tex`` caption (panels such
+    as ``01a_name`` excluded). Returns ``{label: [(file, 0), ...]}``.
+    """
+    labels = defaultdict(list)
+    content_dir = doc_dir / "contents"
+    if not content_dir.exists():
+        return dict(labels)
+    for float_type, subdir in [("fig", "figures"), ("tab", "tables")]:
+        media_dir = content_dir / subdir / "caption_and_media"
+        if not media_dir.exists():
+            continue
+        for f in media_dir.glob("[0-9]*.tex"):
+            if _PANEL_RE.match(f.stem):
+                continue
+            labels[f"{float_type}:{f.stem}"].append((f, 0))
+    return dict(labels)
+
+
+def bib_keys(bib_dir):
+    """``{entry_key: bib_file}`` across ``bib_dir/*.bib``."""
+    keys = {}
+    if not bib_dir.exists():
+        return keys
+    for f in bib_dir.glob("*.bib"):
+        for m in BIB_KEY_RE.finditer(read_text(f)):
+            keys[m.group(1).strip()] = f
+    return keys
+
+
+class ProjectModel:
+    """Labels, refs, cites, floats, captions and bib entries of a project.
+
+    Built from :func:`scan_tex` / :func:`read_text`, so everything a check
+    asks for afterwards is served from the same cache. ``load()`` reads and
+    tokenizes every source up front and returns counts for reporting.
+    """
+
+    def __init__(self, project_dir):
+        self.project_dir = Path(project_dir).resolve()
+
+    def doc_dirs(self):
+        """``{doc_type: dir}`` for the documents present in the project."""
+        found = {}
+        for doc_type, name in DOC_DIRS.items():
+            d = self.project_dir / name
+            if d.is_dir():
+                found[doc_type] = d
+        return found
+
+    def tex_files(self, doc_type):
+        return collect_tex_files(self.project_dir / DOC_DIRS[doc_type])
+
+    def labels(self, doc_type):
+        return index_tokens(self.tex_files(doc_type), "labels")
+
+    def refs(self, doc_type):
+        return index_tokens(self.tex_files(doc_type), "refs")
+
+    def cites(self, doc_type):
+        return index_tokens(self.tex_files(doc_type), "cites")
+
+    def floats(self, doc_type):
+        return float_labels(self.project_dir / DOC_DIRS[doc_type])
+
+    def captions(self, doc_type):
+        """Caption sources (whole-file caption bodies) of a document."""
+        contents = self.project_dir / DOC_DIRS[doc_type] / "contents"
+        return sorted(
+            f
+            for sub in ("figures", "tables")
+            for f in (contents / sub / "caption_and_media").glob("*.tex")
+        )
+
+    def bib_dir(self):
+        return self.project_dir / "00_shared" / "bib_files"
+
+    def bib_entries(self):
+        return bib_keys(self.bib_dir())
+
+    def _seed_from_index(self):
+        """Fill the scan cache from the persistent project index.
+
+        Returns the number of sources served from the index (0 when the
+        scitex-writer package is not importable or the index is unusable;
+        the sources are then tokenized here as usual).
+        """
+        try:
+            from scitex_writer._utils._project_index import ProjectIndex
+        except Exception:
+            return 0
+        paths = {
+            f.relative_to(self.project_dir).as_posix(): f
+            for doc_type in self.doc_dirs()
+            for f in self.tex_files(doc_type)
+        }
+        try:
+            index = ProjectIndex(self.project_dir)
+            index.refresh()
+            stored = index.file_tokens(paths)
+        except Exception:
+            return 0
+        for rel, entry in stored.items():
+            scan = TexScan()
+            for kind, key, line_no in entry["tokens"]:
+                attr = _INDEX_KINDS.get(kind)
+                if attr:
+                    getattr(scan, attr).append((key, line_no))
+            stamp = (entry["mtime_ns"], entry["size"])
+            with _lock:
+                _scans[os.fspath(paths[rel])] = (stamp, scan)
+        return len(stored)
+
+    def load(self):
+        """Read and tokenize every source once; return what was found."""
+        counts = defaultdict(int)
+        counts["from_index"] = self._seed_from_index()
+        for doc_type in self.doc_dirs():
+            for f in self.tex_files(doc_type):
+                scan = scan_tex(f)
+                counts["tex_files"] += 1
+                counts["labels"] += len(scan.labels)
+                counts["refs"] += len(scan.refs)
+                counts["cites"] += len(scan.cites)
+            counts["floats"] += len(self.floats(doc_type))
+            counts["captions"] += len(self.captions(doc_type))
+        counts["bib_entries"] = len(self.bib_entries())
+        return dict(counts)
+
+
+# EOF
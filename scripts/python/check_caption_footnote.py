@@ -54,6 +54,7 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _lint_model import read_text  # noqa: E402
 from _severity import resolve_level  # noqa: E402
 
 # ANSI colors (match check_media_provenance.py / check_paper_symlink.py)
@@ -209,7 +210,7 @@ def _iter_source_tex(project_dir, doc_types):
 def _offenses_in(path, is_caption_media):
     """Return [(line, snippet), ...] for footnote-in-caption hits in ``path``."""
     try:
-        raw = path.read_text(encoding="utf-8", errors="replace")
+        raw = read_text(path)
     except OSError:
         return []
     text = _strip_comments(raw)
@@ -225,7 +226,7 @@ def _offenses_in(path, is_caption_media):
     return hits
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Lint: ERROR when \\footnote/\\footnotetext appears inside a "
         "\\caption{} (a fatal LaTeX pattern). \\footnotemark is allowed."
@@ -243,7 +244,7 @@ def main():
         default=None,
         help="Severity: off, warn, or error (default). Overrides env and config.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     level = resolve_level(
@@ -70,6 +70,7 @@ from _citation_trust_cache import (  # noqa: E402
     load_cache,
     save_cache,
 )
+from _lint_model import read_text  # noqa: E402
 from _severity import env_truthy, resolve_level  # noqa: E402
 from check_citations import (  # noqa: E402
     _load_text,
@@ -262,9 +263,7 @@ def _read_entries(reporter, bib_paths):
     entries = {}
     for bib_path in bib_paths:
         reporter.log_detail(f"reading bib: {bib_path}")
-        for key, fields in iter_bib_entries(
-            bib_path.read_text(encoding="utf-8", errors="replace")
-        ):
+        for key, fields in iter_bib_entries(read_text(bib_path)):
             entries.setdefault(key, fields)
     return entries
 
@@ -61,6 +61,7 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _lint_model import read_text  # noqa: E402
 from _severity import resolve_level  # noqa: E402
 from _citation_banner import reset_banner, write_banner_tex  # noqa: E402
 
@@ -229,7 +230,7 @@ def _load_text(paths):
     chunks = []
     for p in paths:
         try:
-            chunks.append(Path(p).read_text(encoding="utf-8", errors="replace"))
+            chunks.append(read_text(p))
         except OSError:
             continue
     return "\n".join(chunks)
@@ -362,7 +363,7 @@ def audit_citations(cited_keys, entries):
     return stubs, missing, no_doi
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Pre-compile citation gate: FAIL when a cited reference is a "
         "scholar stub (unresolved/placeholder). Defaults ON (error) for research "
@@ -390,7 +391,7 @@ def main():
         default=None,
         help="Severity: off, warn, error, or banner. Overrides env and config.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     research = _is_research_project(project_dir)
@@ -442,9 +443,7 @@ def main():
     # (matches bibtex, which uses the first entry it sees for a key).
     entries = {}
     for bp in bib_paths:
-        for key, fields in iter_bib_entries(
-            bp.read_text(encoding="utf-8", errors="replace")
-        ):
+        for key, fields in iter_bib_entries(read_text(bp)):
             entries.setdefault(key, fields)
     stubs, missing, no_doi = audit_citations(cited_keys, entries)
 
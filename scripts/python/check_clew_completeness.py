@@ -38,13 +38,13 @@
 
 import argparse
 import json
-import re
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _lint_model import collect_tex_files, scan_tex  # noqa: E402
 from _severity import resolve_level  # noqa: E402
 
 # Reuse the sibling gate's helpers so research-default, clew discovery, and the
@@ -66,9 +66,6 @@ PASS_COUNT = 0
 WARN_COUNT = 0
 FAIL_COUNT = 0
 
-_VCLAIM = re.compile(r"\\vclaim(?:\[[^\]]*\])?\{([^}]+)\}")
-
-
 def log_pass(msg):
     global PASS_COUNT
     print(f"  {GREEN}[PASS]{NC} {msg}")
@@ -91,24 +88,6 @@ def log_detail(msg):
     print(f"    {DIM}{msg}{NC}")
 
 
-def _collect_tex_files(doc_dir):
-    skip = re.compile(r"_v\d+\.tex$|_diff\.tex$")
-    files = []
-    content_dir = doc_dir / "contents"
-    if content_dir.exists():
-        for f in content_dir.glob("*.tex"):
-            if not skip.search(f.name):
-                files.append(f)
-        for subdir in ["figures/caption_and_media", "tables/caption_and_media"]:
-            d = content_dir / subdir
-            if d.exists():
-                files.extend(d.glob("*.tex"))
-    base = doc_dir / "base.tex"
-    if base.exists():
-        files.append(base)
-    return list(set(files))
-
-
 def manuscript_claim_set(project_dir):
     """Every claim the manuscript RENDERS: raw \\vclaim{...} args + claims.json
     keys. Raw, no sanitize — this is the join key clew reconciles on."""
@@ -117,14 +96,10 @@ def manuscript_claim_set(project_dir):
         d = project_dir / doc
         if not d.exists():
             continue
-        for f in _collect_tex_files(d):
-            text = f.read_text(encoding="utf-8", errors="replace")
-            for line in text.splitlines():
-                stripped = line.split("%")[0] if "%" in line else line
-                for m in _VCLAIM.finditer(stripped):
-                    k = m.group(1).strip()
-                    if k and not k.startswith("#"):
-                        ids.add(k)
+        for f in collect_tex_files(d):
+            for k, _line in scan_tex(f).vclaims:
+                if k and not k.startswith("#"):
+                    ids.add(k)
     claims_json = project_dir / "00_shared" / "claims.json"
     if claims_json.exists():
         try:
@@ -201,7 +176,7 @@ def _run_gate_completeness(clew_bin, project_dir, claim_ids):
     return proc.returncode, parsed, raw.strip()
 
 
-def main():
+def main(argv=None):
     global FAIL_COUNT
 
     parser = argparse.ArgumentParser(
@@ -221,7 +196,7 @@ def main():
         action="store_true",
         help="Reclassify a missing clew CLI as a real failure (ADR-0021).",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     research = _is_research_project(project_dir)
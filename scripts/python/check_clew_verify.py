@@ -237,7 +237,7 @@ def _run_clew_verify(clew_bin, project_dir, strict):
     return proc.returncode, output.strip()
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Pre-compile clew provenance gate: re-verify every "
         "registered claim against its bound source before compiling. "
@@ -261,7 +261,7 @@ def main():
         help="Reclassify NO_CLAIMS and a missing clew CLI as real failures "
         "(so they gate at the resolved level). Enforces ADR-0021.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     research = _is_research_project(project_dir)
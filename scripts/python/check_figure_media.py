@@ -202,7 +202,7 @@ def _has_media(media_dir, stem):
     return False
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Pre-compile figure-media gate: FAIL when a figure is "
         "declared (caption .tex) but has no rendered media asset -- catches the "
@@ -222,7 +222,7 @@ def main():
         default=None,
         help="Severity: off, warn, or error. Overrides env and config.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     research = _is_research_project(project_dir)
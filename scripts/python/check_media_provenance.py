@@ -180,7 +180,7 @@ def _resolves_under(path, scripts_dir):
         return False
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Verify manuscript media are symlinks (chained to the code "
         "that produced them). Private convention -- disabled (off) by default."
@@ -204,7 +204,7 @@ def main():
         help="Strict mode: each media symlink must resolve UNDER the project "
         "scripts/ dir, not merely be a symlink.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     proj_block, user_block = _config_blocks(project_dir)
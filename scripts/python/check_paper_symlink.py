@@ -158,7 +158,7 @@ def _backup_and_link(link, project_dir):
     return backup
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Detect/repair drift in the top-level `paper` symlink that "
         "should point at `.scitex/writer`. Private convention -- warns by "
@@ -178,7 +178,7 @@ def main():
         help="On repair, convert even diverged `paper/` -- but always back it "
         "up first (move to a timestamped dir). Never deletes content.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     link = project_dir / "paper"
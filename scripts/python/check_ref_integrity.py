@@ -173,7 +173,7 @@ def _classify(key):
     return "reference"
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Pre-compile reference-integrity gate: validate figure/table "
         "\\ref, \\cite-in-bib, and supple- xrefs; report all, then block."
@@ -192,7 +192,7 @@ def main():
         help="Severity: off, warn, or error. Overrides env and config. "
         "Default: error for research projects, warn otherwise.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     research = _is_research_project(project_dir)
@@ -19,12 +19,16 @@
 #   6. LaTeX log warnings (optional --log)
 
 import argparse
-import re
 import sys
-from collections import defaultdict
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _lint_model import (  # noqa: E402
+    bib_keys,
+    collect_tex_files,
+    float_labels,
+    index_tokens,
+)
 from _severity import resolve_level  # noqa: E402
 
 # ANSI colors
@@ -72,51 +76,14 @@ def log_detail(msg):
     print(f"    {DIM}{msg}{NC}")
 
 
-def collect_tex_files(doc_dir):
-    """Collect SOURCE .tex files only (not generated/compiled files).
-
-    Scans: contents/*.tex, caption_and_media/*.tex, base.tex
-    Skips: manuscript.tex, manuscript_diff.tex, supplementary.tex, etc. (auto-generated)
-    """
-    # Patterns for generated/archived files to skip
-    skip_patterns = re.compile(r"_v\d+\.tex$|_diff\.tex$")
-
-    files = []
-    content_dir = doc_dir / "contents"
-    if content_dir.exists():
-        for f in content_dir.glob("*.tex"):
-            if not skip_patterns.search(f.name):
-                files.append(f)
-        for subdir in ["figures/caption_and_media", "tables/caption_and_media"]:
-            d = content_dir / subdir
-            if d.exists():
-                files.extend(d.glob("*.tex"))
-    # Include base.tex (structural template) but NOT generated files
-    base = doc_dir / "base.tex"
-    if base.exists():
-        files.append(base)
-    return list(set(files))
-
-
 def extract_refs(tex_files):
     """Extract all \\ref{...} from tex files.
 
     Returns dict: ref_key -> [(file, line_no), ...]
     """
-    refs = defaultdict(list)
-    pattern = re.compile(r"\\ref\{([^}]+)\}")
-    for f in tex_files:
-        text = f.read_text(encoding="utf-8", errors="replace")
-        for line_no, line in enumerate(text.splitlines(), 1):
-            # Skip comments
-            stripped = line.split("%")[0] if "%" in line else line
-            for m in pattern.finditer(stripped):
-                key = m.group(1)
-                # Skip LaTeX macro arguments like #1
-                if key.startswith("#"):
-                    continue
-                refs[key].append((f, line_no))
-    return dict(refs)
+    refs = index_tokens(tex_files, "refs")
+    # Skip LaTeX macro arguments like #1
+    return {k: v for k, v in refs.items() if not k.startswith("#")}
 
 
 def extract_labels(tex_files):
@@ -124,15 +91,7 @@ def extract_labels(tex_files):
 
     Returns dict: label_key -> [(file, line_no), ...]
     """
-    labels = defaultdict(list)
-    pattern = re.compile(r"\\label\{([^}]+)\}")
-    for f in tex_files:
-        text = f.read_text(encoding="utf-8", errors="replace")
-        for line_no, line in enumerate(text.splitlines(), 1):
-            stripped = line.split("%")[0] if "%" in line else line
-            for m in pattern.finditer(stripped):
-                labels[m.group(1)].append((f, line_no))
-    return dict(labels)
+    return index_tokens(tex_files, "labels")
 
 
 def infer_auto_labels(doc_dir):
@@ -143,24 +102,7 @@ def infer_auto_labels(doc_dir):
 
     Returns dict: label_key -> [(file, 0), ...]  (line 0 = auto-generated)
     """
-    labels = defaultdict(list)
-    content_dir = doc_dir / "contents"
-    if not content_dir.exists():
-        return dict(labels)
-
-    for float_type, subdir in [("fig", "figures"), ("tab", "tables")]:
-        media_dir = content_dir / subdir / "caption_and_media"
-        if not media_dir.exists():
-            continue
-        for f in media_dir.glob("[0-9]*.tex"):
-            stem = f.stem
-            # Skip panel patterns (e.g., 01a_name)
-            if re.match(r"^\d+[a-zA-Z]_", stem):
-                continue
-            key = f"{float_type}:{stem}"
-            labels[key].append((f, 0))
-
-    return dict(labels)
+    return float_labels(doc_dir)
 
 
 def extract_citations(tex_files):
@@ -170,21 +112,7 @@ def extract_citations(tex_files):
 
     Returns dict: cite_key -> [(file, line_no), ...]
     """
-    cites = defaultdict(list)
-    pattern = re.compile(
-        r"\\(?:cite|citep|citet|citealt|citeauthor|citeyear)\{([^}]+)\}"
-    )
-    for f in tex_files:
-        text = f.read_text(encoding="utf-8", errors="replace")
-        for line_no, line in enumerate(text.splitlines(), 1):
-            stripped = line.split("%")[0] if "%" in line else line
-            for m in pattern.finditer(stripped):
-                keys = m.group(1)
-                for key in keys.split(","):
-                    key = key.strip()
-                    if key:
-                        cites[key].append((f, line_no))
-    return dict(cites)
+    return index_tokens(tex_files, "cites")
 
 
 def extract_headings(tex_files):
@@ -192,17 +120,7 @@ def extract_headings(tex_files):
 
     Returns dict: title -> [(file, line_no), ...]
     """
-    headings = defaultdict(list)
-    pattern = re.compile(r"\\(?:sub)?section\*?\{([^}]+)\}")
-    for f in tex_files:
-        text = f.read_text(encoding="utf-8", errors="replace")
-        for line_no, line in enumerate(text.splitlines(), 1):
-            stripped = line.split("%")[0] if "%" in line else line
-            for m in pattern.finditer(stripped):
-                title = m.group(1).strip()
-                if title:
-                    headings[title].append((f, line_no))
-    return dict(headings)
+    return index_tokens(tex_files, "headings")
 
 
 def check_duplicate_headings(headings, doc_label):
@@ -226,15 +144,7 @@ def extract_bib_keys(bib_dir):
 
     Returns dict: bib_key -> bib_file
     """
-    keys = {}
-    if not bib_dir.exists():
-        return keys
-    pattern = re.compile(r"@\w+\{([^,\s]+)")
-    for f in bib_dir.glob("*.bib"):
-        text = f.read_text(encoding="utf-8", errors="replace")
-        for m in pattern.finditer(text):
-            keys[m.group(1).strip()] = f
-    return keys
+    return bib_keys(bib_dir)
 
 
 def parse_log_warnings(log_file):
@@ -235,7 +235,7 @@ def _compiled_table_files(doc_dir):
     return files
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Safety-net lint: warn when a compiled table column has "
         "inconsistent per-column decimal places (the auto-pad missed it)."
@@ -254,7 +254,7 @@ def main():
         help="Severity: off, warn, or error. Overrides env and config. "
         "Default: warn (a safety net; the auto-pad is the systemic prevention).",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     level = resolve_level(
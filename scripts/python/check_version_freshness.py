@@ -136,7 +136,7 @@ def pypi_latest(timeout=3):
         return None
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Pre-compile version-freshness gate: fail loud when the "
         "vendored engine is stale vs the installed scitex-writer."
@@ -147,7 +147,7 @@ def main():
     parser.add_argument(
         "--check-pypi", action="store_true", help="also warn if behind PyPI latest"
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     project_dir = Path(args.project_dir).resolve()
     level = resolve_level(
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ROLE: engine-vendored — DO NOT edit here. `scitex-writer update-project`
+# overwrites this file on every re-vendor; fix it upstream in the
+# scitex-writer package instead (local edits are lost, and update-project
+# may set it read-only in the consumer workspace after vendoring).
+# File: scripts/python/lint_engine.py
+# Purpose: Run the pre-compile checks in ONE process against one shared
+#          project model.
+#
+#          run_provenance_checks.sh used to start a fresh python3 per check
+#          (eleven of them), and each re-globbed and re-read the same .tex /
+#          .bib sources. This engine loads the project once (_lint_model:
+#          every source read and tokenized a single time, then served from
+#          the shared cache) and runs each check as a plugin: a sibling
+#          check_<name>.py whose ``main(argv)`` takes the usual CLI arguments
+#          and returns its exit code. Each plugin is loaded fresh per run (its
+#          PASS/WARN/FAIL counters start at zero) and keeps resolving its own
+#          severity, so the exit semantics are unchanged:
+#            off -> 0, warn -> 0, error-level violation -> 1.
+#
+#          --jobs N runs the plugins on N threads. check_paper_symlink runs
+#          first and alone (at level=repair it rewrites files the others
+#          read); every plugin's output is buffered and printed in CHECKS
+#          order, so parallel runs read exactly like serial ones. Per-check
+#          timings are printed at the end and, with --timings PATH, written
+#          as JSON.
+#
+# Usage:
+#   python lint_engine.py [project_dir] [--only NAME ...] [--skip NAME ...]
+#       [--jobs N] [--timings PATH]
+#
+# Returns the worst exit code across the checks (0 unless a check errored).
+#
+# Self-contained: stdlib only (the plugins bring their own optional deps).
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(_SCRIPT_DIR))
+from _lint_model import ProjectModel  # noqa: E402
+
+BOLD = "\033[1m"
+DIM = "\033[0;90m"
+RED = "\033[0;31m"
+NC = "\033[0m"
+
+# Plugin order == report order == the historical run_provenance_checks.sh
+# order. A plugin is scripts/python/check_<name>.py exposing main(argv).
+CHECKS = (
+    "paper_symlink",
+    "media_provenance",
+    "figure_media",
+    "ref_integrity",
+    "caption_footnote",
+    "table_decimals",
+    "clew_verify",
+    "clew_completeness",
+    "citations",
+    "citation_trust",
+    "version_freshness",
+)
+
+# Plugins that may modify the project (paper_symlink: level=repair) run
+# before, and never alongside, the rest.
+_RUN_FIRST = ("paper_symlink",)
+
+_JOBS_ENV = "SCITEX_WRITER_LINT_JOBS"
+
+
+class _ThreadRouter(io.TextIOBase):
+    """Stream that sends each registered thread's writes to its own buffer.
+
+    Installed as ``sys.stdout`` / ``sys.stderr`` while plugins run, so
+    concurrent plugins' ``print`` calls do not interleave. Threads that did
+    not register write straight through.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        self._local.buffer = buffer
+
+    def release(self):
+        self._local.buffer = None
+
+    def write(self, text):
+        target = getattr(self._local, "buffer", None) or self._fallback
+        return target.write(text)
+
+    def flush(self):
+        self._fallback.flush()
+
+    def writable(self):
+        return True
+
+
+def plugin_path(name, script_dir=_SCRIPT_DIR):
+    return Path(script_dir) / f"check_{name}.py"
+
+
+def _load_plugin(name, script_dir):
+    """Execute check_<name>.py as a fresh module (counters start at zero)."""
+    path = plugin_path(name, script_dir)
+    spec = importlib.util.spec_from_file_location(f"_lint_check_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_plugin(name, project_dir, script_dir=_SCRIPT_DIR):
+    """Run one plugin; return ``{name, exit_code, elapsed}``.
+
+    An exception inside a plugin is printed and counts as exit code 1 (what
+    the crashed standalone script used to return); it never stops the run.
+    """
+    started = time.perf_counter()
+    try:
+        rc = _load_plugin(name, script_dir).main([str(project_dir)])
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc()
+        rc = 1
+    return {
+        "name": name,
+        "exit_code": int(rc or 0),
+        "elapsed": round(time.perf_counter() - started, 3),
+    }
+
+
+def run_checks(project_dir, checks=None, jobs=1, script_dir=_SCRIPT_DIR):
+    """Load the project model once, then run every plugin against it.
+
+    Args:
+        project_dir: Writer project root
+        checks: Plugin names to run, in any order (default: :data:`CHECKS`);
+            names without a check_<name>.py are skipped, as the shell did
+        jobs: Threads for the plugins (1 = one after another, streamed live)
+        script_dir: Where the check_<name>.py plugins live
+
+    Returns:
+        ``{exit_code, elapsed, model: {load, counts}, checks: [{name,
+        exit_code, elapsed}, ...]}`` with checks in :data:`CHECKS` order
+    """
+    project_dir = Path(project_dir).resolve()
+    wanted = set(CHECKS if checks is None else checks)
+    names = [
+        n for n in CHECKS if n in wanted and plugin_path(n, script_dir).is_file()
+    ]
+    started = time.perf_counter()
+    counts = ProjectModel(project_dir).load()
+    model_elapsed = round(time.perf_counter() - started, 3)
+
+    results = {}
+    if jobs <= 1:
+        for name in names:
+            results[name] = run_plugin(name, project_dir, script_dir)
+    else:
+        saved = sys.stdout, sys.stderr
+        router_out, router_err = _ThreadRouter(saved[0]), _ThreadRouter(saved[1])
+        buffers = {name: io.StringIO() for name in names}
+
+        def captured(name):
+            router_out.capture(buffers[name])
+            router_err.capture(buffers[name])
+            try:
+                return run_plugin(name, project_dir, script_dir)
+            finally:
+                router_out.release()
+                router_err.release()
+
+        sys.stdout, sys.stderr = router_out, router_err
+        try:
+            for name in (n for n in names if n in _RUN_FIRST):
+                results[name] = captured(name)
+            rest = [n for n in names if n not in _RUN_FIRST]
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                for name, result in zip(rest, pool.map(captured, rest)):
+                    results[name] = result
+        finally:
+            sys.stdout, sys.stderr = saved
+        for name in names:
+            sys.stdout.write(buffers[name].getvalue())
+
+    ordered = [results[n] for n in names]
+    return {
+        "exit_code": max((r["exit_code"] for r in ordered), default=0),
+        "elapsed": round(time.perf_counter() - started, 3),
+        "model": {"load": model_elapsed, "counts": counts},
+        "checks": ordered,
+    }
+
+
+def format_timings(report):
+    """Per-check timing table printed after the checks' own reports."""
+    lines = [
+        f"\n{BOLD}=== Lint engine: {len(report['checks'])} checks in "
+        f"{report['elapsed']:.2f}s ==={NC}",
+        f"  {'project model':<20} {report['model']['load']:7.3f}s  "
+        f"{DIM}{report['model']['counts']}{NC}",
+    ]
+    for r in report["checks"]:
+        mark = f"{RED}exit {r['exit_code']}{NC}" if r["exit_code"] else ""
+        lines.append(f"  {r['name']:<20} {r['elapsed']:7.3f}s  {mark}".rstrip())
+    return "\n".join(lines)
+
+
+def _default_jobs():
+    try:
+        return max(1, int(os.environ.get(_JOBS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the pre-compile checks in one process against one "
+        "shared project model; exit with the worst check's exit code."
+    )
+    parser.add_argument("project_dir", nargs="?", default=".")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=CHECKS,
+        default=None,
+        help="Run only these checks.",
+    )
+    parser.add_argument(
+        "--skip", nargs="+", choices=CHECKS, default=(), help="Skip these checks."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=_default_jobs(),
+        help=f"Threads for the checks (default: ${_JOBS_ENV} or 1).",
+    )
+    parser.add_argument(
+        "--timings",
+        type=Path,
+        default=None,
+        help="Also write the per-check timings as JSON to this file.",
+    )
+    args = parser.parse_args(argv)
+
+    checks = [c for c in (args.only or CHECKS) if c not in set(args.skip)]
+    report = run_checks(args.project_dir, checks=checks, jobs=args.jobs)
+    print(format_timings(report))
+    if args.timings is not None:
+        args.timings.parent.mkdir(parents=True, exist_ok=True)
+        args.timings.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return report["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,6 +33,32 @@ entry does not have -- it can never overwrite a real field (the old
 Two stubs merge normally and stay stamped, so the citation gate still catches
 them. What a stub *is* is defined by scholar's stamps -- imported from
 `check_citations.py` so there is ONE definition, not two.
+
+PARSING
+-------
+The .bib files are read and the output written by `_bibtex.py`, a hand-written
+tokenizer that yields the same entries as bibtexparser v1 and the same bytes as
+its writer, without the pyparsing grammar that took seconds on a shared
+bibliography of a few thousand entries. No third-party package is needed.
+
+INCREMENTAL MERGE
+-----------------
+`.bibliography_cache.json` is all-or-nothing: one hash over every input. When
+it misses -- and the stub sidecar changes on almost every scholar run -- the
+merge used to re-parse and re-deduplicate the whole library. Now each input's
+parsed entries and identity keys (cite key, DOI, normalized title, year) are
+kept per file in `.bibliography_entries.json`, validated by size + mtime and
+then SHA-256, so only the files that changed are parsed again. The entries are
+deduplicated by a DedupIndex, the incremental form of deduplicate_entries:
+sources are added in merge order, with the same result as one pass over all of
+them, and the cached keys spare re-deriving each entry's identity. The merged
+output's own record is written alongside it (the writer's output reads back as
+the very entries written), so the consumer-owned bibliography.bib -- an input
+too under --include-output -- is not re-parsed after every merge either.
+
+Only parsing is incremental. The index itself is not persisted: every merge
+that misses the all-or-nothing cache re-deduplicates the cached entries of
+every input and re-serialises the whole output.
 """
 
 import argparse
@@ -40,22 +66,23 @@ import hashlib
 import json
 import re
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _bibtex import parse_entries, write_entries  # noqa: E402
+
 # The SSoT for "what is a scholar stub". Do not re-declare these markers here:
 # check_citations.py gates the compile on them, and a second copy would drift.
 from check_citations import STUB_JOURNAL_MARKERS, STUB_NOTE_MARKERS  # noqa: E402
 
-try:
-    import bibtexparser
-    from bibtexparser.bibdatabase import BibDatabase
-    from bibtexparser.bwriter import BibTexWriter
-except ImportError:
-    print("ERROR: bibtexparser not installed")
-    print("Install with: pip install bibtexparser")
-    exit(1)
+ENTRY_CACHE_NAME = ".bibliography_entries.json"
+ENTRY_CACHE_VERSION = 1
+
+# A file modified this recently may change again within the same mtime tick
+# (2 s on FAT), so its size + mtime are not trusted next time: it is re-hashed.
+_RACY_MTIME_NS = 2_000_000_000
 
 
 def normalize_title(title: str) -> str:
@@ -149,6 +176,111 @@ def merge_duplicate_pair(existing: dict, duplicate: dict) -> dict:
     return merge_entries(existing, duplicate)
 
 
+def entry_keys(entry: dict) -> list:
+    """The identity of an entry for deduplication: [cite key, DOI, title, year].
+
+    The title is normalized (normalize_title). An empty string means "no such
+    key"; the title only counts together with a year.
+    """
+    return [
+        str(entry.get("ID", "")).strip(),
+        get_doi(entry),
+        normalize_title(entry.get("title", "")),
+        entry.get("year", ""),
+    ]
+
+
+class _Slot:
+    """One unique entry: the fold of the entries merged into it."""
+
+    __slots__ = ("value", "keys", "merged")
+
+    def __init__(self, entry: dict, keys: list):
+        self.value = entry
+        self.keys = keys  # the creating entry's keys: what the slot is indexed by
+        self.merged = False
+
+
+class DedupIndex:
+    """deduplicate_entries kept open: sources are added in merge order.
+
+    Each unique entry's value is the fold of merge_duplicate_pair over the
+    entries merged into it -- what deduplicate_entries computes in one pass.
+    A unique entry is indexed by the keys of the entry that created it, and a
+    key, once taken, is never re-pointed.
+    """
+
+    def __init__(self):
+        self._slots: List[_Slot] = []
+        self._id_index = {}  # cite key (entry ID) -> slot
+        self._doi_index = {}  # DOI -> slot
+        self._title_index = {}  # (normalized_title, year) -> slot
+        self._total = 0
+        self._duplicates = 0
+
+    def add(self, entries: List[dict], keys: Optional[List[list]] = None) -> None:
+        """Deduplicate ``entries`` against everything added so far.
+
+        ``keys`` are their entry_keys, when already known (e.g. cached).
+        """
+        if keys is None:
+            keys = [entry_keys(entry) for entry in entries]
+        self._total += len(entries)
+
+        for entry, (cite_key, doi, title_norm, year) in zip(entries, keys):
+            # Cite key FIRST: a repeated cite key is exactly what makes bibtex
+            # emit "repeated entry" / "I'm skipping whatever remains of this
+            # entry" and drop a whole reference -- so it must never reach the
+            # merged output, regardless of DOI/title. Common with
+            # auto-generated stub entries duplicated across input .bib files.
+            # Then DOI (most reliable content match), then title + year.
+            if cite_key and cite_key in self._id_index:
+                idx = self._id_index[cite_key]
+            elif doi and doi in self._doi_index:
+                idx = self._doi_index[doi]
+            elif title_norm and year:
+                idx = self._title_index.get((title_norm, year))
+            else:
+                idx = None
+
+            if idx is None:
+                # New unique entry, indexed by position
+                idx = len(self._slots)
+                self._slots.append(_Slot(entry, [cite_key, doi, title_norm, year]))
+                if cite_key:
+                    self._id_index[cite_key] = idx
+                if doi:
+                    self._doi_index[doi] = idx
+                if title_norm and year:
+                    self._title_index[(title_norm, year)] = idx
+            else:
+                # Merge metadata with the existing entry (real beats stub);
+                # the indices keep pointing at the same position.
+                slot = self._slots[idx]
+                slot.value = merge_duplicate_pair(slot.value, entry)
+                slot.merged = True
+                self._duplicates += 1
+
+    def entries(self) -> List[dict]:
+        """The unique entries, in merge order."""
+        return [slot.value for slot in self._slots]
+
+    def entry_keys(self) -> List[list]:
+        """entry_keys of each unique entry (a merge can change them)."""
+        return [
+            entry_keys(slot.value) if slot.merged else slot.keys for slot in self._slots
+        ]
+
+    def stats(self) -> dict:
+        """The statistics deduplicate_entries reports."""
+        return {
+            "total_input": self._total,
+            "unique_output": len(self._slots),
+            "duplicates_found": self._duplicates,
+            "duplicates_merged": self._duplicates,
+        }
+
+
 def deduplicate_entries(entries: List[dict]) -> tuple[List[dict], dict]:
     """
     Deduplicate BibTeX entries by cite key, DOI, and title.
@@ -156,80 +288,9 @@ def deduplicate_entries(entries: List[dict]) -> tuple[List[dict], dict]:
     Returns:
         (unique_entries, stats)
     """
-    unique = []
-    id_index = {}  # cite key (entry ID) -> index in unique list
-    doi_index = {}  # DOI -> index in unique list
-    title_index = {}  # (normalized_title, year) -> index in unique list
-    duplicates_found = 0
-    duplicates_merged = 0
-
-    for entry in entries:
-        doi = get_doi(entry)
-        title = entry.get("title", "")
-        year = entry.get("year", "")
-        title_norm = normalize_title(title)
-        cite_key = str(entry.get("ID", "")).strip()
-
-        is_duplicate = False
-        merge_with_idx = None
-
-        # Check by cite key (entry ID) FIRST. A repeated cite key is exactly
-        # what makes bibtex emit "repeated entry" / "I'm skipping whatever
-        # remains of this entry" and drop a whole reference -- so it must never
-        # reach the merged output, regardless of DOI/title. Common with
-        # auto-generated stub entries duplicated across input .bib files.
-        if cite_key and cite_key in id_index:
-            is_duplicate = True
-            merge_with_idx = id_index[cite_key]
-            duplicates_found += 1
-
-        # Check by DOI (most reliable content match)
-        elif doi and doi in doi_index:
-            is_duplicate = True
-            merge_with_idx = doi_index[doi]
-            duplicates_found += 1
-
-        # Check by title + year
-        elif title_norm and year:
-            key = (title_norm, year)
-            if key in title_index:
-                is_duplicate = True
-                merge_with_idx = title_index[key]
-                duplicates_found += 1
-
-        if is_duplicate and merge_with_idx is not None:
-            # Merge metadata with existing entry (real beats stub)
-            merge_with = unique[merge_with_idx]
-            merged = merge_duplicate_pair(merge_with, entry)
-
-            # Update in unique list
-            unique[merge_with_idx] = merged
-
-            # Indices remain the same (still pointing to same position)
-            # No need to update doi_index or title_index
-
-            duplicates_merged += 1
-        else:
-            # New unique entry
-            new_idx = len(unique)
-            unique.append(entry)
-
-            # Index it by position
-            if cite_key:
-                id_index[cite_key] = new_idx
-            if doi:
-                doi_index[doi] = new_idx
-            if title_norm and year:
-                title_index[(title_norm, year)] = new_idx
-
-    stats = {
-        "total_input": len(entries),
-        "unique_output": len(unique),
-        "duplicates_found": duplicates_found,
-        "duplicates_merged": duplicates_merged,
-    }
-
-    return unique, stats
+    index = DedupIndex()
+    index.add(entries)
+    return index.entries(), index.stats()
 
 
 def calculate_files_hash(bib_files: List[Path]) -> str:
@@ -269,11 +330,13 @@ def load_cache(cache_file: Path) -> Optional[dict]:
         return None
 
 
-def save_cache(cache_file: Path, data: dict) -> None:
+def save_cache(cache_file: Path, data: dict, indent: Optional[int] = 2) -> None:
     """Save cache to file."""
     try:
+        # dumps, not dump: only dumps uses the C encoder (unindented)
+        text = json.dumps(data, indent=indent)
         with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            f.write(text)
     except IOError as e:
         print(f"WARNING: Could not save cache: {e}")
 
@@ -310,6 +373,50 @@ def is_cache_valid(cache_file: Path, bib_files: List[Path], output_file: Path) -
     return cache.get("input_hash") == current_hash
 
 
+def load_entry_cache(cache_file: Path) -> dict:
+    """The per-file records of the entry cache ({} when absent or stale)."""
+    cache = load_cache(cache_file)
+    if not cache or cache.get("version") != ENTRY_CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def _source_record(data: bytes, stat, entries: List[dict], keys: List[list]) -> dict:
+    racy = time.time_ns() - stat.st_mtime_ns < _RACY_MTIME_NS
+    return {
+        "size": stat.st_size,
+        "mtime_ns": None if racy else stat.st_mtime_ns,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "entries": entries,
+        "keys": keys,
+    }
+
+
+def load_source(bib_file: Path, record: Optional[dict]) -> tuple[dict, bool]:
+    """The entry-cache record of ``bib_file``, parsed only if it changed.
+
+    A record whose size and mtime still match is used without reading the
+    file; otherwise the file is hashed, and parsed only when its SHA-256
+    differs from the record's.
+
+    Returns:
+        (record, parsed)
+    """
+    stat = bib_file.stat()
+    if (
+        record
+        and record.get("mtime_ns") == stat.st_mtime_ns
+        and record.get("size") == stat.st_size
+    ):
+        return record, False
+    data = bib_file.read_bytes()
+    if record and record.get("sha256") == hashlib.sha256(data).hexdigest():
+        return _source_record(data, stat, record["entries"], record["keys"]), False
+    entries = parse_entries(data)
+    keys = [entry_keys(entry) for entry in entries]
+    return _source_record(data, stat, entries, keys), True
+
+
 def input_sort_key(bib_file: Path, output_name: str) -> tuple:
     """Deterministic merge order: output file, then real sources, then stubs.
 
@@ -389,38 +496,43 @@ def merge_bibtex_files(
         for f in sorted(bib_files):
             print(f"  - {f.name}")
 
-    # Load and parse all files
-    all_entries = []
+    # Load each file, parsing only the ones that changed since the last merge
+    entry_cache_file = bib_dir / ENTRY_CACHE_NAME
+    cached = {} if force else load_entry_cache(entry_cache_file)
+    records = {}
+    index = DedupIndex()
     for bib_file in bib_files:
         try:
-            with open(bib_file, "r", encoding="utf-8") as f:
-                parser = bibtexparser.bparser.BibTexParser(
-                    common_strings=True, ignore_nonstandard_types=False
-                )
-                bib_db = bibtexparser.load(f, parser=parser)
-                all_entries.extend(bib_db.entries)
-                if verbose:
-                    print(
-                        f"  Loaded: {len(bib_db.entries)} entries from {bib_file.name}"
-                    )
+            record, parsed = load_source(bib_file, cached.get(bib_file.name))
         except Exception as e:
             print(f"ERROR: Failed to parse {bib_file}: {e}")
             continue
-
-    # Deduplicate
-    unique_entries, stats = deduplicate_entries(all_entries)
-
-    # Create output database
-    output_db = BibDatabase()
-    output_db.entries = unique_entries
-
-    # Write output
-    writer = BibTexWriter()
-    writer.indent = "  "  # 2-space indentation
-    writer.order_entries_by = "ID"  # Sort by citation key
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(writer.write(output_db))
+        records[bib_file.name] = record
+        index.add(record["entries"], record["keys"])
+        if verbose:
+            how = "Loaded" if parsed else "Cached"
+            print(f"  {how}: {len(record['entries'])} entries from {bib_file.name}")
+
+    unique_entries = index.entries()
+    stats = index.stats()
+
+    # Write output (2-space indentation, merge order); an unchanged text is
+    # left alone so its mtime does not trigger downstream rebuilds.
+    text = write_entries(unique_entries, indent="  ")
+    data = text.encode("utf-8")
+    if not output_path.exists() or output_path.read_bytes() != data:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    if output_path in bib_files:
+        # The output is an input too: it reads back as the entries just written.
+        records[output_path.name] = _source_record(
+            data, output_path.stat(), unique_entries, index.entry_keys()
+        )
+    save_cache(
+        entry_cache_file,
+        {"version": ENTRY_CACHE_VERSION, "files": records},
+        indent=None,
+    )
 
     # Save cache
     input_hash = calculate_files_hash(bib_files)
@@ -212,83 +212,18 @@ main() {
     fi
     log_stage_end "Clew Render"
 
-    # Merge bibliography files if multiple exist
-    log_stage_start "Bibliography Merge"
-    "$PROJECT_ROOT/scripts/shell/modules/merge_bibliographies.sh"
-    log_stage_end "Bibliography Merge"
-
-    # Apply citation style from config
-    log_stage_start "Citation Style"
-    "$PROJECT_ROOT/scripts/shell/modules/apply_citation_style.sh"
-    log_stage_end "Citation Style"
-
-    # Run independent processing in parallel for speed
+    # Bibliography merge, citation style, figures, tables and word count run in
+    # ONE Python process (`scitex-writer engine run-stages`): the independent
+    # stages concurrently, word count once figures/tables are compiled. One
+    # interpreter start instead of one per stage; per-stage timings land in
+    # $LOG_DIR/asset_stages.json. Stages named in SCITEX_WRITER_SKIP_STAGES
+    # (watch mode) keep their previous outputs -- unlike --no_figs, which
+    # disables figures.
     log_stage_start "Asset Processing"
-
-    # Create temp files for parallel job outputs
-    local temp_dir
-    temp_dir=$(mktemp -d)
-    local fig_log="$temp_dir/figures.log"
-    local tbl_log="$temp_dir/tables.log"
-    local wrd_log="$temp_dir/words.log"
-
-    # Figures/tables delegate to the INSTALLED scitex-writer Python engine
-    # (run_python_pipeline.sh); the shell modules they replace shipped silent
-    # bugs (math escaping, multi-panel figures emitted as panel-a, no-op crop).
-    (
-        "$PROJECT_ROOT/scripts/shell/modules/run_python_pipeline.sh" figures "$no_figs" "$do_p2t" "$do_verbose" "$do_crop_tif" >"$fig_log" 2>&1
-        echo $? >"$temp_dir/fig_exit"
-    ) &
-    local fig_pid=$!
-
-    (
-        "$PROJECT_ROOT/scripts/shell/modules/run_python_pipeline.sh" tables "$no_tables" >"$tbl_log" 2>&1
-        echo $? >"$temp_dir/tbl_exit"
-    ) &
-    local tbl_pid=$!
-
-    # Wait for figures and tables to finish before counting
-    wait $fig_pid $tbl_pid
-
-    # Run word count after figures/tables are ready (needs compiled files)
-    "$PROJECT_ROOT/scripts/shell/modules/count_words.sh" >"$wrd_log" 2>&1
-    echo $? >"$temp_dir/wrd_exit"
-
-    # Display outputs only in verbose mode
-    if [ "${SCITEX_LOG_LEVEL:-1}" -ge 2 ]; then
-        log_info "Figure Processing:"
-        sed 's/^/    /' "$fig_log"
-
-        log_info "Table Processing:"
-        sed 's/^/    /' "$tbl_log"
-
-        log_info "Word Count:"
-        sed 's/^/    /' "$wrd_log"
-    fi
-
-    # Check exit codes
-    local fig_exit
-    local tbl_exit
-    local wrd_exit
-    fig_exit=$(cat "$temp_dir/fig_exit")
-    tbl_exit=$(cat "$temp_dir/tbl_exit")
-    wrd_exit=$(cat "$temp_dir/wrd_exit")
-
-    # Extract summary lines for normal mode
-    if [ "${SCITEX_LOG_LEVEL:-1}" -lt 2 ]; then
-        # Show only key results (remove file paths from grep output)
-        # "Compiled N figures/tables" is the Python engine's summary wording.
-        grep -hE "(figures compiled|tables compiled|Compiled [0-9]+ (figures|tables)|Word counts updated)" "$fig_log" "$tbl_log" "$wrd_log" 2>/dev/null | sed 's/^/  /' || true
-    fi
-
-    rm -rf "$temp_dir"
-
-    # Fail if any job failed
-    if [ "$fig_exit" -ne 0 ] || [ "$tbl_exit" -ne 0 ] || [ "$wrd_exit" -ne 0 ]; then
-        log_error "Asset processing failed (fig=$fig_exit, tbl=$tbl_exit, wrd=$wrd_exit)"
+    if ! "$PROJECT_ROOT/scripts/shell/modules/run_python_pipeline.sh" stages "$no_figs" "$no_tables" "$do_p2t" "$do_crop_tif"; then
+        log_error "Asset processing failed (see the ✗ stage above)"
         exit 1
     fi
-
     log_stage_end "Asset Processing"
 
     # Compile documents
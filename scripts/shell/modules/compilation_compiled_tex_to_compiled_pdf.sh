@@ -47,6 +47,8 @@ source "${ENGINES_DIR}/compile_tectonic.sh"
 source "${ENGINES_DIR}/compile_latexmk.sh"
 # shellcheck source=/dev/null
 source "${ENGINES_DIR}/compile_3pass.sh"
+# shellcheck source=/dev/null
+source "${ENGINES_DIR}/compile_fmt.sh"
 
 # Logging
 touch "$LOG_PATH" >/dev/null 2>&1
@@ -86,6 +88,9 @@ compiled_tex_to_pdf() {
     3pass)
         compile_with_3pass "$tex_file"
         ;;
+    fmt)
+        compile_with_fmt "$tex_file"
+        ;;
     *)
         echo_error "    Unknown compilation engine: $engine"
         echo_info "    Falling back to 3-pass compilation"
@@ -20,6 +20,8 @@ _file_mtime() {
 
 compile_with_3pass() {
     local tex_file="$1"
+    # Extra pdflatex options (compile_with_fmt passes -fmt=<key>)
+    local extra_opts="${2:-}"
     local pdf_file="${tex_file%.tex}.pdf"
 
     echo_info "    Using 3-pass engine"
@@ -35,6 +37,7 @@ compile_with_3pass() {
 
     # Add compilation options (use configured LOG_DIR for clean separation)
     pdf_cmd="$pdf_cmd -output-directory=$LOG_DIR -shell-escape -interaction=nonstopmode -file-line-error -synctex=1"
+    [ -n "$extra_opts" ] && pdf_cmd="$pdf_cmd $extra_opts"
 
     # Helper function for timed execution
     run_pass() {
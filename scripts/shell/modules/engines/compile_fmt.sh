@@ -0,0 +1,162 @@
+#!/bin/bash
+# -*- coding: utf-8 -*-
+# ROLE: engine-vendored — DO NOT edit here. `scitex-writer update-project`
+# overwrites this file on every re-vendor; fix it upstream in the
+# scitex-writer package instead (local edits are lost, and update-project
+# may set it read-only in the consumer workspace after vendoring).
+# Timestamp: "2026-10-17 10:00:00 (ywatanabe)"
+# File: ./scripts/shell/modules/engines/compile_fmt.sh
+# Precompiled-preamble engine: the 3-pass sequence on top of a cached .fmt
+#
+# Every pdflatex pass re-reads the whole preamble (the inlined
+# 00_shared/latex_styles and dozens of packages) before the first line of the
+# body. This engine dumps that preamble once into a format file with
+# mylatexformat and starts every pass from it; mylatexformat then skips the
+# preamble in the document itself. The format is keyed by a hash of the
+# preamble and the pdflatex version line, so editing a style file (or
+# upgrading TeX Live) builds a new one on the next compile. Full-line comments
+# are left out of the hash: the flattened manuscript's "Compiled:" banner
+# changes on every build and would otherwise bust the cache every time.
+#
+# A preamble that cannot be dumped (some packages refuse) is remembered with a
+# <key>.failed marker and compiled by the plain 3-pass engine instead. The
+# marker expires after FMT_FAILED_RETRY_MINUTES, so a transient failure (a
+# package installed since, an interrupted dump) is retried.
+
+THIS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# Source command switching for command detection
+source "${THIS_DIR}/../command_switching.src"
+# The pass sequence itself is the 3-pass engine's
+source "${THIS_DIR}/compile_3pass.sh"
+
+# Formats kept in the cache directory; the least recently used are removed
+# (the bound the Python diff compile applies to the same directory).
+FMT_MAX_CACHED_FORMATS=8
+
+# Age of a <key>.failed marker after which the dump is tried again (the
+# Python engine's FAILED_FORMAT_RETRY_SECONDS).
+FMT_FAILED_RETRY_MINUTES=60
+
+_fmt_sha256() {
+    if command -v sha256sum >/dev/null 2>&1; then
+        sha256sum | cut -d' ' -f1
+    else
+        shasum -a 256 | cut -d' ' -f1
+    fi
+}
+
+# Cache key of the format for tex_file's preamble under pdf_cmd
+_fmt_key() {
+    local tex_file="$1"
+    local pdf_cmd="$2"
+    local digest
+    digest=$(
+        {
+            sed -n '1,/\\begin{document}/p' "$tex_file" | grep -v '^[[:space:]]*%'
+            $pdf_cmd --version 2>/dev/null | head -1
+        } | _fmt_sha256
+    )
+    echo "preamble_${digest:0:16}"
+}
+
+# Dump tex_file's preamble into <fmt_dir>/<key>.fmt; non-zero on failure
+_fmt_build() {
+    local tex_file="$1"
+    local pdf_cmd="$2"
+    local fmt_dir="$3"
+    local key="$4"
+
+    echo_info "    Precompiling preamble into $key.fmt"
+    local start=$(date +%s)
+    $pdf_cmd -ini -interaction=nonstopmode -shell-escape \
+        -jobname="$key" -output-directory="$fmt_dir" \
+        "&pdflatex" mylatexformat.ltx "$tex_file" >/dev/null 2>&1
+    local ret=$?
+
+    if [ $ret -ne 0 ] || [ ! -f "$fmt_dir/$key.fmt" ]; then
+        rm -f "$fmt_dir/$key.fmt"
+        if [ -f "$fmt_dir/$key.log" ]; then
+            tail -n 40 "$fmt_dir/$key.log" >"$fmt_dir/$key.failed"
+        else
+            echo "exit $ret" >"$fmt_dir/$key.failed"
+        fi
+        rm -f "$fmt_dir/$key.log"
+        return 1
+    fi
+    rm -f "$fmt_dir/$key.log"
+    echo_info "      ($(($(date +%s) - start))s)"
+    return 0
+}
+
+# Keep the FMT_MAX_CACHED_FORMATS most recently used formats
+_fmt_prune() {
+    local fmt_dir="$1"
+    local keep=$((FMT_MAX_CACHED_FORMATS + 1))
+    # shellcheck disable=SC2012
+    ls -t "$fmt_dir"/*.fmt 2>/dev/null | tail -n +"$keep" | while read -r stale; do
+        rm -f "$stale" "${stale%.fmt}.failed"
+    done
+}
+
+compile_with_fmt() {
+    local tex_file="$1"
+
+    echo_info "    Using precompiled-preamble engine"
+
+    local pdf_cmd=$(get_cmd_pdflatex)
+    if [ -z "$pdf_cmd" ]; then
+        echo_error "    No LaTeX installation found (native, module, or container)"
+        return 1
+    fi
+
+    # Under the project root so a container's --bind of $(pwd) reaches it
+    local fmt_dir="$(pwd)/.scitex/writer/runtime/formats"
+    mkdir -p "$fmt_dir"
+
+    local key
+    key=$(_fmt_key "$tex_file" "$pdf_cmd")
+
+    if [ -n "$(find "$fmt_dir/$key.failed" -mmin +"$FMT_FAILED_RETRY_MINUTES" 2>/dev/null)" ]; then
+        echo_info "    Retrying the preamble dump (last failure is over ${FMT_FAILED_RETRY_MINUTES} min old)"
+        rm -f "$fmt_dir/$key.failed"
+    fi
+
+    if [ -f "$fmt_dir/$key.failed" ]; then
+        echo_warning "    Preamble cannot be precompiled (see $fmt_dir/$key.failed)"
+        compile_with_3pass "$tex_file"
+        return $?
+    fi
+
+    if [ -f "$fmt_dir/$key.fmt" ]; then
+        echo_info "    Reusing precompiled preamble $key.fmt"
+        touch "$fmt_dir/$key.fmt" # LRU bookkeeping for _fmt_prune
+    else
+        # One dump per key at a time, across concurrent compiles
+        local built=0
+        if command -v flock >/dev/null 2>&1; then
+            (
+                flock -w 600 9 || exit 1
+                [ -f "$fmt_dir/$key.fmt" ] || _fmt_build "$tex_file" "$pdf_cmd" "$fmt_dir" "$key"
+            ) 9>"$fmt_dir/.lock.$key"
+            built=$?
+        else
+            _fmt_build "$tex_file" "$pdf_cmd" "$fmt_dir" "$key"
+            built=$?
+        fi
+        if [ $built -ne 0 ]; then
+            echo_warning "    Could not precompile the preamble; using the 3-pass engine"
+            compile_with_3pass "$tex_file"
+            return $?
+        fi
+        _fmt_prune "$fmt_dir"
+    fi
+
+    # A trailing ':' keeps kpathsea's default format path after ours
+    TEXFORMATS="$fmt_dir:" compile_with_3pass "$tex_file" "-fmt=$key"
+}
+
+# Export function
+export -f compile_with_fmt
+
+# EOF
@@ -183,6 +183,8 @@ compile_diff_tex() {
     source "${ENGINES_DIR}/compile_latexmk.sh"
     # shellcheck source=/dev/null
     source "${ENGINES_DIR}/compile_3pass.sh"
+    # shellcheck source=/dev/null
+    source "${ENGINES_DIR}/compile_fmt.sh"
 
     local engine="${SCITEX_WRITER_SELECTED_ENGINE:-latexmk}"
 
@@ -201,6 +203,9 @@ compile_diff_tex() {
     3pass)
         compile_with_3pass "$tex_file"
         ;;
+    fmt)
+        compile_with_fmt "$tex_file"
+        ;;
     *)
         echo_warning "    Unknown engine '$engine', using latexmk"
         compile_with_latexmk "$tex_file"
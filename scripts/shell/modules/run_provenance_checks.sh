@@ -59,6 +59,13 @@
 # keyed by cite key + bib-entry content hash, so repeated compiles are network-free
 # until an entry actually changes.
 #
+# The checks run in ONE python process (scripts/python/lint_engine.py): the
+# project's .tex/.bib sources are read and tokenized once into a shared model
+# and every check runs against it as a plugin. SCITEX_WRITER_LINT_JOBS=N runs
+# them on N threads; per-check timings are printed after the reports and
+# written to $LOG_DIR/lint_timings.json. A vendored tree without the engine
+# falls back to one process per check.
+#
 # Returns the worst exit code across the checks (0 unless a check errored).
 
 THIS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -67,6 +74,12 @@ THIS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="${PROJECT_ROOT:-$(cd "$THIS_DIR/../../.." && pwd)}"
 PY="${SCITEX_WRITER_PYTHON:-python3}"
 
+ENGINE="$THIS_DIR/../../python/lint_engine.py"
+if [ -f "$ENGINE" ]; then
+    "$PY" "$ENGINE" "$PROJECT_ROOT" ${LOG_DIR:+--timings "$LOG_DIR/lint_timings.json"}
+    exit $?
+fi
+
 rc=0
 for chk in check_paper_symlink check_media_provenance check_figure_media check_ref_integrity check_caption_footnote check_table_decimals check_clew_verify check_clew_completeness check_citations check_citation_trust check_version_freshness; do
     script="$THIS_DIR/../../python/${chk}.py"
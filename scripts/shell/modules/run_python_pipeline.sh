@@ -18,9 +18,20 @@
 # Contract (positional, mirrors the shell modules this replaces):
 #     run_python_pipeline.sh figures  <no_figs> <p2t> <verbose> <crop>
 #     run_python_pipeline.sh tables   <no_tables>
+#     run_python_pipeline.sh stages   <no_figs> <no_tables> <p2t> <crop>
 #     run_python_pipeline.sh diff
 #     run_python_pipeline.sh archive
 #
+# `stages` runs bibliography merge, citation style, figures, tables and word
+# count in ONE interpreter (`scitex-writer engine run-stages`), concurrently
+# where independent, and writes per-stage timings to $LOG_DIR/asset_stages.json.
+# Stages whose inputs are unchanged since their last successful run are served
+# from the content-addressed stage cache (.scitex/writer/runtime/stage_cache/).
+#
+# A --draft compile (SCITEX_WRITER_DRAFT_MODE=true, exported by compile_*.sh)
+# also passes --draft to the figure stage, which then typesets downscaled,
+# cached proxies of the figures instead of the full-resolution JPGs.
+#
 # Document type comes from $SCITEX_WRITER_DOC_TYPE (exported by every
 # compile_*.sh); the project root from $PROJECT_ROOT or the script location.
 #
@@ -41,7 +52,7 @@ echo_success() { echo -e "${GREEN}SUCC: $1${NC}"; }
 echo_error() { echo -e "${RED}ERRO: $1${NC}"; }
 
 usage() {
-    echo "Usage: $(basename "${BASH_SOURCE[0]}") <figures|tables|diff|archive> [args...]"
+    echo "Usage: $(basename "${BASH_SOURCE[0]}") <figures|tables|stages|diff|archive> [args...]"
 }
 
 SCITEX_WRITER_PYTHON="${SCITEX_WRITER_PYTHON:-python3}"
@@ -53,6 +64,13 @@ ensure_python_engine() {
         echo_error "  Install Python 3, or point SCITEX_WRITER_PYTHON at your interpreter."
         return 1
     fi
+    return 0
+}
+
+# Called only after a stage FAILED: a separate `python3 -c "import
+# scitex_writer"` probe before every stage cost a whole interpreter start plus
+# a package import per stage on the success path.
+explain_import_failure() {
     if ! "$SCITEX_WRITER_PYTHON" -c "import scitex_writer" >/dev/null 2>&1; then
         echo_error "The scitex-writer Python package is not importable by $SCITEX_WRITER_PYTHON"
         echo_error "  The compile engine's figure/table/diff/archive stages live in that package."
@@ -81,12 +99,30 @@ run_stage() {
         [ "$no_figs" = true ] && cmd+=(--no-figs)
         [ "$p2t" = true ] && cmd+=(--pptx)
         [ "$crop" = true ] && cmd+=(--crop)
+        [ "${SCITEX_WRITER_DRAFT_MODE:-false}" = true ] && cmd+=(--draft)
         ;;
     tables)
         local no_tables="${1:-false}"
         cmd+=(tables render -p "$PROJECT_ROOT" -t "$doc_type")
         [ "$no_tables" = true ] && cmd+=(--no-tables)
         ;;
+    stages)
+        local no_figs="${1:-false}"
+        local no_tables="${2:-false}"
+        local p2t="${3:-false}"
+        local crop="${4:-false}"
+        local timings_dir="${LOG_DIR:-$PROJECT_ROOT/.scitex/writer/runtime}"
+        cmd+=(engine run-stages -p "$PROJECT_ROOT" -t "$doc_type")
+        cmd+=(--timings "$timings_dir/asset_stages.json")
+        [ "$no_figs" = true ] && cmd+=(--no-figs)
+        [ "$no_tables" = true ] && cmd+=(--no-tables)
+        [ "$p2t" = true ] && cmd+=(--pptx)
+        [ "$crop" = true ] && cmd+=(--crop)
+        [ "${SCITEX_WRITER_DRAFT_MODE:-false}" = true ] && cmd+=(--draft)
+        # --force (compile_manuscript.sh exports do_force) bypasses the stage
+        # cache: every stage reruns even when its inputs are unchanged.
+        [ "${do_force:-false}" = true ] && cmd+=(--no-cache)
+        ;;
     diff)
         cmd+=(compile diff -p "$PROJECT_ROOT" -t "$doc_type")
         [ -n "${SCITEX_DIFF_FROM:-}" ] && cmd+=(--from "$SCITEX_DIFF_FROM")
@@ -109,6 +145,7 @@ run_stage() {
         echo_success "Python $stage pipeline finished"
     else
         echo_error "Python $stage pipeline failed (exit $status)"
+        explain_import_failure
     fi
     return $status
 }
@@ -51,6 +51,14 @@ verify_engine() {
             get_cmd_bibtex >/dev/null 2>&1
         return $?
         ;;
+    fmt)
+        # 3pass plus mylatexformat (looked up beside pdflatex, container or not)
+        local pdf_cmd
+        pdf_cmd=$(get_cmd_pdflatex 2>/dev/null) &&
+            get_cmd_bibtex >/dev/null 2>&1 &&
+            ${pdf_cmd%pdflatex}kpsewhich mylatexformat.ltx >/dev/null 2>&1
+        return $?
+        ;;
     *)
         echo_error "Unknown engine: $engine"
         return 1
@@ -72,6 +80,9 @@ get_engine_info() {
     3pass)
         echo "🔒 3-pass (Guaranteed correctness, 6-7s)"
         ;;
+    fmt)
+        echo "📦 Precompiled preamble (3-pass from a cached .fmt)"
+        ;;
     esac
 }
 
@@ -94,7 +105,7 @@ get_engine_version() {
             $cmd -version 2>&1 | head -1 | grep -oP '\d+\.\d+'
         fi
         ;;
-    3pass)
+    3pass | fmt)
         echo "native"
         ;;
     esac
@@ -105,7 +116,7 @@ list_available_engines() {
     echo "Available compilation engines:"
     echo ""
 
-    for engine in tectonic latexmk 3pass; do
+    for engine in tectonic latexmk 3pass fmt; do
         if verify_engine "$engine" >/dev/null 2>&1; then
             local version
             version=$(get_engine_version "$engine")
@@ -49,7 +49,7 @@ usage() {
     echo "  -nf,  --no_figs       Skip figure processing (~4s faster)"
     echo "  -nt,  --no_tables     Skip table processing (~4s faster)"
     echo "  -nd,  --no_diff       Skip diff generation (~17s faster)"
-    echo "  -d,   --draft         Single-pass compilation (~5s faster)"
+    echo "  -d,   --draft         Single-pass compilation on downscaled figure proxies"
     echo "  -dm,  --dark_mode     Dark mode: black background, white text"
     echo "  -p2t, --ppt2tif       Convert PowerPoint to TIF (WSL)"
     echo "  -c,   --crop_tif      Crop TIF whitespace"
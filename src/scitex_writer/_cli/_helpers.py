@@ -55,7 +55,7 @@ _GUIDELINE_SECTIONS = ["abstract", "introduction", "methods", "discussion", "pro
 # compile constants + result printer
 # =========================================================================
 
-_ENGINE_CHOICES = click.Choice(["tectonic", "latexmk", "3pass"])
+_ENGINE_CHOICES = click.Choice(["tectonic", "latexmk", "3pass", "fmt"])
 
 
 def _print_compile_result(result, as_json) -> int:
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_cli/commands/engine.py
+
+"""``engine`` command group — entry points the compile scripts call.
+
+``engine run-stages`` runs the pre-TeX asset stages (bibliography merge,
+citation style, figures, tables, word count) in ONE interpreter, concurrently
+where they are independent, instead of one ``python3`` launch per stage, and
+skips stages whose inputs are unchanged since their last successful run. See
+``_compile/_stages.py`` and ``_compile/_stage_cache.py``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import click
+
+from .._core import main_group
+from .._helpers import _DOC_TYPE, _emit_json
+
+# =========================================================================
+# engine group
+# =========================================================================
+
+
+@main_group.group("engine", invoke_without_command=True)
+@click.pass_context
+def engine_group(ctx):
+    """Compile-engine entry points used by the compile scripts.
+
+    \b
+    Example:
+        $ scitex-writer engine run-stages -p . -t manuscript
+    """
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+@engine_group.command("run-stages")
+@click.option("-p", "--project", default=".", help="Project path.")
+@click.option("-t", "--doc-type", type=_DOC_TYPE, default="manuscript")
+@click.option(
+    "-s",
+    "--stage",
+    "stages",
+    multiple=True,
+    help="Run only this stage (repeatable; default: all).",
+)
+@click.option(
+    "--skip",
+    default=None,
+    help=(
+        "Comma-separated stages whose previous outputs are current "
+        "(default: $SCITEX_WRITER_SKIP_STAGES)."
+    ),
+)
+@click.option(
+    "--no-figs", is_flag=True, default=False, help="Skip all image processing."
+)
+@click.option("--no-tables", is_flag=True, default=False, help="Skip tables.")
+@click.option(
+    "--pptx", is_flag=True, default=False, help="Also render .pptx via LibreOffice."
+)
+@click.option("--crop", is_flag=True, default=False, help="Trim JPG borders.")
+@click.option(
+    "--draft",
+    is_flag=True,
+    default=False,
+    help="Typeset downscaled figure proxies instead of full-resolution JPGs.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Rerun every stage even when its inputs are unchanged.",
+)
+@click.option(
+    "-j", "--workers", type=int, default=4, show_default=True, help="Threads."
+)
+@click.option(
+    "--timings",
+    "timings_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also write the JSON report (per-stage timings) to this file.",
+)
+@click.option("--json", "as_json", is_flag=True, default=False, help="Emit JSON.")
+def engine_run_stages(
+    project,
+    doc_type,
+    stages,
+    skip,
+    no_figs,
+    no_tables,
+    pptx,
+    crop,
+    draft,
+    no_cache,
+    workers,
+    timings_path,
+    as_json,
+):
+    """Run bib merge, citation style, figures, tables and word count in one process.
+
+    Independent stages run concurrently; word count starts once figures and
+    tables are done. A stage whose inputs, options and tools are unchanged
+    since its last successful run is served from the stage cache
+    (``--no-cache`` or SCITEX_WRITER_STAGE_CACHE=0 disables it). Exits
+    non-zero when a required stage fails (a failed bibliography merge is only
+    a warning, as in the shell).
+
+    \b
+    Example:
+        $ scitex-writer engine run-stages
+        $ scitex-writer engine run-stages -s figures -s tables --json
+        $ scitex-writer engine run-stages --timings logs/stages.json
+    """
+    from ..._compile._stages import (
+        STAGES,
+        format_report,
+        run_stages,
+        skip_stages_from_env,
+    )
+
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        click.echo(
+            f"Error: unknown stage(s) {', '.join(unknown)}; "
+            f"choose from {', '.join(STAGES)}",
+            err=True,
+        )
+        return 2
+    skipped = (
+        tuple(s.strip() for s in skip.split(",") if s.strip())
+        if skip is not None
+        else skip_stages_from_env()
+    )
+    report = run_stages(
+        Path(project),
+        doc_type,
+        stages=stages or None,
+        skip=skipped,
+        no_figs=no_figs,
+        no_tables=no_tables,
+        pptx=pptx,
+        crop=crop,
+        draft=draft,
+        workers=workers,
+        cache=False if no_cache else None,
+    )
+    if timings_path is not None:
+        timings_path.parent.mkdir(parents=True, exist_ok=True)
+        timings_path.write_text(
+            json.dumps(report, indent=2, default=str), encoding="utf-8"
+        )
+    if as_json:
+        _emit_json(report)
+    else:
+        click.echo(format_report(report))
+    return 0 if report["success"] else 1
+
+
+# EOF
@@ -121,8 +121,14 @@ def figures_add(name, image, caption, label, project, doc_type, dry_run, yes, as
     "--pptx", is_flag=True, default=False, help="Also render .pptx via LibreOffice."
 )
 @click.option("--crop", is_flag=True, default=False, help="Trim JPG borders.")
+@click.option(
+    "--draft",
+    is_flag=True,
+    default=False,
+    help="Typeset downscaled proxies (jpg_for_compilation/_draft) instead.",
+)
 @click.option("--json", "as_json", is_flag=True, default=False, help="Emit JSON.")
-def figures_render(project, doc_type, no_figs, pptx, crop, as_json):
+def figures_render(project, doc_type, no_figs, pptx, crop, draft, as_json):
     """Convert every figure source to JPG and gather the floats into FINAL.tex.
 
     The pure-Python figure engine (port of process_figures.sh): tidies panel ids
@@ -136,10 +142,11 @@ def figures_render(project, doc_type, no_figs, pptx, crop, as_json):
     Example:
         $ scitex-writer figures render
         $ scitex-writer figures render -t supplementary --crop --json
+        $ scitex-writer figures render --draft
     """
     from ... import figures
 
-    result = figures.render(project, doc_type, no_figs, pptx, crop)
+    result = figures.render(project, doc_type, no_figs, pptx, crop, draft)
     if as_json:
         _emit_json(result)
         return 0 if result.get("success") else 1
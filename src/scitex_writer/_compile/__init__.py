@@ -10,6 +10,7 @@ Provides organized compilation functionality:
 - supplementary: Supplementary materials compilation
 - revision: Revision response compilation with change tracking
 - _runner: Script execution engine
+- _scheduler: Process-wide compile worker pool (per-project queues)
 - _parser: Output parsing utilities
 - _validator: Pre-compile validation
 """
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_compile/_capture.py
+
+"""Bounded, spill-to-disk capture of compile output.
+
+By default the executors in :mod:`._execute` keep a child's complete stdout and
+stderr in memory, and ``CompilationResult`` carries them in full. A verbose
+revision build (latexdiff + latexmk) emits tens of MB per run, and a
+multi-tenant process running many builds holds all of it at once.
+
+In spill mode each stream is instead written to a file under the document's
+``logs/`` directory as it arrives, and only the last ``tail_bytes`` stay in
+memory (a ring buffer). The caller gets the tail as the familiar ``stdout`` /
+``stderr`` string plus a :class:`CapturedOutput` handle that reads the full
+output back from disk only when asked.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+DEFAULT_TAIL_BYTES = 64 * 1024
+"""In-memory tail kept per stream in spill mode."""
+
+
+def tail_bytes_from_env() -> Optional[int]:
+    """``SCITEX_WRITER_CAPTURE_TAIL_KB`` in bytes, or None (spill mode off)."""
+    raw = os.environ.get("SCITEX_WRITER_CAPTURE_TAIL_KB", "").strip()
+    try:
+        return int(raw) * 1024 if raw else None
+    except ValueError:
+        return None
+
+
+class CapturedOutput:
+    """Lazy handle on one stream's full output, spilled to ``path``.
+
+    ``tail`` is what stayed in memory; ``read()`` / ``iter_lines()`` go back to
+    the file, so holding a handle costs nothing until it is used.
+    """
+
+    def __init__(
+        self, path: Path, tail: str, total_bytes: int, truncated: bool = False
+    ) -> None:
+        self.path = Path(path)
+        self.tail = tail
+        self.total_bytes = total_bytes
+        self.truncated = truncated  # tail is not the whole output
+
+    def read(self) -> str:
+        """The complete output (reads the whole file)."""
+        return self.path.read_text(encoding="utf-8", errors="replace")
+
+    def iter_lines(self) -> Iterator[str]:
+        """The complete output line by line, without loading it at once."""
+        with open(self.path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
+    def __str__(self) -> str:
+        return self.tail
+
+    def __repr__(self) -> str:
+        return (
+            f"CapturedOutput(path={str(self.path)!r}, "
+            f"total_bytes={self.total_bytes}, truncated={self.truncated})"
+        )
+
+
+class SpillCapture:
+    """Write one stream to disk, keeping only its last ``tail_bytes`` in memory.
+
+    Either feed it chunks with :meth:`write`, or hand :attr:`file` to a child
+    process as its stdout/stderr; :meth:`close` then reads the tail back from
+    the end of the file.
+    """
+
+    def __init__(self, path: Path, tail_bytes: int = DEFAULT_TAIL_BYTES) -> None:
+        self.path = Path(path)
+        self.tail_bytes = tail_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file: IO[bytes] = open(self.path, "wb")
+        self._ring = bytearray()
+        self._written = 0
+
+    def write(self, chunk: bytes) -> None:
+        self.file.write(chunk)
+        self._written += len(chunk)
+        self._ring += chunk
+        if len(self._ring) > self.tail_bytes:
+            del self._ring[: len(self._ring) - self.tail_bytes]
+
+    def close(self) -> CapturedOutput:
+        """Flush the file and return its handle, with the tail decoded."""
+        self.file.flush()
+        # fstat, not tell(): a child writing through the inherited descriptor
+        # does not move this object's cached position.
+        total = os.fstat(self.file.fileno()).st_size
+        self.file.close()
+        if self._written:
+            tail = bytes(self._ring)
+        else:
+            # A child wrote to the file directly: the tail is its last bytes.
+            with open(self.path, "rb") as f:
+                f.seek(max(0, total - self.tail_bytes))
+                tail = f.read()
+        truncated = total > len(tail)
+        if truncated:
+            # Drop the partial first line and say where the rest went.
+            cut = tail.find(b"\n")
+            tail = tail[cut + 1 :] if cut != -1 else tail
+            note = (
+                f"[... {total - len(tail)} earlier bytes not kept in memory; "
+                f"full output in {self.path}]\n"
+            )
+            tail = note.encode("utf-8") + tail
+        text = tail.decode("utf-8", errors="replace").rstrip("\n")
+        return CapturedOutput(self.path, text, total, truncated)
+
+
+__all__ = [
+    "DEFAULT_TAIL_BYTES",
+    "CapturedOutput",
+    "SpillCapture",
+    "tail_bytes_from_env",
+]
+
+# EOF
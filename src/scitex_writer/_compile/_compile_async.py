@@ -5,55 +5,63 @@
 """
 Asynchronous compilation support for writer module.
 
-Allows non-blocking compilation operations for concurrent workflows.
+Allows non-blocking compilation operations for concurrent workflows. Every
+call is routed through the process-wide :mod:`._scheduler`, which bounds the
+worker pool, keeps one queue per project and coalesces duplicate requests.
 """
 
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial, wraps
+import inspect
+from functools import wraps
 from logging import getLogger
 from pathlib import Path
 from typing import Any, Callable
 
 from .._dataclasses import CompilationResult
+from ._scheduler import get_scheduler
 from .manuscript import compile_manuscript
 from .revision import compile_revision
 from .supplementary import compile_supplementary
 
 logger = getLogger(__name__)
 
-# Thread pool for async operations
-_executor = ThreadPoolExecutor(max_workers=2)
 
-
-def _make_async_wrapper(sync_func: Callable) -> Callable:
+def _make_async_wrapper(sync_func: Callable, doc_type: str) -> Callable:
     """
     Factory function to create async wrappers for sync compilation functions.
 
     Args:
-        sync_func: Synchronous compilation function
+        sync_func: Synchronous compilation function (first parameter is
+            ``project_dir``)
+        doc_type: Document type the function compiles; with the project it
+            forms the scheduler's queueing / coalescing key
 
     Returns
     -------
-        Async wrapper function
+        Async wrapper function. Raises ``CompileQueueFullError`` when the
+        project's queue is full.
     """
+    signature = inspect.signature(sync_func)
 
     @wraps(sync_func)
     async def async_wrapper(*args: Any, **kwargs: Any) -> CompilationResult:
-        loop = asyncio.get_event_loop()
-        # Use partial to bind kwargs since run_in_executor only accepts positional args
-        bound_func = partial(sync_func, *args, **kwargs)
-        return await loop.run_in_executor(_executor, bound_func)
+        project_dir = signature.bind(*args, **kwargs).arguments["project_dir"]
+        future = get_scheduler().submit(
+            project_dir, doc_type, sync_func, *args, **kwargs
+        )
+        return await asyncio.wrap_future(future)
 
     return async_wrapper
 
 
 # Create async wrappers using factory function
-compile_manuscript_async = _make_async_wrapper(compile_manuscript)
-compile_supplementary_async = _make_async_wrapper(compile_supplementary)
-compile_revision_async = _make_async_wrapper(compile_revision)
+compile_manuscript_async = _make_async_wrapper(compile_manuscript, "manuscript")
+compile_supplementary_async = _make_async_wrapper(
+    compile_supplementary, "supplementary"
+)
+compile_revision_async = _make_async_wrapper(compile_revision, "revision")
 
 
 async def compile_all_async(
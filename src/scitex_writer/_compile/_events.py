@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_compile/_events.py
+
+"""Structured, resumable compile events.
+
+The GUI used to poll ``/api/compile/status``, which re-sent the WHOLE
+accumulated log on every tick -- O(n^2) bytes over the wire for a verbose
+latexmk build. Instead, the compile's line stream (the ``log_callback`` of
+:func:`._execute._execute_with_callbacks`) is turned into typed events with a
+monotonically increasing sequence number, kept in a bounded per-project
+:class:`CompileEventLog`. A client asks for "everything after seq N" and gets
+only the delta; reconnecting with its last seen seq resumes the stream.
+
+Event types:
+
+- ``build_start`` / ``build_end``: one compile (``generation``, ``success``)
+- ``stage_start`` / ``stage_end``: the compile scripts' ``log_stage_start`` /
+  ``log_stage_end`` markers (``stage``, ``elapsed``) -- ``▸ X`` / ``✓ X (Ns)``
+  from compile_manuscript.sh, ``INFO: [ts] Starting: X`` / ``SUCC: [ts]
+  Completed: X (Ns elapsed, Ms total)`` from the supplementary and revision
+  scripts
+- ``progress``: ``percent`` derived from completed stages
+- ``warning`` / ``error``: the scripts' ``⚠`` / ``✗`` lines, and the
+  ``WARN:`` / ``ERRO:`` lines of the other scripts and the modules
+- ``log``: every raw line (ANSI colours stripped), stderr flagged
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+DEFAULT_MAX_EVENTS = 5000
+"""Events retained per log; older ones are dropped (clients see ``truncated``)."""
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+_STAGE_START = (
+    re.compile(r"^▸\s+(?P<stage>.+?)\s*$"),
+    re.compile(r"^INFO:\s+\[[^\]]*\]\s+Starting:\s+(?P<stage>.+?)\s*$"),
+)
+_STAGE_END = (
+    re.compile(r"^✓\s+(?P<stage>.+?)(?:\s+\((?P<elapsed>\d+)s\))?\s*$"),
+    re.compile(
+        r"^SUCC:\s+\[[^\]]*\]\s+Completed:\s+(?P<stage>.+?)"
+        r"(?:\s+\((?P<elapsed>\d+)s elapsed[^)]*\))?\s*$"
+    ),
+)
+_WARNING = re.compile(r"^(?:\s+⚠|\s*WARN:)\s+(?P<message>.*)$")
+_ERROR = re.compile(r"^(?:\s+✗|\s*ERRO:)\s+(?P<message>.*)$")
+# A log_stage_start call, or a stage the script announces by hand (the
+# supplementary and revision scripts' parallel block); the functions' own
+# ``Starting: $stage_name`` is not a stage.
+_STAGE_CALL = re.compile(
+    r'^\s*(?:log_stage_start\s+"|echo_info\s+".*Starting: (?!\$))', re.MULTILINE
+)
+_STDERR_PREFIX = "[STDERR] "
+
+
+def _match(patterns, text: str) -> Optional[re.Match]:
+    for pattern in patterns:
+        if m := pattern.match(text):
+            return m
+    return None
+
+
+@dataclass
+class CompileEvent:
+    """One compile event; ``seq`` is unique and increasing within its log."""
+
+    seq: int
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    ts: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class CompileEventLog:
+    """Thread-safe, bounded, append-only event buffer with blocking reads."""
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self._events: Deque[CompileEvent] = deque(maxlen=max_events)
+        self._cond = threading.Condition()
+        self._seq = 0
+
+    @property
+    def last_seq(self) -> int:
+        with self._cond:
+            return self._seq
+
+    def emit(self, type: str, **data: Any) -> CompileEvent:
+        """Append an event and wake every waiting reader."""
+        with self._cond:
+            self._seq += 1
+            event = CompileEvent(seq=self._seq, type=type, data=data)
+            self._events.append(event)
+            self._cond.notify_all()
+        return event
+
+    def since(self, seq: int = 0, timeout: Optional[float] = None) -> dict:
+        """Events with ``seq`` greater than the given one.
+
+        Blocks up to ``timeout`` seconds when there is nothing new (``None`` /
+        ``0`` returns immediately). ``truncated`` is True when events the
+        caller has not seen were already dropped from the bounded buffer.
+        """
+        with self._cond:
+            if timeout and self._seq <= seq:
+                self._cond.wait_for(lambda: self._seq > seq, timeout=timeout)
+            events = [e for e in self._events if e.seq > seq]
+            oldest = self._events[0].seq if self._events else self._seq + 1
+            return {
+                "events": events,
+                "last_seq": self._seq,
+                "truncated": seq + 1 < oldest and self._seq > seq,
+            }
+
+    def line_callback(self, total_stages: Optional[int] = None) -> Callable:
+        """A ``log_callback`` turning compile output lines into events.
+
+        ``total_stages`` (see :func:`count_stages`) enables ``progress``
+        events; without it only stage/log/warning/error events are emitted.
+        """
+        done = [0]
+
+        def callback(line: str) -> None:
+            stream = "stdout"
+            if line.startswith(_STDERR_PREFIX):
+                line, stream = line[len(_STDERR_PREFIX) :], "stderr"
+            text = _ANSI.sub("", line)
+            self.emit("log", line=text, stream=stream)
+            if m := _match(_STAGE_START, text):
+                self.emit("stage_start", stage=m["stage"])
+            elif m := _match(_STAGE_END, text):
+                elapsed = int(m["elapsed"]) if m["elapsed"] else None
+                self.emit("stage_end", stage=m["stage"], elapsed=elapsed)
+                done[0] += 1
+                if total_stages:
+                    percent = min(99, int(100 * done[0] / total_stages))
+                    self.emit("progress", percent=percent, stage=m["stage"])
+            elif m := _WARNING.match(text):
+                self.emit("warning", message=m["message"])
+            elif m := _ERROR.match(text):
+                self.emit("error", message=m["message"])
+
+        return callback
+
+
+def count_stages(script: Path) -> Optional[int]:
+    """Number of stages a compile script announces, or None.
+
+    Counts its ``log_stage_start`` calls and the stages it announces with a
+    literal ``Starting:`` line.
+
+    An upper bound (some stages are conditional), which is what a progress bar
+    wants: it never overshoots, and ``build_end`` closes it at 100%.
+    """
+    try:
+        count = len(_STAGE_CALL.findall(Path(script).read_text()))
+    except OSError:
+        return None
+    return count or None
+
+
+def format_sse(event: CompileEvent) -> str:
+    """Serialize one event as a Server-Sent Events frame (``id`` = seq)."""
+    return (
+        f"id: {event.seq}\nevent: {event.type}\n"
+        f"data: {json.dumps(event.to_dict())}\n\n"
+    )
+
+
+def events_to_dicts(events: List[CompileEvent]) -> List[dict]:
+    return [e.to_dict() for e in events]
+
+
+__all__ = [
+    "CompileEvent",
+    "CompileEventLog",
+    "count_stages",
+    "events_to_dicts",
+    "format_sse",
+]
+
+# EOF
@@ -11,6 +11,19 @@ rather than process plumbing. `_run_sh_command` is the default; the streaming
 
 Both return the same dict shape -- {stdout, stderr, exit_code, success} -- which
 is also the contract of the `command_runner` injection seam on `run_compile`.
+
+Neither executor touches process-global state: the working directory and the
+environment are handed to the CHILD via `cwd=` / `env=`, never applied with
+`os.chdir` / `os.environ`. Several compiles (three doc types, or two projects
+served by one Django/MCP process) can therefore run on parallel threads
+without racing each other's cwd.
+
+Both also have a spill mode (``spill_to=<path stem>``): each stream is written
+to ``<stem>.stdout`` / ``<stem>.stderr`` as it arrives and only the last
+``tail_bytes`` stay in memory (see :mod:`._capture`). The dict's ``stdout`` /
+``stderr`` are then those tails, and ``stdout_log`` / ``stderr_log`` hold
+:class:`._capture.CapturedOutput` handles on the full output.
+
 NOTE `success` here means "exit code 0" and nothing more; the compile scripts'
 exit 3 ("PDF produced but engine exited non-zero") is interpreted in `_runner`,
 not here.
@@ -18,22 +31,99 @@ not here.
 
 from __future__ import annotations
 
-import fcntl
 import os
+import selectors
 import subprocess
 import time
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Iterator, List, Mapping, Optional
+
+from ._capture import DEFAULT_TAIL_BYTES, SpillCapture
+
+READ_CHUNK_BYTES = 64 * 1024
+"""Bytes read from a child pipe per wake-up."""
+
+MAX_LINE_BYTES = 1024 * 1024
+"""Longest line buffered before it is emitted in pieces (bounds memory)."""
+
+_IDLE_CHECK_SECONDS = 0.5
+"""How often an idle read loop checks whether the child has exited."""
+
+
+def _child_env(
+    cwd: Optional[Path] = None,
+    env: Optional[Mapping[str, str]] = None,
+) -> dict:
+    """Build the environment for one compile child process.
+
+    A fresh copy of ``os.environ`` with ``env`` layered on top. ``PWD`` is
+    pinned to ``cwd`` so scripts reading ``$PWD`` see the directory they were
+    started in, not the parent's -- the parent never chdirs, so its own
+    ``PWD`` is meaningless to the child.
+    """
+    child = os.environ.copy()
+    if env:
+        child.update(env)
+    if cwd is not None:
+        child["PWD"] = str(cwd)
+    return child
+
+
+class _LineFramer:
+    """Split a byte stream into decoded lines in time linear in its size.
+
+    Each chunk is split ONCE; only the trailing partial line is carried over,
+    in a ``bytearray`` so appending to it is amortized O(1). A "line" longer
+    than ``max_line_bytes`` (a child spewing output without newlines) is
+    emitted in pieces of that size instead of growing the carry without bound.
+    """
+
+    def __init__(self, max_line_bytes: int = MAX_LINE_BYTES) -> None:
+        self.max_line_bytes = max_line_bytes
+        self._partial = bytearray()
+
+    def feed(self, chunk: bytes) -> List[str]:
+        pieces = chunk.split(b"\n")
+        if len(pieces) > 1:
+            self._partial += pieces[0]
+            raw = [bytes(self._partial), *pieces[1:-1]]
+            self._partial = bytearray(pieces[-1])
+        else:
+            self._partial += chunk
+            raw = []
+        while len(self._partial) > self.max_line_bytes:
+            raw.append(bytes(self._partial[: self.max_line_bytes]))
+            del self._partial[: self.max_line_bytes]
+        return [line.decode("utf-8", errors="replace") for line in raw]
+
+    def flush(self) -> List[str]:
+        """The unterminated tail, if any (call once, at EOF)."""
+        if not self._partial:
+            return []
+        tail = bytes(self._partial).decode("utf-8", errors="replace")
+        self._partial.clear()
+        return [tail]
+
 
 def _execute_with_callbacks(
     command: list,
     cwd: Path,
     timeout: int,
     log_callback: Optional[Callable[[str], None]] = None,
+    env: Optional[Mapping[str, str]] = None,
+    spill_to: Optional[Path] = None,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
 ) -> dict:
     """
     Execute command with line-by-line output capture and callbacks.
 
+    Event-driven: the parent sleeps in ``select`` until one of the pipes has
+    data (or the deadline passes), reads it in ``READ_CHUNK_BYTES`` chunks and
+    frames lines with :class:`_LineFramer`. There is no fixed polling
+    interval, so lines reach ``log_callback`` as soon as the child writes them
+    and an idle compile costs no CPU.
+
     Parameters
     ----------
     command : list
@@ -44,115 +134,137 @@ def _execute_with_callbacks(
         Timeout in seconds
     log_callback : Optional[Callable[[str], None]]
         Called with each output line
+    env : Optional[Mapping[str, str]]
+        Extra environment variables for the child, layered over os.environ
+    spill_to : Optional[Path]
+        Path stem for spill mode (see the module docstring); None keeps the
+        complete output in memory
+    tail_bytes : int
+        Bytes of each stream kept in memory in spill mode
 
     Returns
     -------
     dict
-        Dict with stdout, stderr, exit_code, success
+        Dict with stdout, stderr, exit_code, success (and stdout_log,
+        stderr_log in spill mode)
     """
     # Set environment for unbuffered output
-    env = os.environ.copy()
-    env["PYTHONUNBUFFERED"] = "1"
-
-    process = subprocess.Popen(
-        command,
-        shell=False,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        bufsize=0,  # Unbuffered
-        cwd=str(cwd),
-        env=env,
-    )
-
-    stdout_lines = []
-    stderr_lines = []
-    start_time = time.time()
-
-    # Make file descriptors non-blocking
-    def make_non_blocking(fd):
-        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-        fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-
-    make_non_blocking(process.stdout)
-    make_non_blocking(process.stderr)
-
-    stdout_buffer = b""
-    stderr_buffer = b""
+    child_env = _child_env(cwd, env)
+    child_env["PYTHONUNBUFFERED"] = "1"
 
-    try:
-        while True:
-            # Check timeout
-            if timeout and (time.time() - start_time) > timeout:
-                process.kill()
-                timeout_msg = f"[ERROR] Command timed out after {timeout} seconds"
-                if log_callback:
-                    log_callback(timeout_msg)
-                stderr_lines.append(timeout_msg)
-                break
-
-            # Check if process has finished
-            poll_result = process.poll()
-
-            # Read from stdout
-            try:
-                chunk = process.stdout.read()
-                if chunk:
-                    stdout_buffer += chunk
-                    # Process complete lines
-                    while b"\n" in stdout_buffer:
-                        line, stdout_buffer = stdout_buffer.split(b"\n", 1)
-                        line_str = line.decode("utf-8", errors="replace")
-                        stdout_lines.append(line_str)
-                        if log_callback:
-                            log_callback(line_str)
-            except (IOError, BlockingIOError):
-                pass
-
-            # Read from stderr
-            try:
-                chunk = process.stderr.read()
-                if chunk:
-                    stderr_buffer += chunk
-                    # Process complete lines
-                    while b"\n" in stderr_buffer:
-                        line, stderr_buffer = stderr_buffer.split(b"\n", 1)
-                        line_str = line.decode("utf-8", errors="replace")
-                        stderr_lines.append(line_str)
-                        if log_callback:
-                            log_callback(f"[STDERR] {line_str}")
-            except (IOError, BlockingIOError):
-                pass
-
-            # If process finished, do final read and break
-            if poll_result is not None:
-                # Process remaining buffer content
-                if stdout_buffer:
-                    line_str = stdout_buffer.decode("utf-8", errors="replace")
-                    stdout_lines.append(line_str)
-                    if log_callback:
-                        log_callback(line_str)
-
-                if stderr_buffer:
-                    line_str = stderr_buffer.decode("utf-8", errors="replace")
-                    stderr_lines.append(line_str)
-                    if log_callback:
-                        log_callback(f"[STDERR] {line_str}")
-
-                break
-
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.05)
-
-    except Exception:
-        process.kill()
-        raise
-
-    return {
-        "stdout": "\n".join(stdout_lines),
-        "stderr": "\n".join(stderr_lines),
-        "exit_code": process.returncode,
-        "success": process.returncode == 0,
-    }
+    with _spill_captures(spill_to, tail_bytes) as spills:
+        process = subprocess.Popen(
+            command,
+            shell=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,  # Unbuffered
+            cwd=str(cwd),
+            env=child_env,
+        )
+
+        lines = {"stdout": [], "stderr": []}
+        framers = {"stdout": _LineFramer(), "stderr": _LineFramer()}
+        prefixes = {"stdout": "", "stderr": "[STDERR] "}
+        deadline = time.monotonic() + timeout if timeout else None
+
+        def deliver(stream: str, new_lines: List[str]) -> None:
+            if spills is None:
+                lines[stream].extend(new_lines)
+            if log_callback:
+                for line in new_lines:
+                    log_callback(prefixes[stream] + line)
+
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ, "stdout")
+        selector.register(process.stderr, selectors.EVENT_READ, "stderr")
+        timed_out = False
+
+        try:
+            # Read until both pipes hit EOF. A grandchild that inherited the pipes
+            # can keep them open after the child exits, so once the child is gone
+            # an idle wake-up ends the loop instead of waiting for EOF.
+            while selector.get_map():
+                wait = _IDLE_CHECK_SECONDS
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+                    wait = min(wait, remaining)
+                ready = selector.select(wait)
+                if not ready:
+                    if process.poll() is not None:
+                        break
+                    continue
+                for key, _ in ready:
+                    chunk = os.read(key.fd, READ_CHUNK_BYTES)
+                    if chunk:
+                        if spills is not None:
+                            spills[key.data].write(chunk)
+                        deliver(key.data, framers[key.data].feed(chunk))
+                    else:
+                        selector.unregister(key.fileobj)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            selector.close()
+            process.stdout.close()
+            process.stderr.close()
+
+        for stream in ("stdout", "stderr"):
+            deliver(stream, framers[stream].flush())
+
+        if timed_out:
+            process.kill()
+            timeout_msg = f"[ERROR] Command timed out after {timeout} seconds"
+            if log_callback:
+                log_callback(timeout_msg)
+            if spills is not None:
+                spills["stderr"].write(f"{timeout_msg}\n".encode())
+            lines["stderr"].append(timeout_msg)
+        process.wait()
+
+        result = {
+            "stdout": "\n".join(lines["stdout"]),
+            "stderr": "\n".join(lines["stderr"]),
+            "exit_code": process.returncode,
+            "success": process.returncode == 0,
+        }
+        if spills is not None:
+            _attach_spills(result, spills)
+        return result
+
+
+@contextmanager
+def _spill_captures(
+    spill_to: Optional[Path], tail_bytes: int
+) -> Iterator[Optional[Dict[str, SpillCapture]]]:
+    """Spill captures for stdout and stderr under ``spill_to`` (None if unset).
+
+    A capture still open on exit -- the run raised before
+    :func:`_attach_spills` -- has its file closed here.
+    """
+    if spill_to is None:
+        yield None
+        return
+    with ExitStack() as stack:
+        spills = {}
+        for stream in ("stdout", "stderr"):
+            capture = SpillCapture(Path(f"{spill_to}.{stream}"), tail_bytes)
+            stack.callback(capture.file.close)
+            spills[stream] = capture
+        yield spills
+
+
+def _attach_spills(result: dict, spills: dict) -> None:
+    """Close spill captures, putting their tails and handles into ``result``."""
+    for stream, capture in spills.items():
+        handle = capture.close()
+        result[stream] = handle.tail
+        result[f"{stream}_log"] = handle
 
 
 def _run_sh_command(
@@ -160,18 +272,29 @@ def _run_sh_command(
     verbose: bool = True,
     timeout: int = 300,
     stream_output: bool = True,
+    cwd: Optional[Path] = None,
+    env: Optional[Mapping[str, str]] = None,
+    spill_to: Optional[Path] = None,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
 ) -> dict:
     """
     Run shell command and return result dictionary.
 
-    Replaces scitex.sh.sh() dependency.
+    Replaces scitex.sh.sh() dependency. ``cwd`` and ``env`` apply to the child
+    only (see the module docstring); ``cwd=None`` inherits the caller's. In
+    spill mode the child writes straight into the spill files, so its output
+    never passes through this process's memory.
     """
+    if spill_to is not None:
+        return _run_spilled(cmd, timeout, cwd, env, Path(spill_to), tail_bytes)
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             timeout=timeout,
+            cwd=str(cwd) if cwd is not None else None,
+            env=_child_env(cwd, env),
         )
         return {
             "stdout": result.stdout,
@@ -194,6 +317,38 @@ def _run_sh_command(
             "success": False,
         }
 
-__all__ = ["_execute_with_callbacks", "_run_sh_command"]
+
+def _run_spilled(
+    cmd: list,
+    timeout: int,
+    cwd: Optional[Path],
+    env: Optional[Mapping[str, str]],
+    spill_to: Path,
+    tail_bytes: int,
+) -> dict:
+    with _spill_captures(spill_to, tail_bytes) as spills:
+        result = {"stdout": "", "stderr": "", "exit_code": -1, "success": False}
+        try:
+            completed = subprocess.run(
+                cmd,
+                stdout=spills["stdout"].file,
+                stderr=spills["stderr"].file,
+                timeout=timeout,
+                cwd=str(cwd) if cwd is not None else None,
+                env=_child_env(cwd, env),
+            )
+            result["exit_code"] = completed.returncode
+            result["success"] = completed.returncode == 0
+        except subprocess.TimeoutExpired:
+            spills["stderr"].file.write(
+                f"Command timed out after {timeout} seconds\n".encode()
+            )
+        except Exception as e:
+            spills["stderr"].file.write(f"{e}\n".encode())
+        _attach_spills(result, spills)
+        return result
+
+
+__all__ = ["_child_env", "_execute_with_callbacks", "_run_sh_command"]
 
 # EOF
@@ -34,7 +34,8 @@ def parse_output(
     stderr : str
         Standard error from compilation
     log_file : Path, optional
-        Path to LaTeX log file
+        Path to LaTeX log file; when it exists the TeX issues come from it
+        and the output is scanned only for shell and bibliography messages
 
     Returns
     -------
@@ -42,7 +43,7 @@ def parse_output(
         (errors, warnings) as lists of strings
     """
     error_issues, warning_issues = parse_compilation_output(
-        stdout + stderr, log_file=log_file
+        "\n".join((stdout, stderr)), log_file=log_file
     )
 
     # Convert LaTeXIssue objects to strings for backward compatibility
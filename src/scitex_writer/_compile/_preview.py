@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_compile/_preview.py
+
+"""Warm preview engine for :func:`.content.compile_content`.
+
+The cold path pays three start-up costs on EVERY preview call: a fresh
+``python3 tex_snippet2full.py`` process to build the wrapper document, a new
+``mkdtemp`` directory, and a latexmk run that loads the whole preamble
+(babel, hyperref, xcolor, ...) from scratch -- most of a second before the
+first line of the body is typeset. This engine removes all three:
+
+- **In-process wrapper.** ``tex_snippet2full.py``'s functions are imported
+  once and called directly; the builder stays the single source of truth for
+  the document template.
+- **Precompiled preamble.** The preamble is dumped once into a ``.fmt`` with
+  ``mylatexformat``, keyed by a hash of the preamble, the color mode and the
+  TeX version. Later compiles load the format instead of re-reading the
+  packages, and ``mylatexformat`` skips the preamble in the document itself.
+- **Per-project scratch dir.** Builds run in
+  ``<project>/.scitex/writer/runtime/preview/<name>_<color>/`` (or a shared
+  directory under the system temp dir without a project), reused across
+  calls so nothing accumulates and ``.aux`` state carries over.
+
+A preamble the format cannot be built for (some packages refuse to be dumped)
+is remembered and sent down the cold path -- for an hour, after which the dump
+is tried again, so a missing package installed since or an interrupted dump
+does not disable the engine for good. :func:`cleanup_stale_temp_dirs`
+removes the ``scitex_content_*`` directories the cold path leaves behind;
+:func:`sweep_stale_temp_dirs` runs it at most once every ten minutes.
+"""
+
+from __future__ import annotations
+
+import errno
+import fcntl
+import hashlib
+import importlib.util
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Iterator, Optional, Tuple
+
+from .._dataclasses import CompilationResult
+
+COLD_TEMP_PREFIX = "scitex_content_"
+"""``mkdtemp`` prefix of the cold path; see :func:`cleanup_stale_temp_dirs`."""
+
+STALE_TEMP_SECONDS = 6 * 3600
+"""Age after which a cold-path temp dir counts as leaked."""
+
+STALE_SWEEP_INTERVAL_SECONDS = 600
+"""Minimum time between two sweeps by :func:`sweep_stale_temp_dirs`."""
+
+MAX_CACHED_FORMATS = 8
+"""Formats kept per cache directory; the least recently used are removed."""
+
+FAILED_FORMAT_RETRY_SECONDS = 3600
+"""Age after which a ``<key>.failed`` marker is dropped and the dump retried
+(``FMT_FAILED_RETRY_MINUTES`` in ``compile_fmt.sh``)."""
+
+_BEGIN_DOCUMENT = "\\begin{document}"
+_RERUN_MARKERS = ("Rerun to get", "Label(s) may have changed")
+
+
+class PreviewFormatError(RuntimeError):
+    """Raised when a preamble cannot be dumped into a ``.fmt``."""
+
+
+@lru_cache(maxsize=4)
+def _load_snippet_builder(builder: Path) -> ModuleType:
+    """Import ``tex_snippet2full.py`` once, as a module."""
+    spec = importlib.util.spec_from_file_location("_tex_snippet2full", builder)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_document(latex_content: str, color_mode: str, scripts_dir: Path) -> str:
+    """The complete ``.tex`` source ``tex_snippet2full.py`` would write."""
+    builder = _load_snippet_builder(scripts_dir / "python" / "tex_snippet2full.py")
+    if "\\documentclass" in latex_content:
+        return builder.inject_color_into_document(latex_content, color_mode)
+    return builder.wrap_body_content(latex_content, color_mode)
+
+
+def split_preamble(document: str) -> Tuple[str, str]:
+    """``(preamble, rest)`` split at ``\\begin{document}``.
+
+    Raises ValueError for a document without one.
+    """
+    index = document.find(_BEGIN_DOCUMENT)
+    if index == -1:
+        raise ValueError("document has no \\begin{document}")
+    return document[:index], document[index:]
+
+
+@lru_cache(maxsize=1)
+def _tex_version() -> str:
+    try:
+        out = subprocess.run(
+            ["pdflatex", "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return out.splitlines()[0] if out else ""
+
+
+def format_key(preamble: str, color_mode: str) -> str:
+    """Cache key of the format for ``preamble`` (includes the TeX version)."""
+    digest = hashlib.sha256()
+    for part in (preamble, color_mode, _tex_version()):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f"preamble_{digest.hexdigest()[:16]}"
+
+
+@lru_cache(maxsize=1)
+def warm_engine_available() -> bool:
+    """pdflatex and ``mylatexformat.ltx`` are both installed."""
+    if not shutil.which("pdflatex") or not shutil.which("kpsewhich"):
+        return False
+    try:
+        found = subprocess.run(
+            ["kpsewhich", "mylatexformat.ltx"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return bool(found)
+
+
+def scratch_root(project_dir: Optional[str]) -> Path:
+    """Where preview builds and cached formats live."""
+    if project_dir:
+        project = Path(project_dir).resolve()
+        return project / ".scitex" / "writer" / "runtime" / "preview"
+    return Path(tempfile.gettempdir()) / "scitex_writer_preview"
+
+
+def cleanup_stale_temp_dirs(
+    max_age: float = STALE_TEMP_SECONDS, temp_root: Optional[Path] = None
+) -> int:
+    """Remove cold-path temp dirs older than ``max_age`` seconds.
+
+    Returns the number removed. Callers that consume ``temp_dir`` promptly
+    clean up after themselves; this catches the ones that never did.
+    """
+    root = Path(temp_root or tempfile.gettempdir())
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.name.startswith(COLD_TEMP_PREFIX):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+_last_sweep: Optional[float] = None
+_sweep_lock = threading.Lock()
+
+
+def sweep_stale_temp_dirs(
+    interval: float = STALE_SWEEP_INTERVAL_SECONDS, temp_root: Optional[Path] = None
+) -> int:
+    """:func:`cleanup_stale_temp_dirs`, at most once per ``interval`` seconds.
+
+    ``compile_content`` calls this on every preview. A sweep lists the whole
+    system tempdir, so a process runs one on its first preview and then only
+    after ``interval`` has passed; returns 0 when it skips.
+    """
+    global _last_sweep
+    now = time.monotonic()
+    with _sweep_lock:
+        if _last_sweep is not None and now - _last_sweep < interval:
+            return 0
+        _last_sweep = now
+    return cleanup_stale_temp_dirs(temp_root=temp_root)
+
+
+@contextmanager
+def _file_lock(path: Path, timeout: float) -> Iterator[None]:
+    """Exclusive ``flock`` on ``path``, waiting at most ``timeout`` seconds.
+
+    Same contract as the shell path's ``flock -w``: one build per
+    (project, name, color) at a time, across threads and processes.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    with open(path, "w") as handle:
+        while True:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError as exc:
+                if exc.errno not in (errno.EAGAIN, errno.EACCES):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not acquire {path} within {timeout}s")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _tail(text: str, limit: int = 2000) -> str:
+    return text[-limit:] if len(text) > limit else text
+
+
+class PreviewEngine:
+    """Compiles preview documents against cached preamble formats."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.format_dir = self.root / "formats"
+
+    def _format_path(self, key: str) -> Path:
+        return self.format_dir / f"{key}.fmt"
+
+    def has_failed(self, key: str) -> bool:
+        """An attempt to dump this preamble failed within the retry interval.
+
+        An older marker is removed, so the next :meth:`ensure_format` retries.
+        """
+        marker = self.format_dir / f"{key}.failed"
+        try:
+            age = time.time() - marker.stat().st_mtime
+        except OSError:
+            return False
+        if age < FAILED_FORMAT_RETRY_SECONDS:
+            return True
+        marker.unlink(missing_ok=True)
+        return False
+
+    def ensure_format(self, document: str, key: str, timeout: float) -> Path:
+        """Build the format for ``document``'s preamble unless cached.
+
+        Raises
+        ------
+        PreviewFormatError
+            The preamble cannot be dumped; the failure is remembered.
+        """
+        fmt = self._format_path(key)
+        if fmt.exists():
+            os.utime(fmt)  # LRU bookkeeping for _prune_formats
+            return fmt
+        with _file_lock(self.format_dir / f".lock.{key}", timeout):
+            if fmt.exists():
+                return fmt
+            build_dir = Path(tempfile.mkdtemp(prefix=".build_", dir=self.format_dir))
+            try:
+                (build_dir / "preamble.tex").write_text(document, encoding="utf-8")
+                proc = subprocess.run(
+                    [
+                        "pdflatex",
+                        "-ini",
+                        "-interaction=nonstopmode",
+                        f"-jobname={key}",
+                        "&pdflatex",
+                        "mylatexformat.ltx",
+                        "preamble.tex",
+                    ],
+                    cwd=build_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+                built = build_dir / f"{key}.fmt"
+                if proc.returncode != 0 or not built.exists():
+                    (self.format_dir / f"{key}.failed").write_text(
+                        _tail(proc.stdout), encoding="utf-8"
+                    )
+                    raise PreviewFormatError(
+                        f"Could not dump preamble into a format (exit "
+                        f"{proc.returncode}); using the cold preview path."
+                    )
+                os.replace(built, fmt)
+            finally:
+                shutil.rmtree(build_dir, ignore_errors=True)
+        self._prune_formats()
+        return fmt
+
+    def _prune_formats(self) -> None:
+        formats = sorted(self.format_dir.glob("*.fmt"), key=lambda p: p.stat().st_mtime)
+        for stale in formats[:-MAX_CACHED_FORMATS]:
+            stale.unlink(missing_ok=True)
+
+    def _run_pdflatex(
+        self, key: str, tex: Path, name: str, out_dir: Path, timeout: float
+    ) -> subprocess.CompletedProcess:
+        env = os.environ.copy()
+        # A trailing ':' keeps kpathsea's default format path after ours.
+        env["TEXFORMATS"] = f"{self.format_dir}:"
+        return subprocess.run(
+            [
+                "pdflatex",
+                f"-fmt={key}",
+                "-interaction=nonstopmode",
+                "-halt-on-error",
+                "-synctex=1",
+                f"-jobname={name}",
+                f"-output-directory={out_dir}",
+                tex.name,
+            ],
+            cwd=out_dir,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+    def compile(
+        self,
+        document: str,
+        name: str,
+        color_mode: str,
+        timeout: float,
+        preview_dir: Optional[Path] = None,
+    ) -> CompilationResult:
+        """Compile ``document`` with its cached format; publish to ``preview_dir``.
+
+        Raises PreviewFormatError when the preamble has no usable format.
+        """
+        deadline = time.monotonic() + timeout
+        preamble, _ = split_preamble(document)
+        key = format_key(preamble, color_mode)
+        if self.has_failed(key):
+            raise PreviewFormatError("Preamble is known not to dump into a format.")
+        self.ensure_format(document, key, timeout)
+
+        out_dir = self.root / f"{name}_{color_mode}"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        remaining = max(1.0, deadline - time.monotonic())
+        with _file_lock(out_dir / ".lock", remaining):
+            tex = out_dir / f"{name}.tex"
+            tex.write_text(document, encoding="utf-8")
+            pdf = out_dir / f"{name}.pdf"
+            log = out_dir / f"{name}.log"
+            pdf.unlink(missing_ok=True)
+
+            proc = self._run_pdflatex(
+                key, tex, name, out_dir, max(1.0, deadline - time.monotonic())
+            )
+            log_text = log.read_text(errors="replace") if log.exists() else ""
+            if proc.returncode == 0 and any(m in log_text for m in _RERUN_MARKERS):
+                proc = self._run_pdflatex(
+                    key, tex, name, out_dir, max(1.0, deadline - time.monotonic())
+                )
+
+            success = proc.returncode == 0 and pdf.exists()
+            output_pdf = pdf if success else None
+            if success and preview_dir is not None:
+                output_pdf = _publish(pdf, Path(preview_dir) / f"{name}.pdf")
+
+        exit_code = proc.returncode
+        if exit_code == 0 and not success:
+            exit_code = 1  # pdflatex "succeeded" without writing a PDF
+        return CompilationResult(
+            success=success,
+            exit_code=exit_code,
+            stdout=_tail(proc.stdout),
+            stderr=_tail(proc.stderr),
+            output_pdf=output_pdf,
+            log_file=log if log.exists() else None,
+            color_mode=color_mode,
+            temp_dir=None,
+            message=(
+                f"Content compiled successfully: {name}"
+                if success
+                else f"Compilation failed with exit code {proc.returncode}"
+            ),
+        )
+
+
+def _publish(pdf: Path, target: Path) -> Path:
+    """Copy ``pdf`` to ``target`` atomically (tmp in the same dir + rename)."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    suffix = f"{os.getpid()}.{threading.get_ident()}"
+    staging = target.parent / f".{target.name}.tmp.{suffix}"
+    shutil.copyfile(pdf, staging)
+    os.replace(staging, target)
+    return target
+
+
+_engines: dict = {}
+_engines_lock = threading.Lock()
+
+
+def get_preview_engine(project_dir: Optional[str]) -> PreviewEngine:
+    """The (process-wide, per scratch root) engine for ``project_dir``."""
+    root = scratch_root(project_dir)
+    with _engines_lock:
+        engine = _engines.get(root)
+        if engine is None:
+            engine = _engines[root] = PreviewEngine(root)
+        return engine
+
+
+__all__ = [
+    "PreviewEngine",
+    "PreviewFormatError",
+    "build_document",
+    "cleanup_stale_temp_dirs",
+    "sweep_stale_temp_dirs",
+    "format_key",
+    "get_preview_engine",
+    "scratch_root",
+    "split_preamble",
+    "warm_engine_available",
+]
+
+# EOF
@@ -10,15 +10,15 @@ Executes LaTeX compilation scripts and captures results.
 
 from __future__ import annotations
 
-import os
 from datetime import datetime
 from logging import getLogger
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Mapping, Optional
 
 from .._dataclasses import CompilationResult
 from .._dataclasses.config import DOC_TYPE_DIRS
 from .._utils._pdf_pages import produced_page_count
+from ._capture import tail_bytes_from_env
 from ._execute import _execute_with_callbacks, _run_sh_command
 from ._parser import parse_output
 from ._validator import validate_before_compile
@@ -135,6 +135,8 @@ def run_compile(
     log_callback: Optional[Callable[[str], None]] = None,
     progress_callback: Optional[Callable[[int, str], None]] = None,
     command_runner: Optional[Callable[..., dict]] = None,
+    env: Optional[Mapping[str, str]] = None,
+    capture_tail_bytes: Optional[int] = None,
 ) -> CompilationResult:
     """
     Run compilation script and parse results with optional callbacks.
@@ -168,9 +170,25 @@ def run_compile(
 
     command_runner : Optional[Callable[..., dict]]
         Executor for the non-callback path, same shape as
-        :func:`_run_sh_command` (cmd, verbose, timeout, stream_output) ->
-        dict. Defaults to :func:`_run_sh_command`. Exposed so callers and
-        tests can supply an alternate executor without patching internals.
+        :func:`_run_sh_command` (cmd, verbose, timeout, stream_output, cwd,
+        env) -> dict. Defaults to :func:`_run_sh_command`. Exposed so callers
+        and tests can supply an alternate executor without patching internals.
+    env : Optional[Mapping[str, str]]
+        Extra environment variables for the compile script, layered over
+        os.environ for the CHILD process only.
+    capture_tail_bytes : Optional[int]
+        Spill mode: stream the script's full stdout/stderr to
+        ``<doc>/logs/<doc_type>.stdout`` / ``.stderr`` and keep only this many
+        trailing bytes of each in memory. The result's ``stdout`` / ``stderr``
+        are then those tails; ``stdout_log`` / ``stderr_log`` read the rest.
+        Defaults to ``SCITEX_WRITER_CAPTURE_TAIL_KB`` (unset: everything is
+        kept in memory).
+
+    Notes
+    -----
+    The compile script runs with ``cwd=project_dir``; this process's working
+    directory and environment are never modified, so concurrent calls (other
+    doc types, other projects) on worker threads are safe.
 
     Returns
     -------
@@ -265,43 +283,51 @@ def run_compile(
     log(f"[INFO] Running: {' '.join(cmd)}")
     log(f"[INFO] Working directory: {project_dir}")
 
+    if capture_tail_bytes is None:
+        capture_tail_bytes = tail_bytes_from_env()
+    spill = {}
+    if capture_tail_bytes is not None:
+        spill = {
+            "spill_to": project_dir / DOC_TYPE_DIRS[doc_type] / "logs" / doc_type,
+            "tail_bytes": capture_tail_bytes,
+        }
+
     try:
-        cwd_original = Path.cwd()
-        os.chdir(project_dir)
-
-        try:
-            progress(15, "Executing LaTeX compilation...")
-
-            # Use callbacks version if callbacks provided
-            if log_callback:
-                result_dict = _execute_with_callbacks(
-                    command=cmd,
-                    cwd=project_dir,
-                    timeout=timeout,
-                    log_callback=log_callback,
-                )
-            else:
-                # Use simple subprocess execution
-                result_dict = command_runner(
-                    cmd,
-                    verbose=True,
-                    timeout=timeout,
-                    stream_output=True,
-                )
+        progress(15, "Executing LaTeX compilation...")
+
+        # Use callbacks version if callbacks provided
+        if log_callback:
+            result_dict = _execute_with_callbacks(
+                command=cmd,
+                cwd=project_dir,
+                timeout=timeout,
+                log_callback=log_callback,
+                env=env,
+                **spill,
+            )
+        else:
+            # Use simple subprocess execution
+            result_dict = command_runner(
+                cmd,
+                verbose=True,
+                timeout=timeout,
+                stream_output=True,
+                cwd=project_dir,
+                env=env,
+                **spill,
+            )
 
-            result = type(
-                "Result",
-                (),
-                {
-                    "returncode": result_dict["exit_code"],
-                    "stdout": result_dict["stdout"],
-                    "stderr": result_dict["stderr"],
-                },
-            )()
+        result = type(
+            "Result",
+            (),
+            {
+                "returncode": result_dict["exit_code"],
+                "stdout": result_dict["stdout"],
+                "stderr": result_dict["stderr"],
+            },
+        )()
 
-            duration = (datetime.now() - start_time).total_seconds()
-        finally:
-            os.chdir(cwd_original)
+        duration = (datetime.now() - start_time).total_seconds()
 
         # Find output files. Exit 3 means the script PRODUCED and promoted a PDF
         # and told us so; its artifacts must be located exactly as on exit 0 --
@@ -318,7 +344,14 @@ def run_compile(
 
         # Parse errors and warnings
         progress(95, "Parsing compilation logs...")
-        errors, warnings = parse_output(result.stdout, result.stderr, log_file=log_file)
+        # A failed run reports no log_file, but its own LaTeX log (when this
+        # run wrote it) is still where the errors' files and lines are.
+        parse_log = log_file
+        doc_log = _doc_latex_log(project_dir, doc_type)
+        if parse_log is None and doc_log.is_file():
+            if doc_log.stat().st_mtime >= start_time.timestamp():
+                parse_log = doc_log
+        errors, warnings = parse_output(result.stdout, result.stderr, log_file=parse_log)
 
         # A promoted run is a success ONLY if a real PDF with pages > 0 exists.
         # We re-derive that here rather than trusting the exit code, so a shell
@@ -356,6 +389,8 @@ def run_compile(
             duration=duration,
             errors=errors,
             warnings=warnings,
+            stdout_log=result_dict.get("stdout_log"),
+            stderr_log=result_dict.get("stderr_log"),
             message=(
                 f"Compiled WITH WARNINGS (exit {result.returncode}): "
                 "a PDF was produced but the engine reported an error"
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_compile/_scheduler.py
+
+"""Process-wide compile scheduler.
+
+Every async compile in the process goes through ONE scheduler so that a
+multi-tenant deployment (many projects compiling through the same MCP/Django
+process) gets a bounded, fair worker pool rather than a hardcoded 2-thread cap
+shared first-come-first-served:
+
+- **Configurable pool.** ``max_workers`` threads (default: CPU count), or a
+  process pool with ``use_processes=True``. Process mode pickles the job, so
+  callbacks (``log_callback`` / ``progress_callback``) cannot cross into it.
+- **One queue per project.** Free workers are handed out round-robin across
+  projects with pending work, so one project's burst cannot starve another.
+- **Coalescing.** A request for a ``(project, doc_type)`` that is already
+  QUEUED (not yet started) returns the queued job's future instead of adding a
+  second build; the first request's arguments stand. A job already RUNNING is
+  not coalesced -- its sources may predate the new request.
+- **No self-overlap.** Two builds of the same ``(project, doc_type)`` write the
+  same output files, so they never run at the same time; the second waits.
+- **Back-pressure.** A project whose queue holds ``max_queue_depth`` jobs
+  rejects new work with :class:`CompileQueueFullError` instead of growing
+  without bound.
+- **Metrics.** ``queue_wait`` and ``run_time`` (seconds) are stamped onto the
+  returned ``CompilationResult`` (or dict, for the dict-returning compile
+  handlers).
+
+The defaults come from ``SCITEX_WRITER_COMPILE_WORKERS``,
+``SCITEX_WRITER_COMPILE_POOL`` (``thread`` / ``process``) and
+``SCITEX_WRITER_COMPILE_QUEUE_DEPTH``; :func:`configure_scheduler` replaces the
+process-wide instance explicitly.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import scitex_logging as slogging
+
+from .._dataclasses import CompilationResult
+
+logger = slogging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_DEPTH = 8
+"""Pending jobs allowed per project before new submissions are rejected."""
+
+
+class CompileQueueFullError(RuntimeError):
+    """Raised when a project's compile queue is at ``max_queue_depth``."""
+
+
+@dataclass
+class _Job:
+    key: Tuple[str, str]
+    func: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future = field(default_factory=Future)
+    submitted_at: float = field(default_factory=time.time)
+
+
+def _timed_call(func: Callable[..., Any], args: tuple, kwargs: dict) -> tuple:
+    """Run ``func`` and return ``(result, started_at, finished_at)``.
+
+    Module-level so a process pool can pickle it. Wall-clock ``time.time()``
+    rather than a monotonic clock, because the start is taken in the worker
+    (possibly another process) and compared with the submit time taken here.
+    """
+    started_at = time.time()
+    result = func(*args, **kwargs)
+    return result, started_at, time.time()
+
+
+def _stamp_metrics(result: Any, queue_wait: float, run_time: float) -> Any:
+    if isinstance(result, CompilationResult):
+        result.queue_wait = queue_wait
+        result.run_time = run_time
+    elif isinstance(result, dict):
+        result["queue_wait"] = queue_wait
+        result["run_time"] = run_time
+    return result
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={raw!r}")
+        return default
+
+
+class CompileScheduler:
+    """Bounded, per-project-fair compile pool (see the module docstring)."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+    ) -> None:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 2
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_queue_depth < 1:
+            raise ValueError(f"max_queue_depth must be >= 1, got {max_queue_depth}")
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.max_queue_depth = max_queue_depth
+
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self._executor: Executor = pool_cls(max_workers=max_workers)
+        self._lock = threading.Lock()
+        # project -> pending jobs; OrderedDict order IS the round-robin order.
+        self._queues: "OrderedDict[str, Deque[_Job]]" = OrderedDict()
+        self._running: Dict[Tuple[str, str], _Job] = {}
+
+    @staticmethod
+    def _key(project_dir: Any, doc_type: str) -> Tuple[str, str]:
+        return str(Path(project_dir).expanduser().resolve()), doc_type
+
+    def submit(
+        self,
+        project_dir: Any,
+        doc_type: str,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future:
+        """Queue ``func(*args, **kwargs)`` as a compile of ``(project, doc_type)``.
+
+        Returns a ``concurrent.futures.Future`` resolving to ``func``'s result
+        with ``queue_wait`` / ``run_time`` stamped on it.
+
+        Raises
+        ------
+        CompileQueueFullError
+            The project already has ``max_queue_depth`` pending jobs.
+        """
+        key = self._key(project_dir, doc_type)
+        project = key[0]
+        with self._lock:
+            queue = self._queues.get(project)
+            if queue is not None:
+                for pending in queue:
+                    if pending.key == key:
+                        logger.info(f"Coalesced compile request for {key}")
+                        return pending.future
+                if len(queue) >= self.max_queue_depth:
+                    raise CompileQueueFullError(
+                        f"Compile queue for {project} is full "
+                        f"({self.max_queue_depth} pending); retry later."
+                    )
+            else:
+                queue = self._queues[project] = deque()
+            job = _Job(key=key, func=func, args=args, kwargs=kwargs)
+            queue.append(job)
+        self._dispatch()
+        return job.future
+
+    def pending(self, project_dir: Any = None) -> int:
+        """Number of queued (not yet running) jobs, optionally for one project."""
+        with self._lock:
+            if project_dir is None:
+                return sum(len(q) for q in self._queues.values())
+            queue = self._queues.get(self._key(project_dir, "")[0])
+            return len(queue) if queue else 0
+
+    def running(self) -> int:
+        """Number of jobs currently executing."""
+        with self._lock:
+            return len(self._running)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting dispatches and shut the underlying pool down."""
+        self._executor.shutdown(wait=wait)
+
+    def _next_job_locked(self) -> Optional[_Job]:
+        """Pop the next runnable job, rotating fairly across projects."""
+        for project in list(self._queues):
+            queue = self._queues[project]
+            for job in queue:
+                if job.key not in self._running:
+                    queue.remove(job)
+                    # Served: move this project to the back of the rotation.
+                    self._queues.move_to_end(project)
+                    if not queue:
+                        del self._queues[project]
+                    return job
+        return None
+
+    def _dispatch(self) -> None:
+        """Start as many queued jobs as there are free workers.
+
+        Done-callbacks are attached AFTER the lock is released: a job that has
+        already finished runs its callback synchronously on attach, and that
+        callback re-enters the scheduler.
+        """
+        started = []
+        with self._lock:
+            while len(self._running) < self.max_workers:
+                job = self._next_job_locked()
+                if job is None:
+                    break
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                self._running[job.key] = job
+                try:
+                    inner = self._executor.submit(
+                        _timed_call, job.func, job.args, job.kwargs
+                    )
+                except Exception as exc:
+                    del self._running[job.key]
+                    job.future.set_exception(exc)
+                    continue
+                started.append((job, inner))
+        for job, inner in started:
+            inner.add_done_callback(lambda f, job=job: self._on_done(job, f))
+
+    def _on_done(self, job: _Job, inner: Future) -> None:
+        try:
+            result, started_at, finished_at = inner.result()
+        except BaseException as exc:
+            job_error: Optional[BaseException] = exc
+        else:
+            job_error = None
+            queue_wait = max(0.0, started_at - job.submitted_at)
+            run_time = max(0.0, finished_at - started_at)
+            result = _stamp_metrics(result, queue_wait, run_time)
+        with self._lock:
+            self._running.pop(job.key, None)
+        self._dispatch()
+        if job_error is not None:
+            job.future.set_exception(job_error)
+        else:
+            job.future.set_result(result)
+
+
+_scheduler: Optional[CompileScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> CompileScheduler:
+    """Return the process-wide scheduler, creating it from the env on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            pool = os.environ.get("SCITEX_WRITER_COMPILE_POOL", "thread").strip()
+            _scheduler = CompileScheduler(
+                max_workers=_env_int("SCITEX_WRITER_COMPILE_WORKERS", None),
+                use_processes=pool.lower() == "process",
+                max_queue_depth=_env_int(
+                    "SCITEX_WRITER_COMPILE_QUEUE_DEPTH", DEFAULT_MAX_QUEUE_DEPTH
+                ),
+            )
+        return _scheduler
+
+
+def configure_scheduler(
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+) -> CompileScheduler:
+    """Replace the process-wide scheduler; running jobs on the old one finish."""
+    global _scheduler
+    new = CompileScheduler(
+        max_workers=max_workers,
+        use_processes=use_processes,
+        max_queue_depth=max_queue_depth,
+    )
+    with _scheduler_lock:
+        old, _scheduler = _scheduler, new
+    if old is not None:
+        old.shutdown(wait=False)
+    return new
+
+
+__all__ = [
+    "CompileQueueFullError",
+    "CompileScheduler",
+    "configure_scheduler",
+    "get_scheduler",
+]
+
+# EOF
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_compile/_stage_cache.py
+
+"""Content-addressed cache for the asset stages of a compile.
+
+Every compile re-ran the bibliography merge, citation style, figure, table and
+word-count stages even when nothing they read had changed. Each stage now
+declares what it reads and writes (a :class:`StageSpec`); its cache key is a
+SHA-256 over the content of every input file, the pipeline options and
+environment variables it depends on, the tools it shells out to, and the
+scitex-writer version. A stage whose key matches its last successful run is
+not run again: its recorded result is returned, and any declared output that
+has gone missing is restored from the object store.
+
+Layout, per document under ``.scitex/writer/runtime/stage_cache/<doc_type>/``:
+
+- ``manifest.json``: per stage, the key, the stored result and the outputs
+  (``{path: {"sha": ...}}`` or ``{path: {"link": target}}`` for symlinks)
+- ``digests.json``: file digests memoized by ``(mtime_ns, size)``, so an
+  unchanged image is stat-ed, not re-hashed
+- ``objects/<sha[:2]>/<sha>``: output contents, pruned when unreferenced
+
+The key is taken AFTER a successful run: stages such as figures and the
+bibliography merge also rewrite files they read (renamed panels, the merged
+``bibliography.bib``), and the post-run state is what the next build sees.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+CACHE_REL = ".scitex/writer/runtime/stage_cache"
+CACHE_VERSION = 1
+
+_PLACEHOLDER_RE = re.compile(r"\{([\w.]+)\}")
+_FALSEY = ("0", "false", "no", "off")
+
+
+@dataclass(frozen=True)
+class StageSpec:
+    """What a stage reads and writes.
+
+    Patterns are globs relative to the project root. ``{doc_type}`` and
+    dotted config keys (``{figures.compiled_dir}``) are filled in from
+    ``config/config_<doc_type>.yaml``; a pattern whose key is missing makes
+    the stage uncacheable for that build (it simply runs).
+
+    Attributes:
+        inputs: Files whose content the stage's outputs depend on
+        outputs: Files the stage writes (recorded and restorable)
+        options: ``run_stages`` option names that change the outputs
+        env: Environment variables that change the outputs
+        tools: Executables on PATH the stage may call
+    """
+
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    options: Tuple[str, ...] = ()
+    env: Tuple[str, ...] = ()
+    tools: Tuple[str, ...] = ()
+
+
+_CONFIG = "config/config_{doc_type}.yaml"
+
+DEFAULT_SPECS: Dict[str, StageSpec] = {
+    "bib": StageSpec(
+        inputs=(
+            "00_shared/bib_files/*.bib",
+            "scripts/python/merge_bibliographies.py",
+            "scripts/python/_bibtex.py",
+        ),
+        outputs=("00_shared/bib_files/bibliography.bib",),
+    ),
+    "citation_style": StageSpec(
+        inputs=(_CONFIG, "00_shared/latex_styles/bibliography.tex"),
+        outputs=("00_shared/latex_styles/bibliography.tex",),
+        env=("SCITEX_WRITER_CITATION_STYLE",),
+    ),
+    "figures": StageSpec(
+        inputs=(_CONFIG, "{figures.caption_media_dir}/*"),
+        outputs=(
+            "{figures.compiled_dir}/**/*",
+            "{figures.jpg_dir}/*",
+            "{figures.jpg_dir}/_draft/*",
+        ),
+        options=("no_figs", "pptx", "crop", "draft"),
+        tools=("libreoffice", "soffice", "mmdc"),
+    ),
+    "tables": StageSpec(
+        inputs=(_CONFIG, "{tables.caption_media_dir}/*"),
+        outputs=("{tables.compiled_dir}/**/*",),
+        options=("no_tables",),
+        tools=("xlsx2csv",),
+    ),
+    "wordcount": StageSpec(
+        inputs=(
+            _CONFIG,
+            "{paths.doc_root_dir}/contents/*.tex",
+            "{figures.compiled_dir}/*.tex",
+            "{tables.compiled_dir}/*.tex",
+        ),
+        outputs=("{misc.wordcount_dir}/*",),
+        tools=("texcount",),
+    ),
+}
+"""Specs of the default stage runners in ``_stages.py``."""
+
+
+def cache_enabled_from_env() -> bool:
+    """False when ``SCITEX_WRITER_STAGE_CACHE`` is 0/false/no/off."""
+    raw = os.environ.get("SCITEX_WRITER_STAGE_CACHE", "1")
+    return raw.strip().lower() not in _FALSEY
+
+
+def _load_config(project_path: Path, doc_type: str) -> dict:
+    config_path = project_path / "config" / f"config_{doc_type}.yaml"
+    if not config_path.is_file():
+        return {}
+    try:
+        import yaml
+
+        data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _lookup(cfg: dict, dotted: str):
+    cur = cfg
+    for part in dotted.split("."):
+        if not isinstance(cur, dict) or part not in cur:
+            return None
+        cur = cur[part]
+    return cur
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=1, default=str), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _tool_stamp(tool: str) -> Optional[str]:
+    """``realpath:mtime_ns:size`` of a tool on PATH (no process launched)."""
+    found = shutil.which(tool)
+    if not found:
+        return None
+    real = os.path.realpath(found)
+    try:
+        st = os.stat(real)
+    except OSError:
+        return None
+    return f"{real}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _package_version() -> str:
+    from .. import __version__
+
+    return __version__
+
+
+class StageCache:
+    """Keys, results and outputs of the cached stages of one document.
+
+    Thread-safe: ``run_stages`` consults it from its worker threads. Call
+    :meth:`save` once the stages are done to persist the manifest.
+
+    Args:
+        project_dir: Writer project root
+        doc_type: Document being compiled
+        root: Cache directory (default ``<project>/CACHE_REL/<doc_type>``)
+    """
+
+    def __init__(
+        self,
+        project_dir,
+        doc_type: str = "manuscript",
+        root: Optional[Path] = None,
+    ):
+        self.project_path = Path(project_dir).resolve()
+        self.doc_type = doc_type
+        self.root = Path(root) if root else self.project_path / CACHE_REL / doc_type
+        self._lock = threading.Lock()
+        self._config = _load_config(self.project_path, doc_type)
+        self._manifest = _read_json(self.root / "manifest.json")
+        if self._manifest.get("version") != CACHE_VERSION:
+            self._manifest = {"version": CACHE_VERSION, "stages": {}}
+        self._digests = _read_json(self.root / "digests.json")
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # patterns and digests
+    # ------------------------------------------------------------------
+
+    def _expand(self, pattern: str) -> Optional[str]:
+        """Fill placeholders; None when a key is unset or escapes the project."""
+        values = {"doc_type": self.doc_type}
+
+        def fill(m: re.Match) -> str:
+            name = m.group(1)
+            value = values.get(name) or _lookup(self._config, name)
+            if value in (None, ""):
+                raise KeyError(name)
+            return str(value)
+
+        try:
+            expanded = _PLACEHOLDER_RE.sub(fill, pattern)
+        except KeyError:
+            return None
+        while expanded.startswith("./"):
+            expanded = expanded[2:]
+        if os.path.isabs(expanded) or ".." in Path(expanded).parts:
+            return None
+        return expanded
+
+    def _files(self, patterns) -> Optional[Dict[str, Path]]:
+        """``{relative_path: path}`` of every file matching ``patterns``."""
+        found: Dict[str, Path] = {}
+        for pattern in patterns:
+            expanded = self._expand(pattern)
+            if expanded is None:
+                return None
+            for path in self.project_path.glob(expanded):
+                if path.is_symlink() or path.is_file():
+                    found[path.relative_to(self.project_path).as_posix()] = path
+        return found
+
+    def digest(self, path: Path) -> str:
+        """SHA-256 of ``path``'s content, memoized by ``(mtime_ns, size)``."""
+        key = os.fspath(path)
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        with self._lock:
+            hit = self._digests.get(key)
+        if hit is not None and hit[:2] == stamp:
+            return hit[2]
+        sha = _sha256_file(path)
+        with self._lock:
+            self._digests[key] = stamp + [sha]
+        return sha
+
+    def _input_digest(self, path: Path) -> str:
+        try:
+            return self.digest(path)
+        except OSError:  # dangling symlink: its target is the input
+            return f"missing:{os.readlink(path)}"
+
+    # ------------------------------------------------------------------
+    # keys, lookups and stores
+    # ------------------------------------------------------------------
+
+    def key(self, name: str, spec: StageSpec, options: dict) -> Optional[str]:
+        """Cache key of stage ``name`` in the project's current state.
+
+        None when the spec cannot be resolved (the stage must then run).
+        """
+        inputs = self._files(spec.inputs)
+        if inputs is None or self._files(spec.outputs) is None:
+            return None
+        material = {
+            "cache": CACHE_VERSION,
+            "package": _package_version(),
+            "stage": name,
+            "doc_type": self.doc_type,
+            "inputs": {rel: self._input_digest(p) for rel, p in sorted(inputs.items())},
+            "options": {k: options.get(k) for k in spec.options},
+            "env": {k: os.environ.get(k) for k in spec.env},
+            "tools": {t: _tool_stamp(t) for t in spec.tools},
+        }
+        blob = json.dumps(material, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _object(self, sha: str) -> Path:
+        return self.root / "objects" / sha[:2] / sha
+
+    def lookup(self, name: str, key: Optional[str]) -> Optional[dict]:
+        """Stored result of ``name`` when ``key`` matches its last success.
+
+        Outputs that have gone missing are restored from the object store. A
+        miss (returns None): no entry, another key, an output edited since,
+        or a missing output that cannot be restored.
+        """
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._manifest["stages"].get(name)
+        if not entry or entry.get("key") != key:
+            return None
+        missing = []
+        for rel, record in entry["outputs"].items():
+            path = self.project_path / rel
+            if not os.path.lexists(path):
+                if "sha" in record and not self._object(record["sha"]).is_file():
+                    return None
+                missing.append((path, record))
+            elif "link" in record:
+                if not path.is_symlink() or os.readlink(path) != record["link"]:
+                    return None
+            elif path.is_symlink() or self.digest(path) != record["sha"]:
+                return None
+        for path, record in missing:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if "link" in record:
+                os.symlink(record["link"], path)
+            else:
+                tmp = path.with_name(f".{path.name}.restore")
+                shutil.copyfile(self._object(record["sha"]), tmp)
+                os.replace(tmp, path)
+        return {**entry["result"], "restored": len(missing)}
+
+    def store(self, name: str, spec: StageSpec, options: dict, result: dict) -> None:
+        """Record a successful run of ``name`` (key taken in the post-run state)."""
+        key = self.key(name, spec, options)
+        outputs = self._files(spec.outputs)
+        if key is None or outputs is None:
+            self.forget(name)
+            return
+        records = {}
+        for rel, path in sorted(outputs.items()):
+            if path.is_symlink():
+                records[rel] = {"link": os.readlink(path)}
+                continue
+            sha = self.digest(path)
+            target = self._object(sha)
+            if not target.is_file():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp = target.with_name(f".{sha}.{threading.get_ident()}.tmp")
+                shutil.copyfile(path, tmp)
+                os.replace(tmp, target)
+            records[rel] = {"sha": sha}
+        stored = json.loads(json.dumps(result, default=str))
+        with self._lock:
+            self._manifest["stages"][name] = {
+                "key": key,
+                "result": stored,
+                "outputs": records,
+            }
+            self._dirty = True
+
+    def forget(self, name: str) -> None:
+        """Drop ``name``'s entry (after a failure the stage must rerun)."""
+        with self._lock:
+            if self._manifest["stages"].pop(name, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist the manifest and digests; prune unreferenced objects."""
+        with self._lock:
+            manifest = json.loads(json.dumps(self._manifest))
+            digests = {
+                path: stamp
+                for path, stamp in self._digests.items()
+                if os.path.lexists(path)
+            }
+            dirty = self._dirty
+            self._dirty = False
+        _write_json(self.root / "digests.json", digests)
+        if not dirty:
+            return
+        _write_json(self.root / "manifest.json", manifest)
+        referenced = {
+            record["sha"]
+            for entry in manifest["stages"].values()
+            for record in entry["outputs"].values()
+            if "sha" in record
+        }
+        objects = self.root / "objects"
+        if objects.is_dir():
+            for blob in objects.glob("*/*"):
+                if blob.name not in referenced:
+                    blob.unlink(missing_ok=True)
+
+
+__all__ = [
+    "CACHE_REL",
+    "DEFAULT_SPECS",
+    "StageCache",
+    "StageSpec",
+    "cache_enabled_from_env",
+]
+
+# EOF
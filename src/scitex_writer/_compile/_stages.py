@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_compile/_stages.py
+
+"""The pre-TeX asset stages of a compile, run in one Python process.
+
+``compile_manuscript.sh`` used to launch a fresh interpreter per stage (a
+``python3 -c "import scitex_writer"`` health check plus a ``python3 -m
+scitex_writer figures|tables ...`` for each of figures and tables, and the
+bibliography merge script on its own), paying a cold start and a full package
+import every time. :func:`run_stages` runs all of them in the calling process
+(``scitex-writer engine run-stages``):
+
+- ``bib``: merge ``00_shared/bib_files/*.bib`` with the project's
+  ``scripts/python/merge_bibliographies.py``, then clear a stale ``.bbl``
+- ``citation_style``: set the configured ``\\bibliographystyle``
+- ``figures`` / ``tables``: the figure and table pipelines
+- ``wordcount``: section word counts and figure/table element counts
+
+The first four are independent and run concurrently on a thread pool (the
+heavy parts are subprocesses, image codecs and file I/O, which release the
+GIL); ``wordcount`` counts the compiled figures and tables, so it starts when
+both of those have finished. Every stage is timed; the report is a dict that
+serializes to JSON.
+
+Stages whose inputs are unchanged since their last successful run are not run
+again: :mod:`._stage_cache` keys each stage on the content of what it reads
+and hands back the recorded result (restoring any output that went missing).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+from ._stage_cache import DEFAULT_SPECS, StageCache, StageSpec, cache_enabled_from_env
+
+STAGES = ("bib", "citation_style", "figures", "tables", "wordcount")
+"""Stage names, in the order they are reported."""
+
+OPTIONAL_STAGES = ("bib",)
+"""Stages whose failure is a warning, not a failed run (the shell's merge was)."""
+
+_AFTER = {"wordcount": ("figures", "tables")}
+# Skipping ``bib`` (watch mode, SCITEX_WRITER_SKIP_STAGES) covers both halves
+# of the bibliography work, as the shell's skip did.
+_SKIP_ALIASES = {"bib": ("bib", "citation_style")}
+
+StageRunner = Callable[[Path, str, dict], dict]
+
+
+@lru_cache(maxsize=None)
+def _load_merge_script(script: Path):
+    """Import the project's vendored merge script (once per process)."""
+    spec = importlib.util.spec_from_file_location("_scitex_merge_bib", script)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except SystemExit:  # copies vendored before _bibtex.py exit without bibtexparser
+        raise ImportError(
+            "bibtexparser not installed. Fix: pip install bibtexparser"
+        ) from None
+    return module
+
+
+def _clear_stale_bbl(
+    project_path: Path, bib_files: Iterable[Path], doc_type: str
+) -> Optional[str]:
+    """Drop ``<LOG_DIR>/<doc_type>.bbl`` when a source .bib is newer than it.
+
+    The sources are ``bib_files`` and the project root's ``bibliography.bib``.
+    latexmk with a custom ``BIBINPUTS`` can miss a source-only .bib edit and
+    ship the old bibliography; removing the .bbl (and latexmk's fdb) forces
+    bibtex to rerun.
+    """
+    log_dir = os.environ.get("LOG_DIR")
+    if not log_dir:
+        return None
+    bbl = Path(log_dir) / f"{doc_type}.bbl"
+    if not bbl.is_file():
+        return None
+    bbl_mtime = bbl.stat().st_mtime
+    for bib in [*bib_files, project_path / "bibliography.bib"]:
+        if bib.is_file() and bib.stat().st_mtime > bbl_mtime:
+            bbl.unlink()
+            (Path(log_dir) / f"{doc_type}.fdb_latexmk").unlink(missing_ok=True)
+            return (
+                f"Source bib {bib.name} newer than {bbl.name}; cleared to force bibtex"
+            )
+    return None
+
+
+def _run_bib(project_path: Path, doc_type: str, options: dict) -> dict:
+    bib_dir = project_path / "00_shared" / "bib_files"
+    bib_files = sorted(bib_dir.glob("*.bib")) if bib_dir.is_dir() else []
+    if not bib_files:
+        return {
+            "success": True,
+            "warnings": [
+                f"No bibliography files found in {bib_dir}: place a "
+                "bibliography.bib there, or several *.bib files to be merged"
+            ],
+        }
+    warnings = []
+    script = project_path / "scripts" / "python" / "merge_bibliographies.py"
+    if script.is_file():
+        merged = _load_merge_script(script).merge_bibtex_files(
+            bib_dir, "bibliography.bib", verbose=False, include_output=True
+        )
+        if not merged:
+            return {"success": False, "error": "Bibliography merge failed"}
+    else:
+        warnings.append(f"Merge script missing: {script}; merge skipped")
+    note = _clear_stale_bbl(project_path, bib_files, doc_type)
+    return {
+        "success": True,
+        "bib_files": len(bib_files),
+        "warnings": warnings + ([note] if note else []),
+    }
+
+
+def _run_citation_style(project_path: Path, doc_type: str, options: dict) -> dict:
+    from .._mcp.handlers._citation_style import apply
+
+    return apply(str(project_path), doc_type)
+
+
+def _run_figures(project_path: Path, doc_type: str, options: dict) -> dict:
+    from .._mcp.handlers._figures_pipeline import process
+
+    return process(
+        str(project_path),
+        doc_type,
+        no_figs=options.get("no_figs", False),
+        pptx=options.get("pptx", False),
+        crop=options.get("crop", False),
+        draft=options.get("draft", False),
+    )
+
+
+def _run_tables(project_path: Path, doc_type: str, options: dict) -> dict:
+    from .._mcp.handlers._tables_pipeline import process
+
+    return process(
+        str(project_path), doc_type, no_tables=options.get("no_tables", False)
+    )
+
+
+def _run_wordcount(project_path: Path, doc_type: str, options: dict) -> dict:
+    from .._mcp.handlers._wordcount import count_words
+
+    return count_words(str(project_path), doc_type)
+
+
+DEFAULT_RUNNERS: Dict[str, StageRunner] = {
+    "bib": _run_bib,
+    "citation_style": _run_citation_style,
+    "figures": _run_figures,
+    "tables": _run_tables,
+    "wordcount": _run_wordcount,
+}
+
+
+def skip_stages_from_env() -> tuple:
+    """Stage names listed in ``SCITEX_WRITER_SKIP_STAGES`` (comma-separated)."""
+    raw = os.environ.get("SCITEX_WRITER_SKIP_STAGES", "")
+    return tuple(s.strip() for s in raw.split(",") if s.strip())
+
+
+def _timed(runner: StageRunner, project_path: Path, doc_type: str, options: dict):
+    started = time.perf_counter()
+    try:
+        result = runner(project_path, doc_type, options)
+    except Exception as e:
+        result = {"success": False, "error": f"{type(e).__name__}: {e}"}
+    return result, round(time.perf_counter() - started, 3)
+
+
+def _cached(
+    name: str,
+    runner: StageRunner,
+    project_path: Path,
+    doc_type: str,
+    options: dict,
+    cache: Optional[StageCache],
+    spec: Optional[StageSpec],
+):
+    """``(result, elapsed, cached)``: the recorded result on a hit, else a run."""
+    if cache is None or spec is None:
+        return (*_timed(runner, project_path, doc_type, options), False)
+    started = time.perf_counter()
+    try:
+        hit = cache.lookup(name, cache.key(name, spec, options))
+    except OSError:
+        hit = None
+    if hit is not None:
+        return hit, round(time.perf_counter() - started, 3), True
+    result, elapsed = _timed(runner, project_path, doc_type, options)
+    try:
+        if result.get("success"):
+            cache.store(name, spec, options, result)
+        else:
+            cache.forget(name)
+    except OSError:
+        cache.forget(name)
+    return result, elapsed, False
+
+
+def run_stages(
+    project_dir: Path,
+    doc_type: str = "manuscript",
+    stages: Optional[Iterable[str]] = None,
+    skip: Iterable[str] = (),
+    no_figs: bool = False,
+    no_tables: bool = False,
+    pptx: bool = False,
+    crop: bool = False,
+    draft: bool = False,
+    workers: int = 4,
+    runners: Optional[Dict[str, StageRunner]] = None,
+    cache: Optional[bool] = None,
+    specs: Optional[Dict[str, StageSpec]] = None,
+) -> dict:
+    """Run the asset stages for ``doc_type`` in this process, concurrently.
+
+    Args:
+        project_dir: Writer project root
+        doc_type: Document to prepare
+        stages: Stages to run (default: all of :data:`STAGES`)
+        skip: Stages whose previous outputs are current (``bib`` also skips
+            ``citation_style``); reported as skipped
+        no_figs / no_tables / pptx / crop / draft: Figure and table pipeline
+            options (``draft`` typesets downscaled figure proxies)
+        workers: Thread-pool size (1 runs the stages one after another)
+        runners: Stage name -> ``runner(project_path, doc_type, options)``;
+            defaults to :data:`DEFAULT_RUNNERS`. Exposed so callers and tests
+            can substitute stages without patching module internals.
+        cache: Reuse the results of stages whose inputs are unchanged
+            (default: on unless ``SCITEX_WRITER_STAGE_CACHE=0``)
+        specs: Stage name -> :class:`StageSpec` of the cached stages; defaults
+            to :data:`DEFAULT_SPECS` for the stages still on their default
+            runner (a substituted runner is not cached unless given a spec)
+
+    Returns:
+        ``{success, doc_type, elapsed, stages: {name: {success, skipped,
+        cached, elapsed, error, warnings, result}}}``; ``success`` is False
+        when any non-optional stage failed
+    """
+    project_path = Path(project_dir).resolve()
+    if specs is None:
+        specs = {
+            name: spec
+            for name, spec in DEFAULT_SPECS.items()
+            if name not in (runners or {})
+        }
+    if cache is None:
+        cache = cache_enabled_from_env()
+    stage_cache = StageCache(project_path, doc_type) if cache and specs else None
+    runners = {**DEFAULT_RUNNERS, **(runners or {})}
+    wanted = [s for s in STAGES if stages is None or s in set(stages)]
+    skipped = {name for s in skip for name in _SKIP_ALIASES.get(s, (s,))}
+    options = {
+        "no_figs": no_figs,
+        "no_tables": no_tables,
+        "pptx": pptx,
+        "crop": crop,
+        "draft": draft,
+    }
+
+    report: Dict[str, dict] = {}
+    started = time.perf_counter()
+
+    def record(name: str, result: dict, elapsed: float, cached: bool) -> None:
+        report[name] = {
+            "success": bool(result.get("success")),
+            "skipped": cached,
+            "cached": cached,
+            "elapsed": elapsed,
+            "error": result.get("error"),
+            "warnings": list(result.get("warnings") or []),
+            "result": result,
+        }
+
+    for name in wanted:
+        if name in skipped:
+            report[name] = {
+                "success": True,
+                "skipped": True,
+                "cached": False,
+                "elapsed": 0.0,
+                "error": None,
+                "warnings": [],
+                "result": {},
+            }
+    pending = [n for n in wanted if n not in report]
+
+    def launch(name: str):
+        spec = specs.get(name)
+        return _cached(
+            name, runners[name], project_path, doc_type, options, stage_cache, spec
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        first = [n for n in pending if n not in _AFTER]
+        futures = {n: pool.submit(launch, n) for n in first}
+        for name in first:
+            record(name, *futures[name].result())
+        for name in (n for n in pending if n in _AFTER):
+            record(name, *launch(name))
+    if stage_cache is not None:
+        try:
+            stage_cache.save()
+        except OSError:
+            pass  # a read-only project still compiles, just uncached
+
+    ordered = {name: report[name] for name in STAGES if name in report}
+    success = all(
+        r["success"] for name, r in ordered.items() if name not in OPTIONAL_STAGES
+    )
+    return {
+        "success": success,
+        "doc_type": doc_type,
+        "elapsed": round(time.perf_counter() - started, 3),
+        "stages": ordered,
+    }
+
+
+def _summary(name: str, result: dict) -> str:
+    if name == "figures":
+        if result.get("skipped"):
+            return "image processing skipped (--no-figs)"
+        return f"Compiled {result.get('figures_compiled', 0)} figures"
+    if name == "tables":
+        if result.get("skipped"):
+            return "skipped (--no-tables)"
+        return f"Compiled {result.get('tables_compiled', 0)} tables"
+    if name == "wordcount":
+        return f"Word counts updated (IMRaD total {result.get('total', 0)})"
+    if name == "citation_style":
+        return result.get("message") or ""
+    if name == "bib":
+        return f"{result.get('bib_files', 0)} bib file(s) merged"
+    return ""
+
+
+def format_report(report: dict) -> str:
+    """Human-readable lines in the compile scripts' ``  ✓`` / ``  ✗`` style."""
+    lines = []
+    for name, stage in report["stages"].items():
+        if stage.get("cached"):
+            summary = _summary(name, stage["result"])
+            lines.append(f"  ✓ {name}: inputs unchanged (cached) {summary}".rstrip())
+            continue
+        if stage["skipped"]:
+            lines.append(f"  ✓ {name}: unchanged since the last build (skipped)")
+            continue
+        if stage["success"]:
+            summary = _summary(name, stage["result"])
+            lines.append(f"  ✓ {name} ({stage['elapsed']:.2f}s) {summary}".rstrip())
+        elif name in OPTIONAL_STAGES:
+            lines.append(f"  ⚠ {name} ({stage['elapsed']:.2f}s) {stage['error']}")
+        else:
+            lines.append(f"  ✗ {name} ({stage['elapsed']:.2f}s) {stage['error']}")
+        lines.extend(f"  ⚠ {name}: {w}" for w in stage["warnings"])
+    return "\n".join(lines)
+
+
+__all__ = [
+    "DEFAULT_RUNNERS",
+    "OPTIONAL_STAGES",
+    "STAGES",
+    "format_report",
+    "run_stages",
+    "skip_stages_from_env",
+]
+
+# EOF
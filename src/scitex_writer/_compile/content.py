@@ -5,19 +5,42 @@
 
 """Content/preview compilation for LaTeX snippets.
 
-Compiles raw LaTeX content to PDF using the shell scripts layer:
-  scripts/python/tex_snippet2full.py → builds .tex document
-  scripts/shell/compile_content.sh → compiles to PDF via latexmk
+Two engines compile raw LaTeX content to PDF:
+
+- warm (default when pdflatex + mylatexformat are installed): the wrapper
+  document is built in-process and compiled against a cached precompiled
+  preamble in a reused scratch dir -- see ``_preview``.
+- cold (fallback): the shell scripts layer,
+    scripts/python/tex_snippet2full.py → builds .tex document
+    scripts/shell/compile_content.sh → compiles to PDF via latexmk
+  in a fresh temp dir per call.
+
+``SCITEX_WRITER_PREVIEW_ENGINE`` (``auto`` / ``warm`` / ``cold``) overrides
+the choice for callers that cannot pass ``engine=``.
 """
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 from typing import Literal, Optional
 
+import scitex_logging as slogging
+
 from .._dataclasses import CompilationResult
+from ._preview import (
+    COLD_TEMP_PREFIX,
+    PreviewFormatError,
+    build_document,
+    get_preview_engine,
+    sweep_stale_temp_dirs,
+    warm_engine_available,
+)
+
+logger = slogging.getLogger(__name__)
 
 
 def _get_scripts_dir(project_dir: Optional[str] = None) -> Path:
@@ -53,6 +76,7 @@ def compile_content(
     name: str = "content",
     timeout: int = 60,
     keep_aux: bool = False,
+    engine: Optional[Literal["auto", "warm", "cold"]] = None,
 ) -> CompilationResult:
     """Compile raw LaTeX content to PDF.
 
@@ -74,7 +98,12 @@ def compile_content(
     timeout : int
         Compilation timeout in seconds.
     keep_aux : bool
-        Keep auxiliary files after compilation.
+        Keep auxiliary files after compilation (cold engine; the warm engine
+        always keeps its scratch dir).
+    engine : str, optional
+        'warm', 'cold' or 'auto' (warm when its toolchain is installed).
+        Defaults to ``SCITEX_WRITER_PREVIEW_ENGINE``, else 'auto'. A preamble
+        that cannot be precompiled falls back to the cold engine.
 
     Returns
     -------
@@ -93,17 +122,38 @@ def compile_content(
         The Django consumer can serialize the dataclass via
         ``dataclasses.asdict(result)`` if a dict-shaped JSON payload is
         still required on the wire.
+
+        The warm engine returns ``temp_dir=None``: its scratch dir is
+        reused across calls and must not be removed by the caller.
     """
     # Sanitize name: strip .tex extension if present
     if name.endswith(".tex"):
         name = name[:-4]
+    engine = engine or os.environ.get("SCITEX_WRITER_PREVIEW_ENGINE", "auto")
+
+    # Temp dirs of earlier cold runs whose callers never removed them.
+    sweep_stale_temp_dirs()
 
+    temp_dir: Optional[Path] = None
     try:
         scripts_dir = _get_scripts_dir(project_dir)
+
+        if engine == "warm" or (engine == "auto" and warm_engine_available()):
+            document = build_document(latex_content, color_mode, scripts_dir)
+            preview_dir = None
+            if project_dir:
+                preview_dir = Path(project_dir).resolve() / ".preview"
+            try:
+                return get_preview_engine(project_dir).compile(
+                    document, name, color_mode, timeout, preview_dir=preview_dir
+                )
+            except PreviewFormatError as e:
+                logger.info(f"Warm preview unavailable for {name}: {e}")
+
         doc_builder = scripts_dir / "python" / "tex_snippet2full.py"
         compiler = scripts_dir / "shell" / "compile_content.sh"
 
-        temp_dir = Path(tempfile.mkdtemp(prefix=f"scitex_content_{name}_"))
+        temp_dir = Path(tempfile.mkdtemp(prefix=f"{COLD_TEMP_PREFIX}{name}_"))
         body_file = temp_dir / "body.tex"
         tex_file = temp_dir / f"{name}.tex"
         pdf_file = temp_dir / f"{name}.pdf"
@@ -211,6 +261,7 @@ def compile_content(
         )
 
     except subprocess.TimeoutExpired:
+        _remove(temp_dir)
         # exit_code 124 is the POSIX `timeout(1)` convention; preserves
         # caller's ability to distinguish "took too long" from "latexmk
         # rejected the source" (which surfaces as 1 / 12 etc.).
@@ -226,6 +277,7 @@ def compile_content(
             message=f"Content compilation timed out after {timeout} seconds",
         )
     except Exception as e:
+        _remove(temp_dir)
         # exit_code -1 = our own internal error wrapper, never produced
         # by latexmk or `timeout`. Lets the Django view branch on
         # `exit_code == -1` to render "internal error, retry" rather
@@ -243,6 +295,12 @@ def compile_content(
         )
 
 
+def _remove(temp_dir: Optional[Path]) -> None:
+    """Remove a temp dir the result will not hand to the caller."""
+    if temp_dir is not None:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def _truncate(text: str, limit: int = 2000) -> str:
     """Truncate text to limit. Used for stdout/stderr capture so the
     CompilationResult never carries multi-MB blobs through the Django
@@ -25,9 +25,14 @@ _ENGINE_BINARIES: dict[str, tuple[str, tuple[str, ...]]] = {
     "tectonic": ("Tectonic (Reproducible, 4-5s per compile)", ("tectonic",)),
     "latexmk": ("latexmk (Smart incremental, 3s)", ("latexmk", "pdflatex")),
     "3pass": ("3-pass (Guaranteed correctness, 6-7s)", ("pdflatex", "bibtex")),
+    "fmt": (
+        "Precompiled preamble (3-pass from a cached .fmt)",
+        ("pdflatex", "bibtex", "kpsewhich"),
+    ),
 }
 
 #: Default auto-detect priority order (fastest-for-dev first, guaranteed last).
+#: ``fmt`` is opt-in only: it is never picked by auto-detection.
 DEFAULT_AUTO_ORDER: tuple[str, ...] = ("latexmk", "tectonic", "3pass")
 
 #: Regex to pull a dotted version number out of a `--version`/`-version` banner.
@@ -35,9 +40,16 @@ _VERSION_RE = re.compile(r"\d+\.\d+(?:\.\d+)?")
 
 
 def verify_engine(engine: str) -> bool:
-    """True if every binary ``engine`` needs is on ``PATH``."""
+    """True if every binary ``engine`` needs is on ``PATH`` (and, for ``fmt``,
+    ``mylatexformat.ltx`` is installed to dump the preamble with)."""
     binaries = _ENGINE_BINARIES.get(engine, (None, ()))[1]
-    return bool(binaries) and all(shutil.which(b) for b in binaries)
+    if not (bool(binaries) and all(shutil.which(b) for b in binaries)):
+        return False
+    if engine == "fmt":
+        from .._compile._preview import warm_engine_available
+
+        return warm_engine_available()
+    return True
 
 
 def auto_detect_engine(order: tuple[str, ...] | None = None) -> str:
@@ -60,9 +72,10 @@ def get_engine_info(engine: str) -> str:
 
 def get_engine_version(engine: str) -> str | None:
     """The installed version string for ``engine``, or None if unavailable /
-    unparseable. ``3pass`` has no single version (it's pdflatex+bibtex) so it
-    reports the fixed token ``"native"``, matching the shell source."""
-    if engine == "3pass":
+    unparseable. ``3pass`` and ``fmt`` have no single version (they're
+    pdflatex+bibtex) so they report the fixed token ``"native"``, matching the
+    shell source."""
+    if engine in ("3pass", "fmt"):
         return "native" if verify_engine(engine) else None
     binary = {"tectonic": "tectonic", "latexmk": "latexmk"}.get(engine)
     if not binary or not shutil.which(binary):
@@ -80,7 +93,8 @@ def get_engine_version(engine: str) -> str | None:
 
 def list_available_engines() -> list[dict]:
     """Availability + version + description for every known engine, in the
-    canonical order (tectonic, latexmk, 3pass -- the shell source's order)."""
+    canonical order (tectonic, latexmk, 3pass, fmt -- the shell source's
+    order)."""
     return [
         {
             "engine": engine,
@@ -88,7 +102,7 @@ def list_available_engines() -> list[dict]:
             "version": get_engine_version(engine),
             "info": get_engine_info(engine),
         }
-        for engine in ("tectonic", "latexmk", "3pass")
+        for engine in ("tectonic", "latexmk", "3pass", "fmt")
     ]
 
 
@@ -10,7 +10,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from ..._compile._capture import CapturedOutput
 
 
 @dataclass
@@ -73,6 +76,30 @@ class CompilationResult:
     string without re-deriving it from ``success`` + ``exit_code``.
     """
 
+    queue_wait: Optional[float] = None
+    """Seconds the job waited in the compile scheduler before a worker took it.
+
+    Set only when the compile went through ``_compile._scheduler`` (the async
+    compile path); direct synchronous calls leave it as None.
+    """
+
+    run_time: Optional[float] = None
+    """Seconds the scheduler's worker spent executing the job.
+
+    Unlike ``duration`` (measured inside ``run_compile``), this covers the whole
+    scheduled call. None outside the scheduler, like ``queue_wait``.
+    """
+
+    stdout_log: Optional["CapturedOutput"] = None
+    """Handle on the full stdout when it was spilled to disk.
+
+    Set only in spill mode (``run_compile(capture_tail_bytes=...)`` or
+    ``SCITEX_WRITER_CAPTURE_TAIL_KB``), where ``stdout`` holds just the tail.
+    """
+
+    stderr_log: Optional["CapturedOutput"] = None
+    """Handle on the full stderr when it was spilled to disk (see ``stdout_log``)."""
+
     def __str__(self):
         """Human-readable summary."""
         status = "SUCCESS" if self.success else "FAILED"
@@ -80,6 +107,8 @@ class CompilationResult:
             f"Compilation {status} (exit code: {self.exit_code})",
             f"Duration: {self.duration:.2f}s",
         ]
+        if self.queue_wait is not None:
+            lines.append(f"Queue wait: {self.queue_wait:.2f}s")
         if self.output_pdf:
             lines.append(f"Output: {self.output_pdf}")
         if self.errors:
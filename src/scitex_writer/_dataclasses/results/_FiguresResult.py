@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -42,6 +42,9 @@ class FiguresResult:
     converted: int = 0
     """Number of format conversions performed (TIF->PNG, MMD->PNG, PNG->JPG)."""
 
+    conversion_timings: Dict[str, float] = field(default_factory=dict)
+    """Seconds spent converting each figure (by stem) that needed conversion."""
+
     composed: int = 0
     """Number of multi-panel figures tiled into a single composite image."""
 
@@ -51,6 +54,9 @@ class FiguresResult:
     cropped: int = 0
     """Number of compilation JPGs whose uniform border was trimmed."""
 
+    draft_proxies: int = 0
+    """Number of downscaled draft proxies (re)written (draft runs only)."""
+
     figures: List[dict] = field(default_factory=list)
     """Per-figure outcomes, ordered by figure number."""
 
@@ -66,6 +72,9 @@ class FiguresResult:
     skipped: bool = False
     """True when image processing was skipped (the shell's ``--no_figs``)."""
 
+    draft: bool = False
+    """True when FINAL.tex points at the draft proxies, not the full JPGs."""
+
     warnings: List[str] = field(default_factory=list)
     """Non-fatal findings surfaced to the caller instead of echoed and lost."""
 
@@ -81,6 +90,7 @@ class FiguresResult:
         "composed",
         "placeholders_created",
         "cropped",
+        "draft_proxies",
     )
 
     def to_dict(self) -> dict:
@@ -92,14 +102,17 @@ class FiguresResult:
             "panel_captions_removed": self.panel_captions_removed,
             "renamed_panels": self.renamed_panels,
             "converted": self.converted,
+            "conversion_timings": self.conversion_timings,
             "composed": self.composed,
             "placeholders_created": self.placeholders_created,
             "cropped": self.cropped,
+            "draft_proxies": self.draft_proxies,
             "figures": self.figures,
             "compiled_file": self.compiled_file,
             "figures_enabled": self.figures_enabled,
             "fallback_header": self.fallback_header,
             "skipped": self.skipped,
+            "draft": self.draft,
             "warnings": self.warnings,
             "error": self.error,
         }
@@ -134,12 +147,15 @@ class FiguresResult:
             return "Figures: skipped (--no-figs)"
         if self.fallback_header:
             return "Figures: none found -- comment-only fallback header emitted"
-        return (
+        summary = (
             f"Figures: compiled={self.figures_compiled}, "
             f"captions_created={self.captions_created}, "
             f"converted={self.converted}, composed={self.composed}, "
             f"placeholders={self.placeholders_created}"
         )
+        if self.draft:
+            summary += f", draft_proxies={self.draft_proxies}"
+        return summary
 
 
 __all__ = ["FiguresResult"]
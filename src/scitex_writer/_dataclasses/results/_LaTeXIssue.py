@@ -9,6 +9,7 @@ LaTeXIssue - dataclass for LaTeX compilation issues.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -17,9 +18,16 @@ class LaTeXIssue:
 
     type: str  # 'error' or 'warning'
     message: str
+    file: Optional[str] = None  # innermost open file when it was reported
+    line: Optional[int] = None  # source line, when the log states one
+    category: Optional[str] = None  # e.g. 'undefined_reference', 'badbox'
 
     def __str__(self) -> str:
         """Human-readable string representation."""
+        if self.file and self.line is not None:
+            return f"{self.type.upper()}: {self.file}:{self.line}: {self.message}"
+        if self.file:
+            return f"{self.type.upper()}: {self.file}: {self.message}"
         return f"{self.type.upper()}: {self.message}"
 
 
@@ -16,7 +16,8 @@ class TablesResult:
 
     Counts are what ACTUALLY happened during this run, never a request total, and
     are never negative. ``tables`` carries one entry per compiled table
-    (``{name, csv, tex, rows, columns, truncated, caption_generated}``).
+    (``{name, csv, tex, rows, columns, truncated, longtable,
+    caption_generated}``).
     ``fallback_header`` is True when NO real table existed and the comment-only
     ``00_Tables_Header.tex`` was emitted instead (it renders no table float).
     """
@@ -35,7 +35,13 @@ class WordCountResult:
     """IMRaD word total (introduction+methods+results+discussion)."""
 
     output_files: List[str] = field(default_factory=list)
-    """Absolute paths of the per-key count files written (one integer each)."""
+    """Absolute paths of the per-key count files (one integer each)."""
+
+    changed_files: List[str] = field(default_factory=list)
+    """Count files rewritten by this run (their value changed or was absent)."""
+
+    texcount_runs: int = 0
+    """Sections counted by texcount this run; the rest came from the cache."""
 
     error: Optional[str] = None
     """Actionable error message when ``success`` is False; else None."""
@@ -48,6 +54,8 @@ class WordCountResult:
             "counts": self.counts,
             "total": self.total,
             "output_files": self.output_files,
+            "changed_files": self.changed_files,
+            "texcount_runs": self.texcount_runs,
             "error": self.error,
         }
 
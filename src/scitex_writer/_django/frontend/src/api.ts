@@ -14,6 +14,11 @@ function withWd(url: string): string {
   return `${url}${sep}working_dir=${encodeURIComponent(PROJECT_DIR)}`;
 }
 
+/** Absolute URL for an endpoint (for EventSource, which cannot use fetch). */
+export function apiUrl(endpoint: string): string {
+  return withWd(API_BASE + endpoint);
+}
+
 export async function apiGet<T>(endpoint: string): Promise<T> {
   const url = withWd(API_BASE + endpoint);
   const response = await fetch(url);
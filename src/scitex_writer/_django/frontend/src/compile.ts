@@ -1,9 +1,10 @@
 /**
- * Compile workflow — POST /api/compile, poll /api/compile/status, load PDF.
+ * Compile workflow — POST /api/compile, follow /api/compile/events (SSE) or
+ * poll /api/compile/status as a fallback, load PDF.
  * Status lamp (green/yellow/red), log drawer, preview-full toggle.
  */
 
-import { apiPost, apiGet } from "./api";
+import { apiPost, apiGet, apiUrl } from "./api";
 import type { PDFViewer } from "./pdf-viewer";
 
 export type CompileMode = "preview" | "full";
@@ -13,6 +14,25 @@ interface CompileStatusResponse {
   compiling: boolean;
   result: { success?: boolean; error?: string; log?: string } | null;
   log: string;
+  /** Newest accepted request. */
+  generation: number;
+  /** Last request whose build has finished. */
+  built_generation: number;
+  /** Request waiting behind the running build (null when clean). */
+  queued_generation: number | null;
+  /** Sequence number of the newest compile event. */
+  last_seq: number;
+}
+
+interface CompileEventData {
+  seq: number;
+  type: string;
+  data: Record<string, unknown>;
+}
+
+interface CompileStartResponse {
+  status: "started" | "queued";
+  generation: number;
 }
 
 interface CompileOptions {
@@ -33,7 +53,10 @@ export class CompileController {
   private opts: CompileOptions;
   private mode: CompileMode = "preview";
   private polling: number | null = null;
+  private events: EventSource | null = null;
   private status: LampStatus = "idle";
+  /** Generation of our newest request; done once built_generation >= it. */
+  private targetGeneration = 0;
   private afterCompileListeners: Array<(success: boolean) => void> = [];
 
   /** Subscribe to "compile finished" (success or error). */
@@ -68,18 +91,31 @@ export class CompileController {
   }
 
   async compile(): Promise<void> {
-    if (this.status === "compiling") return;
+    // No client-side guard: a request during a running build is coalesced
+    // by the server into one follow-up build ("compile latest").
     const docType = this.opts.getDocType();
+    if (this.status !== "compiling") this.setLog("");
     this.updateLamp("compiling");
-    this.setLog("");
     try {
+      // Subscribe from the current sequence number BEFORE posting, so no
+      // event of our build can be missed.
+      if (!this.events && typeof EventSource !== "undefined") {
+        const status = await apiGet<CompileStatusResponse>(
+          "api/compile/status?log=0",
+        );
+        this.streamEvents(docType, status.last_seq ?? 0);
+      }
       const { effectivePdfDarkMode } = await import("./pdf-theme");
-      await apiPost("api/compile", {
+      const started = await apiPost<CompileStartResponse>("api/compile", {
         doc_type: docType,
         draft: this.mode === "preview",
         dark_mode: effectivePdfDarkMode(),
       });
-      this.pollStatus(docType);
+      this.targetGeneration = Math.max(
+        this.targetGeneration,
+        started.generation ?? 0,
+      );
+      if (!this.events) this.pollStatus(docType);
     } catch (err) {
       this.setLog(String(err));
       this.updateLamp("error");
@@ -93,25 +129,16 @@ export class CompileController {
         const status =
           await apiGet<CompileStatusResponse>("api/compile/status");
         if (status.log) this.setLog(status.log);
-        if (status.compiling) {
-          this.polling = window.setTimeout(tick, 800);
+        const pending =
+          (status.built_generation ?? 0) < this.targetGeneration;
+        if (status.compiling && pending) {
+          // Back off while a follow-up build is queued behind the current
+          // one: nothing we render now can be the final result.
+          const delay = status.queued_generation !== null ? 1600 : 800;
+          this.polling = window.setTimeout(tick, delay);
           return;
         }
-        const success = status.result?.success ?? false;
-        this.updateLamp(success ? "ok" : "error");
-        if (success) {
-          await this.opts.pdf.load(docType);
-        } else if (status.result?.error) {
-          this.setLog(status.result.error);
-          this.setLogOpen(true);
-        }
-        for (const cb of this.afterCompileListeners) {
-          try {
-            cb(success);
-          } catch (err) {
-            console.error("[compile] afterCompile listener failed", err);
-          }
-        }
+        await this.finish(docType, status);
       } catch (err) {
         this.setLog(String(err));
         this.updateLamp("error");
@@ -120,6 +147,83 @@ export class CompileController {
     this.polling = window.setTimeout(tick, 400);
   }
 
+  /**
+   * Follow the server's event stream: log lines are appended as they
+   * arrive (no full-log re-download per tick) and the build is finished on
+   * the `build_end` of our target generation. The browser reconnects with
+   * Last-Event-ID on its own, so dropped connections resume losslessly.
+   */
+  private streamEvents(docType: string, since: number): void {
+    const source = new EventSource(
+      apiUrl(`api/compile/events?stream=1&since=${since}`),
+    );
+    this.events = source;
+    const parse = (msg: MessageEvent): CompileEventData =>
+      JSON.parse(msg.data as string) as CompileEventData;
+
+    source.addEventListener("build_start", () => {
+      if (this.status === "compiling") this.setLog("");
+    });
+    source.addEventListener("log", (msg) => {
+      this.appendLog(String(parse(msg as MessageEvent).data.line ?? ""));
+    });
+    source.addEventListener("progress", (msg) => {
+      const percent = parse(msg as MessageEvent).data.percent;
+      if (this.opts.lamp && this.status === "compiling") {
+        this.opts.lamp.title = `Compiling… ${percent}%`;
+      }
+    });
+    source.addEventListener("build_end", (msg) => {
+      const generation = Number(parse(msg as MessageEvent).data.generation);
+      if (generation < this.targetGeneration) return;
+      this.closeEvents();
+      void apiGet<CompileStatusResponse>("api/compile/status?log=0")
+        .then((status) => this.finish(docType, status))
+        .catch((err) => {
+          this.setLog(String(err));
+          this.updateLamp("error");
+        });
+    });
+    source.addEventListener("truncated", () => {
+      // The bounded server buffer dropped events we never saw: fall back
+      // to one full-log poll cycle.
+      this.closeEvents();
+      this.pollStatus(docType);
+    });
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        this.closeEvents();
+        if (this.status === "compiling") this.pollStatus(docType);
+      }
+    };
+  }
+
+  private closeEvents(): void {
+    this.events?.close();
+    this.events = null;
+  }
+
+  private async finish(
+    docType: string,
+    status: CompileStatusResponse,
+  ): Promise<void> {
+    const success = status.result?.success ?? false;
+    this.updateLamp(success ? "ok" : "error");
+    if (success) {
+      await this.opts.pdf.load(docType);
+    } else if (status.result?.error) {
+      this.setLog(status.result.error);
+      this.setLogOpen(true);
+    }
+    for (const cb of this.afterCompileListeners) {
+      try {
+        cb(success);
+      } catch (err) {
+        console.error("[compile] afterCompile listener failed", err);
+      }
+    }
+  }
+
   private updateLamp(status: LampStatus): void {
     this.status = status;
     const lamp = this.opts.lamp;
@@ -142,6 +246,10 @@ export class CompileController {
     if (this.opts.logContent) this.opts.logContent.textContent = text;
   }
 
+  private appendLog(line: string): void {
+    this.opts.logContent?.appendChild(document.createTextNode(line + "\n"));
+  }
+
   private setLogOpen(open: boolean): void {
     this.opts.logPanel?.classList.toggle("u-hidden", !open);
   }
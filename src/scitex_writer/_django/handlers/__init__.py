@@ -12,10 +12,15 @@ from .claim import (
     handle_remove_claim,
     handle_render_claims,
 )
-from .compile import handle_compile, handle_compile_status, handle_pdf
+from .compile import (
+    handle_compile,
+    handle_compile_events,
+    handle_compile_status,
+    handle_pdf,
+)
 from .core import handle_ping, handle_project_info
 from .files import handle_file, handle_list_files, handle_sections
-from .hints import handle_hints
+from .hints import handle_hints, handle_index
 from .media import handle_figures, handle_tables, handle_thumbnail
 from .scholar import (
     handle_scholar_add_to_manuscript,
@@ -43,6 +48,7 @@ HANDLERS = {
     # Compile
     "api/compile":            (handle_compile,        ("POST",)),
     "api/compile/status":     (handle_compile_status, ("GET",)),
+    "api/compile/events":     (handle_compile_events, ("GET",)),
     "api/pdf":                (handle_pdf,            ("GET",)),
 
     # Bibliography
@@ -60,6 +66,7 @@ HANDLERS = {
 
     # Manuscript hints feed (dynamic-paper inline hints)
     "api/hints":              (handle_hints,          ("GET",)),
+    "api/index":              (handle_index,          ("GET",)),
 
     # Scholar bridge (optional; degrades when scitex-scholar absent)
     "api/scholar/status":            (handle_scholar_status,            ("GET",)),
@@ -85,6 +92,7 @@ __all__ = [
     "handle_claim_chain",
     "handle_get_claim",
     "handle_hints",
+    "handle_index",
     "handle_list_claims",
     "handle_remove_claim",
 ]
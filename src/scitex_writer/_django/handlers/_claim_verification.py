@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_django/handlers/_claim_verification.py
+"""Cached, batched claim verification for the claims-metadata endpoint.
+
+Verifying a claim goes through Clew (``verify_claim`` / ``verify_chain``),
+which re-hashes the claim's chain on every call. ``handle_claims_metadata``
+used to do that serially for every claim on every request, so a 50-claim
+manuscript took seconds to open its Details pane and recomputed the same
+verdicts on each refresh.
+
+A :class:`ClaimVerificationCache` (one per ``ProjectState``) keeps each
+claim's last verdict under a fingerprint of what it was computed from: the
+claim's pointers (``output_file``, ``session_id``), its rendered value and
+the SHA-256 of the ``output_file`` content. On a request:
+
+- a claim never seen, or whose fingerprint changed, is a miss: the misses are
+  verified together on a shared thread pool and the request waits for them;
+- a hit is returned as is; when it is older than the TTL (the
+  chain's upstream files are not in the fingerprint) it is also re-verified
+  in the background and the next request sees the new verdict.
+
+A state of ``"ERROR"`` is never trusted as fresh. File hashes are memoized by
+``(size, mtime_ns)``, so a fingerprint costs a stat per claim, not a re-read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import scitex_logging as slogging
+
+logger = slogging.getLogger(__name__)
+
+_STATE_TTL_SECONDS = 60.0
+# Verification is mostly file I/O and hashing (which releases the GIL): size
+# the pool like ThreadPoolExecutor's default, capped.
+_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _executor() -> ThreadPoolExecutor:
+    """The thread pool shared by every project's verifications."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="claim-verify"
+            )
+        return _pool
+
+
+class _Entry(NamedTuple):
+    fingerprint: str
+    state: dict
+    verified_at: float
+
+
+class ClaimVerificationCache:
+    """Last verification state of each claim of one project.
+
+    Args:
+        roots: Directories a claim's relative ``output_file`` is resolved
+            against, in order (see ``_claim_path_roots``).
+        ttl: Seconds after which a verdict is re-verified in the background.
+    """
+
+    def __init__(self, roots: Iterable[Path], ttl: float = _STATE_TTL_SECONDS):
+        self.roots = [Path(root) for root in roots]
+        self.ttl = ttl
+        self.verifications = 0  # verifier calls, for tests and benchmarks
+        # Re-entrant: a future that is already done runs its callback in the
+        # submitting thread, which holds the lock.
+        self._lock = threading.RLock()
+        self._settled = threading.Condition(self._lock)
+        self._entries: Dict[str, _Entry] = {}
+        self._inflight: Dict[str, tuple] = {}  # claim_id -> (fingerprint, Future)
+        self._digests: Dict[str, tuple] = {}  # path -> (size, mtime_ns, sha)
+
+    def _digest(self, output_file: Optional[str]) -> Optional[str]:
+        if not output_file:
+            return None
+        candidate = Path(output_file)
+        paths = (
+            [candidate]
+            if candidate.is_absolute()
+            else [root / candidate for root in self.roots]
+        )
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = str(path)
+            with self._lock:
+                memo = self._digests.get(key)
+            if memo is not None and memo[:2] == (st.st_size, st.st_mtime_ns):
+                return memo[2]
+            try:
+                sha = _sha256_file(path)
+            except OSError:
+                return None
+            with self._lock:
+                self._digests[key] = (st.st_size, st.st_mtime_ns, sha)
+            return sha
+        return None
+
+    def fingerprint(self, claim: dict) -> str:
+        """What a verdict for ``claim`` depends on, as one hex digest."""
+        output_file = claim.get("output_file")
+        basis = [
+            output_file,
+            claim.get("session_id"),
+            claim.get("preview_nature"),
+            self._digest(output_file),
+        ]
+        return hashlib.sha256(json.dumps(basis).encode("utf-8")).hexdigest()
+
+    def _submit(
+        self, claim: dict, fingerprint: str, verify: Callable[[dict], dict]
+    ) -> Future:
+        """Verify ``claim`` on the pool, or join a run for the same fingerprint.
+
+        Called with ``self._lock`` held.
+        """
+        claim_id = claim["claim_id"]
+        running = self._inflight.get(claim_id)
+        if running is not None and running[0] == fingerprint:
+            return running[1]
+        started = time.monotonic()
+
+        def run() -> dict:
+            with self._lock:
+                self.verifications += 1
+            return verify(claim)
+
+        future = _executor().submit(run)
+        self._inflight[claim_id] = (fingerprint, future)
+
+        def done(finished: Future) -> None:
+            with self._lock:
+                if self._inflight.get(claim_id, (None, None))[1] is finished:
+                    del self._inflight[claim_id]
+                self._settled.notify_all()
+                if finished.cancelled():
+                    return
+                if finished.exception() is not None:
+                    # A miss re-raises this in the request; a background
+                    # refresh has no caller, so say so here.
+                    logger.error(
+                        "[viewer] claim verification of %s failed",
+                        claim_id,
+                        exc_info=finished.exception(),
+                    )
+                    return
+                current = self._entries.get(claim_id)
+                if current is not None and current.verified_at > started:
+                    return  # a newer run already landed
+                state = finished.result()
+                # An ERROR is a failed attempt, not a verdict: keep it visible
+                # but stale, so the next request tries again.
+                verified_at = float("-inf")
+                if state.get("state") != "ERROR":
+                    verified_at = time.monotonic()
+                self._entries[claim_id] = _Entry(fingerprint, state, verified_at)
+
+        future.add_done_callback(done)
+        return future
+
+    def states(
+        self,
+        claims: List[dict],
+        verify: Callable[[dict], dict],
+        force: bool = False,
+    ) -> Dict[str, dict]:
+        """Verification state of each claim, by claim id.
+
+        Misses (and every claim when ``force``) are verified in parallel before
+        returning; stale hits are returned and re-verified in the background.
+        An exception raised by ``verify`` for a miss propagates.
+        """
+        now = time.monotonic()
+        fingerprints = {c["claim_id"]: self.fingerprint(c) for c in claims}
+        out: Dict[str, dict] = {}
+        waiting: Dict[str, Future] = {}
+        with self._lock:
+            for claim_id in set(self._entries) - set(fingerprints):
+                del self._entries[claim_id]  # removed from claims.json
+            for claim in claims:
+                claim_id = claim["claim_id"]
+                fingerprint = fingerprints[claim_id]
+                entry = self._entries.get(claim_id)
+                if force or entry is None or entry.fingerprint != fingerprint:
+                    waiting[claim_id] = self._submit(claim, fingerprint, verify)
+                    continue
+                out[claim_id] = entry.state
+                if now - entry.verified_at >= self.ttl:
+                    self._submit(claim, fingerprint, verify)
+        for claim_id, future in waiting.items():
+            out[claim_id] = future.result()
+        return out
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until no verification is running and its result is stored.
+
+        Returns False if ``timeout`` seconds passed first.
+        """
+        with self._settled:
+            return self._settled.wait_for(lambda: not self._inflight, timeout)
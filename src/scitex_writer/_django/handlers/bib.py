@@ -9,6 +9,7 @@ import re
 from django.http import JsonResponse
 
 from scitex_writer._ports import scholar as _scholar
+from scitex_writer._utils._bib_index import get_bib_index
 
 
 def handle_bib_files(request, project):
@@ -17,14 +18,13 @@ def handle_bib_files(request, project):
         return JsonResponse({"files": [], "count": 0})
 
     files = []
-    for bib_file in sorted(bib_dir.glob("*.bib")):
-        content = bib_file.read_text(encoding="utf-8")
+    for name, entry_count in get_bib_index(bib_dir).files():
         files.append(
             {
-                "name": bib_file.name,
-                "path": str(bib_file.relative_to(project.project_dir)),
-                "entry_count": content.count("@"),
-                "is_merged": bib_file.name == "bibliography.bib",
+                "name": name,
+                "path": str((bib_dir / name).relative_to(project.project_dir)),
+                "entry_count": entry_count,
+                "is_merged": name == "bibliography.bib",
             }
         )
     return JsonResponse({"files": files, "count": len(files)})
@@ -1,21 +1,49 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Compilation and PDF serving handlers."""
+"""Compilation and PDF serving handlers.
+
+Compiles are debounced "compile latest": a request that arrives while a build
+is running does not get a 409 -- it marks the project dirty (latest options
+win) and is answered with its generation number. When the running build ends,
+exactly ONE follow-up build runs if the project is dirty, covering every
+request that arrived meanwhile. An autosave burst therefore costs at most one
+wasted build, and the PDF always ends up reflecting the last request.
+
+Progress reaches the browser as typed, seq-numbered events (see
+``scitex_writer._compile._events``) over ``/api/compile/events`` -- only the
+delta after the client's last seen seq, never the whole log again.
+"""
 
 from __future__ import annotations
 
 import json
 import threading
+import time
+
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
 
-from django.http import FileResponse, JsonResponse
+from scitex_writer._compile._events import count_stages, events_to_dicts, format_sse
+
+_SSE_MAX_SECONDS = 60
+"""An SSE response ends after this long; EventSource reconnects with
+``Last-Event-ID`` and resumes, so a worker thread is never pinned forever."""
+
+_SSE_KEEPALIVE_SECONDS = 15
+_MAX_WAIT_SECONDS = 30
 
 
 def _do_compile(project, doc_type: str, draft: bool, dark_mode: bool) -> None:
     from scitex_writer import compile as sw_compile
 
     project_str = str(project.project_dir)
-    kwargs = {"draft": draft, "dark_mode": dark_mode, "quiet": True}
+    script = project.project_dir / "scripts" / "shell" / f"compile_{doc_type}.sh"
     try:
+        kwargs = {
+            "draft": draft,
+            "dark_mode": dark_mode,
+            "quiet": True,
+            "log_callback": project._compile_events.line_callback(count_stages(script)),
+        }
         if doc_type == "manuscript":
             result = sw_compile.manuscript(project_str, **kwargs)
         elif doc_type == "supplementary":
@@ -33,15 +61,56 @@ def _do_compile(project, doc_type: str, draft: bool, dark_mode: bool) -> None:
     except Exception as exc:
         project._compile_result = {"success": False, "error": str(exc)}
         project._compile_log = str(exc)
-    finally:
-        project._compiling = False
+
+
+def _compile_loop(project, options: dict, compile_fn=None) -> None:
+    """Run builds until the project is clean; owns `project._compiling`.
+
+    ``compile_fn`` (default :func:`_do_compile`) is the per-build worker,
+    exposed so tests can drive the loop without a LaTeX toolchain.
+    """
+    compile_fn = compile_fn or _do_compile
+    events = project._compile_events
+    while True:
+        events.emit(
+            "build_start",
+            generation=project._running_generation,
+            doc_type=options.get("doc_type"),
+        )
+        try:
+            compile_fn(project, **options)
+        except Exception as exc:
+            # A build that raises is a failed build, not the end of the loop:
+            # escaping here would leave `_compiling` set and drop the pending
+            # follow-up, so every later request would queue behind nothing.
+            project._compile_result = {"success": False, "error": str(exc)}
+            project._compile_log = str(exc)
+        result = project._compile_result
+        if isinstance(result, dict):
+            success = bool(result.get("success"))
+        else:
+            success = bool(getattr(result, "success", False))
+        if success:
+            events.emit("progress", percent=100)
+        events.emit(
+            "build_end", generation=project._running_generation, success=success
+        )
+        with project._lock:
+            project._built_generation = project._running_generation
+            options = project._compile_pending
+            project._compile_pending = None
+            if options is None:
+                project._compiling = False
+                return
+            project._running_generation = project._compile_generation
+            # The follow-up must not report the previous build's outcome.
+            project._compile_log = ""
+            project._compile_result = None
 
 
 def handle_compile(request, project):
     if request.method != "POST":
         return JsonResponse({"error": "POST required"}, status=405)
-    if project._compiling:
-        return JsonResponse({"error": "Compilation already in progress"}, status=409)
 
     try:
         data = json.loads(request.body) if request.body else {}
@@ -49,34 +118,127 @@ def handle_compile(request, project):
         data = {}
 
     doc_type = data.get("doc_type", "manuscript")
+    # The editor's "Preview" mode: a single-pass compile that typesets
+    # downscaled, cached figure proxies instead of the full-resolution JPGs.
     draft = bool(data.get("draft", False))
     # Dark mode from request body (current UI theme) falls back to
     # ProjectState.dark_mode which is persisted per-project.
     dark_mode = bool(data.get("dark_mode", project.dark_mode))
     project.dark_mode = dark_mode
+    options = {"doc_type": doc_type, "draft": draft, "dark_mode": dark_mode}
 
-    project._compiling = True
-    project._compile_log = ""
-    project._compile_result = None
+    with project._lock:
+        project._compile_generation += 1
+        generation = project._compile_generation
+        if project._compiling:
+            # Dirty flag: the running build's loop picks this up when it ends.
+            project._compile_pending = options
+            return JsonResponse(
+                {
+                    "status": "queued",
+                    "doc_type": doc_type,
+                    "dark_mode": dark_mode,
+                    "generation": generation,
+                },
+                status=202,
+            )
+        project._compiling = True
+        project._running_generation = generation
+        project._compile_log = ""
+        project._compile_result = None
 
     thread = threading.Thread(
-        target=_do_compile,
-        args=(project, doc_type, draft, dark_mode),
+        target=_compile_loop,
+        args=(project, options),
         daemon=True,
     )
     thread.start()
 
     return JsonResponse(
-        {"status": "started", "doc_type": doc_type, "dark_mode": dark_mode}
+        {
+            "status": "started",
+            "doc_type": doc_type,
+            "dark_mode": dark_mode,
+            "generation": generation,
+        }
     )
 
 
 def handle_compile_status(request, project):
+    # `?log=0` omits the accumulated log: streaming clients already have it.
+    include_log = request.GET.get("log", "1") not in ("0", "false")
+    with project._lock:
+        queued = project._compile_generation if project._compile_pending else None
+        return JsonResponse(
+            {
+                "compiling": project._compiling,
+                "result": project._compile_result,
+                **({"log": project._compile_log} if include_log else {}),
+                "last_seq": project._compile_events.last_seq,
+                # The newest accepted request, the one the running build
+                # covers, the last one finished, and the one waiting behind
+                # the running build (None when clean). A client that got
+                # generation N back is done once built_generation >= N.
+                "generation": project._compile_generation,
+                "running_generation": (
+                    project._running_generation if project._compiling else None
+                ),
+                "built_generation": project._built_generation,
+                "queued_generation": queued,
+            }
+        )
+
+
+def _sse_stream(events, since: int):
+    """Yield SSE frames after ``since`` until ``_SSE_MAX_SECONDS`` elapse."""
+    deadline = time.monotonic() + _SSE_MAX_SECONDS
+    yield "retry: 1000\n\n"
+    while time.monotonic() < deadline:
+        page = events.since(since, timeout=_SSE_KEEPALIVE_SECONDS)
+        if page["truncated"]:
+            yield f"event: truncated\ndata: {json.dumps({'since': since})}\n\n"
+        if not page["events"]:
+            yield ": keepalive\n\n"
+            continue
+        for event in page["events"]:
+            yield format_sse(event)
+        since = page["events"][-1].seq
+
+
+def handle_compile_events(request, project):
+    """Compile events after a sequence number, as SSE or as one JSON page.
+
+    The resume point is the ``Last-Event-ID`` header (sent automatically by a
+    reconnecting EventSource) or ``?since=<seq>``. ``?stream=1`` (or an
+    ``Accept: text/event-stream`` header) selects SSE; otherwise a JSON page
+    ``{events, last_seq, truncated}`` is returned, long-polling up to
+    ``?wait=<seconds>`` when there is nothing new.
+    """
+    raw_since = request.headers.get("Last-Event-ID") or request.GET.get("since", "0")
+    try:
+        since = max(0, int(raw_since))
+        wait = min(float(request.GET.get("wait", "0")), _MAX_WAIT_SECONDS)
+    except ValueError:
+        return JsonResponse({"error": "since/wait must be numbers"}, status=400)
+
+    streaming = request.GET.get("stream") in ("1", "true") or (
+        "text/event-stream" in request.headers.get("Accept", "")
+    )
+    if streaming:
+        response = StreamingHttpResponse(
+            _sse_stream(project._compile_events, since),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    page = project._compile_events.since(since, timeout=max(0.0, wait))
     return JsonResponse(
         {
-            "compiling": project._compiling,
-            "result": project._compile_result,
-            "log": project._compile_log,
+            "events": events_to_dicts(page["events"]),
+            "last_seq": page["last_seq"],
+            "truncated": page["truncated"],
         }
     )
 
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Hints handler — serves the manuscript-hints feed to the editor UI.
+"""Hints handlers — the manuscript-hints feed and cross-reference lookups.
 
-Thin Django wrapper; the read logic lives in
-``scitex_writer._mcp.handlers._hints`` (framework-agnostic), mirroring the
-claim/bib/media handlers.
+Thin Django wrappers; the read logic lives in
+``scitex_writer._mcp.handlers._hints`` and ``._index`` (framework-agnostic),
+mirroring the claim/bib/media handlers.
 """
 
 from __future__ import annotations
@@ -22,3 +22,22 @@ def handle_hints(request, project):
     from ..._mcp.handlers._hints import get_hints
 
     return JsonResponse(get_hints(str(project.project_dir)))
+
+
+def handle_index(request, project):
+    """GET cross-reference lookups from the persistent project index.
+
+    Query params: ``kind`` (label/ref/cite/heading/vclaim/float/bibentry,
+    default ``cite``), ``key`` and ``doc_type`` (both optional). Lets the
+    Details pane answer "who cites X" / "where is label Y" without a compile.
+    400 for an unknown kind.
+    """
+    from ..._mcp.handlers._index import query_index
+
+    result = query_index(
+        str(project.project_dir),
+        kind=request.GET.get("kind", "cite"),
+        key=request.GET.get("key") or None,
+        doc_type=request.GET.get("doc_type") or None,
+    )
+    return JsonResponse(result, status=200 if result["success"] else 400)
@@ -3,7 +3,9 @@
 """Viewer handlers — claims metadata sidecar, DAG, citation verification.
 
 Backs the live-paper viewer (issue #82 / cloud #133):
-- GET /api/claims-metadata — claims.json + per-claim verification state
+- GET /api/claims-metadata — claims.json + per-claim verification state,
+  served from the project's verification cache (``?refresh=1`` re-verifies
+  every claim)
 - GET /api/dag?target=…    — Clew DAG as Mermaid code
 - GET /api/citation/<key>  — scitex-scholar verification state
 """
@@ -23,7 +25,13 @@ _CITATION_CONTRADICTED = "CONTRADICTED"
 
 
 def handle_claims_metadata(request, project):
-    """Return all claims with verification state (clew-aware if available)."""
+    """Return all claims with verification state (clew-aware if available).
+
+    Claims whose output or pointers changed since their last verdict are
+    verified in parallel before answering; unchanged ones come from the cache
+    at once, and those older than the cache TTL are re-verified in the
+    background for the next request.
+    """
     from ..._mcp.handlers._claim import list_claims
 
     result = list_claims(str(project.project_dir))
@@ -31,8 +39,14 @@ def handle_claims_metadata(request, project):
         return JsonResponse(result, status=500)
 
     # Augment each claim with its Clew verification state if available.
-    for claim in result.get("claims", []):
-        claim["verification"] = _claim_verification_state(project, claim)
+    claims = result.get("claims", [])
+    states = project._claim_verifications.states(
+        claims,
+        lambda claim: _claim_verification_state(project, claim),
+        force=request.GET.get("refresh") in ("1", "true"),
+    )
+    for claim in claims:
+        claim["verification"] = states[claim["claim_id"]]
 
     return JsonResponse(result)
 
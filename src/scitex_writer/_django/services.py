@@ -30,12 +30,35 @@ class ProjectState:
     _compiling: bool = False
     _compile_result: Optional[Dict[str, Any]] = None
     _compile_log: str = ""
+    # "Compile latest" bookkeeping (handlers/compile.py). Every accepted
+    # request bumps `_compile_generation`; a request arriving mid-build parks
+    # its options in `_compile_pending` (the dirty flag) and is served by ONE
+    # follow-up build covering every request up to the newest.
+    _compile_generation: int = 0
+    _running_generation: int = 0
+    _built_generation: int = 0
+    _compile_pending: Optional[Dict[str, Any]] = None
+    # Typed, seq-numbered compile events streamed by /api/compile/events.
+    _compile_events: Any = field(default=None, repr=False)
+    # Last verdict per claim for /api/claims-metadata
+    # (handlers/_claim_verification.py).
+    _claim_verifications: Any = field(default=None, repr=False)
     _lock: Any = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         import threading
 
+        from scitex_writer._compile._events import CompileEventLog
+        from scitex_writer._django.handlers._claim_verification import (
+            ClaimVerificationCache,
+        )
+        from scitex_writer._mcp.handlers._claim import _claim_path_roots
+
         self._lock = threading.Lock()
+        self._compile_events = CompileEventLog()
+        self._claim_verifications = ClaimVerificationCache(
+            _claim_path_roots(Path(self.project_dir))
+        )
 
 
 def get_or_create_project(project_dir: str) -> ProjectState:
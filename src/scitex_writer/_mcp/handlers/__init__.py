@@ -29,6 +29,7 @@ from ._compile import compile_manuscript, compile_revision, compile_supplementar
 from ._diff_pipeline import process as process_diff
 from ._export import export_manuscript
 from ._figures import convert_figure, list_figures, pdf_to_images
+from ._index import query_index
 from ._project import clone_project, get_pdf, get_project_info, list_document_types
 from ._tables import csv_to_latex, latex_to_csv
 from ._tables_pipeline import process as process_tables
@@ -65,6 +66,7 @@ __all__ = [
     "process_archive",
     "process_diff",
     "process_tables",
+    "query_index",
     "remove_claim",
     "render_claims",
     "update_project",
@@ -4,6 +4,8 @@
 
 """Compilation handlers: manuscript, supplementary, revision."""
 
+from typing import Callable, Optional
+
 from ..utils import resolve_project_path, run_compile_script
 
 
@@ -64,6 +66,7 @@ def compile_manuscript(
     quiet: bool = False,
     verbose: bool = False,
     engine: str | None = None,
+    log_callback: Optional[Callable[[str], None]] = None,
 ) -> dict:
     """Compile manuscript to PDF."""
     project_path = resolve_project_path(project_dir)
@@ -81,6 +84,7 @@ def compile_manuscript(
         quiet=quiet,
         verbose=verbose,
         engine=engine,
+        log_callback=log_callback,
     )
 
 
@@ -94,6 +98,7 @@ def compile_supplementary(
     dark_mode: bool = False,
     quiet: bool = False,
     engine: str | None = None,
+    log_callback: Optional[Callable[[str], None]] = None,
 ) -> dict:
     """Compile supplementary materials to PDF."""
     project_path = resolve_project_path(project_dir)
@@ -110,6 +115,7 @@ def compile_supplementary(
         dark_mode=dark_mode,
         quiet=quiet,
         engine=engine,
+        log_callback=log_callback,
     )
 
 
@@ -122,6 +128,7 @@ def compile_revision(
     dark_mode: bool = False,
     quiet: bool = False,
     engine: str | None = None,
+    log_callback: Optional[Callable[[str], None]] = None,
 ) -> dict:
     """Compile revision document to PDF."""
     project_path = resolve_project_path(project_dir)
@@ -137,6 +144,7 @@ def compile_revision(
         quiet=quiet,
         track_changes=track_changes,
         engine=engine,
+        log_callback=log_callback,
     )
 
 
@@ -6,7 +6,7 @@ r"""The MEDIA half of the figure pipeline (port of ``process_figures.sh``).
 
 Everything that touches image files, in the order ``process`` runs it:
 
-1. :func:`init_figures`           -- create the figure dirs, clear ``compiled_dir/*.tex``,
+1. :func:`init_figures`           -- create the figure dirs, clear orphan compiled ``.tex``,
                                      drop derived symlinks from ``jpg_dir`` while
                                      PRESERVING (and warning about) real user files.
 2. :func:`ensure_lower_letter_id` -- ``01A_panel.png`` -> ``01a_panel.png``.
@@ -16,6 +16,18 @@ Everything that touches image files, in the order ``process`` runs it:
 6. :func:`compose_panels`         -- tile ``NN<letter>_*.jpg`` panels into ``NN.jpg``.
 7. :func:`link_compilation_jpgs`  -- symlink each main JPG into ``jpg_dir`` (cp fallback).
 8. :func:`create_placeholders`    -- a placeholder JPG for a declared-but-missing figure.
+9. :func:`make_draft_proxies`     -- (draft only) downscaled copies in ``jpg_dir/_draft``.
+
+Stage 5 is scheduled as a per-figure dependency graph (:func:`run_conversions`):
+each figure's ``tif -> png -> jpg`` chain is one task, independent figures run
+on a process pool sized to the CPU count, and every stale Mermaid source is
+rendered in one ``mmdc`` session before its ``png -> jpg`` step is queued.
+
+Freshness is decided by content, not mtimes: an :class:`ArtifactManifest` in
+``caption_media_dir`` records the source hashes, conversion parameters (Pillow
+or ``mmdc``/LibreOffice version, JPEG quality) and output hash of every file the
+cascade writes, so a checkout, bind mount or CI cache restore neither forces a
+full reconversion nor lets a changed source slip through.
 
 The LaTeX half lives in :mod:`._figures_tex`; :mod:`._figures_pipeline` reads the
 config and runs both. See that module's docstring for the shell behaviours this
@@ -24,15 +36,30 @@ port deliberately changed (all of them silent degradations, never working paths)
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 import shutil
 import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from ..._utils._artifact_manifest import ArtifactManifest
 from ..._utils._figure_image import (
+    DRAFT_JPEG_QUALITY,
+    DRAFT_MAX_EDGE,
+    JPEG_QUALITY,
+    TRIM_FUZZ,
     panel_letter,
     placeholder_jpg,
     tile_panels,
+    to_draft_jpg,
     to_jpg,
     to_png,
     trim_whitespace,
@@ -50,6 +77,9 @@ CAPTION_SOURCE_SUFFIXES = (
 )
 """Media kinds that entitle a MAIN figure to an auto-generated caption."""
 
+DRAFT_DIR = "_draft"
+"""Subdirectory of ``jpg_dir`` holding the draft proxies."""
+
 REGENERABLE_SUFFIXES = (".png", ".tif", ".tiff", ".pptx", ".mmd", ".pdf", ".jpg")
 """Sources the cascade can regenerate a compilation JPG from (orphan detection)."""
 
@@ -96,8 +126,10 @@ def init_figures(
 ) -> List[str]:
     """Stage 1: (re)create the figure dirs and clear DERIVED artifacts only.
 
-    Compiled ``*.tex`` are stale by definition and always cleared (Issue #41: a
-    renamed figure otherwise left its old float behind). In ``jpg_dir`` only
+    A compiled ``*.tex`` with no MAIN caption behind it is cleared (Issue #41: a
+    renamed figure otherwise left its old float behind); the others are kept for
+    :func:`._figures_tex.compile_legends`, which rewrites only the legends whose
+    caption changed. In ``jpg_dir`` only
     SYMLINKS are dropped -- they are re-created from ``caption_and_media`` every
     run. A REAL file there is user-placed: a blanket wipe once destroyed figures
     that had no ``caption_and_media`` source to regenerate from, so it is
@@ -105,8 +137,10 @@ def init_figures(
     """
     for directory in (figure_dir, caption_media_dir, jpg_dir, compiled_dir):
         directory.mkdir(parents=True, exist_ok=True)
+    captions = {p.stem for p in mains(caption_media_dir, ".tex")}
     for stale in compiled_dir.glob("*.tex"):
-        stale.unlink()
+        if stale.stem not in captions:
+            stale.unlink()
     for entry in jpg_dir.iterdir():
         if entry.is_symlink():
             entry.unlink()
@@ -180,8 +214,66 @@ def ensure_caption(caption_media_dir: Path, project_path: Path) -> int:
     return created
 
 
-def pptx_to_tif(caption_media_dir: Path) -> int:
-    """Cascade step 1: PPTX -> PDF -> PNG, refreshed when the source is newer.
+def _params(step: str, tool: str = "", trim: bool = False) -> str:
+    """Conversion parameters recorded with (and checked against) an output.
+
+    ``tool`` names the converter (and its settings) when it is not Pillow
+    alone; ``trim`` marks a JPG whose border was cropped after conversion.
+    """
+    from PIL import __version__ as pillow
+
+    if step == "jpg":
+        params = f"jpg;pillow={pillow};quality={JPEG_QUALITY};flatten=white"
+        return f"{params};trim={TRIM_FUZZ}" if trim else params
+    if step == "png":
+        return f"png;pillow={pillow};{tool}" if tool else f"png;pillow={pillow}"
+    return f"{step};{tool}"
+
+
+def _pymupdf_version() -> str:
+    try:
+        return version("PyMuPDF")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def _version_of(real: str, mtime_ns: int, size: int) -> str:
+    try:
+        result = subprocess.run(
+            [real, "--version"], capture_output=True, text=True, timeout=60
+        )
+        version = result.stdout.strip() if result.returncode == 0 else ""
+    except (OSError, subprocess.TimeoutExpired):
+        version = ""
+    return version.splitlines()[0] if version else os.path.basename(real)
+
+
+def _tool_version(binary: str) -> str:
+    """``binary --version`` (first line), asked once per installed binary."""
+    real = os.path.realpath(binary)
+    try:
+        st = os.stat(real)
+    except OSError:
+        return os.path.basename(real)
+    return _version_of(real, st.st_mtime_ns, st.st_size)
+
+
+@contextmanager
+def _manifest_for(caption_media_dir: Path, manifest: Optional[ArtifactManifest]):
+    """The caller's manifest, or one loaded here and saved on the way out."""
+    if manifest is not None:
+        yield manifest
+        return
+    manifest = ArtifactManifest(caption_media_dir)
+    yield manifest
+    manifest.save()
+
+
+def pptx_to_tif(
+    caption_media_dir: Path, manifest: Optional[ArtifactManifest] = None
+) -> int:
+    """Cascade step 1: PPTX -> PDF -> PNG, refreshed when the source changed.
 
     Requires ``libreoffice`` (rendering a slide deck has no Python equivalent that
     preserves its fonts and vector shapes). FAILS LOUD with an install hint when a
@@ -206,112 +298,382 @@ def pptx_to_tif(caption_media_dir: Path) -> int:
             f"place the .png beside the .pptx in {caption_media_dir}."
         )
     converted = 0
-    for pptx_file in sources:
-        pdf_file = pptx_file.with_suffix(".pdf")
-        if pdf_file.exists() and pdf_file.stat().st_mtime >= pptx_file.stat().st_mtime:
-            continue
-        subprocess.run(
-            [
-                binary,
-                "--headless",
-                "--convert-to",
-                "pdf",
-                "--outdir",
-                str(caption_media_dir),
-                str(pptx_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        converted += 1
-
-    from ..._utils._pdf_images import pdf_to_images
-
-    for pdf_file in numbered(caption_media_dir, ".pdf"):
-        png_file = caption_media_dir / f"{pdf_file.stem}.png"
-        if png_file.exists() and png_file.stat().st_mtime >= pdf_file.stat().st_mtime:
-            continue
-        rendered = pdf_to_images(
-            str(pdf_file), output_dir=str(caption_media_dir), pages=[0], dpi=600
-        )
-        if not rendered:
-            raise RuntimeError(
-                f"LibreOffice produced {pdf_file.name} but it has no renderable "
-                f"first page. Re-export the slide and retry."
+    with _manifest_for(caption_media_dir, manifest) as manifest:
+        pdf_params = _params("pdf", _tool_version(binary))
+        for pptx_file in sources:
+            pdf_file = pptx_file.with_suffix(".pdf")
+            if manifest.fresh(pdf_file, [pptx_file], pdf_params):
+                continue
+            subprocess.run(
+                [
+                    binary,
+                    "--headless",
+                    "--convert-to",
+                    "pdf",
+                    "--outdir",
+                    str(caption_media_dir),
+                    str(pptx_file),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
             )
-        shutil.move(rendered[0]["path"], png_file)
-        converted += 1
+            manifest.record(pdf_file, [pptx_file], pdf_params)
+            converted += 1
+
+        from ..._utils._pdf_images import pdf_to_images
+
+        png_params = _params("png", f"pymupdf={_pymupdf_version()};dpi=600")
+        for pdf_file in numbered(caption_media_dir, ".pdf"):
+            png_file = caption_media_dir / f"{pdf_file.stem}.png"
+            if manifest.fresh(png_file, [pdf_file], png_params):
+                continue
+            rendered = pdf_to_images(
+                str(pdf_file), output_dir=str(caption_media_dir), pages=[0], dpi=600
+            )
+            if not rendered:
+                raise RuntimeError(
+                    f"LibreOffice produced {pdf_file.name} but it has no renderable "
+                    f"first page. Re-export the slide and retry."
+                )
+            shutil.move(rendered[0]["path"], png_file)
+            manifest.record(png_file, [pdf_file], png_params)
+            converted += 1
     return converted
 
 
-def tif_to_png(caption_media_dir: Path) -> int:
-    """Cascade step 2: TIF/TIFF -> PNG, refreshed when the source is newer."""
+def _tif_source(caption_media_dir: Path, stem: str) -> Optional[Path]:
+    for suffix in (".tif", ".tiff"):
+        tif_file = caption_media_dir / f"{stem}{suffix}"
+        if tif_file.is_file():
+            return tif_file
+    return None
+
+
+def tif_to_png(
+    caption_media_dir: Path, manifest: Optional[ArtifactManifest] = None
+) -> int:
+    """Cascade step 2: TIF/TIFF -> PNG, refreshed when the source changed."""
     converted = 0
-    for tif_file in numbered(caption_media_dir, ".tif", ".tiff"):
-        png_file = caption_media_dir / f"{tif_file.stem}.png"
-        if png_file.exists() and png_file.stat().st_mtime >= tif_file.stat().st_mtime:
-            continue
-        to_png(tif_file, png_file)
-        converted += 1
+    params = _params("png")
+    with _manifest_for(caption_media_dir, manifest) as manifest:
+        for tif_file in numbered(caption_media_dir, ".tif", ".tiff"):
+            png_file = caption_media_dir / f"{tif_file.stem}.png"
+            if manifest.fresh(png_file, [tif_file], params):
+                continue
+            to_png(tif_file, png_file)
+            manifest.record(png_file, [tif_file], params)
+            converted += 1
     return converted
 
 
-def mmd_to_png(caption_media_dir: Path) -> int:
+def _mmd_batch(binary: str, sources: List[Path], caption_media_dir: Path) -> set:
+    """Render ``sources`` in ONE mmdc session; return the sources it rendered.
+
+    mmdc renders every ```` ```mermaid ```` block of a Markdown input to
+    ``<output>-<n>.png``, so one headless-Chromium launch serves the whole
+    batch. Anything the batch did not produce is left to the per-file path.
+    """
+    rendered = set()
+    with tempfile.TemporaryDirectory(prefix="scitex_mmd_") as tmp:
+        batch_md = Path(tmp) / "batch.md"
+        batch_md.write_text(
+            "".join(
+                f"```mermaid\n{source.read_text(encoding='utf-8').strip()}\n```\n\n"
+                for source in sources
+            ),
+            encoding="utf-8",
+        )
+        out_md = Path(tmp) / "out.md"
+        try:
+            subprocess.run(
+                [binary, "-i", str(batch_md), "-o", str(out_md), "-e", "png"],
+                capture_output=True,
+                text=True,
+                timeout=60 + 30 * len(sources),
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return rendered
+        for index, source in enumerate(sources, 1):
+            image = Path(tmp) / f"out-{index}.png"
+            if image.is_file() and image.stat().st_size > 0:
+                shutil.move(str(image), caption_media_dir / f"{source.stem}.png")
+                rendered.add(source)
+    return rendered
+
+
+def mmd_to_png(
+    caption_media_dir: Path, manifest: Optional[ArtifactManifest] = None
+) -> int:
     """Cascade step 3: Mermaid ``.mmd`` -> PNG through the ``mmdc`` CLI.
 
     Prechecked by :func:`scitex_writer._utils._mermaid_precheck.check_mmdc_or_raise`:
     ``mmdc`` can be on PATH yet unable to start its headless chromium, in which case
     it writes a CORRUPT png. Fails loud with an install hint when a ``.mmd`` is
     present and mmdc is unusable (the shell warned and skipped).
+
+    Two or more stale sources are rendered in one mmdc session (one Chromium
+    launch instead of one per diagram); a source the batch could not render
+    falls back to its own ``mmdc -i`` run, which fails loud as before.
     """
     sources = numbered(caption_media_dir, ".mmd")
     if not sources:
         return 0
+    with _manifest_for(caption_media_dir, manifest) as manifest:
+        return len(_render_mermaid(caption_media_dir, sources, manifest))
+
+
+def _render_mermaid(
+    caption_media_dir: Path, sources: List[Path], manifest: ArtifactManifest
+) -> List[str]:
+    """Render the stale ``.mmd`` of ``sources``; return the stems rendered."""
     from ..._utils._mermaid_precheck import check_mmdc_or_raise
 
     binary = check_mmdc_or_raise()
-    converted = 0
-    for mmd_file in sources:
-        png_file = caption_media_dir / f"{mmd_file.stem}.png"
-        if png_file.exists() and png_file.stat().st_mtime >= mmd_file.stat().st_mtime:
-            continue
-        subprocess.run(
-            [binary, "-i", str(mmd_file), "-o", str(png_file)],
-            capture_output=True,
-            text=True,
-            check=True,
+    params = _params("png", _tool_version(binary))
+    stale = [
+        mmd_file
+        for mmd_file in sources
+        if not manifest.fresh(
+            caption_media_dir / f"{mmd_file.stem}.png", [mmd_file], params
         )
-        converted += 1
-    return converted
+    ]
+    done = _mmd_batch(binary, stale, caption_media_dir) if len(stale) > 1 else set()
+    for mmd_file in stale:
+        png_file = caption_media_dir / f"{mmd_file.stem}.png"
+        if mmd_file not in done:
+            subprocess.run(
+                [binary, "-i", str(mmd_file), "-o", str(png_file)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        manifest.record(png_file, [mmd_file], params)
+    return [mmd_file.stem for mmd_file in stale]
 
 
-def png_to_jpg(caption_media_dir: Path) -> int:
-    """Cascade step 4: PNG -> JPG (alpha flattened onto white), refreshed if newer.
+def png_to_jpg(
+    caption_media_dir: Path, manifest: Optional[ArtifactManifest] = None
+) -> int:
+    """Cascade step 4: PNG -> JPG (alpha flattened onto white), refreshed if changed.
 
     A symlinked PNG is read through transparently (Pillow follows the link), so the
     shell's ``cp -L`` temp-file dance is gone.
     """
     converted = 0
-    for png_file in numbered(caption_media_dir, ".png"):
-        jpg_file = caption_media_dir / f"{png_file.stem}.jpg"
-        source_mtime = png_file.resolve().stat().st_mtime
-        if jpg_file.exists() and jpg_file.stat().st_mtime >= source_mtime:
-            continue
+    params = _params("jpg")
+    with _manifest_for(caption_media_dir, manifest) as manifest:
+        for png_file in numbered(caption_media_dir, ".png"):
+            jpg_file = caption_media_dir / f"{png_file.stem}.jpg"
+            if manifest.fresh(jpg_file, [png_file], params):
+                continue
+            to_jpg(png_file, jpg_file)
+            manifest.record(jpg_file, [png_file], params)
+            converted += 1
+    return converted
+
+
+def convert_figure(
+    caption_media_dir: Path, stem: str, steps=("png", "jpg"), trim: bool = False
+) -> tuple:
+    """One figure's raster chain: ``tif -> png`` then ``png -> jpg``.
+
+    The unit of work :func:`run_conversions` schedules (module-level so a
+    process pool can run it). Only the requested ``steps`` run; deciding which
+    are stale is left to the caller, which owns the manifest. With ``trim`` the
+    new JPG's border is cropped before the caller records it. Returns
+    ``(stem, conversions, seconds)``.
+    """
+    started = time.perf_counter()
+    caption_media_dir = Path(caption_media_dir)
+    png_file = caption_media_dir / f"{stem}.png"
+    converted = 0
+    tif_file = _tif_source(caption_media_dir, stem)
+    if "png" in steps and tif_file is not None:
+        to_png(tif_file, png_file)
+        converted += 1
+    if "jpg" in steps and png_file.exists():
+        jpg_file = caption_media_dir / f"{stem}.jpg"
         to_jpg(png_file, jpg_file)
+        if trim:
+            trim_whitespace(jpg_file)
         converted += 1
-    return converted
+    return stem, converted, time.perf_counter() - started
+
+
+def _plan(
+    manifest: ArtifactManifest, caption_media_dir: Path, stem: str, trim: bool
+) -> tuple:
+    """The steps of ``stem``'s chain whose output is not fresh (in order)."""
+    png_file = caption_media_dir / f"{stem}.png"
+    tif_file = _tif_source(caption_media_dir, stem)
+    if tif_file is not None and not manifest.fresh(
+        png_file, [tif_file], _params("png")
+    ):
+        return ("png", "jpg")
+    jpg_file = caption_media_dir / f"{stem}.jpg"
+    if png_file.exists() and not manifest.fresh(
+        jpg_file, [png_file], _params("jpg", trim=trim)
+    ):
+        return ("jpg",)
+    return ()
+
+
+def _record(
+    manifest: ArtifactManifest,
+    caption_media_dir: Path,
+    stem: str,
+    steps: tuple,
+    trim: bool,
+) -> None:
+    png_file = caption_media_dir / f"{stem}.png"
+    tif_file = _tif_source(caption_media_dir, stem)
+    if "png" in steps and tif_file is not None and png_file.exists():
+        manifest.record(png_file, [tif_file], _params("png"))
+    jpg_file = caption_media_dir / f"{stem}.jpg"
+    if "jpg" in steps and jpg_file.exists():
+        manifest.record(jpg_file, [png_file], _params("jpg", trim=trim))
+
+
+def conversion_workers() -> int:
+    """Process-pool size: ``SCITEX_WRITER_FIGURE_WORKERS`` or the CPU count."""
+    raw = os.environ.get("SCITEX_WRITER_FIGURE_WORKERS", "")
+    if raw.strip().isdigit() and int(raw) > 0:
+        return int(raw)
+    return os.cpu_count() or 1
+
+
+def _process_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """A pool whose workers do not inherit our threads' locks; None if unavailable.
+
+    The asset stages run on threads, so ``fork`` could copy a held lock into a
+    child; ``forkserver`` (or ``spawn``) starts workers from a clean process.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    try:
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(method)
+        )
+    except (OSError, NotImplementedError, ValueError):
+        return None
+
+
+def run_conversions(
+    caption_media_dir: Path,
+    pptx: bool = False,
+    workers: Optional[int] = None,
+    manifest: Optional[ArtifactManifest] = None,
+    crop: bool = False,
+) -> dict:
+    """Stage 5: run the conversion cascade as a per-figure dependency graph.
+
+    PPTX decks go first, one at a time (concurrent LibreOffice instances fight
+    over one user profile). Every figure whose ``tif -> png -> jpg`` chain is
+    stale then becomes a task on a process pool of ``workers`` processes
+    (default :func:`conversion_workers`); while they run, stale Mermaid sources
+    are rendered in one mmdc session, and their ``png -> jpg`` tasks are queued
+    when it finishes. One stale figure, or ``workers=1``, runs in-process.
+
+    Staleness is decided by the content-hash ``manifest`` (default: the one in
+    ``caption_media_dir``, saved on return), never by mtimes; the workers only
+    convert, and every output is recorded here once its task is done.
+
+    With ``crop`` each MAIN figure's new JPG has its border trimmed before it
+    is recorded (panels are left whole for tiling), so the trim is part of the
+    recorded output and a later cropped build finds it fresh.
+
+    Returns:
+        ``{converted, cropped, timings}``: the conversion count, the number of
+        new JPGs trimmed and, per figure stem that needed work, the seconds its
+        conversions took (a Mermaid figure is charged an equal share of the
+        batch)
+    """
+    caption_media_dir = Path(caption_media_dir)
+    workers = workers or conversion_workers()
+    converted = cropped = 0
+    timings: Dict[str, float] = {}
+    with _manifest_for(caption_media_dir, manifest) as manifest:
+        if pptx:
+            converted += pptx_to_tif(caption_media_dir, manifest)
+
+        mmd_sources = numbered(caption_media_dir, ".mmd")
+        mmd_stems = sorted({p.stem for p in mmd_sources})
+        raster_stems = sorted(
+            {p.stem for p in numbered(caption_media_dir, ".tif", ".tiff", ".png")}
+            - set(mmd_stems)
+        )
+        trims = {s: crop and panel_letter(s) is None for s in raster_stems + mmd_stems}
+        plans = {
+            s: _plan(manifest, caption_media_dir, s, trims[s]) for s in raster_stems
+        }
+        ready = [s for s in raster_stems if plans[s]]
+        pool = _process_pool(workers) if workers > 1 and len(ready) > 1 else None
+
+        def submit(stems) -> list:
+            if pool is None:
+                return [
+                    (s, convert_figure(caption_media_dir, s, plans[s], trims[s]))
+                    for s in stems
+                ]
+            return [
+                (
+                    s,
+                    pool.submit(
+                        convert_figure, caption_media_dir, s, plans[s], trims[s]
+                    ),
+                )
+                for s in stems
+            ]
+
+        def collect(tasks) -> None:
+            nonlocal converted, cropped
+            for stem, task in tasks:
+                if pool is None:
+                    _, count, seconds = task
+                else:
+                    try:
+                        _, count, seconds = task.result()
+                    except BrokenProcessPool:  # a killed worker: finish in-process
+                        _, count, seconds = convert_figure(
+                            caption_media_dir, stem, plans[stem], trims[stem]
+                        )
+                _record(manifest, caption_media_dir, stem, plans[stem], trims[stem])
+                converted += count
+                cropped += trims[stem] and "jpg" in plans[stem]
+                if count:
+                    timings[stem] = round(timings.get(stem, 0.0) + seconds, 3)
+
+        try:
+            tasks = submit(ready)
+            if mmd_sources:
+                started = time.perf_counter()
+                rendered = _render_mermaid(caption_media_dir, mmd_sources, manifest)
+                converted += len(rendered)
+                if rendered:
+                    share = (time.perf_counter() - started) / len(rendered)
+                    timings.update({stem: round(share, 3) for stem in rendered})
+                plans.update(
+                    {
+                        s: _plan(manifest, caption_media_dir, s, trims[s])
+                        for s in mmd_stems
+                    }
+                )
+                tasks += submit([s for s in mmd_stems if plans[s]])
+            collect(tasks)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    return {
+        "converted": converted,
+        "cropped": cropped,
+        "timings": dict(sorted(timings.items())),
+    }
 
 
 def convert_formats(caption_media_dir: Path, pptx: bool = False) -> int:
     """Stage 5: run the whole conversion cascade; return the conversion count."""
-    converted = 0
-    if pptx:
-        converted += pptx_to_tif(caption_media_dir)
-    converted += tif_to_png(caption_media_dir)
-    converted += mmd_to_png(caption_media_dir)
-    converted += png_to_jpg(caption_media_dir)
-    return converted
+    return run_conversions(caption_media_dir, pptx)["converted"]
 
 
 def panel_groups(caption_media_dir: Path) -> dict:
@@ -390,24 +752,76 @@ def create_placeholders(caption_media_dir: Path, jpg_dir: Path) -> int:
     return created
 
 
-def crop_compilation_jpgs(jpg_dir: Path) -> int:
+def crop_compilation_jpgs(
+    jpg_dir: Path, manifest: Optional[ArtifactManifest] = None
+) -> int:
     """Optional stage: trim the uniform border off every JPG bound for compilation.
 
     A symlinked JPG is resolved first, so the crop lands on the real
     ``caption_and_media`` file rather than replacing the link with a file.
+    A JPG that ``run_conversions(crop=True)`` already trimmed and recorded in
+    ``manifest`` is skipped: cropping it again would change the recorded
+    output and force a reconversion on the next build.
     """
+    params = _params("jpg", trim=True)
     cropped = 0
     for jpg_file in sorted(jpg_dir.glob("*.jpg")):
-        if trim_whitespace(jpg_file.resolve()):
+        real = jpg_file.resolve()
+        if manifest is not None:
+            converted = manifest.directory / jpg_file.name
+            if converted.resolve() == real and manifest.fresh(
+                converted, [converted.with_suffix(".png")], params
+            ):
+                continue
+        if trim_whitespace(real):
             cropped += 1
     return cropped
 
 
+def make_draft_proxies(
+    caption_media_dir: Path,
+    jpg_dir: Path,
+    max_edge: int = DRAFT_MAX_EDGE,
+    manifest: Optional[ArtifactManifest] = None,
+) -> int:
+    """Draft stage: a downscaled proxy of every compilation JPG, cached.
+
+    ``jpg_dir/<name>.jpg`` -> ``jpg_dir/_draft/<name>.jpg`` with its longest edge
+    capped at ``max_edge`` px. A proxy whose source content and ``max_edge`` are
+    unchanged since ``manifest`` recorded it is reused, so only edited figures
+    are re-proxied between draft compiles; proxies of JPGs no longer in
+    ``jpg_dir`` are removed. The full-resolution JPGs are never touched.
+
+    Returns the number of proxies (re)written.
+    """
+    proxy_dir = jpg_dir / DRAFT_DIR
+    proxy_dir.mkdir(parents=True, exist_ok=True)
+    params = f"draft;max_edge={max_edge};quality={DRAFT_JPEG_QUALITY}"
+    sources = sorted(jpg_dir.glob("*.jpg"))
+    wanted = {source.name for source in sources}
+    for stale in proxy_dir.glob("*.jpg"):
+        if stale.name not in wanted:
+            stale.unlink()
+    written = 0
+    with _manifest_for(caption_media_dir, manifest) as manifest:
+        for source in sources:
+            proxy = proxy_dir / source.name
+            if manifest.fresh(proxy, [source], params):
+                continue
+            to_draft_jpg(source, proxy, max_edge)
+            manifest.record(proxy, [source], params)
+            written += 1
+    return written
+
+
 __all__ = [
     "CAPTION_SOURCE_SUFFIXES",
+    "DRAFT_DIR",
     "REGENERABLE_SUFFIXES",
     "cleanup_panel_captions",
     "compose_panels",
+    "conversion_workers",
+    "convert_figure",
     "convert_formats",
     "create_placeholders",
     "crop_compilation_jpgs",
@@ -417,11 +831,13 @@ __all__ = [
     "init_figures",
     "link_compilation_jpgs",
     "mains",
+    "make_draft_proxies",
     "mmd_to_png",
     "numbered",
     "panel_groups",
     "png_to_jpg",
     "pptx_to_tif",
+    "run_conversions",
     "tif_to_png",
 ]
 
@@ -8,7 +8,8 @@ Ports the shell module (plus every ``.src`` under ``process_figures_modules/``)
 stage for stage, reading the SAME config keys the shell read via ``yq``:
 ``figures.dir``, ``figures.caption_media_dir``, ``figures.jpg_dir``,
 ``figures.compiled_dir``, ``figures.compiled_file`` and the optional
-``figures.max_height_frac`` from ``config/config_<doc_type>.yaml``.
+``figures.max_height_frac`` from ``config/config_<doc_type>.yaml`` (plus
+``figures.draft_max_edge``, read only by draft runs).
 
 This module is the ORCHESTRATOR: it resolves and boundary-checks the configured
 paths, then runs the media stages (:mod:`._figures_media`) followed by the LaTeX
@@ -16,7 +17,13 @@ stages (:mod:`._figures_tex`) in the shell's order --
 
     init -> lowercase panel ids -> drop panel captions -> ensure captions
          -> convert cascade -> compose panels -> link JPGs -> placeholders
-         -> [crop] -> compile legends -> visibility marker -> assemble FINAL.tex
+         -> [crop] -> [draft proxies] -> compile legends -> visibility marker
+         -> assemble FINAL.tex
+
+A DRAFT run points ``FINAL.tex`` at downscaled, cached proxies of the
+compilation JPGs (``jpg_dir/_draft/``) instead of the full-resolution files:
+the layout is unchanged, while pdflatex reads and embeds a fraction of the
+bytes. ``no_figs`` stays the way to drop figures altogether.
 
 Three shell behaviours this port deliberately CHANGES. Each replaced a SILENT
 degradation, never a working path:
@@ -38,6 +45,11 @@ degradation, never a working path:
 Robust by construction: pathlib only (never shells out to find/rm/mv); every write
 target is resolved and asserted to live INSIDE the project root; fail-loud
 (explicit error dict + actionable hint) on a missing project dir / config.
+
+Incremental by content: every derived file (converted image, compiled legend)
+is checked against the content-hash manifest in ``caption_media_dir`` (see
+:mod:`scitex_writer._utils._artifact_manifest`), so only the figures whose
+sources changed are rebuilt, on this machine or in another clone.
 """
 
 from __future__ import annotations
@@ -46,17 +58,21 @@ from pathlib import Path
 from typing import Optional
 
 from ..._dataclasses import FiguresResult
+from ..._utils._artifact_manifest import ArtifactManifest
+from ..._utils._figure_image import DRAFT_MAX_EDGE
 from ..utils import resolve_project_path
 from ._figures_media import (
+    DRAFT_DIR,
     cleanup_panel_captions,
     compose_panels,
-    convert_formats,
     create_placeholders,
     crop_compilation_jpgs,
     ensure_caption,
     ensure_lower_letter_id,
     init_figures,
     link_compilation_jpgs,
+    make_draft_proxies,
+    run_conversions,
 )
 from ._figures_tex import (
     DEFAULT_MAX_HEIGHT_FRAC,
@@ -156,12 +172,23 @@ def max_height_frac(cfg: dict) -> str:
     return str(frac)
 
 
+def draft_max_edge(cfg: dict) -> int:
+    """The configured draft-proxy edge (px); the default when unset or invalid."""
+    edge = _cfg_get(cfg, ("figures", "draft_max_edge"))
+    try:
+        edge = int(edge)
+    except (TypeError, ValueError):
+        return DRAFT_MAX_EDGE
+    return edge if edge > 0 else DRAFT_MAX_EDGE
+
+
 def process(
     project_dir: str,
     doc_type: str = "manuscript",
     no_figs: bool = False,
     pptx: bool = False,
     crop: bool = False,
+    draft: bool = False,
 ) -> dict:
     """Run the whole figure pipeline for ``doc_type`` and return its outcome.
 
@@ -180,6 +207,10 @@ def process(
         Off by default -- it is slow and needs LibreOffice on PATH.
     crop : bool
         Trim the uniform border off each compilation JPG (the shell's ``--crop``).
+    draft : bool
+        Typeset downscaled proxies (longest edge ``figures.draft_max_edge`` px,
+        default 1000) instead of the full-resolution JPGs. Proxies are cached
+        per figure and rebuilt only when their JPG changes.
 
     Returns
     -------
@@ -221,24 +252,38 @@ def process(
         warnings = init_figures(
             paths["figure_dir"], caption_media_dir, jpg_dir, compiled_dir
         )
+        manifest = ArtifactManifest(caption_media_dir, boundary)
         renamed = ensure_lower_letter_id(caption_media_dir)
         panel_captions_removed = cleanup_panel_captions(caption_media_dir)
         captions_created = ensure_caption(caption_media_dir, boundary)
 
-        converted = composed = placeholders = cropped = 0
+        converted = composed = placeholders = cropped = proxies = 0
+        timings = {}
+        image_dir = jpg_dir
         if not no_figs:
-            converted = convert_formats(caption_media_dir, pptx)
+            conversions = run_conversions(
+                caption_media_dir, pptx, manifest=manifest, crop=crop
+            )
+            converted, timings = conversions["converted"], conversions["timings"]
             composed = compose_panels(caption_media_dir)
             warnings += link_compilation_jpgs(caption_media_dir, jpg_dir)
             placeholders = create_placeholders(caption_media_dir, jpg_dir)
             if crop:
-                cropped = crop_compilation_jpgs(jpg_dir)
-
-        compile_legends(caption_media_dir, compiled_dir)
+                cropped = conversions["cropped"] + crop_compilation_jpgs(
+                    jpg_dir, manifest
+                )
+            if draft:
+                proxies = make_draft_proxies(
+                    caption_media_dir, jpg_dir, draft_max_edge(cfg), manifest
+                )
+                image_dir = jpg_dir / DRAFT_DIR
+
+        compile_legends(caption_media_dir, compiled_dir, manifest)
+        manifest.save()
         enabled = handle_figure_visibility(jpg_dir, compiled_dir, no_figs)
         gathered = compile_figure_tex_files(
             caption_media_dir,
-            jpg_dir,
+            image_dir,
             compiled_dir,
             paths["compiled_file"],
             max_height_frac(cfg),
@@ -251,14 +296,17 @@ def process(
             panel_captions_removed=panel_captions_removed,
             renamed_panels=renamed,
             converted=converted,
+            conversion_timings=timings,
             composed=composed,
             placeholders_created=placeholders,
             cropped=cropped,
+            draft_proxies=proxies,
             figures=gathered["figures"],
             compiled_file=str(paths["compiled_file"]),
             figures_enabled=enabled,
             fallback_header=gathered["fallback_header"],
             skipped=no_figs,
+            draft=draft and not no_figs,
             warnings=warnings,
         )
         result.validate()
@@ -267,6 +315,12 @@ def process(
         return {"success": False, "error": f"{type(e).__name__}: {e}"}
 
 
-__all__ = ["DOC_DIRS", "max_height_frac", "process", "resolve_paths"]
+__all__ = [
+    "DOC_DIRS",
+    "draft_max_edge",
+    "max_height_frac",
+    "process",
+    "resolve_paths",
+]
 
 # EOF
@@ -30,6 +30,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from ..._utils._artifact_manifest import ArtifactManifest
 from ..._utils._caption_footnote import split_caption_footnote
 from ._figures_media import figure_number, mains, numbered
 
@@ -54,22 +55,37 @@ FALLBACK_HEADER = r"""%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 """
 
 
-def compile_legends(caption_media_dir: Path, compiled_dir: Path) -> int:
+def compile_legends(
+    caption_media_dir: Path,
+    compiled_dir: Path,
+    manifest: Optional[ArtifactManifest] = None,
+) -> int:
     """Derive ``compiled_dir/NN_*.tex`` from each MAIN caption body.
 
     The caption is copied with its comment lines stripped (the ``%% Edit this
     file:`` hint must never leak into the PDF) under a metadata banner. Panels are
     excluded: they carry no caption and get no compiled float of their own.
+
+    A legend whose caption content is unchanged since ``manifest`` recorded it
+    is left alone; pass the pipeline's manifest (the caller saves it), or none
+    to regenerate every legend. Returns the number of legends.
     """
+    from ... import __version__
+
     compiled = 0
+    params = f"legend;scitex-writer={__version__}"
     for caption_file in mains(caption_media_dir, ".tex"):
         figure_id = caption_file.stem
+        compiled += 1
+        legend = compiled_dir / f"{figure_id}.tex"
+        if manifest is not None and manifest.fresh(legend, [caption_file], params):
+            continue
         body = "\n".join(
             line
             for line in caption_file.read_text(encoding="utf-8").splitlines()
             if not line.startswith("%")
         )
-        (compiled_dir / f"{figure_id}.tex").write_text(
+        legend.write_text(
             f"% FIGURE METADATA - Figure ID {figure_id}, "
             f"Number {figure_number(figure_id)}\n"
             "% FIGURE TYPE: Image\n"
@@ -77,7 +93,8 @@ def compile_legends(caption_media_dir: Path, compiled_dir: Path) -> int:
             f"{body}\n",
             encoding="utf-8",
         )
-        compiled += 1
+        if manifest is not None:
+            manifest.record(legend, [caption_file], params)
     return compiled
 
 
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_mcp/handlers/_index.py
+
+"""Cross-reference lookups served from the persistent project index.
+
+Framework-agnostic ("who cites X", "where is label Y"); the MCP tool and the
+editor's ``/api/index`` endpoint are thin wrappers. The index is refreshed
+first, which re-parses only the sources changed since the last lookup.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from ..._utils._project_index import KINDS, ProjectIndex
+from ..utils import resolve_project_path
+
+
+def query_index(
+    project_dir: str,
+    kind: str = "cite",
+    key: Optional[str] = None,
+    doc_type: Optional[str] = None,
+) -> dict:
+    """Occurrences of a label, ref, cite, heading, vclaim, float or bib entry.
+
+    Args:
+        project_dir: Writer project root
+        kind: Token kind (see ``KINDS``); ``label`` also returns the
+            ``fig:``/``tab:`` labels the compile derives from caption files
+        key: Only this key (e.g. a cite key or ``fig:01_overview``); all
+            keys when omitted
+        doc_type: Only this document (``manuscript``/``supplementary``/
+            ``revision``)
+
+    Returns:
+        ``{success, kind, key, count, hits: [{key, path, line, doc_type}],
+        index: {files, parsed, touched, removed, elapsed}, error}``
+    """
+    if kind not in KINDS:
+        return {
+            "success": False,
+            "error": f"Unknown kind {kind!r}; choose from {', '.join(KINDS)}",
+        }
+    try:
+        index = ProjectIndex(resolve_project_path(project_dir))
+        stats = index.refresh()
+        if kind == "label" and key is not None:
+            hits = index.where_label(key)
+            if doc_type is not None:
+                hits = [h for h in hits if h["doc_type"] == doc_type]
+        else:
+            hits = index.find(kind, key, doc_type)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "kind": kind,
+        "key": key,
+        "count": len(hits),
+        "hits": hits,
+        "index": stats,
+    }
+
+
+__all__ = ["query_index"]
+
+# EOF
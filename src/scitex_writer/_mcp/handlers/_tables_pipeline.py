@@ -7,16 +7,19 @@ r"""The table pipeline: a pure-Python port of ``process_tables.sh``.
 Ports the shell module (plus its sourced ``03_csv2tex.src`` / ``04_gather.src``)
 stage for stage, reading the SAME config keys the shell read via ``yq``:
 ``tables.dir``, ``tables.caption_media_dir``, ``tables.compiled_dir`` and
-``tables.compiled_file`` from ``config/config_<doc_type>.yaml``.
+``tables.compiled_file`` from ``config/config_<doc_type>.yaml`` (plus the
+optional ``tables.full_length``).
 
 Stages (``process`` runs them in order):
 
-1. ``init_tables``       -- clear ``compiled_dir/*.tex``, create the table dirs,
-                            truncate the gathered ``FINAL.tex``.
-2. ``xlsx2csv_convert``  -- refresh ``NN_*.csv`` from a newer ``NN_*.xlsx/.xls``.
+1. ``init_tables``       -- clear orphan ``compiled_dir/*.tex``, create the table
+                            dirs, truncate the gathered ``FINAL.tex``.
+2. ``xlsx2csv_convert``  -- refresh ``NN_*.csv`` from a changed ``NN_*.xlsx/.xls``.
 3. ``ensure_caption``    -- write a default ``NN_*.tex`` caption where none exists.
 4. ``csv2tex``           -- render each ``NN_*.csv`` through the ONE pandas
-                            backend (:mod:`scitex_writer._utils._csv_table`).
+                            backend (:mod:`scitex_writer._utils._csv_table`);
+                            with ``tables.full_length``, a table longer than
+                            ``max_rows`` is streamed whole into a ``longtable``.
 5. ``gather_table_tex_files`` -- assemble ``FINAL.tex`` (+ ``_placeable/`` copies).
 
 Two behaviours the shell pinned and this port keeps:
@@ -28,6 +31,11 @@ Two behaviours the shell pinned and this port keeps:
 * an end-block ``\input`` is GUARDED by ``\ifcsname scitextabplaced@<n>``, so a
   table placed inline with ``\scitextab{<n>}`` is not also duplicated at the end.
 
+Incremental by content: a compiled table (and an Excel-derived CSV) is rebuilt
+only when the content-hash manifest in ``caption_media_dir`` (see
+:mod:`scitex_writer._utils._artifact_manifest`) says its sources or render
+options changed -- never because of an mtime.
+
 Robust by construction: pathlib only (never shells out to find/rm/mv); every
 write target is resolved and asserted to live INSIDE the project root; fail-loud
 (explicit error dict + actionable hint) on a missing project dir / config.
@@ -35,13 +43,21 @@ write target is resolved and asserted to live INSIDE the project root; fail-loud
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Optional
 
 from ..._dataclasses import TablesResult
-from ..._utils._csv_table import MAX_ROWS, render_csv_table
+from ..._utils._artifact_manifest import ArtifactManifest
+from ..._utils._csv_table import (
+    MAX_ROWS,
+    read_csv_table,
+    render_table,
+    write_longtable,
+)
 from ..utils import resolve_project_path
 
 DOC_DIRS = {
@@ -125,10 +141,20 @@ def _numbered(directory: Path, suffix: str):
 def init_tables(
     table_dir: Path, caption_media_dir: Path, compiled_dir: Path, compiled_file: Path
 ) -> None:
-    """Stage 1: clear stale compiled tables and (re)create the table directories."""
+    """Stage 1: clear orphan compiled tables and (re)create the table directories.
+
+    A compiled ``NN_*.tex`` whose ``NN_*.csv`` (or Excel source) is gone is
+    removed; the rest are kept for :func:`csv2tex` to reuse when fresh.
+    """
     if compiled_dir.is_dir():
+        sources = {
+            p.stem
+            for suffix in (".csv", ".xlsx", ".xls")
+            for p in _numbered(caption_media_dir, suffix)
+        }
         for stale in compiled_dir.glob("*.tex"):
-            stale.unlink()
+            if stale.stem not in sources:
+                stale.unlink()
     for directory in (table_dir, caption_media_dir, compiled_dir):
         directory.mkdir(parents=True, exist_ok=True)
     compiled_file.parent.mkdir(parents=True, exist_ok=True)
@@ -158,21 +184,48 @@ def xlsx_to_csv(xlsx_file: Path, csv_file: Path) -> None:
         )
 
 
-def xlsx2csv_convert(caption_media_dir: Path) -> int:
-    """Stage 2: refresh each ``NN_*.csv`` whose Excel source is newer (or absent).
+def _csv_params() -> str:
+    """Parameters recorded with each CSV: the converters :func:`xlsx_to_csv` uses.
 
-    Returns the number of files converted.
+    A pandas or Excel-reader upgrade (or a different ``xlsx2csv``) can change
+    the CSV, so it makes the recorded one stale.
     """
+    tools = []
+    for package in ("pandas", "openpyxl", "xlrd"):
+        try:
+            tools.append(f"{package}={version(package)}")
+        except PackageNotFoundError:
+            tools.append(f"{package}=none")
+    binary = shutil.which("xlsx2csv")
+    tools.append(f"xlsx2csv={os.path.realpath(binary) if binary else 'none'}")
+    return ";".join(["csv", *tools])
+
+
+def xlsx2csv_convert(
+    caption_media_dir: Path, manifest: Optional[ArtifactManifest] = None
+) -> int:
+    """Stage 2: refresh each ``NN_*.csv`` whose Excel source changed (or absent).
+
+    Freshness comes from ``manifest`` (default: the one in ``caption_media_dir``,
+    saved here). Returns the number of files converted.
+    """
+    own = manifest is None
+    if own:
+        manifest = ArtifactManifest(caption_media_dir)
     converted = 0
     excels = _numbered(caption_media_dir, ".xlsx") + _numbered(
         caption_media_dir, ".xls"
     )
+    params = _csv_params()
     for xlsx_file in sorted(excels):
         csv_file = xlsx_file.with_suffix(".csv")
-        if csv_file.exists() and csv_file.stat().st_mtime >= xlsx_file.stat().st_mtime:
+        if manifest.fresh(csv_file, [xlsx_file], params):
             continue
         xlsx_to_csv(xlsx_file, csv_file)
+        manifest.record(csv_file, [xlsx_file], params)
         converted += 1
+    if own:
+        manifest.save()
     return converted
 
 
@@ -197,38 +250,84 @@ def ensure_caption(caption_media_dir: Path, project_path: Path) -> int:
 
 
 def csv2tex(
-    caption_media_dir: Path, compiled_dir: Path, max_rows: int = MAX_ROWS
+    caption_media_dir: Path,
+    compiled_dir: Path,
+    max_rows: int = MAX_ROWS,
+    manifest: Optional[ArtifactManifest] = None,
+    full_length: bool = False,
 ) -> list:
     """Stage 4: render every ``NN_*.csv`` to ``compiled_dir/NN_*.tex``.
 
     ONE backend (pandas) -- see :mod:`scitex_writer._utils._csv_table` for why the
-    shell's 4-way backend selection is gone. Returns one dict per table.
+    shell's 4-way backend selection is gone. Each CSV that becomes a float is
+    parsed once: the same frame is rendered and measured. A table whose CSV, caption, ``max_rows``
+    and renderer version are unchanged since ``manifest`` recorded it is not
+    re-rendered; its shape comes from the manifest. Returns one dict per table.
+
+    With ``full_length``, a CSV longer than ``max_rows`` is not truncated: it
+    is streamed in chunks into a page-breaking ``longtable``
+    (:func:`~scitex_writer._utils._csv_table.write_longtable`), so even a
+    supplementary table of tens of thousands of rows is never held in memory.
+    Only its first ``max_rows + 1`` rows are read to choose the path, so a
+    table that fits is still parsed once, by that read.
     """
+    from ... import __version__
+
+    own = manifest is None
+    if own:
+        manifest = ArtifactManifest(caption_media_dir)
+    params = f"tex;max_rows={max_rows};scitex-writer={__version__}"
+    if full_length:
+        params += ";full_length"
     rendered = []
     for csv_file in _numbered(caption_media_dir, ".csv"):
         caption_file = csv_file.with_suffix(".tex")
         has_caption = caption_file.exists() or caption_file.is_symlink()
-        caption = (
-            caption_file.read_text(encoding="utf-8").strip() if has_caption else None
-        )
         compiled_file = compiled_dir / f"{csv_file.stem}.tex"
-        latex = render_csv_table(csv_file, caption=caption, max_rows=max_rows)
-        compiled_file.write_text(latex + "\n", encoding="utf-8")
-
-        import pandas as pd
-
-        frame = pd.read_csv(csv_file)
+        sources = [csv_file, caption_file] if has_caption else [csv_file]
+        shape = manifest.meta(compiled_file)
+        if not (shape and manifest.fresh(compiled_file, sources, params)):
+            caption = (
+                caption_file.read_text(encoding="utf-8").strip()
+                if has_caption
+                else None
+            )
+            frame = read_csv_table(
+                csv_file, nrows=max_rows + 1 if full_length else None
+            )
+            if full_length and len(frame) > max_rows:
+                scan = write_longtable(csv_file, compiled_file, caption=caption)
+                shape = {
+                    "rows": scan.rows,
+                    "columns": len(scan.columns),
+                    "longtable": True,
+                }
+            else:
+                latex = render_table(
+                    frame, csv_file.stem, caption=caption, max_rows=max_rows
+                )
+                compiled_file.write_text(latex + "\n", encoding="utf-8")
+                shape = {
+                    "rows": int(len(frame)),
+                    "columns": int(len(frame.columns)),
+                }
+            manifest.record(compiled_file, sources, params, meta=shape)
         rendered.append(
             {
                 "name": csv_file.stem,
                 "csv": str(csv_file),
                 "tex": str(compiled_file),
-                "rows": int(len(frame)),
-                "columns": int(len(frame.columns)),
-                "truncated": bool(len(frame) > max_rows),
+                "rows": shape["rows"],
+                "columns": shape["columns"],
+                "truncated": bool(
+                    shape["rows"] > max_rows and not shape.get("longtable")
+                ),
+                "longtable": bool(shape.get("longtable")),
                 "caption_generated": not has_caption,
             }
         )
+    if own:
+        manifest.save()
     return rendered
 
 
@@ -292,7 +391,8 @@ def process(
     no_tables : bool
         Skip all table processing (the shell's ``--no_tables`` early exit).
     max_rows : int
-        Data rows shown per table before truncation.
+        Data rows shown per table before truncation (unless the config sets
+        ``tables.full_length``: longer tables are then emitted in full).
 
     Returns
     -------
@@ -372,11 +472,17 @@ def process(
             paths["compiled_dir"],
             paths["compiled_file"],
         )
-        xlsx_converted = xlsx2csv_convert(paths["caption_media_dir"])
+        manifest = ArtifactManifest(paths["caption_media_dir"], boundary)
+        xlsx_converted = xlsx2csv_convert(paths["caption_media_dir"], manifest)
         captions_created = ensure_caption(paths["caption_media_dir"], boundary)
         tables = csv2tex(
-            paths["caption_media_dir"], paths["compiled_dir"], max_rows=max_rows
+            paths["caption_media_dir"],
+            paths["compiled_dir"],
+            max_rows=max_rows,
+            manifest=manifest,
+            full_length=bool(_cfg_get(cfg, ("tables", "full_length"), False)),
         )
+        manifest.save()
         gathered = gather_table_tex_files(paths["compiled_dir"], paths["compiled_file"])
 
         result = TablesResult(
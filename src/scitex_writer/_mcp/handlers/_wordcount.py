@@ -16,10 +16,20 @@ empty file), so the downstream ``\\num{}`` can never receive an empty argument
 (the siunitx "Invalid number" fatal that failed every latexmk pass). A missing
 config / texcount / doc dir returns an explicit error dict with an actionable
 hint -- never a silent fallback.
+
+Incremental: each section's texcount result is cached by content hash (the
+section, the files it ``\\input``s and the texcount binary) in
+``.scitex/writer/runtime/wordcount_cache.json``, so only changed sections
+reach texcount, and those run concurrently. A count file is rewritten only
+when its value changes, so an unchanged rebuild touches nothing.
 """
 
+import hashlib
+import json
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import which
 from typing import Dict, Optional
@@ -48,6 +58,13 @@ _CFG_WC_DIR = ("misc", "wordcount_dir")
 _ELEMENT_GLOB = "[0-9]*.tex"
 _EXCLUDE_NAMES = ("FINAL.tex",)
 
+# Per-section texcount results keyed by content hash (see _section_digest).
+CACHE_REL = ".scitex/writer/runtime/wordcount_cache.json"
+_CACHE_VERSION = 1
+# Files texcount -inc follows from a section.
+_INPUT_RE = re.compile(r"\\(?:input|include)\{([^}]+)\}")
+_MAX_TEXCOUNT_WORKERS = 4
+
 
 def _cfg_get(cfg: dict, path, default=None):
     """Nested dict lookup by a key-tuple; ``default`` if any level is absent."""
@@ -83,13 +100,10 @@ def _count_elements(compiled_dir: Optional[Path]) -> int:
     return n
 
 
-def _count_words_texcount(texcount: str, section_tex: Path) -> int:
-    """Words in one section via ``texcount -inc -1 -sum``; 0 when absent/empty.
+def _run_texcount(texcount: str, section_tex: Path) -> Optional[int]:
+    """Words in one section via ``texcount -inc -1 -sum``; None when it failed.
 
-    NEVER returns a non-int: extract the first integer texcount prints, else 0
-    (the never-empty invariant that protects the manuscript's \\num{})."""
-    if not section_tex.exists():
-        return 0
+    A run that prints no integer (an empty section) counts 0."""
     try:
         out = subprocess.run(
             [texcount, str(section_tex), "-inc", "-1", "-sum"],
@@ -98,12 +112,132 @@ def _count_words_texcount(texcount: str, section_tex: Path) -> int:
             timeout=30,
         ).stdout
     except (subprocess.TimeoutExpired, OSError):
-        return 0
+        return None
     m = re.search(r"\d+", out)
     return int(m.group(0)) if m else 0
 
 
-def count_words(project_dir: str, doc_type: str = "manuscript") -> dict:
+def _tool_stamp(binary: str) -> str:
+    """Identity of the texcount binary: a new texcount invalidates the cache."""
+    real = os.path.realpath(binary)
+    try:
+        st = os.stat(real)
+    except OSError:
+        return real
+    return f"{real}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _section_digest(
+    section_tex: Path, search_dirs, tool_stamp: str, project_path: Path
+) -> Optional[str]:
+    """SHA-1 over a section and the files it ``\\input``s; None when absent.
+
+    ``texcount -inc`` counts included files too, so an edit to one of them
+    must change the digest. Includes are resolved against ``search_dirs``
+    (followed recursively, each file once). Paths are hashed relative to
+    ``project_path``, so a moved or re-cloned project keeps its cache.
+    """
+    if not section_tex.is_file():
+        return None
+    digest = hashlib.sha1(tool_stamp.encode("utf-8"))
+    seen = set()
+    pending = [section_tex]
+    while pending:
+        path = pending.pop()
+        rel = os.path.relpath(path, project_path)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            digest.update(f"missing:{rel}".encode("utf-8"))
+            continue
+        digest.update(f"{rel}:".encode("utf-8"))
+        digest.update(data)
+        for name in _INPUT_RE.findall(data.decode("utf-8", "replace")):
+            name = name.strip()
+            if not name.endswith(".tex"):
+                name += ".tex"
+            for base in (path.parent, *search_dirs):
+                candidate = (base / name).resolve()
+                if candidate.is_file():
+                    break
+            else:
+                digest.update(f"unresolved:{name}".encode("utf-8"))
+                continue
+            if candidate not in seen:
+                seen.add(candidate)
+                pending.append(candidate)
+    return digest.hexdigest()
+
+
+def _load_cache(cache_path: Path) -> dict:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    sections = data.get("sections")
+    return sections if isinstance(sections, dict) else {}
+
+
+def _save_cache(cache_path: Path, sections: dict) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    payload = {"version": _CACHE_VERSION, "sections": sections}
+    tmp.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, cache_path)
+
+
+def _count_sections(texcount: str, contents: Path, project_path: Path) -> tuple:
+    """``({section: words}, texcount_runs)``, texcount run only on cache misses."""
+    cache_path = project_path / CACHE_REL
+    cached = _load_cache(cache_path)
+    stamp = _tool_stamp(texcount)
+    search_dirs = (contents, contents.parent, project_path)
+
+    words: Dict[str, int] = {}
+    misses = []
+    updated = dict(cached)
+    for sec in _WORD_SECTIONS:
+        section_tex = contents / f"{sec}.tex"
+        key = os.path.relpath(section_tex, project_path)
+        digest = _section_digest(section_tex, search_dirs, stamp, project_path)
+        if digest is None:
+            words[sec] = 0
+            updated.pop(key, None)
+            continue
+        hit = cached.get(key)
+        if isinstance(hit, dict) and hit.get("sha") == digest:
+            words[sec] = int(hit.get("words", 0))
+        else:
+            misses.append((sec, section_tex, key, digest))
+
+    if misses:
+        workers = min(len(misses), _MAX_TEXCOUNT_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(lambda miss: _run_texcount(texcount, miss[1]), misses)
+            )
+        for (sec, _, key, digest), n in zip(misses, results):
+            words[sec] = n or 0
+            if n is None:  # texcount failed: count 0 now, retry next build
+                updated.pop(key, None)
+            else:
+                updated[key] = {"sha": digest, "words": n}
+
+    if updated != cached:
+        try:
+            _save_cache(cache_path, updated)
+        except OSError:
+            pass  # a read-only project still counts, just uncached
+    return words, len(misses)
+
+
+def count_words(
+    project_dir: str,
+    doc_type: str = "manuscript",
+    texcount: Optional[str] = None,
+) -> dict:
     """Count words + figures + tables for a document type and write count files.
 
     Parameters
@@ -112,6 +246,8 @@ def count_words(project_dir: str, doc_type: str = "manuscript") -> dict:
         Path to the scitex-writer project directory.
     doc_type : str
         One of 'manuscript' (default), 'supplementary', 'revision'.
+    texcount : str, optional
+        texcount executable to use; default: ``texcount`` on PATH.
 
     Returns
     -------
@@ -168,7 +304,7 @@ def count_words(project_dir: str, doc_type: str = "manuscript") -> dict:
         fig_dir = _resolve(project_path, _cfg_get(cfg, _CFG_FIG_DIR))
         tab_dir = _resolve(project_path, _cfg_get(cfg, _CFG_TAB_DIR))
 
-        texcount = which("texcount")
+        texcount = texcount or which("texcount")
         if not texcount:
             return {
                 "success": False,
@@ -178,35 +314,49 @@ def count_words(project_dir: str, doc_type: str = "manuscript") -> dict:
                 ),
             }
 
-        # init(): clear stale *.txt then recreate (mirror count_words.sh).
         wc_dir.mkdir(parents=True, exist_ok=True)
-        for stale in wc_dir.glob("*.txt"):
-            stale.unlink()
 
         counts: Dict[str, int] = {}
         output_files = []
+        changed_files = []
 
         def _write(key: str, value: int) -> None:
             value = int(value)
             counts[key] = value
             out = wc_dir / f"{key}_count.txt"
-            out.write_text(f"{value}\n", encoding="utf-8")
+            text = f"{value}\n"
+            try:
+                unchanged = out.read_text(encoding="utf-8") == text
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                out.write_text(text, encoding="utf-8")
+                changed_files.append(str(out))
             output_files.append(str(out))
 
         _write("figure", _count_elements(fig_dir))
         _write("table", _count_elements(tab_dir))
-        contents = doc_root / "contents"
+        words, texcount_runs = _count_sections(
+            texcount, doc_root / "contents", project_path
+        )
         for sec in _WORD_SECTIONS:
-            _write(sec, _count_words_texcount(texcount, contents / f"{sec}.tex"))
+            _write(sec, words[sec])
         imrd_total = sum(counts[s] for s in _IMRD)
         _write("imrd", imrd_total)
 
+        # Clear stale *.txt (count_words.sh recreated the directory).
+        for stale in wc_dir.glob("*.txt"):
+            if str(stale) not in output_files:
+                stale.unlink()
+
         result = WordCountResult(
             success=True,
             doc_type=doc_type,
             counts=counts,
             total=imrd_total,
             output_files=output_files,
+            changed_files=changed_files,
+            texcount_runs=texcount_runs,
         )
         result.validate()
         return result.to_dict()
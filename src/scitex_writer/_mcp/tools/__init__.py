@@ -22,6 +22,7 @@ def register_all_tools(mcp: FastMCP) -> None:
         export,
         figures,
         guidelines,
+        index,
         migration,
         project,
         prompts,
@@ -50,6 +51,7 @@ def register_all_tools(mcp: FastMCP) -> None:
     skills.register_tools(mcp)
     checks.register_tools(mcp)
     wordcount.register_tools(mcp)
+    index.register_tools(mcp)
 
 
 __all__ = ["register_all_tools"]
@@ -6,7 +6,7 @@
 """Bibliography MCP tools."""
 
 import re
-from typing import Optional
+from typing import List, Optional
 
 from fastmcp import FastMCP
 
@@ -18,97 +18,26 @@ def register_tools(mcp: FastMCP) -> None:
 
     @mcp.tool()
     def writer_bib_list_files(project_dir: str) -> dict:
-        """List all bibliography files in the project."""
-        try:
-            project_path = resolve_project_path(project_dir)
-            bib_dir = project_path / "00_shared" / "bib_files"
-
-            if not bib_dir.exists():
-                return {"success": True, "bibfiles": [], "count": 0}
+        """List all bibliography files in the project, with entry counts."""
+        from scitex_writer import bib
 
-            bibfiles = []
-            for bib_file in sorted(bib_dir.glob("*.bib")):
-                content = bib_file.read_text(encoding="utf-8")
-                entry_count = content.count("@")
-                bibfiles.append(
-                    {
-                        "name": bib_file.name,
-                        "path": str(bib_file),
-                        "entry_count": entry_count,
-                        "is_merged": bib_file.name == "bibliography.bib",
-                    }
-                )
-
-            return {"success": True, "bibfiles": bibfiles, "count": len(bibfiles)}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        return bib.list_files(project_dir)
 
     @mcp.tool()
     def writer_bib_list_entries(
         project_dir: str, bibfile: Optional[str] = None
     ) -> dict:
         """List all BibTeX entries in the project or specific file."""
-        try:
-            project_path = resolve_project_path(project_dir)
-            bib_dir = project_path / "00_shared" / "bib_files"
-
-            if not bib_dir.exists():
-                return {"success": True, "entries": [], "count": 0}
-
-            entries = []
-            files_to_scan = (
-                [bib_dir / bibfile] if bibfile else list(bib_dir.glob("*.bib"))
-            )
+        from scitex_writer import bib
 
-            for bib_file in files_to_scan:
-                if not bib_file.exists():
-                    continue
-                content = bib_file.read_text(encoding="utf-8")
-                # Extract citation keys and types
-                pattern = r"@(\w+)\{([^,\s]+)"
-                for match in re.finditer(pattern, content):
-                    entry_type, citation_key = match.groups()
-                    entries.append(
-                        {
-                            "citation_key": citation_key,
-                            "entry_type": entry_type,
-                            "bibfile": bib_file.name,
-                        }
-                    )
-
-            return {"success": True, "entries": entries, "count": len(entries)}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        return bib.list_entries(project_dir, bibfile)
 
     @mcp.tool()
     def writer_bib_get(project_dir: str, citation_key: str) -> dict:
         """Get a specific BibTeX entry by citation key."""
-        try:
-            project_path = resolve_project_path(project_dir)
-            bib_dir = project_path / "00_shared" / "bib_files"
+        from scitex_writer import bib
 
-            if not bib_dir.exists():
-                return {"success": False, "error": "No bib_files directory found"}
-
-            for bib_file in bib_dir.glob("*.bib"):
-                content = bib_file.read_text(encoding="utf-8")
-                # Match @type{citation_key, ... }
-                pattern = rf"(@\w+\{{{citation_key}\s*,.*?(?=\n@|\Z))"
-                match = re.search(pattern, content, re.DOTALL)
-                if match:
-                    return {
-                        "success": True,
-                        "citation_key": citation_key,
-                        "bibfile": str(bib_file),
-                        "entry": match.group(1).strip(),
-                    }
-
-            return {
-                "success": False,
-                "error": f"Citation key not found: {citation_key}",
-            }
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        return bib.get(project_dir, citation_key)
 
     @mcp.tool()
     def writer_bib_add(
@@ -119,52 +48,43 @@ def register_tools(mcp: FastMCP) -> None:
     ) -> dict:
         """Add a BibTeX entry to a bibliography file.
 
+        To add several entries, use writer_bib_add_many (one write).
+
         Args:
             project_dir: Path to project
             bibtex_entry: The BibTeX entry to add
             bibfile: Target bib file name (default: custom.bib)
             deduplicate: Check for existing entry with same key (default: True)
         """
-        try:
-            project_path = resolve_project_path(project_dir)
-            bib_dir = project_path / "00_shared" / "bib_files"
-            bib_dir.mkdir(parents=True, exist_ok=True)
-
-            # Extract citation key from entry
-            key_match = re.search(r"@\w+\{([^,\s]+)", bibtex_entry)
-            if not key_match:
-                return {"success": False, "error": "Could not parse citation key"}
-            citation_key = key_match.group(1)
-
-            # Check for duplicates if requested
-            if deduplicate:
-                existing = writer_bib_get.__wrapped__(project_dir, citation_key)
-                if existing.get("success"):
-                    return {
-                        "success": False,
-                        "error": f"Duplicate citation key: {citation_key}",
-                        "existing_file": existing.get("bibfile"),
-                    }
-
-            bib_path = bib_dir / bibfile
-            if bib_path.exists():
-                current_content = bib_path.read_text(encoding="utf-8")
-                if not current_content.endswith("\n"):
-                    current_content += "\n"
-                new_content = current_content + "\n" + bibtex_entry.strip() + "\n"
-            else:
-                new_content = bibtex_entry.strip() + "\n"
-
-            bib_path.write_text(new_content, encoding="utf-8")
+        from scitex_writer import bib
 
-            return {
-                "success": True,
-                "bibfile": str(bib_path),
-                "citation_key": citation_key,
-                "message": f"Entry '{citation_key}' added to {bibfile}",
-            }
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        result = bib.add(project_dir, bibtex_entry, bibfile, deduplicate)
+        if result.get("success"):
+            result["message"] = f"Entry '{result['citation_key']}' added to {bibfile}"
+        return result
+
+    @mcp.tool()
+    def writer_bib_add_many(
+        project_dir: str,
+        bibtex_entries: List[str],
+        bibfile: str = "custom.bib",
+        deduplicate: bool = True,
+    ) -> dict:
+        """Add several BibTeX entries to a bibliography file with one write.
+
+        Args:
+            project_dir: Path to project
+            bibtex_entries: The BibTeX entries to add, one per item
+            bibfile: Target bib file name (default: custom.bib)
+            deduplicate: Skip keys that already exist, in any .bib file or
+                earlier in the batch (default: True)
+
+        Returns {success, bibfile, added, count, skipped: [{citation_key,
+        existing_file}], invalid}.
+        """
+        from scitex_writer import bib
+
+        return bib.add_many(project_dir, bibtex_entries, bibfile, deduplicate)
 
     @mcp.tool()
     def writer_bib_remove(
@@ -172,35 +92,23 @@ def register_tools(mcp: FastMCP) -> None:
         citation_key: str,
     ) -> dict:
         """Remove a BibTeX entry by citation key."""
-        try:
-            project_path = resolve_project_path(project_dir)
-            bib_dir = project_path / "00_shared" / "bib_files"
+        from scitex_writer import bib
 
-            if not bib_dir.exists():
-                return {"success": False, "error": "No bib_files directory found"}
+        return bib.remove(project_dir, citation_key)
 
-            for bib_file in bib_dir.glob("*.bib"):
-                content = bib_file.read_text(encoding="utf-8")
-                # Match the full entry
-                pattern = rf"@\w+\{{{citation_key}\s*,.*?(?=\n@|\Z)"
-                match = re.search(pattern, content, re.DOTALL)
-                if match:
-                    new_content = content[: match.start()] + content[match.end() :]
-                    # Clean up extra newlines
-                    new_content = re.sub(r"\n{3,}", "\n\n", new_content).strip() + "\n"
-                    bib_file.write_text(new_content, encoding="utf-8")
-                    return {
-                        "success": True,
-                        "citation_key": citation_key,
-                        "removed_from": str(bib_file),
-                    }
+    @mcp.tool()
+    def writer_bib_remove_many(
+        project_dir: str,
+        citation_keys: List[str],
+    ) -> dict:
+        """Remove several BibTeX entries, writing each touched file once.
 
-            return {
-                "success": False,
-                "error": f"Citation key not found: {citation_key}",
-            }
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        Returns {success, removed: [{citation_key, removed_from}], count,
+        not_found}.
+        """
+        from scitex_writer import bib
+
+        return bib.remove_many(project_dir, citation_keys)
 
     @mcp.tool()
     def writer_bib_merge(
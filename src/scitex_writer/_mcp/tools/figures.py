@@ -34,6 +34,7 @@ def register_tools(mcp: FastMCP) -> None:
         no_figs: bool = False,
         pptx: bool = False,
         crop: bool = False,
+        draft: bool = False,
     ) -> dict:
         """Run the figure pipeline: image sources -> JPG -> gathered FINAL.tex.
 
@@ -45,12 +46,14 @@ def register_tools(mcp: FastMCP) -> None:
         \\scitexfig{<number>} placement). With no figures it emits a comment-only
         fallback header -- never a placeholder float. no_figs=True skips all image
         work; pptx=True also renders .pptx slides via LibreOffice; crop=True trims
-        each JPG's uniform border. Returns {success, figures_compiled,
-        captions_created, panel_captions_removed, renamed_panels, converted,
-        composed, placeholders_created, cropped, figures, compiled_file,
-        figures_enabled, fallback_header, skipped, warnings, error}.
+        each JPG's uniform border; draft=True typesets cached, downscaled proxies
+        instead of the full-resolution JPGs (same layout, faster compile). Returns
+        {success, figures_compiled, captions_created, panel_captions_removed,
+        renamed_panels, converted, conversion_timings, composed,
+        placeholders_created, cropped, draft_proxies, figures, compiled_file,
+        figures_enabled, fallback_header, skipped, draft, warnings, error}.
         """
-        return _process(project_dir, doc_type, no_figs, pptx, crop)
+        return _process(project_dir, doc_type, no_figs, pptx, crop, draft)
 
     @mcp.tool()
     def writer_figures_list(
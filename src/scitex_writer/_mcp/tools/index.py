@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_mcp/tools/index.py
+
+"""Project-index MCP tools (cross-reference lookups)."""
+
+from typing import Literal, Optional
+
+from fastmcp import FastMCP
+
+from ..handlers._index import query_index as _query_index
+
+
+def register_tools(mcp: FastMCP) -> None:
+    """Register project-index tools with the MCP server."""
+
+    @mcp.tool()
+    def writer_index_query(
+        project_dir: str,
+        kind: Literal[
+            "label", "ref", "cite", "heading", "vclaim", "float", "bibentry"
+        ] = "cite",
+        key: Optional[str] = None,
+        doc_type: Optional[str] = None,
+    ) -> dict:
+        """Where a label / ref / cite / heading / claim / bib entry occurs.
+
+        Answers "who cites X" (kind='cite', key=X) and "where is label Y"
+        (kind='label', key=Y) from the persistent index in
+        .scitex/writer/runtime/project_index.sqlite; only sources changed
+        since the last query are re-parsed. Returns {success, kind, key,
+        count, hits: [{key, path, line, doc_type}], index, error}.
+        """
+        return _query_index(project_dir, kind, key, doc_type)
+
+
+# EOF
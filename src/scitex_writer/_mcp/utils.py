@@ -7,6 +7,7 @@
 
 import subprocess
 from pathlib import Path
+from typing import Callable, Iterable, Optional
 
 
 def resolve_project_path(project_dir: str) -> Path:
@@ -30,8 +31,19 @@ def run_compile_script(
     verbose: bool = False,
     track_changes: bool = False,
     engine: str | None = None,
+    log_callback: Optional[Callable[[str], None]] = None,
+    skip_stages: Optional[Iterable[str]] = None,
 ) -> dict:
-    """Run compile.sh script with specified options."""
+    """Run compile.sh script with specified options.
+
+    With ``log_callback`` the script's output is streamed line by line through
+    :func:`scitex_writer._compile._execute._execute_with_callbacks` (stderr
+    lines prefixed ``[STDERR] ``) instead of being captured in one piece.
+
+    ``skip_stages`` (any of ``bib``, ``figures``, ``tables``) names stages whose
+    previous outputs are still current; the manuscript script reuses them
+    instead of rerunning the stage (``SCITEX_WRITER_SKIP_STAGES``).
+    """
     compile_script = project_dir / "compile.sh"
 
     if not compile_script.exists():
@@ -66,16 +78,32 @@ def run_compile_script(
     env = os.environ.copy()
     if engine:
         env["SCITEX_WRITER_ENGINE"] = engine
+    if skip_stages:
+        env["SCITEX_WRITER_SKIP_STAGES"] = ",".join(sorted(skip_stages))
 
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=str(project_dir),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=env,
-        )
+        if log_callback is not None:
+            from .._compile._execute import _execute_with_callbacks
+
+            streamed = _execute_with_callbacks(
+                cmd,
+                cwd=project_dir,
+                timeout=timeout,
+                log_callback=log_callback,
+                env=env,
+            )
+            result = subprocess.CompletedProcess(
+                cmd, streamed["exit_code"], streamed["stdout"], streamed["stderr"]
+            )
+        else:
+            result = subprocess.run(
+                cmd,
+                cwd=str(project_dir),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=env,
+            )
 
         # Determine output PDF path
         pdf_paths = {
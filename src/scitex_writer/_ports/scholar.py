@@ -9,8 +9,16 @@ Resolution paths, in order:
 
 1. ``<library_root>/index.db`` — when scitex-scholar PR-C has shipped,
    use a single SQLite SELECT. This is preferred whenever the DB exists.
-2. Linear scan of ``<library_root>/MASTER/*/metadata.json``, cached
-   in-process with an mtime key. Works today, no DB needed.
+2. The writer's own identifier index over
+   ``<library_root>/MASTER/*/metadata.json``: DOI, arXiv id and PMID ->
+   paper_id (plus the browse-card fields), persisted in the sidecar
+   ``<library_root>/.scitex-writer-ids.sqlite``. A refresh stats every
+   ``metadata.json`` and re-reads only those whose mtime or size changed, so
+   a warm library costs one stat pass, not one JSON parse per record. A
+   process refreshes at most once per ``_REFRESH_INTERVAL_S`` unless the
+   MASTER listing changed, so resolving the 300 citation cards of a
+   manuscript is one pass plus 300 indexed SELECTs (the old in-process scan
+   was a linear walk per DOI). A read-only library keeps the index in memory.
 3. Return ``None`` — caller falls back to bare bib card.
 
 Every function degrades on missing/dangling symlink, unreadable JSON,
@@ -20,8 +28,10 @@ or unknown schema fields.
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
-from functools import lru_cache
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -34,6 +44,15 @@ SCHOLAR_AVAILABLE = scitex_scholar is not None
 
 
 _INDEX_DB_NAME = "index.db"
+_SIDECAR_DB_NAME = ".scitex-writer-ids.sqlite"
+
+# Bump when the sidecar's columns or key normalization change: a sidecar
+# written by another version is rebuilt rather than trusted.
+_SIDECAR_SCHEMA = 1
+
+# Within this many seconds of a full stat pass, and with the MASTER listing
+# unchanged, lookups trust the index as is.
+_REFRESH_INTERVAL_S = 2.0
 
 
 def scholar_library_root(project_dir: Path) -> Optional[Path]:
@@ -55,26 +74,48 @@ def _index_db_path(root: Path) -> Optional[Path]:
 
 
 def metadata_for_doi(root: Path, doi: str) -> Optional[dict]:
-    """Look up a paper by DOI. Prefers index.db, falls back to MASTER scan."""
+    """Look up a paper by DOI (case-insensitive). Prefers index.db."""
+    return _metadata_for_identifier(root, "doi", doi)
+
+
+def metadata_for_arxiv_id(root: Path, arxiv_id: str) -> Optional[dict]:
+    """Look up a paper by arXiv id (an ``arXiv:`` prefix is ignored)."""
+    return _metadata_for_identifier(root, "arxiv_id", arxiv_id)
+
+
+def metadata_for_pmid(root: Path, pmid: str) -> Optional[dict]:
+    """Look up a paper by PubMed id."""
+    return _metadata_for_identifier(root, "pmid", pmid)
+
+
+def _metadata_for_identifier(root: Path, column: str, value: str) -> Optional[dict]:
     db = _index_db_path(root)
     if db is not None:
         try:
             with sqlite3.connect(f"file:{db}?mode=ro", uri=True) as conn:
                 conn.row_factory = sqlite3.Row
                 row = conn.execute(
-                    "SELECT * FROM papers WHERE doi = ? COLLATE NOCASE", (doi,)
+                    f"SELECT * FROM papers WHERE {column} = ? COLLATE NOCASE",
+                    (value,),
                 ).fetchone()
                 if row:
-                    return _hydrate_full_metadata(root, dict(row)["paper_id"]) or dict(
-                        row
-                    )
+                    row = dict(row)
+                    return _hydrate_full_metadata(root, row["paper_id"]) or row
         except sqlite3.Error:
             pass
 
-    doi_lc = doi.lower()
-    for md in _iter_all_metadata(root):
-        entry_doi = (md.get("metadata", {}).get("id", {}) or {}).get("doi")
-        if entry_doi and entry_doi.lower() == doi_lc:
+    key = _identifier_key(column, value)
+    if not key:
+        return None
+    index = _identifier_index(root)
+    for force in (False, True):
+        paper_id = index.lookup(column, key, force_refresh=force)
+        if paper_id is None:
+            return None
+        md = _hydrate_full_metadata(root, paper_id)
+        # An edit within the refresh interval can leave the index stale:
+        # re-check the hit against the record itself.
+        if md is not None and _identifier_key(column, _ids(md).get(column)) == key:
             return md
     return None
 
@@ -103,23 +144,7 @@ def iter_library_cards(root: Path) -> list[dict]:
         except sqlite3.Error:
             pass
 
-    out = []
-    for md in _iter_all_metadata(root):
-        m = md.get("metadata", {}) or {}
-        id_ = m.get("id", {}) or {}
-        basic = m.get("basic", {}) or {}
-        pub = m.get("publication", {}) or {}
-        out.append(
-            {
-                "paper_id": md.get("_paper_id"),
-                "doi": id_.get("doi"),
-                "arxiv_id": id_.get("arxiv_id"),
-                "pmid": id_.get("pmid"),
-                "title": basic.get("title"),
-                "year": basic.get("year"),
-                "venue": pub.get("short_journal") or pub.get("journal"),
-            }
-        )
+    out = _identifier_index(root).cards()
     out.sort(key=lambda r: (-(r.get("year") or 0), (r.get("title") or "")))
     return out
 
@@ -137,25 +162,186 @@ def _hydrate_full_metadata(root: Path, paper_id: str) -> Optional[dict]:
         return None
 
 
-def _iter_all_metadata(root: Path) -> tuple[dict, ...]:
-    """Cached MASTER scan, invalidated when the MASTER dir mtime changes."""
-    master = root / "MASTER"
-    mtime = master.stat().st_mtime if master.is_dir() else 0.0
-    return _cached_master_scan(str(root), mtime)
+def _ids(md: dict) -> dict:
+    return (md.get("metadata", {}) or {}).get("id", {}) or {}
 
 
-@lru_cache(maxsize=8)
-def _cached_master_scan(root_str: str, mtime_key: float) -> tuple[dict, ...]:
-    root = Path(root_str)
-    master = root / "MASTER"
-    if not master.is_dir():
-        return ()
-    entries = []
-    for f in master.glob("*/metadata.json"):
+def _identifier_key(column: str, value) -> Optional[str]:
+    """The normalized form an identifier is indexed and looked up by."""
+    if value is None:
+        return None
+    key = str(value).strip().lower()
+    if column == "arxiv_id" and key.startswith("arxiv:"):
+        key = key[len("arxiv:") :].strip()
+    return key or None
+
+
+def _sql_value(value):
+    """``value`` as SQLite stores it; an unexpected JSON shape becomes text."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value)
+
+
+def _card_row(paper_id: str, stamp: tuple, md: dict) -> tuple:
+    m = md.get("metadata", {}) or {}
+    id_ = m.get("id", {}) or {}
+    basic = m.get("basic", {}) or {}
+    pub = m.get("publication", {}) or {}
+    return (
+        paper_id,
+        stamp[0],
+        stamp[1],
+        _sql_value(id_.get("doi")),
+        _sql_value(id_.get("arxiv_id")),
+        _sql_value(id_.get("pmid")),
+        _sql_value(basic.get("title")),
+        _sql_value(basic.get("year")),
+        _sql_value(pub.get("short_journal") or pub.get("journal")),
+        _identifier_key("doi", id_.get("doi")),
+        _identifier_key("arxiv_id", id_.get("arxiv_id")),
+        _identifier_key("pmid", id_.get("pmid")),
+    )
+
+
+_SIDECAR_DDL = """
+CREATE TABLE IF NOT EXISTS records (
+    paper_id TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    doi TEXT,
+    arxiv_id TEXT,
+    pmid TEXT,
+    title TEXT,
+    year,
+    venue TEXT,
+    doi_key TEXT,
+    arxiv_id_key TEXT,
+    pmid_key TEXT
+);
+CREATE INDEX IF NOT EXISTS records_doi ON records(doi_key);
+CREATE INDEX IF NOT EXISTS records_arxiv_id ON records(arxiv_id_key);
+CREATE INDEX IF NOT EXISTS records_pmid ON records(pmid_key);
+"""
+
+
+class _IdentifierIndex:
+    """DOI / arXiv id / PMID -> paper_id over one library's MASTER records."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.lock = threading.Lock()
+        self.reads = 0  # metadata.json files parsed, for tests
+        self._master_mtime: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        try:
+            self.conn = self._open(str(self.root / _SIDECAR_DB_NAME))
+        except sqlite3.Error:  # read-only library: index in memory only
+            self.conn = self._open(":memory:")
+
+    @staticmethod
+    def _open(target: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(target, check_same_thread=False)
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SIDECAR_SCHEMA:
+                conn.executescript("DROP TABLE IF EXISTS records;")
+            conn.executescript(_SIDECAR_DDL)
+            conn.execute(f"PRAGMA user_version = {_SIDECAR_SCHEMA}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def refresh(self, force: bool = False) -> None:
+        """Re-read the metadata.json files that changed since the last pass."""
+        master = self.root / "MASTER"
+        try:
+            master_mtime = master.stat().st_mtime_ns
+        except OSError:
+            master_mtime = None
+        if (
+            not force
+            and self._checked_at is not None
+            and master_mtime == self._master_mtime
+            and time.monotonic() - self._checked_at < _REFRESH_INTERVAL_S
+        ):
+            return
+
+        known = {
+            row[0]: (row[1], row[2])
+            for row in self.conn.execute("SELECT paper_id, mtime_ns, size FROM records")
+        }
+        seen = set()
+        changed = []
         try:
-            md = json.loads(f.read_text())
-            md["_paper_id"] = f.parent.name
-            entries.append(md)
-        except (OSError, json.JSONDecodeError):
-            continue
-    return tuple(entries)
+            listing = list(os.scandir(master))
+        except OSError:
+            listing = []
+        for item in listing:
+            path = os.path.join(item.path, "metadata.json")
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if known.get(item.name) == stamp:
+                seen.add(item.name)
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    md = json.load(f)
+            except (OSError, ValueError):
+                continue  # unreadable: left out, as the old scan did
+            self.reads += 1
+            seen.add(item.name)
+            changed.append(_card_row(item.name, stamp, md))
+        gone = [(paper_id,) for paper_id in known.keys() - seen]
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO records VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    changed,
+                )
+                self.conn.executemany("DELETE FROM records WHERE paper_id = ?", gone)
+        except sqlite3.Error:
+            return  # e.g. the library went read-only: retry on the next pass
+        self._master_mtime = master_mtime
+        self._checked_at = time.monotonic()
+
+    def lookup(
+        self, column: str, key: str, force_refresh: bool = False
+    ) -> Optional[str]:
+        """paper_id of the first record (by paper_id) whose ``column`` is ``key``."""
+        with self.lock:
+            self.refresh(force=force_refresh)
+            row = self.conn.execute(
+                f"SELECT paper_id FROM records WHERE {column}_key = ? "
+                "ORDER BY paper_id LIMIT 1",
+                (key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def cards(self) -> list[dict]:
+        """Compact browse records of every paper (unsorted)."""
+        with self.lock:
+            self.refresh()
+            rows = self.conn.execute(
+                "SELECT paper_id, doi, arxiv_id, pmid, title, year, venue FROM records"
+            ).fetchall()
+        columns = ("paper_id", "doi", "arxiv_id", "pmid", "title", "year", "venue")
+        return [dict(zip(columns, row)) for row in rows]
+
+
+_IDENTIFIER_INDEXES: dict[str, _IdentifierIndex] = {}
+_IDENTIFIER_INDEXES_LOCK = threading.Lock()
+
+
+def _identifier_index(root: Path) -> _IdentifierIndex:
+    """The process-wide identifier index of the library at ``root``."""
+    with _IDENTIFIER_INDEXES_LOCK:
+        index = _IDENTIFIER_INDEXES.get(str(root))
+        if index is None:
+            index = _IDENTIFIER_INDEXES[str(root)] = _IdentifierIndex(root)
+        return index
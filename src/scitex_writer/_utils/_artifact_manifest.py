@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_utils/_artifact_manifest.py
+
+"""Content-hash freshness for derived figure and table files.
+
+The figure and table pipelines used to decide whether a derived file (a PNG from
+a TIF, a JPG from a PNG, a compiled ``.tex`` from a caption or CSV) was current
+by comparing ``st_mtime``. After a ``git checkout``, a container bind mount or a
+CI cache restore, mtimes say nothing about content: everything was either
+reconverted or, worse, wrongly skipped.
+
+An :class:`ArtifactManifest` records, per derived file, the SHA-256 of each
+source, the conversion parameters (tool version, quality, ...) and the SHA-256
+of the output it produced. A derived file is fresh when all of those still
+match. Paths are stored relative to the manifest's directory, so the manifest
+stays valid in another clone of the project.
+
+Hashes are memoized by ``(size, mtime_ns)``: an unchanged file is stat-ed, not
+re-read. A file whose stat changed (including every file after a fresh clone)
+is hashed once and the memo updated, so the stat is only a shortcut and never
+the verdict.
+
+The memo is machine-specific and changes on every build, so the manifest is
+kept in the project's build cache (``.scitex/writer/runtime/manifests/``), not
+next to the author's sources; see :func:`manifest_path`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+MANIFEST_NAME = ".scitex_manifest.json"
+"""In-directory name: used for a directory outside any project, and read once
+from manifests written there by earlier versions."""
+MANIFEST_DIR = ".scitex/writer/runtime/manifests"
+MANIFEST_VERSION = 1
+
+PathLike = Union[str, Path]
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _project_root(directory: Path) -> Optional[Path]:
+    """The nearest ancestor of ``directory`` holding ``.scitex`` or ``.git``."""
+    for candidate in (directory, *directory.parents):
+        if (candidate / ".scitex").is_dir() or (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def manifest_path(directory: PathLike, root: Optional[PathLike] = None) -> Path:
+    """Where the manifest of the files derived in ``directory`` is kept.
+
+    ``<root>/.scitex/writer/runtime/manifests/<directory below root>.json``,
+    with ``root`` defaulting to the nearest ancestor holding ``.scitex`` or
+    ``.git``. A directory outside any project keeps ``.scitex_manifest.json``
+    in itself.
+    """
+    directory = Path(os.path.abspath(directory))
+    root = Path(os.path.abspath(root)) if root else _project_root(directory)
+    if root is not None:
+        rel = Path(os.path.relpath(directory, root))
+        if rel.parts and rel.parts[0] != "..":
+            return root / MANIFEST_DIR / f"{'--'.join(rel.parts)}.json"
+    return directory / MANIFEST_NAME
+
+
+class ArtifactManifest:
+    """Sources, parameters and output hash of every file derived in a directory.
+
+    Args:
+        directory: The directory whose derived files are recorded; recorded
+            paths are relative to it.
+        root: The project root whose build cache holds the manifest (see
+            :func:`manifest_path`).
+    """
+
+    def __init__(self, directory: PathLike, root: Optional[PathLike] = None):
+        self.directory = Path(directory)
+        self.path = manifest_path(self.directory, root)
+        self._legacy = self.directory / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._dirty = False
+        data = self._read(self.path)
+        if not data and self._legacy != self.path:
+            data = self._read(self._legacy)
+        self._artifacts: Dict[str, dict] = data.get("artifacts", {})
+        self._hashes: Dict[str, list] = data.get("hashes", {})
+
+    @staticmethod
+    def _read(path: Path) -> dict:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data
+
+    def _rel(self, path: PathLike) -> str:
+        return Path(os.path.relpath(os.path.abspath(path), self.directory)).as_posix()
+
+    def digest(self, path: PathLike) -> Optional[str]:
+        """SHA-256 of ``path``'s content (links followed); None when absent."""
+        rel = self._rel(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = [st.st_size, st.st_mtime_ns]
+        with self._lock:
+            memo = self._hashes.get(rel)
+        if memo is not None and memo[:2] == stamp:
+            return memo[2]
+        sha = _sha256_file(Path(path))
+        with self._lock:
+            self._hashes[rel] = stamp + [sha]
+            self._dirty = True
+        return sha
+
+    def fresh(
+        self, target: PathLike, sources: Iterable[PathLike], params: str = ""
+    ) -> bool:
+        """True when ``target`` is exactly what ``sources`` + ``params`` produced.
+
+        False for a target that is missing, never recorded, hand-edited since it
+        was recorded, or whose sources or parameters changed.
+        """
+        with self._lock:
+            entry = self._artifacts.get(self._rel(target))
+        if entry is None or entry.get("params") != params:
+            return False
+        recorded = entry.get("sources", {})
+        sources = list(sources)
+        if {self._rel(s) for s in sources} != set(recorded):
+            return False
+        for source in sources:
+            if self.digest(source) != recorded[self._rel(source)]:
+                return False
+        output = self.digest(target)
+        return output is not None and output == entry.get("output")
+
+    def record(
+        self,
+        target: PathLike,
+        sources: Iterable[PathLike],
+        params: str = "",
+        meta: Optional[dict] = None,
+    ) -> None:
+        """Note that ``target`` was just produced from ``sources`` with ``params``.
+
+        ``meta`` is kept with the entry (e.g. a table's row count) and returned
+        by :meth:`meta` while the entry stays fresh.
+        """
+        entry = {
+            "sources": {self._rel(s): self.digest(s) for s in sources},
+            "params": params,
+            "output": self.digest(target),
+        }
+        if meta:
+            entry["meta"] = meta
+        with self._lock:
+            self._artifacts[self._rel(target)] = entry
+            self._dirty = True
+
+    def meta(self, target: PathLike) -> dict:
+        """The ``meta`` recorded with ``target`` (empty when none)."""
+        with self._lock:
+            entry = self._artifacts.get(self._rel(target), {})
+        return dict(entry.get("meta", {}))
+
+    def forget(self, target: PathLike) -> None:
+        """Drop ``target``'s entry (it will be rebuilt next time)."""
+        with self._lock:
+            if self._artifacts.pop(self._rel(target), None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest, dropping entries and hashes of vanished files.
+
+        Written atomically, and only when something changed.
+        """
+        with self._lock:
+            for rel in list(self._artifacts):
+                if not (self.directory / rel).exists():
+                    del self._artifacts[rel]
+                    self._dirty = True
+            live = set(self._artifacts)
+            for entry in self._artifacts.values():
+                live.update(entry.get("sources", {}))
+            for rel in list(self._hashes):
+                if rel not in live:
+                    del self._hashes[rel]
+                    self._dirty = True
+            if not self._dirty:
+                return
+            data = {
+                "version": MANIFEST_VERSION,
+                "artifacts": dict(sorted(self._artifacts.items())),
+                "hashes": dict(sorted(self._hashes.items())),
+            }
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+        if self._legacy != self.path:
+            self._legacy.unlink(missing_ok=True)  # moved into the build cache
+
+
+__all__ = ["MANIFEST_DIR", "MANIFEST_NAME", "ArtifactManifest", "manifest_path"]
+
+# EOF
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_utils/_bib_index.py
+
+"""In-process index of a project's ``00_shared/bib_files/*.bib`` entries.
+
+``sw.bib`` used to re-read every .bib file on each call: ``get`` compiled a
+fresh DOTALL regex per lookup and scanned the files in glob order, ``add``
+called ``get`` first, and ``list_files`` counted ``@`` characters. An agent
+adding 200 references one call at a time paid O(n^2) file I/O.
+
+One :class:`BibIndex` per bib directory is shared by the process
+(:func:`get_bib_index`). :meth:`BibIndex.refresh` stats the directory's
+``*.bib`` files and re-reads only those whose ``(mtime_ns, size)`` changed;
+deleted files drop out. A stamp taken within the mtime resolution of the
+file's last write is not trusted (a second write in the same tick may keep
+it): such a file is read again on the next refresh, and re-scanned only if
+its text changed. Cite keys map to their entries, so a lookup is a dict
+hit, and the batch writes (:meth:`BibIndex.add_many`,
+:meth:`BibIndex.remove_many`) write each touched file once and update the
+index from the text they wrote instead of reading it back. Appends go to the
+end of the file without rewriting it.
+
+Entries are found by :func:`scan_entries`: an entry runs from its ``@`` to
+the brace (or parenthesis) that closes it, so the comments between entries
+are neither part of an entry nor removed with it. ``@string``,
+``@preamble`` and ``@comment`` blocks are not entries.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+NON_ENTRY_TYPES = frozenset({"comment", "preamble", "string"})
+
+_HEAD_RE = re.compile(r"@[ \t]*(\w+)[ \t\r\n]*([{(])[ \t\r\n]*")
+_KEY_RE = re.compile(r"[^,\s{}()]+")
+_BRACE_RE = re.compile(r"[{}]")
+_BRACE_PAREN_RE = re.compile(r"[{}()]")
+_NEXT_ITEM_RE = re.compile(r"\n@")
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+# A file modified this recently may change again within the same mtime tick
+# (2 s on FAT), so its (mtime_ns, size) is not trusted next time: it is re-read.
+_RACY_MTIME_NS = 2_000_000_000
+
+PathLike = Union[str, Path]
+
+
+class BibEntry(NamedTuple):
+    """One entry of a .bib file: key, type and character span in its text."""
+
+    citation_key: str
+    entry_type: str
+    bibfile: str
+    start: int
+    end: int
+
+
+def _block_end(text: str, opener: int) -> Optional[int]:
+    """End of the block whose ``{`` or ``(`` is at ``opener``; None if open."""
+    depth = 0
+    if text[opener] == "{":
+        for match in _BRACE_RE.finditer(text, opener):
+            depth += 1 if match.group() == "{" else -1
+            if depth == 0:
+                return match.end()
+        return None
+    for match in _BRACE_PAREN_RE.finditer(text, opener + 1):
+        char = match.group()
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif char == ")" and depth == 0:
+            return match.end()
+    return None
+
+
+def _scan(text: str, bibfile: str, pos: int) -> Tuple[List[BibEntry], bool]:
+    """Entries from ``pos`` on, and whether the last block runs to the end."""
+    entries: List[BibEntry] = []
+    open_tail = False
+    size = len(text)
+    while True:
+        head = _HEAD_RE.search(text, pos)
+        if head is None:
+            return entries, open_tail
+        end = _block_end(text, head.start(2))
+        if end is None:
+            # Unbalanced: bibtex reads on to the next line starting with "@"
+            following = _NEXT_ITEM_RE.search(text, head.end())
+            end = following.start() if following else size
+            open_tail = following is None
+        else:
+            open_tail = False
+        entry_type = head.group(1).lower()
+        key = _KEY_RE.match(text, head.end())
+        if entry_type not in NON_ENTRY_TYPES and key is not None:
+            entries.append(
+                BibEntry(key.group(), head.group(1), bibfile, head.start(), end)
+            )
+        pos = end
+
+
+def scan_entries(text: str, bibfile: str = "") -> List[BibEntry]:
+    """The entries of the .bib source ``text``, in order (see module doc)."""
+    return _scan(text, bibfile, 0)[0]
+
+
+def split_entries(text: str) -> List[str]:
+    """The text of each entry in ``text`` (e.g. a pasted batch of entries)."""
+    return [text[e.start : e.end] for e in scan_entries(text)]
+
+
+class _BibFile:
+    __slots__ = ("stamp", "racy", "text", "entries", "open_tail")
+
+    def __init__(self, name: str, stamp: Tuple[int, int], text: str):
+        self.restamp(stamp)
+        self.text = text
+        self.entries, self.open_tail = _scan(text, name, 0)
+
+    def restamp(self, stamp: Tuple[int, int]) -> None:
+        self.stamp = stamp
+        self.racy = time.time_ns() - stamp[0] < _RACY_MTIME_NS
+
+
+class BibIndex:
+    """The entries of one bib directory, kept current by ``(mtime_ns, size)``.
+
+    Every public method refreshes first and holds the index lock, so the
+    index is safe to share between threads (the MCP server's tool calls).
+    """
+
+    def __init__(self, bib_dir: PathLike):
+        self.bib_dir = Path(bib_dir)
+        self.lock = threading.RLock()
+        self.reads = 0  # files (re-)read from disk, for tests and benchmarks
+        self._files: Dict[str, _BibFile] = {}
+        self._keys: Dict[str, List[BibEntry]] = {}
+
+    # -- keeping current --------------------------------------------------
+
+    def refresh(self) -> None:
+        """Re-read the .bib files that changed since the last call."""
+        with self.lock:
+            seen = set()
+            try:
+                listing = list(os.scandir(self.bib_dir))
+            except OSError:
+                listing = []
+            for item in listing:
+                if not self._indexable(item.name) or not item.is_file():
+                    continue
+                seen.add(item.name)
+                stat = item.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                cached = self._files.get(item.name)
+                if cached is not None and cached.stamp == stamp and not cached.racy:
+                    continue
+                text = Path(item.path).read_text(encoding="utf-8")
+                self.reads += 1
+                if cached is not None and cached.text == text:
+                    cached.restamp(stamp)
+                else:
+                    self._store(item.name, _BibFile(item.name, stamp, text))
+            for name in set(self._files) - seen:
+                self._unregister(name)
+                del self._files[name]
+
+    @staticmethod
+    def _indexable(name: str) -> bool:
+        # What the callers' bib_dir.glob("*.bib") saw: no dotfiles, no subdirs
+        return name.endswith(".bib") and not name.startswith(".")
+
+    def _store(self, name: str, record: _BibFile) -> None:
+        self._unregister(name)
+        self._files[name] = record
+        self._register(record.entries)
+
+    def _register(self, entries: List[BibEntry]) -> None:
+        for entry in entries:
+            self._keys.setdefault(entry.citation_key, []).append(entry)
+
+    def _unregister(self, name: str) -> None:
+        record = self._files.get(name)
+        if record is None:
+            return
+        for entry in record.entries:
+            occurrences = self._keys[entry.citation_key]
+            occurrences.remove(entry)
+            if not occurrences:
+                del self._keys[entry.citation_key]
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    # -- reading ----------------------------------------------------------
+
+    def files(self) -> List[Tuple[str, int]]:
+        """``[(file name, entry count), ...]`` in name order."""
+        with self.lock:
+            self.refresh()
+            return [
+                (name, len(self._files[name].entries)) for name in sorted(self._files)
+            ]
+
+    def entries(self, bibfile: Optional[str] = None) -> List[BibEntry]:
+        """All entries in file-name order, or those of ``bibfile`` only."""
+        with self.lock:
+            self.refresh()
+            names = [bibfile] if bibfile is not None else sorted(self._files)
+            return [
+                entry
+                for name in names
+                if name in self._files
+                for entry in self._files[name].entries
+            ]
+
+    def lookup(self, citation_key: str) -> Optional[BibEntry]:
+        """The first entry with ``citation_key`` (by file name, then position)."""
+        with self.lock:
+            self.refresh()
+            return self._first(citation_key)
+
+    def _first(self, citation_key: str) -> Optional[BibEntry]:
+        occurrences = self._keys.get(citation_key)
+        if not occurrences:
+            return None
+        return min(occurrences, key=lambda e: (e.bibfile, e.start))
+
+    def text_of(self, entry: BibEntry) -> str:
+        """The source text of ``entry``."""
+        with self.lock:
+            return self._files[entry.bibfile].text[entry.start : entry.end]
+
+    # -- writing ----------------------------------------------------------
+
+    def add_many(
+        self,
+        bibtex_entries: Union[str, Iterable[str]],
+        bibfile: str = "custom.bib",
+        deduplicate: bool = True,
+    ) -> Tuple[List[str], List[dict], List[str]]:
+        """Append entries to ``bibfile`` with one write.
+
+        ``bibtex_entries`` is a list of entry texts, or one text holding
+        several entries. Each text is appended as ``sw.bib.add`` appends it;
+        its key is that of its first entry. With ``deduplicate``, a key that
+        already exists -- in any .bib file, or earlier in the batch -- is
+        skipped.
+
+        Returns:
+            (added keys, skipped [{citation_key, existing_file}], texts with
+            no parsable key)
+        """
+        if isinstance(bibtex_entries, str):
+            bibtex_entries = split_entries(bibtex_entries)
+        with self.lock:
+            self.refresh()
+            added: List[str] = []
+            skipped: List[dict] = []
+            invalid: List[str] = []
+            chunks: List[str] = []
+            for raw in bibtex_entries:
+                found = scan_entries(raw)
+                if not found:
+                    invalid.append(raw)
+                    continue
+                key = found[0].citation_key
+                if deduplicate:
+                    existing = self._first(key)
+                    if existing is not None or key in added:
+                        where = existing.bibfile if existing else bibfile
+                        skipped.append(
+                            {
+                                "citation_key": key,
+                                "existing_file": str(self.bib_dir / where),
+                            }
+                        )
+                        continue
+                added.append(key)
+                chunks.append(raw.strip())
+            if chunks:
+                self._append(bibfile, chunks)
+            return added, skipped, invalid
+
+    def _append(self, bibfile: str, chunks: List[str]) -> None:
+        path = self.bib_dir / bibfile
+        record = self._files.get(bibfile)
+        if record is not None or path.exists():
+            old = record.text if record is not None else path.read_text("utf-8")
+            addition = "" if old.endswith("\n") else "\n"
+            addition += "".join(f"\n{chunk}\n" for chunk in chunks)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(addition)
+        else:
+            old = ""
+            addition = chunks[0] + "\n" + "".join(f"\n{c}\n" for c in chunks[1:])
+            path.write_text(addition, encoding="utf-8")
+        if not self._indexable(bibfile) or path.parent != self.bib_dir:
+            return
+        text = old + addition
+        if record is None or record.open_tail:
+            self._store(bibfile, _BibFile(bibfile, self._stamp(path), text))
+            return
+        # Only the appended tail needs scanning
+        tail, record.open_tail = _scan(text, bibfile, len(old))
+        record.restamp(self._stamp(path))
+        record.text = text
+        record.entries.extend(tail)
+        self._register(tail)
+
+    def remove_many(self, citation_keys: Iterable[str]) -> Tuple[List[dict], List[str]]:
+        """Remove the entry of each key, writing each touched file once.
+
+        Each key loses the entry :meth:`lookup` finds for it.
+
+        Returns:
+            (removed [{citation_key, removed_from}], keys not found)
+        """
+        with self.lock:
+            self.refresh()
+            removed: List[dict] = []
+            missing: List[str] = []
+            by_file: Dict[str, List[BibEntry]] = {}
+            for key in dict.fromkeys(citation_keys):
+                entry = self._first(key)
+                if entry is None:
+                    missing.append(key)
+                    continue
+                by_file.setdefault(entry.bibfile, []).append(entry)
+                removed.append(
+                    {
+                        "citation_key": key,
+                        "removed_from": str(self.bib_dir / entry.bibfile),
+                    }
+                )
+            for name, entries in by_file.items():
+                text = self._files[name].text
+                pieces = []
+                pos = 0
+                for entry in sorted(entries, key=lambda e: e.start):
+                    pieces.append(text[pos : entry.start])
+                    pos = entry.end
+                pieces.append(text[pos:])
+                new_text = _BLANK_RUN_RE.sub("\n\n", "".join(pieces)).strip() + "\n"
+                path = self.bib_dir / name
+                path.write_text(new_text, encoding="utf-8")
+                self._store(name, _BibFile(name, self._stamp(path), new_text))
+            return removed, missing
+
+
+_INDEXES: Dict[str, BibIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_bib_index(bib_dir: PathLike) -> BibIndex:
+    """The process-wide :class:`BibIndex` of ``bib_dir``."""
+    key = os.path.realpath(bib_dir)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = BibIndex(key)
+        return index
+
+
+__all__ = [
+    "BibEntry",
+    "BibIndex",
+    "NON_ENTRY_TYPES",
+    "get_bib_index",
+    "scan_entries",
+    "split_entries",
+]
+
+# EOF
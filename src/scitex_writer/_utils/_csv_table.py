@@ -22,17 +22,33 @@ Emitted structure (parity with the shell + the old Python script):
 ``\resizebox`` -> ``booktabs`` tabular (bold header, zebra ``\rowcolor``) ->
 caption (author's, or a generated default) -> ``\label{tab:<base>}`` emitted
 ONLY when the caption does not already carry one.
+
+Cells are formatted a column at a time: a numeric column's display strings and
+its alignment precision come from one array pass (:func:`format_column`), and
+plain text is escaped with one ``str.translate`` per cell. A caller that already
+parsed the CSV hands the frame to :func:`render_table` instead of reading the
+file again.
+
+A table too long to truncate (a supplementary data table emitted in full) goes
+through :func:`write_longtable` instead: the CSV is read in chunks twice -- once
+by :func:`scan_csv_table` for the row count, alignments and column precisions,
+once to write the ``longtable`` rows straight to the output file -- so memory
+stays bounded by the chunk size, not the table size.
 """
 
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 
 MAX_ROWS = 30
 """Data rows shown before the table is truncated with an omitted-rows marker."""
 
+CHUNK_ROWS = 10_000
+"""CSV rows held in memory at a time by :func:`write_longtable`."""
+
 _TEXTBF_RE = re.compile(r"\\textbf\{([^}]*)\}")
 _CAPTION_HEAD_RE = re.compile(r"\\caption\{([^.]*)\.")
 
@@ -53,16 +69,24 @@ _ESCAPES = (
 )
 
 
+def _escape_sequentially(char: str) -> str:
+    for old, new in _ESCAPES:
+        char = char.replace(old, new)
+    return char
+
+
+# One-pass equivalent of applying _ESCAPES in order (later rules also rewrite
+# what earlier ones inserted, e.g. the braces of ``\textbackslash{}``).
+_ESCAPE_TABLE = str.maketrans({old: _escape_sequentially(old) for old, _ in _ESCAPES})
+
+
 def escape_latex(text) -> str:
     """Escape LaTeX-special characters in a plain (non-verbatim) value."""
     import pandas as pd
 
     if pd.isna(text):
         return ""
-    text = str(text)
-    for old, new in _ESCAPES:
-        text = text.replace(old, new)
-    return text
+    return str(text).translate(_ESCAPE_TABLE)
 
 
 def is_verbatim(value) -> bool:
@@ -131,16 +155,73 @@ def _value_decimals(val) -> Optional[int]:
     return len(shown.split(".")[1]) if "." in shown else 0
 
 
+def _is_numeric_column(values) -> bool:
+    """True for a pandas/numpy column of ints or floats (never verbatim text)."""
+    dtype = getattr(values, "dtype", None)
+    return dtype is not None and getattr(dtype, "kind", "") in "iuf"
+
+
+def _number_strings(values):
+    """:func:`format_number` over a whole numeric column, in array operations.
+
+    Returns ``(numbers, shown, decimals)``: the column as floats (NaN for
+    missing), each value's display string, and the decimals it shows
+    (``-1`` where :func:`_value_decimals` gives None: NaN and scientific).
+    """
+    import numpy as np
+    import pandas as pd
+
+    numbers = pd.Series(values).to_numpy(dtype=float, na_value=np.nan)
+    missing = np.isnan(numbers)
+    finite = np.isfinite(numbers)
+    integral = finite & (np.floor(np.where(finite, numbers, 0.0)) == numbers)
+    tiny = ~integral & (np.abs(numbers) < 0.01) & (numbers != 0)
+    plain = ~(integral | tiny | missing)
+
+    shown = np.full(numbers.shape, "", dtype=object)
+    decimals = np.full(numbers.shape, -1, dtype=int)
+    if integral.any():
+        shown[integral] = np.char.mod("%d", numbers[integral])
+        decimals[integral] = 0
+    if tiny.any():
+        shown[tiny] = np.char.mod("%.2e", numbers[tiny])
+    if plain.any():
+        fixed = np.char.mod("%.3f", numbers[plain])
+        fixed = np.char.rstrip(np.char.rstrip(fixed, "0"), ".")
+        dot = np.char.find(fixed, ".")
+        shown[plain] = fixed
+        decimals[plain] = np.where(dot < 0, 0, np.char.str_len(fixed) - dot - 1)
+    return numbers, shown, decimals
+
+
+def _plain_values(values):
+    """A text column's values as a plain sequence (cheap to iterate).
+
+    Element access on a pandas (string-dtype) Series goes through the array
+    machinery per call; a numpy object array does not.
+    """
+    to_numpy = getattr(values, "to_numpy", None)
+    return to_numpy(dtype=object) if to_numpy is not None else values
+
+
+def _max_decimals(values) -> int:
+    """Most decimals any value of ``values`` shows; -1 when none is alignable."""
+    if _is_numeric_column(values):
+        _, _, found = _number_strings(values)
+        found = found[found >= 0]
+        return int(found.max()) if found.size else -1
+    decimals = (_value_decimals(v) for v in _plain_values(values))
+    return max((d for d in decimals if d is not None), default=-1)
+
+
 def column_precision(values) -> Optional[int]:
     """Decimal places a column pads to so its numbers align, or None.
 
     None for an all-integer or non-numeric column: counts like ``288`` stay
-    ``288``, never ``288.000``.
+    ``288``, never ``288.000``. A numeric column is measured in one array
+    pass; anything else value by value.
     """
-    decimals = [d for d in (_value_decimals(v) for v in values) if d is not None]
-    if not decimals:
-        return None
-    target = max(decimals)
+    target = _max_decimals(values)
     return target if target > 0 else None
 
 
@@ -162,6 +243,52 @@ def _render_cell(val, precision: Optional[int]) -> str:
     return escape_latex(_format_aligned(val, precision))
 
 
+def format_column(values) -> List[str]:
+    """Render every data cell of one column, aligned to the column's precision.
+
+    The column-wise form of :func:`_render_cell` (same output, cell for cell).
+    A numeric column cannot hold authored LaTeX and needs no escaping, so its
+    cells are formatted with array operations; text columns go cell by cell.
+    """
+    if not _is_numeric_column(values):
+        return _format_cells(values, column_precision(values))
+    strings = _number_strings(values)
+    found = strings[2][strings[2] >= 0]
+    precision = int(found.max()) if found.size else 0
+    return _numeric_cells(strings, precision or None)
+
+
+def _format_cells(values, precision: Optional[int]) -> List[str]:
+    """Render a column's cells aligned to a ``precision`` measured elsewhere."""
+    if _is_numeric_column(values):
+        return _numeric_cells(_number_strings(values), precision)
+    cells = []
+    for val in _plain_values(values):
+        # Plain prose (the bulk of a text column): what _render_cell would
+        # return, minus its NaN, verbatim and number checks.
+        if type(val) is str and "$" not in val and "\\" not in val:
+            try:
+                float(val)
+            except ValueError:
+                cells.append(val.translate(_ESCAPE_TABLE))
+                continue
+        cells.append(_render_cell(val, precision))
+    return cells
+
+
+def _numeric_cells(strings, precision: Optional[int]) -> List[str]:
+    """Cells of a numeric column from its :func:`_number_strings`."""
+    import numpy as np
+
+    numbers, shown, decimals = strings
+    cells = shown.copy()
+    if precision:
+        aligned = decimals >= 0
+        cells[aligned] = np.char.mod(f"%.{precision}f", numbers[aligned])
+    cells[np.isnan(numbers)] = "--"
+    return cells.tolist()
+
+
 def _render_header(col) -> str:
     r"""One header cell: verbatim if authored LaTeX/math, else escaped.
 
@@ -206,6 +333,13 @@ def caption_title(caption: Optional[str]) -> str:
     return match.group(1).strip().rstrip(".").strip()
 
 
+def _bookmark(table_number: str, caption: Optional[str]) -> str:
+    title = caption_title(caption)
+    if title:
+        return f"Table {table_number} --- {title}"
+    return f"Table {table_number}"
+
+
 def _tabcolsep(num_columns: int) -> str:
     """Column separation that keeps a wide table inside the text width."""
     if num_columns > 8:
@@ -217,6 +351,24 @@ def _tabcolsep(num_columns: int) -> str:
     return "6pt"
 
 
+def read_csv_table(csv_path: Union[str, Path], nrows: Optional[int] = None):
+    """Parse ``csv_path`` into a DataFrame, failing loud when it is missing.
+
+    With ``nrows``, only the first ``nrows`` data rows are read.
+
+    Raises
+    ------
+    FileNotFoundError
+        If ``csv_path`` does not exist (never a silent empty table).
+    """
+    import pandas as pd
+
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    return pd.read_csv(csv_path, nrows=nrows)
+
+
 def render_csv_table(
     csv_path: Union[str, Path],
     caption: Optional[str] = None,
@@ -230,6 +382,41 @@ def render_csv_table(
     csv_path : str or Path
         The CSV to render. Its stem (``01_seizure_count``) supplies the table
         number, the default caption text and the default label.
+    caption, label, max_rows
+        As for :func:`render_table`.
+
+    Returns
+    -------
+    str
+        The LaTeX table float (no trailing newline).
+
+    Raises
+    ------
+    FileNotFoundError
+        If ``csv_path`` does not exist (fail-loud: never a silent empty table).
+    """
+    frame = read_csv_table(csv_path)
+    return render_table(
+        frame, Path(csv_path).stem, caption=caption, label=label, max_rows=max_rows
+    )
+
+
+def render_table(
+    frame,
+    base_name: str,
+    caption: Optional[str] = None,
+    label: Optional[str] = None,
+    max_rows: int = MAX_ROWS,
+) -> str:
+    r"""Render an already-parsed table as a complete LaTeX ``table`` float.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+        The table, as :func:`read_csv_table` parsed it. Not modified.
+    base_name : str
+        The CSV stem (``01_seizure_count``): the table number, the default
+        caption text and the default label.
     caption : str, optional
         The author's caption BLOCK (a full ``\caption{...}``, typically the
         sibling ``NN_name.tex``). When absent a default caption is generated.
@@ -246,80 +433,68 @@ def render_csv_table(
     -------
     str
         The LaTeX table float (no trailing newline).
-
-    Raises
-    ------
-    FileNotFoundError
-        If ``csv_path`` does not exist (fail-loud: never a silent empty table).
     """
     import pandas as pd
 
-    csv_path = Path(csv_path)
-    if not csv_path.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
-
-    df = pd.read_csv(csv_path)
-    original_rows = len(df)
+    original_rows = len(frame)
     truncated = original_rows > max_rows
-    if truncated:
-        if max_rows > 5:
-            separator = pd.DataFrame([["..."] * len(df.columns)], columns=df.columns)
-            df = pd.concat(
-                [df.head(max_rows - 2), separator, df.tail(2)], ignore_index=True
-            )
-        else:
-            df = df.head(max_rows)
+    head_rows = original_rows
+    shown = frame
+    if truncated and max_rows > 5:
+        head_rows = max_rows - 2
+        shown = pd.concat([frame.head(head_rows), frame.tail(2)])
+    elif truncated:
+        head_rows = max_rows
+        shown = frame.head(max_rows)
 
-    base_name = csv_path.stem
     table_number, table_clean_name = split_table_name(base_name)
+    columns = list(shown.columns)
 
     alignments = []
-    for col in df.columns:
+    for i in range(len(columns)):
         try:
-            pd.to_numeric(df[col], errors="raise")
+            pd.to_numeric(shown.iloc[:, i], errors="raise")
             alignments.append("r")
         except (ValueError, TypeError):
             alignments.append("l")
 
-    title = caption_title(caption)
-    bookmark = f"Table {table_number}"
-    if title:
-        bookmark = f"Table {table_number} --- {title}"
+    bookmark = _bookmark(table_number, caption)
 
     lines = [
         f"\\pdfbookmark[2]{{{bookmark}}}{{table_{base_name}}}",
         "\\begin{table}[htbp]",
         "\\centering",
         "\\footnotesize",
-        f"\\setlength{{\\tabcolsep}}{{{_tabcolsep(len(df.columns))}}}",
+        f"\\setlength{{\\tabcolsep}}{{{_tabcolsep(len(columns))}}}",
         # Shrink-to-fit ONLY: a too-wide table scales down to \linewidth; a
         # narrow one keeps its natural width (never stretched).
         "\\resizebox{\\ifdim\\width>\\linewidth\\linewidth\\else\\width\\fi}{!}{%",
         f"\\begin{{tabular}}{{{''.join(alignments)}}}",
         "\\toprule",
-        " & ".join(_render_header(col) for col in df.columns) + " \\\\",
+        " & ".join(_render_header(col) for col in columns) + " \\\\",
         "\\midrule",
     ]
 
-    col_prec = {col: column_precision(df[col]) for col in df.columns}
-    for idx, row in df.iterrows():
-        if any(str(row[col]) == "..." for col in df.columns):
+    cells = [format_column(shown.iloc[:, i]) for i in range(len(columns))]
+    # Rows are numbered as displayed, the omitted-rows marker included, so the
+    # zebra stripes keep alternating across it.
+    position = 0
+    for row in zip(*cells):
+        if truncated and position == head_rows and max_rows > 5:
             omitted = original_rows - max_rows + 1
             lines.append("\\midrule")
             lines.append(
-                f"\\multicolumn{{{len(df.columns)}}}{{c}}"
+                f"\\multicolumn{{{len(columns)}}}{{c}}"
                 f"{{\\textit{{... {omitted} rows omitted ...}}}} \\\\"
             )
             lines.append("\\midrule")
-            continue
+            position += 1
         # Zebra striping via the theme color `lightgray` (redefined under
         # dark_mode.tex), so the stripe stays legible in BOTH modes.
-        if idx % 2 == 1:
+        if position % 2 == 1:
             lines.append("\\rowcolor{lightgray}")
-        lines.append(
-            " & ".join(_render_cell(row[col], col_prec[col]) for col in df.columns)
-            + " \\\\"
-        )
+        lines.append(" & ".join(row) + " \\\\")
+        position += 1
 
     lines += [
         "\\bottomrule",
@@ -351,16 +526,190 @@ def render_csv_table(
     return "\n".join(lines)
 
 
+@dataclass(frozen=True)
+class CsvScan:
+    """What one chunked pass over a CSV learned (see :func:`scan_csv_table`)."""
+
+    columns: Tuple[str, ...]
+    rows: int
+    alignments: str
+    """One ``l``/``r`` per column, as :func:`render_table` would choose."""
+    precisions: Tuple[Optional[int], ...]
+    """Per-column :func:`column_precision` over ALL rows."""
+
+
+def _csv_chunks(csv_path: Path, chunk_rows: int):
+    import pandas as pd
+
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    return pd.read_csv(csv_path, chunksize=chunk_rows)
+
+
+def scan_csv_table(csv_path: Union[str, Path], chunk_rows: int = CHUNK_ROWS) -> CsvScan:
+    """First streaming pass: row count, alignments and precisions of a CSV.
+
+    Holds one chunk of ``chunk_rows`` rows at a time. Alignment and precision
+    are exactly what the in-memory path computes on the whole column: a column
+    is right-aligned when every chunk converts to numbers, and pads to the most
+    decimals any chunk shows.
+
+    Raises
+    ------
+    FileNotFoundError
+        If ``csv_path`` does not exist.
+    """
+    import pandas as pd
+
+    columns: Tuple[str, ...] = ()
+    numeric: List[bool] = []
+    decimals: List[int] = []
+    rows = 0
+    with _csv_chunks(Path(csv_path), chunk_rows) as reader:
+        for chunk in reader:
+            if not numeric:
+                columns = tuple(chunk.columns)
+                numeric = [True] * len(columns)
+                decimals = [-1] * len(columns)
+            rows += len(chunk)
+            for i in range(len(columns)):
+                values = chunk.iloc[:, i]
+                if numeric[i]:
+                    try:
+                        pd.to_numeric(values, errors="raise")
+                    except (ValueError, TypeError):
+                        numeric[i] = False
+                decimals[i] = max(decimals[i], _max_decimals(values))
+    return CsvScan(
+        columns=columns,
+        rows=rows,
+        alignments="".join("r" if n else "l" for n in numeric),
+        precisions=tuple(d if d > 0 else None for d in decimals),
+    )
+
+
+def write_longtable(
+    csv_path: Union[str, Path],
+    output_path: Union[str, Path],
+    caption: Optional[str] = None,
+    label: Optional[str] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    scan: Optional[CsvScan] = None,
+) -> CsvScan:
+    r"""Stream a CSV of any length to ``output_path`` as a full ``longtable``.
+
+    Nothing is truncated. Cells are formatted exactly as in
+    :func:`render_table`, but the rows are written chunk by chunk, so memory
+    is bounded by ``chunk_rows`` whatever the table's size. The ``longtable``
+    breaks across pages, repeating the header with a "(continued)" line.
+    Caption, label and PDF bookmark follow :func:`render_table`; the caption
+    sits at the top, as ``longtable`` requires.
+
+    Parameters
+    ----------
+    csv_path : str or Path
+        The CSV to render; its stem names the table.
+    output_path : str or Path
+        The ``.tex`` file to write (overwritten).
+    caption, label
+        As for :func:`render_table`.
+    chunk_rows : int
+        CSV rows held in memory at a time.
+    scan : CsvScan, optional
+        The result of :func:`scan_csv_table` when the caller already ran it.
+
+    Returns
+    -------
+    CsvScan
+        The first pass's findings (row count, columns, ...).
+    """
+    csv_path = Path(csv_path)
+    if scan is None:
+        scan = scan_csv_table(csv_path, chunk_rows)
+    base_name = csv_path.stem
+    table_number, table_clean_name = split_table_name(base_name)
+    width = len(scan.columns)
+    header = " & ".join(_render_header(col) for col in scan.columns) + " \\\\"
+
+    if caption:
+        caption_lines = [caption.rstrip()]
+    else:
+        caption_lines = [
+            f"\\caption{{\\textbf{{Table {table_number}: {table_clean_name}}}",
+            "\\\\",
+            "Data table generated from CSV file.",
+            "}",
+        ]
+    if not (caption and "\\label{tab:" in caption):
+        caption_lines.append(f"\\label{{{label or 'tab:' + base_name}}}")
+
+    head = [
+        f"\\pdfbookmark[2]{{{_bookmark(table_number, caption)}}}{{table_{base_name}}}",
+        "\\begingroup",
+        "\\footnotesize",
+        f"\\setlength{{\\tabcolsep}}{{{_tabcolsep(width)}}}",
+        "\\setlength{\\LTcapwidth}{\\textwidth}",
+        f"\\begin{{longtable}}{{{scan.alignments}}}",
+        *caption_lines,
+        # On its own line: a caption block may end in a % comment.
+        "\\\\",
+        "\\toprule",
+        header,
+        "\\midrule",
+        "\\endfirsthead",
+        f"\\multicolumn{{{width}}}{{l}}"
+        "{\\textit{Table \\thetable{} (continued)}} \\\\",
+        "\\toprule",
+        header,
+        "\\midrule",
+        "\\endhead",
+        "\\midrule",
+        f"\\multicolumn{{{width}}}{{r}}{{\\textit{{Continued on next page}}}} \\\\",
+        "\\endfoot",
+        "\\bottomrule",
+        "\\endlastfoot",
+    ]
+
+    output_path = Path(output_path)
+    position = 0
+    with open(output_path, "w", encoding="utf-8") as out:
+        out.write("\n".join(head) + "\n")
+        with _csv_chunks(csv_path, chunk_rows) as reader:
+            for chunk in reader:
+                cells = [
+                    _format_cells(chunk.iloc[:, i], scan.precisions[i])
+                    for i in range(width)
+                ]
+                lines = []
+                for row in zip(*cells):
+                    # Same theme-colored zebra striping as render_table.
+                    if position % 2 == 1:
+                        lines.append("\\rowcolor{lightgray}")
+                    lines.append(" & ".join(row) + " \\\\")
+                    position += 1
+                if lines:
+                    out.write("\n".join(lines) + "\n")
+        out.write("\\end{longtable}\n\\endgroup\n")
+    return scan
+
+
 __all__ = [
+    "CHUNK_ROWS",
+    "CsvScan",
     "MAX_ROWS",
     "caption_title",
     "column_precision",
     "escape_latex",
+    "format_column",
     "format_number",
     "is_verbatim",
     "protect_verbatim",
+    "read_csv_table",
     "render_csv_table",
+    "render_table",
+    "scan_csv_table",
     "split_table_name",
+    "write_longtable",
 ]
 
 # EOF
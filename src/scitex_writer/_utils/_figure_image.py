@@ -40,6 +40,12 @@ PLACEHOLDER_SIZE = (800, 600)
 TRIM_FUZZ = 16
 """Per-channel tolerance when trimming a border (ImageMagick's ``-fuzz``)."""
 
+DRAFT_MAX_EDGE = 1000
+"""Longest edge (px) of a draft proxy: about 150 dpi across a 6.5-inch text block."""
+
+DRAFT_JPEG_QUALITY = 75
+"""JPEG quality of a draft proxy (layout checks, not print)."""
+
 _LABEL_FONTS = (
     "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
     "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
@@ -107,6 +113,31 @@ def to_png(src: Union[str, Path], dst: Union[str, Path]) -> Path:
     return dst
 
 
+def to_draft_jpg(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    max_edge: int = DRAFT_MAX_EDGE,
+    quality: int = DRAFT_JPEG_QUALITY,
+) -> Path:
+    """Write a downscaled JPEG proxy of ``src`` for draft compiles.
+
+    The longest edge is capped at ``max_edge`` pixels (never upscaled) and the
+    aspect ratio is kept, so ``\\includegraphics[width=...,keepaspectratio]``
+    lays the proxy out exactly where the full image would go. A JPEG source is
+    decoded at reduced scale (``Image.draft``), which skips most of the decode.
+    """
+    from PIL import Image
+
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with _open(src) as image:
+        image.draft("RGB", (max_edge, max_edge))
+        proxy = flatten_to_white(image)
+        proxy.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+        proxy.save(dst, "JPEG", quality=quality, optimize=True)
+    return dst
+
+
 def trim_whitespace(path: Union[str, Path], fuzz: int = TRIM_FUZZ) -> bool:
     """Crop uniform border padding off an image IN PLACE; True if anything went.
 
@@ -269,6 +300,8 @@ def tile_panels(
 
 
 __all__ = [
+    "DRAFT_JPEG_QUALITY",
+    "DRAFT_MAX_EDGE",
     "JPEG_QUALITY",
     "PANEL_SPACING",
     "PLACEHOLDER_SIZE",
@@ -278,6 +311,7 @@ __all__ = [
     "panel_letter",
     "placeholder_jpg",
     "tile_panels",
+    "to_draft_jpg",
     "to_jpg",
     "to_png",
     "trim_whitespace",
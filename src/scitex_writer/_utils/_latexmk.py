@@ -19,6 +19,14 @@ The flags are the shell's ``compile_with_latexmk``: ``-pdf -bibtex -synctex=1
 -interaction=nonstopmode -file-line-error -output-directory=<log_dir> -gg``, with
 ``BIBINPUTS`` pointed at the project root so ``bibtex`` -- which latexmk runs from
 the output directory -- still finds the bibliography.
+
+With the ``fmt`` engine selected (``SCITEX_WRITER_ENGINE=fmt``), the preamble is
+first dumped into a ``.fmt`` under ``<project>/.scitex/writer/runtime/formats``
+and every pdflatex run latexmk makes starts from it instead of re-reading the
+packages. A preamble that cannot be dumped is remembered and compiled the plain
+way. The shell's ``compile_with_fmt`` keeps its formats in the same directory
+(and prunes it to the same bound), but under its own ``sed | sha256`` key, so
+the two never reuse each other's format.
 """
 
 from __future__ import annotations
@@ -27,7 +35,7 @@ import os
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 DEFAULT_TIMEOUT_SEC = 120
 """The shell's ``SCITEX_WRITER_DIFF_TIMEOUT`` default: latexdiff output can send
@@ -55,18 +63,71 @@ def require_latexmk() -> str:
     return binary
 
 
+def preamble_format_key(document: str) -> str:
+    """Cache key of the format for ``document``'s preamble.
+
+    Full-line comments are left out, as in ``compile_fmt.sh``: the compiled
+    manuscript's ``Compiled:`` banner changes on every build. Raises ValueError
+    for a document without ``\\begin{document}``.
+    """
+    from .._compile._preview import format_key, split_preamble
+
+    preamble, _body = split_preamble(document)
+    kept = "".join(
+        line
+        for line in preamble.splitlines(keepends=True)
+        if not line.lstrip().startswith("%")
+    )
+    return format_key(kept, "")
+
+
+def _preamble_format(
+    tex_file: Path, cache_root: Path, timeout_sec: int
+) -> Optional[Tuple[Path, str]]:
+    """``(format_dir, key)`` of a format for ``tex_file``, built unless cached.
+
+    None when mylatexformat is missing or the preamble cannot be dumped.
+    """
+    from .._compile._preview import (
+        PreviewEngine,
+        PreviewFormatError,
+        warm_engine_available,
+    )
+
+    if not warm_engine_available():
+        return None
+    document = tex_file.read_text(encoding="utf-8", errors="replace")
+    try:
+        key = preamble_format_key(document)
+    except ValueError:
+        return None
+    engine = PreviewEngine(cache_root)
+    if engine.has_failed(key):
+        return None
+    try:
+        engine.ensure_format(document, key, timeout_sec)
+    except (PreviewFormatError, TimeoutError, subprocess.TimeoutExpired):
+        return None
+    return engine.format_dir, key
+
+
 def compile_tex(
     tex_file: Path,
     output_dir: Path,
     project_root: Optional[Path] = None,
     timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+    preamble_format: Optional[bool] = None,
 ) -> Path:
     """Compile ``tex_file`` with latexmk into ``output_dir``; return the PDF path.
 
+    ``preamble_format`` starts pdflatex from a precompiled preamble (see the
+    module docstring); None follows ``SCITEX_WRITER_ENGINE=fmt``.
+
     Raises :class:`LatexmkUnavailableError` when latexmk is missing, and
     :class:`LatexmkFailedError` on a non-zero exit, a timeout, or a run that
     reported success yet produced no PDF. The caller is responsible for moving the
-    PDF out of ``output_dir`` -- this function never touches anything outside it.
+    PDF out of ``output_dir`` -- this function never touches anything outside it
+    (apart from the format cache).
     """
     binary = require_latexmk()
     if not tex_file.is_file():
@@ -77,6 +138,18 @@ def compile_tex(
     if project_root is not None:
         env["BIBINPUTS"] = f"{project_root}:"
 
+    if preamble_format is None:
+        preamble_format = env.get("SCITEX_WRITER_ENGINE") == "fmt"
+    pdflatex = "pdflatex -shell-escape %O %S"
+    if preamble_format:
+        cache_root = Path(project_root or output_dir) / ".scitex" / "writer" / "runtime"
+        warm = _preamble_format(tex_file, cache_root, timeout_sec)
+        if warm is not None:
+            format_dir, key = warm
+            # A trailing ':' keeps kpathsea's default format path after ours.
+            env["TEXFORMATS"] = f"{format_dir}:"
+            pdflatex = f"pdflatex -fmt={key} -shell-escape %O %S"
+
     command = [
         binary,
         "-pdf",
@@ -85,7 +158,7 @@ def compile_tex(
         "-interaction=nonstopmode",
         "-file-line-error",
         f"-output-directory={output_dir}",
-        "-pdflatex=pdflatex -shell-escape %O %S",
+        f"-pdflatex={pdflatex}",
         "-gg",
         str(tex_file),
     ]
@@ -124,6 +197,7 @@ __all__ = [
     "LatexmkFailedError",
     "LatexmkUnavailableError",
     "compile_tex",
+    "preamble_format_key",
     "require_latexmk",
 ]
 
@@ -3,51 +3,365 @@
 # File: src/scitex_writer/_utils/_parse_latex_logs.py
 
 """
-LaTeX error and warning parsing from compilation output.
+LaTeX error and warning parsing from ``.log`` files and compilation output.
 
-Simple parsing of LaTeX errors and warnings from stdout/stderr.
+A single streaming pass over the log, in the format TeX actually writes:
+
+- **Wrapped lines.** TeX breaks every line at ``max_print_line`` (79)
+  characters; a physical line of exactly that length is joined with the next
+  before anything else looks at it.
+- **Open-file stack.** ``(./path/file.tex`` opens a file and the matching
+  ``)`` closes it, so each issue is attributed to the innermost open file.
+  Message lines (errors, warnings, badbox contents) are not scanned: their
+  parentheses are prose, not files.
+- **Line numbers.** From ``-file-line-error`` prefixes (``./a.tex:12: ...``),
+  the ``l.<n>`` context line after a ``!`` error, ``on input line <n>`` in
+  warnings, and ``at lines <n>--<m>`` in badboxes.
+- **Deduplication.** latexmk output repeats every warning once per pass;
+  identical issues (same type, category, file, line and message) are reported
+  once, in first-seen order.
+
+Badboxes (``Overfull`` / ``Underfull``) are parsed as ``category="badbox"``
+warnings but only returned when asked for: they are typesetting notes, and
+a long document has hundreds of them.
+
+The compilation output also carries lines no ``.log`` can contain: the shell
+stages' ``ERRO:`` / ``WARN:`` messages, BibTeX's ``Warning--`` and biber's
+``ERROR -`` / ``WARN -`` lines, and a shell's "command not found".
+:func:`parse_compilation_output` always picks those out of the output, even
+when it takes the TeX issues from the ``.log``.
 """
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from .._dataclasses import LaTeXIssue
 
+MAX_PRINT_LINE = 79
+"""TeX's default ``max_print_line``: the width at which log lines wrap."""
+
+_ERROR_LOOKAHEAD = 12
+"""Lines after a ``!`` error searched for its ``l.<n>`` context line."""
+
+_FILE_LINE_ERROR = re.compile(
+    r"^(?P<file>[^\s:()][^:()]*?\.\w+):(?P<line>\d+): (?P<msg>.*)$"
+)
+_CONTEXT_LINE = re.compile(r"^l\.(?P<line>\d+)(?: |$)")
+_WARNING = re.compile(
+    r"^(?:"
+    r"(?P<latex>LaTeX(?: (?P<font>Font))?)"
+    r"|Package(?: (?P<package>[^\s:]+))?"
+    r"|Class(?: (?P<cls>[^\s:]+))?"
+    r"|(?P<pdftex>pdfTeX)"
+    r"|(?P<other>[\w.@-]+(?: [\w.@-]+)?)"
+    r") warning(?: \([^)]*\))?:\s*(?P<msg>.*)$",
+    re.IGNORECASE,
+)
+_BADBOX = re.compile(r"^(?:Overfull|Underfull) \\[hv]box\b")
+_INPUT_LINE = re.compile(r"on input line (\d+)")
+_BOX_LINES = re.compile(r"at lines? (\d+)")
+_PAREN = re.compile(r"[()]")
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+_TOOL_LINE = re.compile(
+    r"^(?:"
+    r"(?P<shell>ERRO|ERROR|WARN|WARNING): "
+    r"|(?P<bibtex>Warning)--"
+    r"|(?P<biber>ERROR|WARN) - "
+    r")(?P<msg>.+)$"
+)
+_COMMAND_NOT_FOUND = re.compile(r"^\S+: (?:\d+: )?\S+: (?:command )?not found$")
+_FILE_TOKEN = re.compile(r'"?([^\s()"<>\[\]{}]+)')
+_FILE_LIKE = re.compile(r"(?:^\.{0,2}/|^~/|\.[A-Za-z][\w-]{0,7}$)")
+
+
+def _unwrap(lines: Iterable[str], width: int) -> Iterator[str]:
+    """Join TeX's hard-wrapped physical lines back into logical lines.
+
+    pdfTeX counts bytes, not characters, so a line wrapped in the middle of
+    UTF-8 text is shorter than ``width`` characters but ``width`` bytes long.
+    """
+    buffered: List[str] = []
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        buffered.append(line)
+        if len(line) == width or (
+            not line.isascii() and len(line.encode("utf-8", "replace")) == width
+        ):
+            continue
+        yield "".join(buffered)
+        buffered = []
+    if buffered:
+        yield "".join(buffered)
+
+
+def _error_category(message: str) -> str:
+    if message.startswith("Undefined control sequence"):
+        return "undefined_control_sequence"
+    if "not found" in message and ("File `" in message or "file `" in message):
+        return "missing_file"
+    if message.startswith("LaTeX Error"):
+        return "latex"
+    if message.startswith(("Package ", "Class ")) and " Error" in message:
+        return "package"
+    return "tex"
+
+
+def _warning_category(match: "re.Match[str]", message: str) -> str:
+    lowered = message.lower()
+    if "undefined" in lowered and "citation" in lowered:
+        return "undefined_citation"
+    if "undefined" in lowered and "reference" in lowered:
+        return "undefined_reference"
+    if "multiply defined" in lowered or "multiply-defined" in lowered:
+        return "duplicate_label"
+    if "rerun" in lowered:
+        return "rerun"
+    if match["font"]:
+        return "font"
+    if "float" in lowered and ("too large" in lowered or "specifier" in lowered):
+        return "float"
+    if match["latex"]:
+        return "latex"
+    if match["pdftex"]:
+        return "pdftex"
+    if match["package"] is not None or lowered.startswith("package"):
+        return "package"
+    if match["cls"] is not None:
+        return "class"
+    return "other"
+
+
+class _LogParser:
+    """State machine behind :func:`parse_latex_log` (one instance per log)."""
+
+    def __init__(self) -> None:
+        self.issues: List[LaTeXIssue] = []
+        self._seen: set = set()
+        self._files: List[Optional[str]] = []
+        # An error waiting for its `l.<n>` line, and how many lines it may wait.
+        self._error: Optional[LaTeXIssue] = None
+        self._error_budget = 0
+        # A warning still collecting `(name)`-prefixed continuation lines.
+        self._warning: Optional[LaTeXIssue] = None
+        self._warning_prefix = ""
+        self._in_badbox = False
+
+    @property
+    def current_file(self) -> Optional[str]:
+        for name in reversed(self._files):
+            if name is not None:
+                return name
+        return None
+
+    def _emit(self, issue: LaTeXIssue) -> None:
+        key = (issue.type, issue.category, issue.file, issue.line, issue.message)
+        if key not in self._seen:
+            self._seen.add(key)
+            self.issues.append(issue)
+
+    def _finish_error(self) -> None:
+        if self._error is not None:
+            self._emit(self._error)
+            self._error = None
+
+    def _finish_warning(self) -> None:
+        warning = self._warning
+        if warning is None:
+            return
+        if warning.line is None:
+            m = _INPUT_LINE.search(warning.message)
+            if m:
+                warning.line = int(m.group(1))
+        self._emit(warning)
+        self._warning = None
+
+    def feed(self, line: str) -> None:
+        if self._error is not None:
+            m = _CONTEXT_LINE.match(line)
+            if m:
+                if self._error.line is None:
+                    self._error.line = int(m["line"])
+                self._finish_error()
+                return
+            self._error_budget -= 1
+            if self._error_budget > 0 and not self._starts_issue(line):
+                return
+            self._finish_error()
+
+        if self._warning is not None:
+            if self._warning_prefix and line.startswith(self._warning_prefix):
+                rest = line[len(self._warning_prefix) :].strip()
+                self._warning.message = f"{self._warning.message} {rest}"
+                return
+            self._finish_warning()
+
+        if self._in_badbox:
+            # The box contents follow until a blank line; never scan them.
+            self._in_badbox = bool(line.strip()) and not self._starts_issue(line)
+            if self._in_badbox or not line.strip():
+                return
+
+        if line.startswith("!"):
+            message = line[1:].strip()
+            if message:
+                self._start_error(message, self.current_file, None)
+            return
+
+        if ":" in line:
+            m = _FILE_LINE_ERROR.match(line)
+            if m:
+                self._start_error(m["msg"].strip(), m["file"], int(m["line"]))
+                return
+
+        if "arning" in line or "ARNING" in line:
+            m = _WARNING.match(line)
+            if m:
+                self._start_warning(m, line.strip())
+                return
+
+        if line.startswith(("Overfull", "Underfull")) and _BADBOX.match(line):
+            m = _BOX_LINES.search(line)
+            self._emit(
+                LaTeXIssue(
+                    type="warning",
+                    message=line.strip(),
+                    file=self.current_file,
+                    line=int(m.group(1)) if m else None,
+                    category="badbox",
+                )
+            )
+            self._in_badbox = True
+            return
+
+        if "(" in line or ")" in line:
+            self._scan_parens(line)
+
+    @staticmethod
+    def _starts_issue(line: str) -> bool:
+        """Whether ``line`` opens a new error or warning (ends a pending one)."""
+        return (
+            line.startswith("!")
+            or bool(_FILE_LINE_ERROR.match(line))
+            or bool(_WARNING.match(line))
+        )
+
+    def _start_error(self, message: str, file: Optional[str], line: Optional[int]):
+        self._error = LaTeXIssue(
+            type="error",
+            message=message,
+            file=file,
+            line=line,
+            category=_error_category(message),
+        )
+        self._error_budget = _ERROR_LOOKAHEAD
+
+    def _start_warning(self, match: "re.Match[str]", text: str) -> None:
+        name = match["package"] or match["cls"] or ("Font" if match["font"] else "")
+        self._warning_prefix = f"({name})" if name else ""
+        self._warning = LaTeXIssue(
+            type="warning",
+            message=text,
+            file=self.current_file,
+            line=None,
+            category=_warning_category(match, text),
+        )
+
+    def _scan_parens(self, line: str) -> None:
+        for m in _PAREN.finditer(line):
+            if m.group() == ")":
+                if self._files:
+                    self._files.pop()
+                continue
+            token = _FILE_TOKEN.match(line, m.end())
+            name = token.group(1) if token else ""
+            self._files.append(name if name and _FILE_LIKE.search(name) else None)
+
+    def close(self) -> List[LaTeXIssue]:
+        self._finish_error()
+        self._finish_warning()
+        return self.issues
+
+
+def parse_latex_log(
+    lines: Iterable[str],
+    max_print_line: int = MAX_PRINT_LINE,
+) -> List[LaTeXIssue]:
+    """Parse a LaTeX log (any iterable of lines) into deduplicated issues.
+
+    Args:
+        lines: The log, e.g. an open file or ``text.splitlines()``
+        max_print_line: TeX's wrap width for the run that wrote the log
+
+    Returns:
+        Errors and warnings (badboxes included) in first-seen order
+    """
+    parser = _LogParser()
+    for line in _unwrap(lines, max_print_line):
+        parser.feed(line)
+    return parser.close()
+
+
+def _parse_tool_output(lines: Iterable[str]) -> Iterator[LaTeXIssue]:
+    """Issues in compilation output that come from outside the TeX engine."""
+    for raw in lines:
+        line = _ANSI.sub("", raw).strip()
+        m = _TOOL_LINE.match(line)
+        if m:
+            tool = next(g for g in ("shell", "bibtex", "biber") if m[g])
+            severity = "warning" if m[tool].startswith("W") else "error"
+            yield LaTeXIssue(type=severity, message=m["msg"].strip(), category=tool)
+        elif _COMMAND_NOT_FOUND.match(line):
+            yield LaTeXIssue(type="error", message=line, category="missing_tool")
+
 
 def parse_compilation_output(
-    output: str, log_file: Path = None
+    output: str,
+    log_file: Path = None,
+    include_badboxes: bool = False,
 ) -> Tuple[List[LaTeXIssue], List[LaTeXIssue]]:
     """
-    Parse errors and warnings from compilation output.
+    Parse errors and warnings from a LaTeX log and the compilation output.
 
     Args:
         output: Compilation output (stdout + stderr)
-        log_file: Optional path to .log file (unused, for compatibility)
+        log_file: Optional path to the document's .log; when it exists the TeX
+            issues come from it rather than ``output`` (it holds only the final
+            pass), and ``output`` is still scanned for shell, BibTeX/biber and
+            missing-tool messages
+        include_badboxes: Also return Overfull/Underfull box warnings
 
     Returns:
         Tuple of (error_issues, warning_issues)
     """
-    errors = []
-    warnings = []
-
-    for line in output.split("\n"):
-        # LaTeX error pattern: "! Error message"
-        if line.startswith("!"):
-            error_text = line[1:].strip()
-            if error_text:
-                errors.append(LaTeXIssue(type="error", message=error_text))
-
-        # LaTeX warning pattern
-        elif "warning" in line.lower():
-            warnings.append(LaTeXIssue(type="warning", message=line.strip()))
+    output_lines = output.splitlines()
+    if log_file is not None and Path(log_file).is_file():
+        with open(log_file, encoding="utf-8", errors="replace") as f:
+            issues = parse_latex_log(f)
+    else:
+        issues = parse_latex_log(output_lines)
+    seen = {(i.type, i.category, i.message) for i in issues}
+    for issue in _parse_tool_output(output_lines):
+        key = (issue.type, issue.category, issue.message)
+        if key not in seen:
+            seen.add(key)
+            issues.append(issue)
 
+    errors = [i for i in issues if i.type == "error"]
+    warnings = [
+        i
+        for i in issues
+        if i.type == "warning" and (include_badboxes or i.category != "badbox")
+    ]
     return errors, warnings
 
 
 __all__ = [
+    "MAX_PRINT_LINE",
     "parse_compilation_output",
+    "parse_latex_log",
 ]
 
 # EOF
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: src/scitex_writer/_utils/_project_index.py
+
+"""Persistent, incrementally updated index of a project's cross-references.
+
+``check_references.py``, ``check_cited_states.py``, ``check_float_order.py``,
+``explore_bibtex.get_cited_papers`` and the pre-compile gate each rebuilt the
+same label/ref/cite maps from every source file, with their own regexes, on
+every call. This index keeps them in SQLite at
+``<project>/.scitex/writer/runtime/project_index.sqlite``:
+
+- ``files``: one row per indexed source (relative path, doc type,
+  ``mtime_ns``, size, SHA-1 of the bytes)
+- ``tokens``: ``(path, kind, key, line)`` for every label, ref, cite,
+  heading, ``\\vclaim`` id, float and bib entry
+
+:meth:`ProjectIndex.refresh` stats every source and re-parses only those
+whose ``(mtime_ns, size)`` changed AND whose content hash differs (a save
+that leaves the bytes unchanged just updates the stamp); deleted files drop
+out. Lookups ("who cites X", "where is label Y") are then single indexed
+queries, so the MCP tools, the editor and the checks answer in milliseconds
+even for manuscripts with hundreds of section files.
+
+Sources follow ``check_references.collect_tex_files``: ``contents/*.tex``
+(not ``*_v<N>.tex`` / ``*_diff.tex``), ``caption_and_media/*.tex`` and
+``base.tex`` per document, plus ``00_shared/bib_files/*.bib``. Tokens use the
+checks' rules: regexes applied per line to the text before the first ``%``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+INDEX_REL = Path(".scitex") / "writer" / "runtime" / "project_index.sqlite"
+
+# Bump when the tokenizer or schema changes: an index written by another
+# version is rebuilt rather than trusted.
+SCHEMA_VERSION = 1
+
+DOC_DIRS = {
+    "manuscript": "01_manuscript",
+    "supplementary": "02_supplementary",
+    "revision": "03_revision",
+}
+
+KINDS = ("label", "ref", "cite", "heading", "vclaim", "float", "bibentry")
+
+# Kept identical to scripts/python/_lint_model.py (the vendored checks), so
+# tokens read back from the index equal the checks' own scan. The checks are
+# stdlib-only standalones and cannot import these; test__project_index.py
+# asserts the two sets match.
+_LABEL_RE = re.compile(r"\\label\{([^}]+)\}")
+_REF_RE = re.compile(r"\\ref\{([^}]+)\}")
+_CITE_RE = re.compile(
+    r"\\(?:cite|citep|citet|citealt|citeauthor|citeyear)\{([^}]+)\}"
+)
+_HEADING_RE = re.compile(r"\\(?:sub)?section\*?\{([^}]+)\}")
+_VCLAIM_RE = re.compile(r"\\vclaim(?:\[[^\]]*\])?\{([^}]+)\}")
+_BIB_ENTRY_RE = re.compile(r"@\w+\{([^,\s]+)")
+_SKIP_SOURCE_RE = re.compile(r"_v\d+\.tex$|_diff\.tex$")
+_PANEL_RE = re.compile(r"^\d+[a-zA-Z]_")
+
+Token = Tuple[str, str, int]
+PathLike = Union[str, Path]
+
+
+def tokenize_tex(text: str) -> List[Token]:
+    """``[(kind, key, line), ...]`` for one .tex source.
+
+    Labels and refs are kept verbatim; cite keys are split on commas and
+    stripped; empty headings are dropped (the checks' rules).
+    """
+    tokens: List[Token] = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        stripped = line.split("%")[0] if "%" in line else line
+        if "\\" not in stripped:
+            continue
+        for m in _LABEL_RE.finditer(stripped):
+            tokens.append(("label", m.group(1), line_no))
+        for m in _REF_RE.finditer(stripped):
+            tokens.append(("ref", m.group(1), line_no))
+        for m in _CITE_RE.finditer(stripped):
+            for key in m.group(1).split(","):
+                if key.strip():
+                    tokens.append(("cite", key.strip(), line_no))
+        for m in _HEADING_RE.finditer(stripped):
+            if m.group(1).strip():
+                tokens.append(("heading", m.group(1).strip(), line_no))
+        for m in _VCLAIM_RE.finditer(stripped):
+            tokens.append(("vclaim", m.group(1).strip(), line_no))
+    return tokens
+
+
+def tokenize_bib(text: str) -> List[Token]:
+    """``[("bibentry", key, line), ...]`` for one .bib file."""
+    return [
+        ("bibentry", m.group(1).strip(), text.count("\n", 0, m.start()) + 1)
+        for m in _BIB_ENTRY_RE.finditer(text)
+    ]
+
+
+def _float_token(rel: Path) -> Optional[Token]:
+    """``fig:STEM`` / ``tab:STEM`` for a numbered caption_and_media source."""
+    if rel.parent.name != "caption_and_media" or not rel.name[:1].isdigit():
+        return None
+    if _PANEL_RE.match(rel.stem):
+        return None
+    prefix = {"figures": "fig", "tables": "tab"}.get(rel.parent.parent.name)
+    return ("float", f"{prefix}:{rel.stem}", 0) if prefix else None
+
+
+def source_files(project_dir: Path) -> Dict[Path, Optional[str]]:
+    """``{path: doc_type}`` of every indexed source (bib files: None)."""
+    found: Dict[Path, Optional[str]] = {}
+    for doc_type, name in DOC_DIRS.items():
+        doc_dir = project_dir / name
+        contents = doc_dir / "contents"
+        if contents.is_dir():
+            for f in contents.glob("*.tex"):
+                if not _SKIP_SOURCE_RE.search(f.name):
+                    found[f] = doc_type
+            for sub in ("figures", "tables"):
+                for f in (contents / sub / "caption_and_media").glob("*.tex"):
+                    found[f] = doc_type
+        base = doc_dir / "base.tex"
+        if base.is_file():
+            found[base] = doc_type
+    for f in (project_dir / "00_shared" / "bib_files").glob("*.bib"):
+        found[f] = None
+    return found
+
+
+class ProjectIndex:
+    """SQLite index of one project's labels, refs, cites, floats and headings.
+
+    Opens (and creates) the database lazily; every method uses its own short
+    connection, so one instance can be shared across threads and several
+    processes (editor, MCP server, compile) can use the same file.
+
+    Args:
+        project_dir: Writer project root
+        db_path: Database file (default: :data:`INDEX_REL` under the project)
+    """
+
+    def __init__(self, project_dir: PathLike, db_path: Optional[PathLike] = None):
+        self.project_dir = Path(project_dir).resolve()
+        self.db_path = Path(db_path) if db_path else self.project_dir / INDEX_REL
+
+    # ------------------------------------------------------------------ db
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS tokens;"
+            )
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path     TEXT PRIMARY KEY,
+                    doc_type TEXT,
+                    mtime_ns INTEGER NOT NULL,
+                    size     INTEGER NOT NULL,
+                    sha1     TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS tokens (
+                    path TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    key  TEXT NOT NULL,
+                    line INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_tokens_kind_key ON tokens (kind, key);
+                CREATE INDEX IF NOT EXISTS ix_tokens_path ON tokens (path);
+                """
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        return conn
+
+    # ------------------------------------------------------------- refresh
+
+    def refresh(self) -> dict:
+        """Bring the index up to date; re-parse only changed sources.
+
+        Returns:
+            ``{files, parsed, touched, removed, elapsed}``: sources on disk,
+            sources (re)tokenized, sources whose stamp changed but whose
+            bytes did not, and rows dropped for deleted sources
+        """
+        started = time.perf_counter()
+        on_disk = source_files(self.project_dir)
+        stats = {"files": len(on_disk), "parsed": 0, "touched": 0, "removed": 0}
+        conn = self._connect()
+        try:
+            known = {
+                row[0]: row[1:]
+                for row in conn.execute("SELECT path, mtime_ns, size, sha1 FROM files")
+            }
+            with conn:
+                for path, doc_type in on_disk.items():
+                    rel = path.relative_to(self.project_dir).as_posix()
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        continue
+                    prev = known.pop(rel, None)
+                    if prev and prev[:2] == (st.st_mtime_ns, st.st_size):
+                        continue
+                    try:
+                        data = path.read_bytes()
+                    except OSError:
+                        continue
+                    sha1 = hashlib.sha1(data).hexdigest()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                        (rel, doc_type, st.st_mtime_ns, st.st_size, sha1),
+                    )
+                    if prev and prev[2] == sha1:
+                        stats["touched"] += 1
+                        continue
+                    conn.execute("DELETE FROM tokens WHERE path = ?", (rel,))
+                    conn.executemany(
+                        "INSERT INTO tokens VALUES (?, ?, ?, ?)",
+                        [(rel, *t) for t in self._tokens(Path(rel), data)],
+                    )
+                    stats["parsed"] += 1
+                for rel in known:
+                    conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                    conn.execute("DELETE FROM tokens WHERE path = ?", (rel,))
+                stats["removed"] = len(known)
+        finally:
+            conn.close()
+        stats["elapsed"] = round(time.perf_counter() - started, 4)
+        return stats
+
+    @staticmethod
+    def _tokens(rel: Path, data: bytes) -> List[Token]:
+        text = data.decode("utf-8", errors="replace")
+        if rel.suffix == ".bib":
+            return tokenize_bib(text)
+        tokens = tokenize_tex(text)
+        float_token = _float_token(rel)
+        return tokens + [float_token] if float_token else tokens
+
+    # ------------------------------------------------------------- queries
+
+    def find(
+        self, kind: str, key: Optional[str] = None, doc_type: Optional[str] = None
+    ) -> List[dict]:
+        """Occurrences of ``kind`` tokens (optionally one ``key`` / document).
+
+        Returns:
+            ``[{key, path, line, doc_type}, ...]`` ordered by path and line;
+            ``path`` is relative to the project root
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind {kind!r}; choose from {', '.join(KINDS)}")
+        sql = (
+            "SELECT t.key, t.path, t.line, f.doc_type FROM tokens t "
+            "JOIN files f ON f.path = t.path WHERE t.kind = ?"
+        )
+        args: list = [kind]
+        if key is not None:
+            sql += " AND t.key = ?"
+            args.append(key)
+        if doc_type is not None:
+            sql += " AND f.doc_type = ?"
+            args.append(doc_type)
+        sql += " ORDER BY t.path, t.line"
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, args).fetchall()
+        finally:
+            conn.close()
+        return [
+            {"key": k, "path": p, "line": line, "doc_type": d} for k, p, line, d in rows
+        ]
+
+    def keys(self, kind: str, doc_type: Optional[str] = None) -> Dict[str, int]:
+        """``{key: occurrences}`` for one token kind."""
+        counts: Dict[str, int] = {}
+        for hit in self.find(kind, doc_type=doc_type):
+            counts[hit["key"]] = counts.get(hit["key"], 0) + 1
+        return counts
+
+    def who_cites(self, key: str) -> List[dict]:
+        """Every ``\\cite`` of bib ``key``."""
+        return self.find("cite", key)
+
+    def where_label(self, key: str) -> List[dict]:
+        """Where ``key`` is defined: ``\\label`` sites and caption-derived floats."""
+        return self.find("label", key) + self.find("float", key)
+
+    def where_referenced(self, key: str) -> List[dict]:
+        """Every ``\\ref`` to ``key``."""
+        return self.find("ref", key)
+
+    def file_tokens(self, rel_paths: Iterable[str]) -> Dict[str, dict]:
+        """Stamp and tokens of indexed sources, for callers seeding a cache.
+
+        Returns:
+            ``{rel_path: {mtime_ns, size, tokens: [(kind, key, line), ...]}}``
+        """
+        rels = list(rel_paths)
+        out: Dict[str, dict] = {}
+        conn = self._connect()
+        try:
+            for rel in rels:
+                row = conn.execute(
+                    "SELECT mtime_ns, size FROM files WHERE path = ?", (rel,)
+                ).fetchone()
+                if row is None:
+                    continue
+                tokens = conn.execute(
+                    "SELECT kind, key, line FROM tokens WHERE path = ? "
+                    "ORDER BY rowid",
+                    (rel,),
+                ).fetchall()
+                out[rel] = {"mtime_ns": row[0], "size": row[1], "tokens": tokens}
+        finally:
+            conn.close()
+        return out
+
+
+def refreshed_index(project_dir: PathLike) -> Tuple[ProjectIndex, dict]:
+    """A :class:`ProjectIndex` for ``project_dir``, refreshed, and its stats."""
+    index = ProjectIndex(project_dir)
+    return index, index.refresh()
+
+
+__all__ = [
+    "INDEX_REL",
+    "KINDS",
+    "ProjectIndex",
+    "refreshed_index",
+    "source_files",
+    "tokenize_bib",
+    "tokenize_tex",
+]
+
+# EOF
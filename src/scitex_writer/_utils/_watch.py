@@ -5,24 +5,441 @@
 """
 Watch mode for auto-recompilation.
 
-Monitors file changes and triggers automatic recompilation.
+An in-process watcher: file changes come from watchdog (inotify / FSEvents /
+ReadDirectoryChangesW) when it is installed, or from a polling scan otherwise.
+A burst of saves is debounced into one rebuild, and each changed path is
+classified so only the affected pipeline stages rerun:
+
+============  =============================================
+Category      Stages rerun
+============  =============================================
+``bib``       bibliography merge + citation style, engine
+``figure``    figures, structure, engine
+``table``     tables, structure, engine
+``section``   structure, engine
+``style``     everything (config, .sty/.cls, engine scripts)
+============  =============================================
+
+Stages that are not needed are passed to the compile script as
+``SCITEX_WRITER_SKIP_STAGES`` and keep their previous outputs, so editing one
+section ``.tex`` no longer reprocesses figures or re-merges the bibliography.
+Structure assembly and the TeX engine always run.
 """
 
 from __future__ import annotations
 
+import hashlib
+import inspect
+import os
+import queue
 import subprocess
+import time
+import warnings
+from dataclasses import dataclass, field
 from logging import getLogger
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Set, Tuple
+
+from .._compile._events import CompileEvent, CompileEventLog
+from .._dataclasses.config import DOC_TYPE_DIRS
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional ([all]); the watcher falls back to polling
+    FileSystemEventHandler = Observer = None
 
 logger = getLogger(__name__)
 
+ALL_STAGES = ("bib", "figures", "tables", "structure", "engine")
+"""Pipeline stages in build order."""
+
+SKIPPABLE_STAGES = ("bib", "figures", "tables")
+"""Stages the compile script can skip (``SCITEX_WRITER_SKIP_STAGES``)."""
+
+CATEGORY_STAGES: Dict[str, Tuple[str, ...]] = {
+    "bib": ("bib", "engine"),
+    "figure": ("figures", "structure", "engine"),
+    "table": ("tables", "structure", "engine"),
+    "section": ("structure", "engine"),
+    "style": ALL_STAGES,
+}
+
+# Build outputs and tool state: never a reason to rebuild.
+_IGNORED_DIRS = {
+    "compiled",
+    "jpg_for_compilation",
+    "logs",
+    "archive",
+    "wordcounts",
+    "docs",
+    "__pycache__",
+    "node_modules",
+}
+_GENERATED_FILES = {
+    "wordcount.tex",
+    "claims_rendered.tex",
+    "clew_rendered.tex",
+    "scitex_writer_version.tex",
+}
+_EDITOR_SUFFIXES = (".swp", ".swo", ".swx", ".tmp", ".bak", "~")
+_STYLE_SUFFIXES = {".sty", ".cls", ".bst", ".yaml", ".yml", ".sh", ".py"}
+# A converted image is derived from its source (the figure pipeline refreshes
+# it when the source is newer), so the conversion writing it is not a change.
+_MEDIA_SOURCES = {
+    ".jpg": (".png", ".tif", ".tiff", ".mmd", ".pptx"),
+    ".jpeg": (".png", ".tif", ".tiff", ".mmd", ".pptx"),
+    ".png": (".tif", ".tiff", ".mmd", ".pptx"),
+}
+
+
+def _is_derived_media(path: Path) -> bool:
+    sources = _MEDIA_SOURCES.get(path.suffix.lower(), ())
+    return any(path.with_suffix(suffix).exists() for suffix in sources)
+
+
+def classify_path(
+    path: Path, project_dir: Path, doc_type: str = "manuscript"
+) -> Optional[str]:
+    """The category of a changed path, or None when it cannot affect the build.
+
+    Args:
+        path: Changed file (absolute, or relative to ``project_dir``)
+        project_dir: Writer project root
+        doc_type: Document being watched; other documents' files are ignored
+
+    Returns:
+        One of ``bib``, ``figure``, ``table``, ``section``, ``style`` or None
+    """
+    project_dir = Path(project_dir)
+    path = Path(path)
+    try:
+        rel = path.relative_to(project_dir) if path.is_absolute() else path
+    except ValueError:
+        return None
+    parts = rel.parts
+    if not parts:
+        return None
+    name = parts[-1]
+    if any(p.startswith(".") for p in parts) or name.startswith("#"):
+        return None
+    if name.endswith(_EDITOR_SUFFIXES) or _IGNORED_DIRS.intersection(parts[:-1]):
+        return None
+
+    doc_dir = DOC_TYPE_DIRS.get(doc_type, doc_type)
+    top = parts[0]
+    if top in DOC_TYPE_DIRS.values() and top != doc_dir:
+        return None
+    if name in _GENERATED_FILES or name in (
+        f"{doc_type}.tex",
+        f"{doc_type}_diff.tex",
+    ):
+        return None
+
+    suffix = rel.suffix.lower()
+    if suffix == ".bib":
+        return "bib"
+    if "figures" in parts[:-1]:
+        return None if _is_derived_media(project_dir / rel) else "figure"
+    if "tables" in parts[:-1]:
+        return "table"
+    if suffix in _STYLE_SUFFIXES or "latex_styles" in parts[:-1]:
+        return "style"
+    if suffix in (".tex", ".json"):
+        return "section"
+    return None
+
+
+@dataclass
+class RebuildPlan:
+    """What changed since the last build and which stages that requires."""
+
+    changes: Dict[str, List[str]] = field(default_factory=dict)
+    stages: Tuple[str, ...] = ()
+
+    @property
+    def skipped(self) -> Tuple[str, ...]:
+        """Skippable stages the plan does not need."""
+        return tuple(s for s in SKIPPABLE_STAGES if s not in self.stages)
+
+    def __bool__(self) -> bool:
+        return bool(self.stages)
+
+
+def plan_rebuild(
+    paths: Iterable[Path],
+    project_dir: Path,
+    doc_type: str = "manuscript",
+    extra_stages: Iterable[str] = (),
+) -> RebuildPlan:
+    """Classify changed paths and collect the stages they require.
+
+    ``extra_stages`` are added unconditionally (e.g. stages of a failed build
+    that must rerun even though their inputs did not change again).
+    """
+    changes: Dict[str, List[str]] = {}
+    needed: Set[str] = set(extra_stages)
+    for path in paths:
+        category = classify_path(path, project_dir, doc_type)
+        if category is None:
+            continue
+        changes.setdefault(category, []).append(str(path))
+        needed.update(CATEGORY_STAGES[category])
+    if needed:
+        # A rebuild always reassembles the document and runs the engine.
+        needed.update(("structure", "engine"))
+    stages = tuple(s for s in ALL_STAGES if s in needed)
+    return RebuildPlan({k: sorted(v) for k, v in changes.items()}, stages)
+
+
+def _watch_roots(project_dir: Path, doc_type: str) -> List[Path]:
+    roots = [project_dir / DOC_TYPE_DIRS.get(doc_type, doc_type)]
+    roots += [project_dir / "00_shared", project_dir / "config"]
+    return [r for r in roots if r.is_dir()]
+
+
+class PollingSource:
+    """Change source that rescans the watched trees every ``interval`` seconds.
+
+    Files are compared by ``(mtime_ns, size)``; creations and deletions are
+    reported too. Used when watchdog is not installed.
+    """
+
+    def __init__(self, roots: Iterable[Path], interval: float = 2.0) -> None:
+        self.roots = [Path(r) for r in roots]
+        self.interval = interval
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [
+                    d
+                    for d in dirnames
+                    if not d.startswith(".") and d not in _IGNORED_DIRS
+                ]
+                for name in filenames:
+                    path = Path(dirpath) / name
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def start(self) -> None:
+        self._snapshot = self._scan()
+
+    def get(self, timeout: Optional[float]) -> List[Path]:
+        """Wait up to ``timeout`` (at most one interval) and return changed paths."""
+        wait = self.interval if timeout is None else min(self.interval, timeout)
+        if wait > 0:
+            time.sleep(wait)
+        current = self._scan()
+        previous, self._snapshot = self._snapshot, current
+        changed = [p for p, sig in current.items() if previous.get(p) != sig]
+        changed += [p for p in previous if p not in current]
+        return changed
+
+    def stop(self) -> None:
+        self._snapshot = {}
+
+
+class WatchdogSource:
+    """Change source backed by a watchdog observer (native OS notifications)."""
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        if Observer is None:
+            raise ImportError(
+                "watchdog is not installed: pip install scitex-writer[all]"
+            )
+        self.roots = [Path(r) for r in roots]
+        self._queue: "queue.Queue[Path]" = queue.Queue()
+        changes = self._queue
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                if event.is_directory or event.event_type in (
+                    "opened",
+                    "closed_no_write",
+                ):
+                    return
+                changes.put(Path(event.src_path))
+                dest = getattr(event, "dest_path", "")
+                if dest:
+                    changes.put(Path(dest))
+
+        self._observer = Observer()
+        for root in self.roots:
+            self._observer.schedule(_Handler(), str(root), recursive=True)
+
+    def start(self) -> None:
+        self._observer.start()
+
+    def get(self, timeout: Optional[float]) -> List[Path]:
+        """Block up to ``timeout`` for one change, then drain what is queued."""
+        try:
+            changed = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                changed.append(self._queue.get_nowait())
+            except queue.Empty:
+                return changed
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join(timeout=5)
+
+
+def watchdog_available() -> bool:
+    return Observer is not None
+
+
+def make_source(
+    roots: Iterable[Path],
+    interval: float = 2.0,
+    backend: Literal["auto", "watchdog", "polling"] = "auto",
+):
+    """The change source for ``backend`` (``auto``: watchdog when installed)."""
+    if backend == "watchdog" or (backend == "auto" and watchdog_available()):
+        return WatchdogSource(roots)
+    return PollingSource(roots, interval)
+
+
+def collect_changes(source, debounce: float, timeout: Optional[float]) -> Set[Path]:
+    """Wait for a change, then keep collecting until ``debounce`` seconds pass quietly.
+
+    Returns an empty set when nothing changed within ``timeout``.
+    """
+    first = source.get(timeout)
+    if not first:
+        return set()
+    pending = set(first)
+    while True:
+        more = source.get(debounce)
+        if not more:
+            return pending
+        pending.update(more)
+
+
+class _ContentFilter:
+    """Drops changes that leave a file's bytes unchanged (touch, identical save)."""
+
+    def __init__(self) -> None:
+        self._digests: Dict[Path, Optional[str]] = {}
+
+    @staticmethod
+    def _digest(path: Path) -> Optional[str]:
+        try:
+            return hashlib.sha1(path.read_bytes()).hexdigest()
+        except OSError:
+            return None  # deleted, or unreadable mid-write
+
+    def changed(self, paths: Iterable[Path]) -> List[Path]:
+        result = []
+        for path in paths:
+            digest = self._digest(path)
+            if path in self._digests and self._digests[path] == digest:
+                continue
+            self._digests[path] = digest
+            result.append(path)
+        return result
+
+
+class _NotifyingEventLog(CompileEventLog):
+    """Event log that also hands every event to the watch callback."""
+
+    def __init__(self, notify: Callable[[CompileEvent], None]) -> None:
+        super().__init__()
+        self._notify = notify
+
+    def emit(self, type: str, **data) -> CompileEvent:
+        event = super().emit(type, **data)
+        self._notify(event)
+        return event
+
+
+def _callback_notifier(
+    on_compile: Optional[Callable],
+) -> Callable[[CompileEvent], None]:
+    """Adapt ``on_compile`` to receive events.
+
+    A callback taking one argument gets every :class:`CompileEvent`; a legacy
+    zero-argument callback is called once per finished build.
+    """
+    if on_compile is None:
+        return lambda event: None
+    try:
+        params = inspect.signature(on_compile).parameters.values()
+        legacy = not any(
+            p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.VAR_POSITIONAL)
+            for p in params
+        )
+    except (TypeError, ValueError):
+        legacy = False
+
+    def notify(event: CompileEvent) -> None:
+        try:
+            if not legacy:
+                on_compile(event)
+            elif event.type == "build_end":
+                on_compile()
+        except Exception as e:
+            logger.error(f"Callback error: {e}")
+
+    return notify
+
+
+def _default_compile(project_dir: Path, doc_type: str, skip_stages, log_callback):
+    from .._mcp.utils import run_compile_script
+
+    return run_compile_script(
+        project_dir,
+        doc_type,
+        no_diff=True,
+        skip_stages=skip_stages,
+        log_callback=log_callback,
+    )
+
+
+def _popen_compile(popen: Callable) -> Callable:
+    """A ``compile_fn`` running compile.sh through a ``subprocess.Popen``-like
+    launcher (the deprecated ``popen=`` of :func:`watch_manuscript`).
+
+    The launcher gets the old call shape and no environment, so skipped
+    stages cannot be passed on: every build runs every stage.
+    """
+
+    def compile_fn(project_dir: Path, doc_type: str, skip_stages, log_callback):
+        process = popen(
+            ["/bin/bash", str(project_dir / "compile.sh"), doc_type, "--no_diff"],
+            cwd=project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,  # Line-buffered
+        )
+        for line in iter(process.stdout.readline, ""):
+            log_callback(line.rstrip("\n"))
+        return {"success": process.wait() == 0}
+
+    return compile_fn
+
 
 def watch_manuscript(
     project_dir: Path,
     interval: int = 2,
     on_compile: Optional[Callable] = None,
     timeout: Optional[int] = None,
+    doc_type: str = "manuscript",
+    debounce: float = 0.5,
+    initial_build: bool = True,
+    backend: Literal["auto", "watchdog", "polling"] = "auto",
+    source=None,
+    compile_fn: Optional[Callable] = None,
     popen: Optional[Callable] = None,
 ) -> None:
     """
@@ -30,78 +447,133 @@ def watch_manuscript(
 
     Args:
         project_dir: Path to writer project directory
-        interval: Check interval in seconds
-        on_compile: Callback function called after each compilation
+        interval: Polling interval in seconds (polling backend only)
+        on_compile: Callback receiving each :class:`CompileEvent`
+            (``changes``, ``build_start``, the build's stage/log/warning/error
+            events, ``build_end``). A zero-argument callback is called once
+            after each build instead.
         timeout: Optional timeout in seconds (None = infinite)
-        popen: Process launcher with the same call shape as
-            ``subprocess.Popen`` (cmd, cwd, stdout, stderr, text, bufsize).
-            Defaults to :class:`subprocess.Popen`. Exposed so callers and
-            tests can supply an alternate launcher without patching
-            ``subprocess.Popen`` globally.
+        doc_type: Document to watch and build
+        debounce: Quiet period, in seconds, that ends a burst of saves
+        initial_build: Run a full build before waiting for changes
+        backend: ``watchdog``, ``polling``, or ``auto`` (watchdog when installed)
+        source: Change source with ``start()``, ``get(timeout)`` and
+            ``stop()``; defaults to :func:`make_source`. Exposed so callers and
+            tests can drive the watcher without touching the filesystem.
+        compile_fn: Build runner called as ``compile_fn(project_dir, doc_type,
+            skip_stages, log_callback)`` returning a dict with ``success``;
+            defaults to :func:`scitex_writer._mcp.utils.run_compile_script`
+            (without the diff stage).
+        popen: Deprecated; use ``compile_fn``. Process launcher with the call
+            shape of ``subprocess.Popen`` (cmd, cwd, stdout, stderr, text,
+            bufsize); each build then runs ``compile.sh`` through it, with
+            every stage.
 
     Examples:
         >>> from pathlib import Path
-        >>> def on_change():
-        ...     print("Recompiled!")
-        >>> watch_manuscript(Path("/path/to/project"), on_compile=on_change)
+        >>> def on_event(event):
+        ...     if event.type == "build_end":
+        ...         print("Recompiled:", event.data["stages"])
+        >>> watch_manuscript(Path("/path/to/project"), on_compile=on_event)
     """
-    if popen is None:
-        popen = subprocess.Popen
+    project_dir = Path(project_dir)
+    if popen is not None:
+        warnings.warn(
+            "watch_manuscript(popen=...) is deprecated; pass compile_fn=...",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
-    # Get compile script from project directory
-    compile_script = project_dir / "compile"
+    if compile_fn is None:
+        if not (project_dir / "compile.sh").exists():
+            logger.error(f"compile.sh not found: {project_dir / 'compile.sh'}")
+            return
+        compile_fn = _default_compile if popen is None else _popen_compile(popen)
 
-    if not compile_script.exists():
-        logger.error(f"compile script not found: {compile_script}")
-        return
+    if source is None:
+        source = make_source(_watch_roots(project_dir, doc_type), interval, backend)
 
-    # Build watch command
-    cmd = [str(compile_script), "-m", "-w"]
+    events = _NotifyingEventLog(_callback_notifier(on_compile))
+    content = _ContentFilter()
+    generation = 0
+    # Stages of a failed build rerun next time even if nothing else needs them.
+    dirty: Set[str] = set()
 
-    logger.info(f"Starting watch mode for {project_dir}")
-    logger.info("Press Ctrl+C to stop")
-
-    process = None
-    try:
-        # Run watch script
-        process = popen(
-            cmd,
-            cwd=project_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,  # Line-buffered
+    def build(plan: RebuildPlan) -> None:
+        nonlocal generation, dirty
+        generation += 1
+        events.emit(
+            "build_start",
+            generation=generation,
+            stages=list(plan.stages),
+            skipped=list(plan.skipped),
         )
+        started = time.monotonic()
+        on_line = events.line_callback()
 
-        # Stream output
-        for line in iter(process.stdout.readline, ""):
-            if line:
-                print(line.rstrip())
+        def log_callback(line: str) -> None:
+            print(line.rstrip())
+            on_line(line)
 
-                # Call callback on compilation events
-                if on_compile and "Compilation" in line:
-                    try:
-                        on_compile()
-                    except Exception as e:
-                        logger.error(f"Callback error: {e}")
+        try:
+            result = compile_fn(project_dir, doc_type, plan.skipped, log_callback)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        success = bool(result.get("success"))
+        dirty = set() if success else set(plan.stages)
+        events.emit(
+            "build_end",
+            generation=generation,
+            success=success,
+            stages=list(plan.stages),
+            skipped=list(plan.skipped),
+            elapsed=round(time.monotonic() - started, 3),
+            error=result.get("error"),
+        )
 
-        process.wait(timeout=timeout)
+    logger.info(f"Starting watch mode for {project_dir}")
+    logger.info("Press Ctrl+C to stop")
 
+    deadline = None if timeout is None else time.monotonic() + timeout
+    source.start()
+    try:
+        if initial_build:
+            build(RebuildPlan({}, ALL_STAGES))
+        while deadline is None or time.monotonic() < deadline:
+            remaining = (
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            paths = collect_changes(source, debounce, remaining)
+            if not paths:
+                continue
+            plan = plan_rebuild(
+                content.changed(sorted(paths)), project_dir, doc_type, dirty
+            )
+            if not plan:
+                continue
+            events.emit("changes", changes=plan.changes, stages=list(plan.stages))
+            build(plan)
     except KeyboardInterrupt:
         logger.info("\nWatch mode stopped by user")
-        if process:
-            process.terminate()
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
-
     except Exception as e:
         logger.error(f"Watch mode error: {e}")
-        if process:
-            process.terminate()
+    finally:
+        source.stop()
 
 
-__all__ = ["watch_manuscript"]
+__all__ = [
+    "ALL_STAGES",
+    "CATEGORY_STAGES",
+    "PollingSource",
+    "RebuildPlan",
+    "SKIPPABLE_STAGES",
+    "WatchdogSource",
+    "classify_path",
+    "collect_changes",
+    "make_source",
+    "plan_rebuild",
+    "watch_manuscript",
+    "watchdog_available",
+]
 
 # EOF
@@ -18,14 +18,25 @@ Usage::
     # Add an entry
     sw.bib.add("./my-paper", "@article{Smith2024, ...}")
 
+    # Add / remove many entries, writing each file once
+    sw.bib.add_many("./my-paper", ["@article{A2024, ...}", "@misc{B2023, ...}"])
+    sw.bib.remove_many("./my-paper", ["A2024", "B2023"])
+
     # Merge all bib files
     sw.bib.merge("./my-paper")
+
+Reads go through a process-wide index of ``00_shared/bib_files/*.bib``
+(``_utils/_bib_index.py``): a file is re-read only when its mtime or size
+changed, and a key lookup is a dict hit.
 """
 
 import re as _re
+from typing import Iterable as _Iterable
 from typing import Optional as _Optional
+from typing import Union as _Union
 
 from ._mcp.utils import resolve_project_path as _resolve_project_path
+from ._utils._bib_index import get_bib_index as _get_bib_index
 
 try:
     from scitex_dev.decorators import supports_return_as as _supports_return_as
@@ -53,15 +64,13 @@ def list_files(project_dir: str) -> dict:
             return {"success": True, "bibfiles": [], "count": 0}
 
         bibfiles = []
-        for bib_file in sorted(bib_dir.glob("*.bib")):
-            content = bib_file.read_text(encoding="utf-8")
-            entry_count = content.count("@")
+        for name, entry_count in _get_bib_index(bib_dir).files():
             bibfiles.append(
                 {
-                    "name": bib_file.name,
-                    "path": str(bib_file),
+                    "name": name,
+                    "path": str(bib_dir / name),
                     "entry_count": entry_count,
-                    "is_merged": bib_file.name == "bibliography.bib",
+                    "is_merged": name == "bibliography.bib",
                 }
             )
 
@@ -88,23 +97,14 @@ def list_entries(project_dir: str, bibfile: _Optional[str] = None) -> dict:
         if not bib_dir.exists():
             return {"success": True, "entries": [], "count": 0}
 
-        entries = []
-        files_to_scan = [bib_dir / bibfile] if bibfile else list(bib_dir.glob("*.bib"))
-
-        for bib_file in files_to_scan:
-            if not bib_file.exists():
-                continue
-            content = bib_file.read_text(encoding="utf-8")
-            pattern = r"@(\w+)\{([^,\s]+)"
-            for match in _re.finditer(pattern, content):
-                entry_type, citation_key = match.groups()
-                entries.append(
-                    {
-                        "citation_key": citation_key,
-                        "entry_type": entry_type,
-                        "bibfile": bib_file.name,
-                    }
-                )
+        entries = [
+            {
+                "citation_key": entry.citation_key,
+                "entry_type": entry.entry_type,
+                "bibfile": entry.bibfile,
+            }
+            for entry in _get_bib_index(bib_dir).entries(bibfile)
+        ]
 
         return {"success": True, "entries": entries, "count": len(entries)}
     except Exception as e:
@@ -129,19 +129,19 @@ def get(project_dir: str, citation_key: str) -> dict:
         if not bib_dir.exists():
             return {"success": False, "error": "No bib_files directory found"}
 
-        for bib_file in bib_dir.glob("*.bib"):
-            content = bib_file.read_text(encoding="utf-8")
-            pattern = rf"(@\w+\{{{citation_key}\s*,.*?(?=\n@|\Z))"
-            match = _re.search(pattern, content, _re.DOTALL)
-            if match:
-                return {
-                    "success": True,
-                    "citation_key": citation_key,
-                    "bibfile": str(bib_file),
-                    "entry": match.group(1).strip(),
-                }
-
-        return {"success": False, "error": f"Citation key not found: {citation_key}"}
+        index = _get_bib_index(bib_dir)
+        entry = index.lookup(citation_key)
+        if entry is None:
+            return {
+                "success": False,
+                "error": f"Citation key not found: {citation_key}",
+            }
+        return {
+            "success": True,
+            "citation_key": citation_key,
+            "bibfile": str(bib_dir / entry.bibfile),
+            "entry": index.text_of(entry),
+        }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -169,35 +169,62 @@ def add(
         bib_dir = project_path / "00_shared" / "bib_files"
         bib_dir.mkdir(parents=True, exist_ok=True)
 
-        key_match = _re.search(r"@\w+\{([^,\s]+)", bibtex_entry)
-        if not key_match:
+        added, skipped, invalid = _get_bib_index(bib_dir).add_many(
+            [bibtex_entry], bibfile, deduplicate
+        )
+        if invalid:
             return {"success": False, "error": "Could not parse citation key"}
-        citation_key = key_match.group(1)
-
-        if deduplicate:
-            existing = get(project_dir, citation_key)
-            if existing.get("success"):
-                return {
-                    "success": False,
-                    "error": f"Duplicate citation key: {citation_key}",
-                    "existing_file": existing.get("bibfile"),
-                }
+        if skipped:
+            return {
+                "success": False,
+                "error": f"Duplicate citation key: {skipped[0]['citation_key']}",
+                "existing_file": skipped[0]["existing_file"],
+            }
 
-        bib_path = bib_dir / bibfile
-        if bib_path.exists():
-            current_content = bib_path.read_text(encoding="utf-8")
-            if not current_content.endswith("\n"):
-                current_content += "\n"
-            new_content = current_content + "\n" + bibtex_entry.strip() + "\n"
-        else:
-            new_content = bibtex_entry.strip() + "\n"
+        return {
+            "success": True,
+            "bibfile": str(bib_dir / bibfile),
+            "citation_key": added[0],
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@_supports_return_as
+def add_many(
+    project_dir: str,
+    bibtex_entries: _Union[str, _Iterable[str]],
+    bibfile: str = "custom.bib",
+    deduplicate: bool = True,
+) -> dict:
+    """Add several BibTeX entries to a bibliography file with one write.
+
+    Args:
+        project_dir: Path to scitex-writer project.
+        bibtex_entries: List of BibTeX entries, or one text holding several.
+        bibfile: Target bib file name (default: custom.bib).
+        deduplicate: Skip entries whose key exists already (in any .bib file
+            or earlier in the batch).
 
-        bib_path.write_text(new_content, encoding="utf-8")
+    Returns:
+        Dict with bibfile path, added keys, skipped duplicates
+        ({citation_key, existing_file}) and entries without a citation key.
+    """
+    try:
+        project_path = _resolve_project_path(project_dir)
+        bib_dir = project_path / "00_shared" / "bib_files"
+        bib_dir.mkdir(parents=True, exist_ok=True)
 
+        added, skipped, invalid = _get_bib_index(bib_dir).add_many(
+            bibtex_entries, bibfile, deduplicate
+        )
         return {
             "success": True,
-            "bibfile": str(bib_path),
-            "citation_key": citation_key,
+            "bibfile": str(bib_dir / bibfile),
+            "added": added,
+            "count": len(added),
+            "skipped": skipped,
+            "invalid": invalid,
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -221,21 +248,42 @@ def remove(project_dir: str, citation_key: str) -> dict:
         if not bib_dir.exists():
             return {"success": False, "error": "No bib_files directory found"}
 
-        for bib_file in bib_dir.glob("*.bib"):
-            content = bib_file.read_text(encoding="utf-8")
-            pattern = rf"@\w+\{{{citation_key}\s*,.*?(?=\n@|\Z)"
-            match = _re.search(pattern, content, _re.DOTALL)
-            if match:
-                new_content = content[: match.start()] + content[match.end() :]
-                new_content = _re.sub(r"\n{3,}", "\n\n", new_content).strip() + "\n"
-                bib_file.write_text(new_content, encoding="utf-8")
-                return {
-                    "success": True,
-                    "citation_key": citation_key,
-                    "removed_from": str(bib_file),
-                }
+        removed, _missing = _get_bib_index(bib_dir).remove_many([citation_key])
+        if not removed:
+            return {
+                "success": False,
+                "error": f"Citation key not found: {citation_key}",
+            }
+        return {"success": True, **removed[0]}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@_supports_return_as
+def remove_many(project_dir: str, citation_keys: _Iterable[str]) -> dict:
+    """Remove several BibTeX entries, writing each touched file once.
 
-        return {"success": False, "error": f"Citation key not found: {citation_key}"}
+    Args:
+        project_dir: Path to scitex-writer project.
+        citation_keys: The citation keys to remove.
+
+    Returns:
+        Dict with removed ({citation_key, removed_from}) and not_found keys.
+    """
+    try:
+        project_path = _resolve_project_path(project_dir)
+        bib_dir = project_path / "00_shared" / "bib_files"
+
+        if not bib_dir.exists():
+            return {"success": False, "error": "No bib_files directory found"}
+
+        removed, missing = _get_bib_index(bib_dir).remove_many(citation_keys)
+        return {
+            "success": True,
+            "removed": removed,
+            "count": len(removed),
+            "not_found": missing,
+        }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -306,6 +354,15 @@ def merge(
         return {"success": False, "error": str(e)}
 
 
-__all__ = ["list_files", "list_entries", "get", "add", "remove", "merge"]
+__all__ = [
+    "list_files",
+    "list_entries",
+    "get",
+    "add",
+    "add_many",
+    "remove",
+    "remove_many",
+    "merge",
+]
 
 # EOF
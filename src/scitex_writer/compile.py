@@ -33,6 +33,7 @@ Usage::
     result = sw.compile.archive("./my-paper")
 """
 
+from typing import Callable as _Callable
 from typing import Literal as _Literal
 from typing import Optional as _Optional
 
@@ -64,6 +65,7 @@ def manuscript(
     quiet: bool = False,
     verbose: bool = False,
     engine: str | None = None,
+    log_callback: _Optional[_Callable[[str], None]] = None,
 ) -> dict:
     """Compile manuscript to PDF.
 
@@ -73,11 +75,16 @@ def manuscript(
         no_figs: Skip figure processing.
         no_tables: Skip table processing.
         no_diff: Skip diff generation.
-        draft: Fast single-pass compilation.
+        draft: Fast single-pass compilation that typesets downscaled, cached
+            figure proxies (longest edge ``figures.draft_max_edge`` px, default
+            1000) instead of the full-resolution JPGs; the layout is unchanged.
         dark_mode: Enable dark mode output.
         quiet: Suppress output.
         verbose: Verbose output.
-        engine: LaTeX engine override ('tectonic', 'latexmk', '3pass').
+        engine: LaTeX engine override ('tectonic', 'latexmk', '3pass',
+            'fmt').
+        log_callback: Called with each output line as the compile runs
+            (stderr lines prefixed ``[STDERR] ``).
 
     Returns:
         Dict with success status, pdf_path, and any errors.
@@ -93,6 +100,7 @@ def manuscript(
         quiet=quiet,
         verbose=verbose,
         engine=engine,
+        log_callback=log_callback,
     )
 
 
@@ -106,6 +114,7 @@ def supplementary(
     draft: bool = False,
     quiet: bool = False,
     engine: str | None = None,
+    log_callback: _Optional[_Callable[[str], None]] = None,
 ) -> dict:
     """Compile supplementary materials to PDF.
 
@@ -115,9 +124,12 @@ def supplementary(
         no_figs: Skip figure processing.
         no_tables: Skip table processing.
         no_diff: Skip diff generation.
-        draft: Fast single-pass compilation.
+        draft: Fast single-pass compilation on downscaled figure proxies.
         quiet: Suppress output.
-        engine: LaTeX engine override ('tectonic', 'latexmk', '3pass').
+        engine: LaTeX engine override ('tectonic', 'latexmk', '3pass',
+            'fmt').
+        log_callback: Called with each output line as the compile runs
+            (stderr lines prefixed ``[STDERR] ``).
 
     Returns:
         Dict with success status, pdf_path, and any errors.
@@ -131,6 +143,7 @@ def supplementary(
         draft=draft,
         quiet=quiet,
         engine=engine,
+        log_callback=log_callback,
     )
 
 
@@ -143,6 +156,7 @@ def revision(
     draft: bool = False,
     quiet: bool = False,
     engine: str | None = None,
+    log_callback: _Optional[_Callable[[str], None]] = None,
 ) -> dict:
     """Compile revision document to PDF.
 
@@ -151,9 +165,12 @@ def revision(
         track_changes: Enable change tracking.
         timeout: Compilation timeout in seconds.
         no_diff: Skip diff generation.
-        draft: Fast single-pass compilation.
+        draft: Fast single-pass compilation on downscaled figure proxies.
         quiet: Suppress output.
-        engine: LaTeX engine override ('tectonic', 'latexmk', '3pass').
+        engine: LaTeX engine override ('tectonic', 'latexmk', '3pass',
+            'fmt').
+        log_callback: Called with each output line as the compile runs
+            (stderr lines prefixed ``[STDERR] ``).
 
     Returns:
         Dict with success status, pdf_path, and any errors.
@@ -166,6 +183,7 @@ def revision(
         draft=draft,
         quiet=quiet,
         engine=engine,
+        log_callback=log_callback,
     )
 
 
@@ -304,6 +304,7 @@ def render(
     no_figs: bool = False,
     pptx: bool = False,
     crop: bool = False,
+    draft: bool = False,
 ) -> dict:
     """Run the engine's figure pipeline for ``doc_type``.
 
@@ -318,12 +319,16 @@ def render(
 
     ``no_figs=True`` skips all image work and disables figures (the shell's
     ``no_figs``); ``pptx=True`` also renders ``NN_*.pptx`` slides through
-    LibreOffice; ``crop=True`` trims each compilation JPG's uniform border.
+    LibreOffice; ``crop=True`` trims each compilation JPG's uniform border;
+    ``draft=True`` points ``FINAL.tex`` at cached, downscaled proxies
+    (``jpg_for_compilation/_draft/``, longest edge ``figures.draft_max_edge`` px)
+    for fast iteration compiles with the same layout.
     Returns ``{success, figures_compiled, captions_created, panel_captions_removed,
-    renamed_panels, converted, composed, placeholders_created, cropped, figures,
-    compiled_file, figures_enabled, fallback_header, skipped, warnings, error}``.
+    renamed_panels, converted, conversion_timings, composed, placeholders_created,
+    cropped, draft_proxies, figures, compiled_file, figures_enabled,
+    fallback_header, skipped, draft, warnings, error}``.
     """
-    return _process(project_dir, doc_type, no_figs, pptx, crop)
+    return _process(project_dir, doc_type, no_figs, pptx, crop, draft)
 
 
 __all__ = [
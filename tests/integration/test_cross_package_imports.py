@@ -30,6 +30,7 @@ CROSS_PACKAGE_IMPORTS = [
     "scitex_dev.skills",
     "scitex_dev.system_deps",
     "scitex_dev.types",
+    "scitex_logging",
     "scitex_scholar",
     "scitex_todo",
     "scitex_ui",
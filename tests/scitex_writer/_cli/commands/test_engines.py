@@ -45,13 +45,13 @@ def test_engines_default_exits_zero(runner):
     assert result.exit_code == 0
 
 
-def test_engines_default_lists_all_three(runner):
+def test_engines_default_lists_every_engine(runner):
     # Arrange
     args = ["list-engines"]
     # Act
     result = runner.invoke(main_group, args)
     # Assert
-    assert all(e in result.output for e in ("tectonic", "latexmk", "3pass"))
+    assert all(e in result.output for e in ("tectonic", "latexmk", "3pass", "fmt"))
 
 
 def test_engines_json_exits_zero(runner):
@@ -63,14 +63,14 @@ def test_engines_json_exits_zero(runner):
     assert result.exit_code == 0
 
 
-def test_engines_json_lists_all_three_in_order(runner):
+def test_engines_json_lists_every_engine_in_order(runner):
     # Arrange
     args = ["list-engines", "--json"]
     # Act
     result = runner.invoke(main_group, args)
     payload = json.loads(result.output)
     # Assert
-    assert [row["engine"] for row in payload] == ["tectonic", "latexmk", "3pass"]
+    assert [row["engine"] for row in payload] == ["tectonic", "latexmk", "3pass", "fmt"]
 
 
 def test_engines_json_rows_have_available_key(runner):
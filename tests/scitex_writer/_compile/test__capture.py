@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/_compile/test__capture.py
+
+"""Tests for bounded, spill-to-disk compile output capture."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scitex_writer._compile._capture import SpillCapture
+from scitex_writer._compile._execute import _execute_with_callbacks, _run_sh_command
+
+_MANY_LINES = "i=0; while [ $i -lt 2000 ]; do echo line$i; i=$((i+1)); done"
+
+
+class TestSpillCapture:
+    def test_short_output_is_kept_whole(self, tmp_path):
+        # Arrange
+        capture = SpillCapture(tmp_path / "out.stdout", tail_bytes=1024)
+        capture.write(b"a\nb\n")
+        # Act
+        handle = capture.close()
+        # Assert
+        assert (handle.tail, handle.truncated) == ("a\nb", False)
+
+    def test_memory_holds_only_the_tail(self, tmp_path):
+        # Arrange
+        capture = SpillCapture(tmp_path / "out.stdout", tail_bytes=20)
+        for i in range(100):
+            capture.write(b"line %d\n" % i)
+        # Act
+        handle = capture.close()
+        # Assert
+        assert handle.truncated and handle.tail.endswith("line 98\nline 99")
+        assert "line 50" not in handle.tail
+
+    def test_truncated_tail_says_where_the_full_output_is(self, tmp_path):
+        # Arrange
+        capture = SpillCapture(tmp_path / "out.stdout", tail_bytes=16)
+        capture.write(b"x\n" * 100)
+        # Act
+        handle = capture.close()
+        # Assert
+        assert str(tmp_path / "out.stdout") in handle.tail.splitlines()[0]
+
+    def test_handle_reads_the_full_output_lazily(self, tmp_path):
+        # Arrange
+        capture = SpillCapture(tmp_path / "out.stdout", tail_bytes=16)
+        for i in range(100):
+            capture.write(b"line %d\n" % i)
+        # Act
+        handle = capture.close()
+        # Assert
+        assert list(handle.iter_lines()) == [f"line {i}" for i in range(100)]
+
+    def test_child_writing_to_the_file_directly_is_tailed(self, tmp_path):
+        # Arrange
+        capture = SpillCapture(tmp_path / "out.stdout", tail_bytes=8)
+        subprocess.run(["/bin/sh", "-c", "echo first; echo last"], stdout=capture.file)
+        # Act
+        handle = capture.close()
+        # Assert
+        assert handle.tail.endswith("last") and handle.total_bytes == 11
+
+
+class TestExecutorSpillMode:
+    def test_streaming_executor_spills_and_keeps_a_tail(self, tmp_path):
+        # Arrange
+        lines = []
+        # Act
+        result = _execute_with_callbacks(
+            ["/bin/sh", "-c", _MANY_LINES], cwd=tmp_path, timeout=60,
+            log_callback=lines.append, spill_to=tmp_path / "logs" / "manuscript",
+            tail_bytes=64,
+        )
+        # Assert
+        assert len(lines) == 2000 and result["stdout"].endswith("line1999")
+        assert len(result["stdout"].splitlines()) < 10
+        assert (tmp_path / "logs" / "manuscript.stdout").read_text().count(
+            "\n"
+        ) == 2000
+
+    def test_plain_executor_spills_stderr_too(self, tmp_path):
+        # Arrange
+        cmd = ["/bin/sh", "-c", "echo oops >&2; exit 2"]
+        # Act
+        result = _run_sh_command(cmd, cwd=tmp_path, spill_to=tmp_path / "doc")
+        # Assert
+        assert (result["exit_code"], result["stderr"]) == (2, "oops")
+        assert result["stderr_log"].path == tmp_path / "doc.stderr"
+
+    @pytest.mark.skipif(
+        not Path("/proc/self/fd").is_dir(), reason="needs /proc/self/fd"
+    )
+    def test_spill_files_are_closed_when_the_executor_raises(self, tmp_path):
+        # Arrange
+        def callback(line):
+            raise RuntimeError("viewer went away")
+
+        # Act: the held traceback keeps the executor's frame (and its
+        # captures) alive, as a caller logging the exception would
+        with pytest.raises(RuntimeError) as raised:
+            _execute_with_callbacks(
+                ["/bin/sh", "-c", "echo hello"], cwd=tmp_path, timeout=60,
+                log_callback=callback, spill_to=tmp_path / "doc",
+            )
+        # Assert
+        open_paths = {
+            os.path.realpath(f"/proc/self/fd/{fd}") for fd in os.listdir("/proc/self/fd")
+        }
+        assert raised.traceback
+        assert str((tmp_path / "doc.stdout").resolve()) not in open_paths
+
+
+# EOF
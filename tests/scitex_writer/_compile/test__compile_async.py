@@ -18,3 +18,19 @@ def test_module_exposes_compile_all_async():
     module = importlib.import_module("scitex_writer._compile._compile_async")
     # Assert
     assert hasattr(module, "compile_all_async")
+
+
+def test_async_compile_goes_through_the_scheduler(tmp_path):
+    # Arrange: a real worker via the documented `runner` seam, no LaTeX needed
+    import asyncio
+
+    from scitex_writer._compile._compile_async import compile_manuscript_async
+    from scitex_writer._dataclasses import CompilationResult
+
+    def runner(doc_type, project_dir, **kwargs):
+        return CompilationResult(success=True, exit_code=0, stdout="", stderr="")
+
+    # Act
+    result = asyncio.run(compile_manuscript_async(tmp_path, runner=runner))
+    # Assert
+    assert result.queue_wait is not None
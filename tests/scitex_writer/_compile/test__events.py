@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/_compile/test__events.py
+
+"""Tests for the structured, resumable compile event log."""
+
+import threading
+from pathlib import Path
+
+from scitex_writer._compile._events import (
+    CompileEventLog,
+    count_stages,
+    format_sse,
+)
+
+
+def _types(log, since=0):
+    return [e.type for e in log.since(since)["events"]]
+
+
+class TestSince:
+    def test_returns_only_events_after_seq(self):
+        # Arrange
+        log = CompileEventLog()
+        for i in range(3):
+            log.emit("log", line=str(i))
+        # Act
+        page = log.since(2)
+        # Assert
+        assert [e.data["line"] for e in page["events"]] == ["2"]
+
+    def test_reports_truncation_when_unseen_events_were_dropped(self):
+        # Arrange
+        log = CompileEventLog(max_events=2)
+        for i in range(5):
+            log.emit("log", line=str(i))
+        # Act
+        page = log.since(1)
+        # Assert
+        assert page["truncated"] and [e.seq for e in page["events"]] == [4, 5]
+
+    def test_caught_up_reader_is_not_truncated(self):
+        # Arrange
+        log = CompileEventLog(max_events=2)
+        for i in range(5):
+            log.emit("log", line=str(i))
+        # Act
+        page = log.since(5)
+        # Assert
+        assert not page["truncated"] and page["events"] == []
+
+    def test_blocking_read_wakes_on_emit(self):
+        # Arrange
+        log = CompileEventLog()
+        timer = threading.Timer(0.05, log.emit, args=("build_start",))
+        timer.start()
+        # Act
+        page = log.since(0, timeout=10)
+        timer.join()
+        # Assert
+        assert [e.type for e in page["events"]] == ["build_start"]
+
+
+class TestLineCallback:
+    def test_stage_markers_become_stage_events(self):
+        # Arrange
+        log = CompileEventLog()
+        callback = log.line_callback()
+        # Act
+        callback("\x1b[1;36m▸ Compiling figures\x1b[0m")
+        callback("\x1b[0;32m✓ Compiling figures (3s)\x1b[0m")
+        # Assert
+        assert _types(log) == ["log", "stage_start", "log", "stage_end"]
+
+    def test_stage_end_carries_elapsed_seconds(self):
+        # Arrange
+        log = CompileEventLog()
+        # Act
+        log.line_callback()("✓ Compiling tables (12s)")
+        # Assert
+        end = log.since(0)["events"][-1]
+        assert end.data == {"stage": "Compiling tables", "elapsed": 12}
+
+    def test_progress_is_derived_from_total_stages(self):
+        # Arrange
+        log = CompileEventLog()
+        callback = log.line_callback(total_stages=4)
+        # Act
+        callback("✓ One (1s)")
+        # Assert
+        assert log.since(0)["events"][-1].data["percent"] == 25
+
+    def test_warning_and_error_lines_are_typed(self):
+        # Arrange
+        log = CompileEventLog()
+        callback = log.line_callback()
+        # Act
+        callback("  ⚠ Undefined reference fig:x")
+        callback("[STDERR]   ✗ LaTeX failed")
+        # Assert
+        events = log.since(0)["events"]
+        assert [(e.type, e.data.get("message")) for e in events[1::2]] == [
+            ("warning", "Undefined reference fig:x"),
+            ("error", "LaTeX failed"),
+        ]
+
+    def test_stderr_prefix_is_stripped_and_flagged(self):
+        # Arrange
+        log = CompileEventLog()
+        # Act
+        log.line_callback()("[STDERR] boom")
+        # Assert
+        assert log.since(0)["events"][0].data == {"line": "boom", "stream": "stderr"}
+
+
+# What compile_supplementary.sh / compile_revision.sh print (echo -e with
+# colours): their log_stage_* functions, the hand-announced parallel block and
+# echo_warning / echo_error.
+_SCRIPT_OUTPUT = [
+    "\x1b[0;90mINFO: [10:00:01] Starting: Dependency Check\x1b[0m",
+    "\x1b[0;32mSUCC: [10:00:02] Completed: Dependency Check"
+    " (1s elapsed, 1s total)\x1b[0m",
+    "\x1b[0;90mINFO: [10:00:02] Starting: Parallel Processing"
+    " (Figures, Tables, Word Count)\x1b[0m",
+    "\x1b[1;33mWARN: Figure 03 has no caption\x1b[0m",
+    "\x1b[0;32mSUCC: [10:00:09] Completed: Parallel Processing"
+    " (7s elapsed, 8s total)\x1b[0m",
+    "\x1b[0;31mERRO: PDF generation failed — supplementary.pdf was not"
+    " (re)created. Aborting.\x1b[0m",
+]
+
+
+class TestScriptOutputOfOtherDocTypes:
+    def test_starting_and_completed_lines_are_stage_events(self):
+        # Arrange
+        log = CompileEventLog()
+        callback = log.line_callback()
+        # Act
+        for line in _SCRIPT_OUTPUT[:2]:
+            callback(line)
+        # Assert
+        events = log.since(0)["events"]
+        assert [(e.type, e.data) for e in events[1::2]] == [
+            ("stage_start", {"stage": "Dependency Check"}),
+            ("stage_end", {"stage": "Dependency Check", "elapsed": 1}),
+        ]
+
+    def test_progress_advances_per_completed_stage(self):
+        # Arrange
+        log = CompileEventLog()
+        callback = log.line_callback(total_stages=4)
+        # Act
+        for line in _SCRIPT_OUTPUT:
+            callback(line)
+        # Assert
+        percents = [
+            e.data["percent"] for e in log.since(0)["events"] if e.type == "progress"
+        ]
+        assert percents == [25, 50]
+
+    def test_warn_and_erro_lines_are_typed(self):
+        # Arrange
+        log = CompileEventLog()
+        callback = log.line_callback()
+        # Act
+        for line in _SCRIPT_OUTPUT:
+            callback(line)
+        # Assert
+        typed = [
+            e.type for e in log.since(0)["events"] if e.type in ("warning", "error")
+        ]
+        assert typed == ["warning", "error"]
+
+    def test_stages_of_the_vendored_scripts_are_counted(self):
+        # Arrange: each script's stages, including the hand-announced one
+        scripts = Path(__file__).resolve().parents[3] / "scripts" / "shell"
+        # Act
+        counts = {
+            doc_type: count_stages(scripts / f"compile_{doc_type}.sh")
+            for doc_type in ("supplementary", "revision")
+        }
+        # Assert
+        assert all(count and count > 1 for count in counts.values())
+
+
+def test_count_stages_counts_log_stage_start_calls(tmp_path):
+    # Arrange
+    script = tmp_path / "compile_manuscript.sh"
+    script.write_text('log_stage_start "A"\n  log_stage_start "B"\necho done\n')
+    # Act
+    count = count_stages(script)
+    # Assert
+    assert count == 2
+
+
+def test_count_stages_counts_hand_announced_stages(tmp_path):
+    # Arrange
+    script = tmp_path / "compile_supplementary.sh"
+    script.write_text(
+        'log_stage_start() {\n    echo_info "[$timestamp] Starting: $stage_name"\n}\n'
+        'log_stage_start "A"\n'
+        'echo_info "[$timestamp] Starting: Parallel Processing (Figures)"\n'
+    )
+    # Act
+    count = count_stages(script)
+    # Assert
+    assert count == 2
+
+
+def test_format_sse_uses_seq_as_event_id():
+    # Arrange
+    event = CompileEventLog().emit("build_end", success=True)
+    # Act
+    frame = format_sse(event)
+    # Assert
+    assert frame.startswith("id: 1\nevent: build_end\ndata: ")
+
+
+# EOF
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/_compile/test__execute.py
+
+"""Tests for the compile-path subprocess executors.
+
+Real child processes (``/bin/sh``) under ``tmp_path``; no mocks. The contract
+pinned here is that the working directory and environment reach the CHILD
+while the parent's cwd and ``os.environ`` are left untouched -- the property
+that makes concurrent compiles on worker threads safe.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+from scitex_writer._compile._execute import (
+    _child_env,
+    _execute_with_callbacks,
+    _LineFramer,
+    _run_sh_command,
+)
+
+
+class TestChildEnv:
+    def test_layers_overrides_over_os_environ(self):
+        # Arrange
+        overrides = {"SCITEX_WRITER_TEST_VAR": "1"}
+        # Act
+        env = _child_env(None, overrides)
+        # Assert
+        assert env["SCITEX_WRITER_TEST_VAR"] == "1"
+
+    def test_pins_pwd_to_cwd(self, tmp_path):
+        # Arrange
+        # Act
+        env = _child_env(tmp_path)
+        # Assert
+        assert env["PWD"] == str(tmp_path)
+
+    def test_never_mutates_os_environ(self, tmp_path):
+        # Arrange
+        before = dict(os.environ)
+        # Act
+        _child_env(tmp_path, {"SCITEX_WRITER_TEST_VAR": "1"})
+        # Assert
+        assert dict(os.environ) == before
+
+
+class TestRunShCommand:
+    def test_child_runs_in_requested_cwd(self, tmp_path):
+        # Arrange
+        cmd = ["/bin/sh", "-c", "pwd -P"]
+        # Act
+        result = _run_sh_command(cmd, cwd=tmp_path)
+        # Assert
+        assert result["stdout"].strip() == str(tmp_path.resolve())
+
+    def test_parent_cwd_is_unchanged(self, tmp_path):
+        # Arrange
+        before = Path.cwd()
+        # Act
+        _run_sh_command(["/bin/sh", "-c", "true"], cwd=tmp_path)
+        # Assert
+        assert Path.cwd() == before
+
+    def test_env_reaches_child(self, tmp_path):
+        # Arrange
+        cmd = ["/bin/sh", "-c", 'printf %s "$SCITEX_WRITER_TEST_VAR"']
+        # Act
+        result = _run_sh_command(
+            cmd, cwd=tmp_path, env={"SCITEX_WRITER_TEST_VAR": "from-parent"}
+        )
+        # Assert
+        assert result["stdout"] == "from-parent"
+
+    def test_concurrent_calls_each_see_their_own_cwd(self, tmp_path):
+        # Arrange
+        dirs = [tmp_path / f"project{i}" for i in range(6)]
+        for d in dirs:
+            d.mkdir()
+        seen = {}
+
+        def run(d):
+            seen[d] = _run_sh_command(["/bin/sh", "-c", "pwd -P"], cwd=d)["stdout"]
+
+        threads = [threading.Thread(target=run, args=(d,)) for d in dirs]
+        # Act
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Assert
+        assert all(seen[d].strip() == str(d.resolve()) for d in dirs)
+
+
+class TestExecuteWithCallbacks:
+    def test_child_runs_in_requested_cwd(self, tmp_path):
+        # Arrange
+        lines = []
+        # Act
+        _execute_with_callbacks(
+            ["/bin/sh", "-c", "pwd -P"], cwd=tmp_path, timeout=30,
+            log_callback=lines.append,
+        )
+        # Assert
+        assert lines == [str(tmp_path.resolve())]
+
+    def test_env_reaches_child(self, tmp_path):
+        # Arrange
+        cmd = ["/bin/sh", "-c", 'echo "$SCITEX_WRITER_TEST_VAR"']
+        # Act
+        result = _execute_with_callbacks(
+            cmd, cwd=tmp_path, timeout=30, env={"SCITEX_WRITER_TEST_VAR": "x"}
+        )
+        # Assert
+        assert result["stdout"] == "x"
+
+    def test_stderr_lines_are_prefixed_for_the_callback(self, tmp_path):
+        # Arrange
+        lines = []
+        # Act
+        _execute_with_callbacks(
+            ["/bin/sh", "-c", "echo oops >&2"], cwd=tmp_path, timeout=30,
+            log_callback=lines.append,
+        )
+        # Assert
+        assert lines == ["[STDERR] oops"]
+
+    def test_unterminated_last_line_is_kept(self, tmp_path):
+        # Arrange
+        cmd = ["/bin/sh", "-c", "printf 'a\\nb'"]
+        # Act
+        result = _execute_with_callbacks(cmd, cwd=tmp_path, timeout=30)
+        # Assert
+        assert result["stdout"] == "a\nb"
+
+    def test_many_lines_arrive_in_order(self, tmp_path):
+        # Arrange
+        script = "i=0; while [ $i -lt 5000 ]; do echo $i; i=$((i+1)); done"
+        cmd = ["/bin/sh", "-c", script]
+        # Act
+        result = _execute_with_callbacks(cmd, cwd=tmp_path, timeout=60)
+        # Assert
+        assert result["stdout"].split("\n") == [str(i) for i in range(5000)]
+
+    def test_timeout_kills_and_reaps_the_child(self, tmp_path):
+        # Arrange
+        cmd = ["/bin/sh", "-c", "echo started; sleep 30"]
+        # Act
+        result = _execute_with_callbacks(cmd, cwd=tmp_path, timeout=1)
+        # Assert
+        assert result["exit_code"] is not None and not result["success"]
+        assert "timed out after 1 seconds" in result["stderr"]
+
+
+class TestLineFramer:
+    def test_lines_split_across_chunks_are_joined(self):
+        # Arrange
+        framer = _LineFramer()
+        # Act
+        lines = framer.feed(b"hel") + framer.feed(b"lo\nwor") + framer.feed(b"ld\n")
+        # Assert
+        assert lines == ["hello", "world"]
+
+    def test_flush_returns_the_unterminated_tail_once(self):
+        # Arrange
+        framer = _LineFramer()
+        framer.feed(b"tail")
+        # Act
+        first, second = framer.flush(), framer.flush()
+        # Assert
+        assert (first, second) == (["tail"], [])
+
+    def test_overlong_line_is_emitted_in_bounded_pieces(self):
+        # Arrange
+        framer = _LineFramer(max_line_bytes=4)
+        # Act
+        lines = framer.feed(b"abcdefghij")
+        # Assert
+        assert lines == ["abcd", "efgh"] and framer.flush() == ["ij"]
+
+    def test_multibyte_character_split_across_chunks_decodes(self):
+        # Arrange
+        framer = _LineFramer()
+        data = "✓ done\n".encode()
+        # Act
+        lines = framer.feed(data[:1]) + framer.feed(data[1:])
+        # Assert
+        assert lines == ["✓ done"]
+
+
+# EOF
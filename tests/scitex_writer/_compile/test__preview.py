@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/_compile/test__preview.py
+
+"""Tests for the warm content-preview engine.
+
+The document builder is checked against the real ``tex_snippet2full.py``
+script it replaces in-process; the compile itself needs pdflatex and
+mylatexformat and is skipped without them.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from scitex_writer._compile._preview import (
+    COLD_TEMP_PREFIX,
+    FAILED_FORMAT_RETRY_SECONDS,
+    PreviewEngine,
+    build_document,
+    cleanup_stale_temp_dirs,
+    format_key,
+    get_preview_engine,
+    scratch_root,
+    split_preamble,
+    sweep_stale_temp_dirs,
+    warm_engine_available,
+)
+from scitex_writer._compile.content import _get_scripts_dir
+
+_REQUIRES_WARM = pytest.mark.skipif(
+    not warm_engine_available(), reason="pdflatex + mylatexformat not installed"
+)
+
+
+@pytest.fixture
+def scripts_dir():
+    return _get_scripts_dir()
+
+
+def _script_output(scripts_dir, tmp_path, content, color_mode, complete=False):
+    body, out = tmp_path / "body.tex", tmp_path / "out.tex"
+    body.write_text(content, encoding="utf-8")
+    cmd = [
+        sys.executable,
+        str(scripts_dir / "python" / "tex_snippet2full.py"),
+        "--body-file", str(body),
+        "--output", str(out),
+        "--color-mode", color_mode,
+    ]
+    if complete:
+        cmd.append("--complete-document")
+    subprocess.run(cmd, check=True, capture_output=True)
+    return out.read_text(encoding="utf-8")
+
+
+class TestBuildDocument:
+    @pytest.mark.parametrize("color_mode", ["light", "dark"])
+    def test_body_matches_the_script_output(self, scripts_dir, tmp_path, color_mode):
+        # Arrange
+        content = "\\section{Intro}\nHello."
+        expected = _script_output(scripts_dir, tmp_path, content, color_mode)
+        # Act
+        document = build_document(content, color_mode, scripts_dir)
+        # Assert
+        assert document == expected
+
+    def test_complete_document_matches_the_script_output(self, scripts_dir, tmp_path):
+        # Arrange
+        content = "\\documentclass{article}\n\\begin{document}\nX\n\\end{document}\n"
+        expected = _script_output(scripts_dir, tmp_path, content, "dark", True)
+        # Act
+        document = build_document(content, "dark", scripts_dir)
+        # Assert
+        assert document == expected
+
+
+class TestFormatKey:
+    def test_splits_at_begin_document(self):
+        # Arrange
+        document = "\\documentclass{article}\n\\begin{document}\nX\n"
+        # Act
+        preamble, rest = split_preamble(document)
+        # Assert
+        assert (preamble, rest) == ("\\documentclass{article}\n", "\\begin{document}\nX\n")
+
+    def test_same_preamble_and_color_share_a_key(self):
+        # Arrange
+        preamble = "\\documentclass{article}\n"
+        # Act
+        first, second = format_key(preamble, "light"), format_key(preamble, "light")
+        # Assert
+        assert first == second
+
+    def test_color_mode_is_part_of_the_key(self):
+        # Arrange
+        preamble = "\\documentclass{article}\n"
+        # Act
+        light, dark = format_key(preamble, "light"), format_key(preamble, "dark")
+        # Assert
+        assert light != dark
+
+
+class TestScratch:
+    def test_project_scratch_lives_under_runtime_dir(self, tmp_path):
+        # Arrange
+        # Act
+        root = scratch_root(str(tmp_path))
+        # Assert
+        assert root == tmp_path.resolve() / ".scitex" / "writer" / "runtime" / "preview"
+
+    def test_engine_is_reused_per_project(self, tmp_path):
+        # Arrange
+        # Act
+        first, second = get_preview_engine(str(tmp_path)), get_preview_engine(str(tmp_path))
+        # Assert
+        assert first is second
+
+
+class TestCleanupStaleTempDirs:
+    def test_removes_only_old_cold_path_dirs(self, tmp_path):
+        # Arrange
+        old = tmp_path / f"{COLD_TEMP_PREFIX}old_1"
+        fresh = tmp_path / f"{COLD_TEMP_PREFIX}fresh_1"
+        other = tmp_path / "unrelated_old"
+        for d in (old, fresh, other):
+            d.mkdir()
+        past = time.time() - 7200
+        os.utime(old, (past, past))
+        os.utime(other, (past, past))
+        # Act
+        removed = cleanup_stale_temp_dirs(max_age=3600, temp_root=tmp_path)
+        # Assert
+        assert removed == 1 and not old.exists() and fresh.exists() and other.exists()
+
+    def test_sweep_skips_within_its_interval(self, tmp_path):
+        # Arrange
+        old = tmp_path / f"{COLD_TEMP_PREFIX}old_1"
+        old.mkdir()
+        past = time.time() - 2 * 86400
+        os.utime(old, (past, past))
+        sweep_stale_temp_dirs(interval=0, temp_root=tmp_path / "elsewhere")
+        # Act
+        removed = sweep_stale_temp_dirs(interval=3600, temp_root=tmp_path)
+        # Assert
+        assert removed == 0 and old.exists()
+
+
+class TestFailedFormatMarker:
+    def _marker(self, tmp_path, age):
+        engine = PreviewEngine(tmp_path)
+        engine.format_dir.mkdir()
+        marker = engine.format_dir / "preamble_0123.failed"
+        marker.write_text("! LaTeX Error: File `foo.sty' not found.")
+        stamp = time.time() - age
+        os.utime(marker, (stamp, stamp))
+        return engine, marker
+
+    def test_recent_failure_is_remembered(self, tmp_path):
+        # Arrange
+        engine, _ = self._marker(tmp_path, age=60)
+        # Act
+        failed = engine.has_failed("preamble_0123")
+        # Assert
+        assert failed is True
+
+    def test_expired_failure_is_retried(self, tmp_path):
+        # Arrange: e.g. the missing package has been installed since
+        engine, marker = self._marker(tmp_path, age=FAILED_FORMAT_RETRY_SECONDS + 60)
+        # Act
+        failed = engine.has_failed("preamble_0123")
+        # Assert
+        assert (failed, marker.exists()) == (False, False)
+
+
+@_REQUIRES_WARM
+def test_warm_compile_publishes_pdf_to_preview_dir(tmp_path, scripts_dir):
+    # Arrange
+    document = build_document("Hello, warm world.", "light", scripts_dir)
+    engine = get_preview_engine(str(tmp_path))
+    # Act
+    result = engine.compile(
+        document, "warm", "light", timeout=120, preview_dir=tmp_path / ".preview"
+    )
+    # Assert
+    assert result.success and result.output_pdf == tmp_path / ".preview" / "warm.pdf"
+    assert result.temp_dir is None
+
+
+# EOF
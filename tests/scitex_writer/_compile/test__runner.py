@@ -75,9 +75,11 @@ class _RecordingCommandRunner:
 
     def __init__(self):
         self.cmd = None
+        self.kwargs = None
 
     def __call__(self, cmd, **kwargs):
         self.cmd = list(cmd)
+        self.kwargs = kwargs
         return {"stdout": "", "stderr": "", "exit_code": 0, "success": True}
 
 
@@ -236,6 +238,76 @@ class TestRunCompileCommandBuilding:
         assert "--track-changes" in runner.cmd
 
 
+class TestRunCompileNoGlobalState:
+    """The child gets cwd/env; the parent process's cwd is never changed."""
+
+    def test_command_runner_receives_project_dir_as_cwd(self, valid_project):
+        # Arrange
+        runner = _RecordingCommandRunner()
+        # Act
+        run_compile("manuscript", valid_project, command_runner=runner)
+        # Assert
+        assert runner.kwargs["cwd"] == valid_project.absolute()
+
+    def test_command_runner_receives_env_overrides(self, valid_project):
+        # Arrange
+        runner = _RecordingCommandRunner()
+        # Act
+        run_compile(
+            "manuscript", valid_project, command_runner=runner, env={"X": "1"}
+        )
+        # Assert
+        assert runner.kwargs["env"] == {"X": "1"}
+
+    def test_parent_cwd_is_untouched_during_the_run(self, valid_project):
+        # Arrange: record the cwd as seen from INSIDE the executor
+        seen = []
+
+        def runner(cmd, **kwargs):
+            seen.append(Path.cwd())
+            return {"stdout": "", "stderr": "", "exit_code": 0, "success": True}
+
+        before = Path.cwd()
+        # Act
+        run_compile("manuscript", valid_project, command_runner=runner)
+        # Assert
+        assert seen == [before]
+
+
+class TestRunCompileSpillMode:
+    """capture_tail_bytes spills the script's output under the doc's logs/."""
+
+    def test_runner_is_asked_to_spill_into_doc_logs(self, valid_project):
+        # Arrange
+        runner = _RecordingCommandRunner()
+        # Act
+        run_compile(
+            "manuscript", valid_project, command_runner=runner, capture_tail_bytes=64
+        )
+        # Assert
+        assert runner.kwargs["spill_to"] == (
+            valid_project.absolute() / "01_manuscript" / "logs" / "manuscript"
+        )
+
+    def test_result_carries_tail_and_full_output_handle(self, valid_project):
+        # Arrange
+        script = valid_project / "scripts" / "shell" / "compile_manuscript.sh"
+        script.write_text("#!/bin/bash\nfor i in $(seq 1000); do echo line$i; done\n")
+        # Act
+        result = run_compile("manuscript", valid_project, capture_tail_bytes=64)
+        # Assert
+        assert result.stdout.endswith("line1000")
+        assert result.stdout_log.read().count("\n") == 1000
+
+    def test_default_keeps_everything_in_memory(self, valid_project):
+        # Arrange
+        runner = _RecordingCommandRunner()
+        # Act
+        run_compile("manuscript", valid_project, command_runner=runner)
+        # Assert
+        assert "spill_to" not in runner.kwargs
+
+
 class _ExitCodeCommandRunner:
     """Real _run_sh_command stand-in returning a chosen exit code.
 
@@ -556,7 +628,9 @@ class TestCompilePathUsesPythonPipelines:
         # Assert
         assert invocations == []
 
-    @pytest.mark.parametrize("doc_type", ["manuscript", "supplementary", "revision"])
+    # The manuscript script runs figures and tables inside the single
+    # `stages` launch (`scitex-writer engine run-stages`).
+    @pytest.mark.parametrize("doc_type", ["supplementary", "revision"])
     def test_compile_script_delegates_figures_to_python(self, doc_type):
         # Arrange
         stage = "figures"
@@ -565,7 +639,7 @@ class TestCompilePathUsesPythonPipelines:
         # Assert
         assert delegated
 
-    @pytest.mark.parametrize("doc_type", ["manuscript", "supplementary", "revision"])
+    @pytest.mark.parametrize("doc_type", ["supplementary", "revision"])
     def test_compile_script_delegates_tables_to_python(self, doc_type):
         # Arrange
         stage = "tables"
@@ -574,6 +648,17 @@ class TestCompilePathUsesPythonPipelines:
         # Assert
         assert delegated
 
+    def test_manuscript_delegates_asset_stages_to_python_once(self):
+        # Arrange
+        stage = "stages"
+        # Act
+        launches = re.findall(
+            r"modules/run_python_pipeline\.sh\"?\s+(figures|tables|stages)\b",
+            self._script_text("manuscript"),
+        )
+        # Assert
+        assert launches == [stage]
+
     @pytest.mark.parametrize("doc_type", ["manuscript", "supplementary"])
     def test_compile_script_delegates_diff_to_python(self, doc_type):
         # Arrange
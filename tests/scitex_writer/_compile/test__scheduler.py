@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/_compile/test__scheduler.py
+
+"""Tests for the process-wide compile scheduler.
+
+Jobs are real callables gated on ``threading.Event``s, so queueing, coalescing
+and back-pressure are observed on a live pool rather than a mocked executor.
+"""
+
+import threading
+
+import pytest
+
+from scitex_writer._compile._scheduler import (
+    CompileQueueFullError,
+    CompileScheduler,
+)
+from scitex_writer._dataclasses import CompilationResult
+
+
+def _result(**kwargs):
+    return CompilationResult(success=True, exit_code=0, stdout="", stderr="")
+
+
+@pytest.fixture
+def scheduler():
+    sched = CompileScheduler(max_workers=1, max_queue_depth=2)
+    yield sched
+    sched.shutdown(wait=True)
+
+
+def _blocker(release: threading.Event, started: threading.Event):
+    def job():
+        started.set()
+        release.wait(10)
+        return _result()
+
+    return job
+
+
+class TestSubmit:
+    def test_result_carries_queue_wait_and_run_time(self, scheduler):
+        # Arrange
+        # Act
+        result = scheduler.submit("/tmp/p", "manuscript", _result).result(10)
+        # Assert
+        assert result.queue_wait is not None and result.run_time is not None
+
+    def test_dict_results_get_the_same_metrics(self, scheduler):
+        # Arrange
+        # Act
+        result = scheduler.submit("/tmp/p", "manuscript", dict).result(10)
+        # Assert
+        assert {"queue_wait", "run_time"} <= set(result)
+
+    def test_job_exception_propagates_to_the_future(self, scheduler):
+        # Arrange
+        def boom():
+            raise RuntimeError("engine exploded")
+
+        # Act
+        future = scheduler.submit("/tmp/p", "manuscript", boom)
+        # Assert
+        with pytest.raises(RuntimeError, match="engine exploded"):
+            future.result(10)
+
+
+class TestCoalescing:
+    def test_queued_duplicate_returns_the_same_future(self, scheduler):
+        # Arrange: occupy the only worker so later jobs stay queued
+        release, started = threading.Event(), threading.Event()
+        scheduler.submit("/tmp/other", "manuscript", _blocker(release, started))
+        started.wait(10)
+        # Act
+        first = scheduler.submit("/tmp/p", "manuscript", _result)
+        second = scheduler.submit("/tmp/p", "manuscript", _result)
+        release.set()
+        # Assert
+        assert first is second
+
+    def test_different_doc_types_are_not_coalesced(self, scheduler):
+        # Arrange
+        release, started = threading.Event(), threading.Event()
+        scheduler.submit("/tmp/other", "manuscript", _blocker(release, started))
+        started.wait(10)
+        # Act
+        first = scheduler.submit("/tmp/p", "manuscript", _result)
+        second = scheduler.submit("/tmp/p", "revision", _result)
+        release.set()
+        # Assert
+        assert first is not second
+
+    def test_running_job_is_not_coalesced(self, scheduler):
+        # Arrange: the SAME key is already running
+        release, started = threading.Event(), threading.Event()
+        running = scheduler.submit("/tmp/p", "manuscript", _blocker(release, started))
+        started.wait(10)
+        # Act
+        queued = scheduler.submit("/tmp/p", "manuscript", _result)
+        release.set()
+        # Assert
+        assert queued is not running
+
+
+class TestBackPressure:
+    def test_full_project_queue_rejects_new_work(self, scheduler):
+        # Arrange
+        release, started = threading.Event(), threading.Event()
+        scheduler.submit("/tmp/p", "manuscript", _blocker(release, started))
+        started.wait(10)
+        scheduler.submit("/tmp/p", "supplementary", _result)
+        scheduler.submit("/tmp/p", "revision", _result)
+        # Act / Assert
+        try:
+            with pytest.raises(CompileQueueFullError):
+                scheduler.submit("/tmp/p", "content", _result)
+        finally:
+            release.set()
+
+    def test_full_queue_does_not_block_other_projects(self, scheduler):
+        # Arrange
+        release, started = threading.Event(), threading.Event()
+        scheduler.submit("/tmp/p", "manuscript", _blocker(release, started))
+        started.wait(10)
+        scheduler.submit("/tmp/p", "supplementary", _result)
+        scheduler.submit("/tmp/p", "revision", _result)
+        # Act
+        other = scheduler.submit("/tmp/q", "manuscript", _result)
+        release.set()
+        # Assert
+        assert other.result(10).success
+
+
+class TestFairness:
+    def test_projects_are_served_round_robin(self, scheduler):
+        # Arrange
+        order = []
+        release, started = threading.Event(), threading.Event()
+        scheduler.submit("/tmp/gate", "manuscript", _blocker(release, started))
+        started.wait(10)
+
+        def record(tag):
+            def job():
+                order.append(tag)
+                return _result()
+
+            return job
+
+        futures = [
+            scheduler.submit("/tmp/a", "manuscript", record("a1")),
+            scheduler.submit("/tmp/a", "supplementary", record("a2")),
+            scheduler.submit("/tmp/b", "manuscript", record("b1")),
+        ]
+        # Act
+        release.set()
+        for f in futures:
+            f.result(10)
+        # Assert
+        assert order == ["a1", "b1", "a2"]
+
+
+def test_same_key_never_runs_concurrently():
+    # Arrange
+    sched = CompileScheduler(max_workers=4)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def job():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        threading.Event().wait(0.05)
+        with lock:
+            active[0] -= 1
+        return _result()
+
+    # Act
+    first = sched.submit("/tmp/p", "manuscript", job)
+    second = sched.submit("/tmp/p", "manuscript", job)
+    first.result(10), second.result(10)
+    sched.shutdown()
+    # Assert
+    assert peak[0] == 1
+
+
+# EOF
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: src/scitex_writer/_compile/_stage_cache.py
+
+"""Tests for the content-addressed stage cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from scitex_writer._compile._stage_cache import (
+    CACHE_REL,
+    StageCache,
+    StageSpec,
+    cache_enabled_from_env,
+)
+from scitex_writer._compile._stages import run_stages
+
+SPEC = StageSpec(
+    inputs=("src/*.txt",),
+    outputs=("out/*",),
+    options=("no_figs",),
+)
+
+
+def _write(root, rel, content):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _build(project):
+    """The stage SPEC describes: src/*.txt -> out/<name> (upper-cased)."""
+    for src in sorted((project / "src").glob("*.txt")):
+        _write(project, f"out/{src.name}", src.read_text().upper())
+    return {"success": True, "built": len(list((project / "src").glob("*.txt")))}
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    _write(tmp_path, "src/a.txt", "alpha")
+    _write(tmp_path, "src/b.txt", "beta")
+    return tmp_path
+
+
+@pytest.fixture
+def stored(project) -> StageCache:
+    """A cache holding one successful run of the SPEC stage."""
+    result = _build(project)
+    cache = StageCache(project)
+    cache.store("demo", SPEC, {"no_figs": False}, result)
+    return cache
+
+
+class TestKey:
+    """What the cache key depends on."""
+
+    def test_key_is_stable_for_unchanged_inputs(self, project):
+        # Arrange
+        cache = StageCache(project)
+        first = cache.key("demo", SPEC, {})
+        # Act
+        second = StageCache(project).key("demo", SPEC, {})
+        # Assert
+        assert first == second
+
+    def test_content_change_changes_the_key(self, project):
+        # Arrange
+        cache = StageCache(project)
+        before = cache.key("demo", SPEC, {})
+        _write(project, "src/a.txt", "ALPHA!")
+        # Act
+        after = cache.key("demo", SPEC, {})
+        # Assert
+        assert before != after
+
+    def test_touch_without_content_change_keeps_the_key(self, project):
+        # Arrange
+        cache = StageCache(project)
+        before = cache.key("demo", SPEC, {})
+        src = project / "src" / "a.txt"
+        st = src.stat()
+        os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        # Act
+        after = cache.key("demo", SPEC, {})
+        # Assert
+        assert before == after
+
+    def test_declared_option_changes_the_key(self, project):
+        # Arrange
+        cache = StageCache(project)
+        # Act
+        keys = {cache.key("demo", SPEC, {"no_figs": v}) for v in (False, True)}
+        # Assert
+        assert len(keys) == 2
+
+    def test_unresolvable_config_placeholder_disables_caching(self, project):
+        # Arrange
+        spec = StageSpec(inputs=("{figures.caption_media_dir}/*",))
+        # Act
+        key = StageCache(project).key("demo", spec, {})
+        # Assert
+        assert key is None
+
+    def test_placeholders_come_from_the_doc_config(self, project):
+        # Arrange
+        _write(
+            project,
+            "config/config_manuscript.yaml",
+            "figures:\n  caption_media_dir: ./src\n",
+        )
+        spec = StageSpec(inputs=("{figures.caption_media_dir}/*.txt",))
+        cache = StageCache(project)
+        before = cache.key("demo", spec, {})
+        _write(project, "src/a.txt", "changed")
+        # Act
+        after = cache.key("demo", spec, {})
+        # Assert
+        assert None not in (before, after) and before != after
+
+
+class TestLookup:
+    """Hits, misses and output restoration."""
+
+    def test_matching_key_returns_the_stored_result(self, project, stored):
+        # Arrange
+        key = stored.key("demo", SPEC, {"no_figs": False})
+        # Act
+        hit = stored.lookup("demo", key)
+        # Assert
+        assert (hit["built"], hit["restored"]) == (2, 0)
+
+    def test_changed_input_is_a_miss(self, project, stored):
+        # Arrange
+        _write(project, "src/c.txt", "gamma")
+        # Act
+        hit = stored.lookup("demo", stored.key("demo", SPEC, {"no_figs": False}))
+        # Assert
+        assert hit is None
+
+    def test_missing_output_is_restored(self, project, stored):
+        # Arrange
+        out = project / "out" / "a.txt"
+        out.unlink()
+        # Act
+        hit = stored.lookup("demo", stored.key("demo", SPEC, {"no_figs": False}))
+        # Assert
+        assert (hit["restored"], out.read_text()) == (1, "ALPHA")
+
+    def test_edited_output_is_a_miss(self, project, stored):
+        # Arrange
+        _write(project, "out/a.txt", "hand edited")
+        # Act
+        hit = stored.lookup("demo", stored.key("demo", SPEC, {"no_figs": False}))
+        # Assert
+        assert hit is None
+
+    def test_symlink_outputs_are_restored_as_links(self, project):
+        # Arrange
+        (project / "out").mkdir()
+        os.symlink("../src/a.txt", project / "out" / "a.txt")
+        cache = StageCache(project)
+        cache.store("demo", SPEC, {}, {"success": True})
+        (project / "out" / "a.txt").unlink()
+        # Act
+        cache.lookup("demo", cache.key("demo", SPEC, {}))
+        # Assert
+        assert os.readlink(project / "out" / "a.txt") == "../src/a.txt"
+
+    def test_forgotten_stage_misses(self, project, stored):
+        # Arrange
+        stored.forget("demo")
+        # Act
+        hit = stored.lookup("demo", stored.key("demo", SPEC, {"no_figs": False}))
+        # Assert
+        assert hit is None
+
+
+class TestSave:
+    """Persistence of the manifest and the object store."""
+
+    def test_saved_manifest_serves_a_new_instance(self, project, stored):
+        # Arrange
+        stored.save()
+        cache = StageCache(project)
+        # Act
+        hit = cache.lookup("demo", cache.key("demo", SPEC, {"no_figs": False}))
+        # Assert
+        assert hit is not None
+
+    def test_unreferenced_objects_are_pruned(self, project, stored):
+        # Arrange
+        stored.save()
+        _write(project, "src/a.txt", "other")
+        result = _build(project)
+        stored.store("demo", SPEC, {"no_figs": False}, result)
+        # Act
+        stored.save()
+        # Assert
+        blobs = list((project / CACHE_REL / "manuscript" / "objects").glob("*/*"))
+        assert len(blobs) == 2
+
+
+class TestRunStagesCache:
+    """run_stages with a cached stage."""
+
+    def _runners(self, calls):
+        def demo(project_path, doc_type, options):
+            calls.append(1)
+            return _build(project_path)
+
+        return {"wordcount": demo}
+
+    def _run(self, project, calls, specs, **kwargs):
+        return run_stages(
+            project,
+            stages=["wordcount"],
+            runners=self._runners(calls),
+            specs=specs,
+            **kwargs,
+        )
+
+    def test_second_run_is_served_from_cache(self, project):
+        # Arrange
+        calls = []
+        specs = {"wordcount": SPEC}
+        self._run(project, calls, specs)
+        # Act
+        report = self._run(project, calls, specs)
+        # Assert
+        assert (len(calls), report["stages"]["wordcount"]["cached"]) == (1, True)
+
+    def test_input_change_reruns_the_stage(self, project):
+        # Arrange
+        calls = []
+        specs = {"wordcount": SPEC}
+        self._run(project, calls, specs)
+        _write(project, "src/a.txt", "edited")
+        # Act
+        self._run(project, calls, specs)
+        # Assert
+        assert (len(calls), (project / "out/a.txt").read_text()) == (2, "EDITED")
+
+    def test_cache_false_always_runs(self, project):
+        # Arrange
+        calls = []
+        specs = {"wordcount": SPEC}
+        self._run(project, calls, specs)
+        # Act
+        self._run(project, calls, specs, cache=False)
+        # Assert
+        assert len(calls) == 2
+
+    def test_failed_runs_are_not_cached(self, project):
+        # Arrange
+        calls = []
+
+        def failing(project_path, doc_type, options):
+            calls.append(1)
+            return {"success": False, "error": "bad"}
+
+        specs = {"tables": SPEC}
+        run_stages(project, stages=["tables"], runners={"tables": failing}, specs=specs)
+        # Act
+        run_stages(project, stages=["tables"], runners={"tables": failing}, specs=specs)
+        # Assert
+        assert len(calls) == 2
+
+
+class TestCacheEnabledFromEnv:
+    """SCITEX_WRITER_STAGE_CACHE parsing."""
+
+    def test_zero_disables_the_cache(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("SCITEX_WRITER_STAGE_CACHE", "0")
+        # Act
+        enabled = cache_enabled_from_env()
+        # Assert
+        assert enabled is False
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__)])
+
+# EOF
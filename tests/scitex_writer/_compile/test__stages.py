@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: src/scitex_writer/_compile/_stages.py
+
+"""Tests for the single-process asset stage runner."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from scitex_writer._compile._stages import (
+    STAGES,
+    _clear_stale_bbl,
+    format_report,
+    run_stages,
+    skip_stages_from_env,
+)
+
+
+class _Recorder:
+    """Stage runners recording start/end times; injected via ``runners=``."""
+
+    def __init__(self, delay=0.0, results=None):
+        self.delay = delay
+        self.results = results or {}
+        self.spans = {}
+        self.options = {}
+        self._lock = threading.Lock()
+
+    def runners(self):
+        return {name: self._runner(name) for name in STAGES}
+
+    def _runner(self, name):
+        def run(project_path, doc_type, options):
+            start = time.perf_counter()
+            time.sleep(self.delay)
+            with self._lock:
+                self.spans[name] = (start, time.perf_counter())
+                self.options[name] = options
+            return self.results.get(name, {"success": True})
+
+        return run
+
+
+class TestRunStagesScheduling:
+    """Concurrency and ordering of run_stages."""
+
+    def test_runs_every_stage_by_default(self, tmp_path):
+        # Arrange
+        recorder = _Recorder()
+        # Act
+        report = run_stages(tmp_path, runners=recorder.runners())
+        # Assert
+        assert list(report["stages"]) == list(STAGES)
+
+    def test_independent_stages_overlap(self, tmp_path):
+        # Arrange
+        recorder = _Recorder(delay=0.2)
+        # Act
+        run_stages(tmp_path, runners=recorder.runners())
+        # Assert
+        figures, tables = recorder.spans["figures"], recorder.spans["tables"]
+        assert tables[0] < figures[1] and figures[0] < tables[1]
+
+    def test_wordcount_starts_after_figures_and_tables(self, tmp_path):
+        # Arrange
+        recorder = _Recorder(delay=0.05)
+        # Act
+        run_stages(tmp_path, runners=recorder.runners())
+        # Assert
+        spans = recorder.spans
+        assert spans["wordcount"][0] >= max(spans["figures"][1], spans["tables"][1])
+
+    def test_single_worker_still_runs_everything(self, tmp_path):
+        # Arrange
+        recorder = _Recorder()
+        # Act
+        report = run_stages(tmp_path, workers=1, runners=recorder.runners())
+        # Assert
+        assert report["success"] is True
+
+    def test_stage_subset_runs_only_those(self, tmp_path):
+        # Arrange
+        recorder = _Recorder()
+        # Act
+        run_stages(tmp_path, stages=["tables"], runners=recorder.runners())
+        # Assert
+        assert set(recorder.spans) == {"tables"}
+
+    def test_pipeline_options_reach_runners(self, tmp_path):
+        # Arrange
+        recorder = _Recorder()
+        # Act
+        run_stages(tmp_path, no_figs=True, crop=True, runners=recorder.runners())
+        # Assert
+        assert recorder.options["figures"]["no_figs"] is True
+
+
+class TestRunStagesReport:
+    """Timings, skips and failure semantics of the report."""
+
+    def test_each_stage_is_timed(self, tmp_path):
+        # Arrange
+        recorder = _Recorder(delay=0.05)
+        # Act
+        report = run_stages(tmp_path, runners=recorder.runners())
+        # Assert
+        assert all(s["elapsed"] >= 0.05 for s in report["stages"].values())
+
+    def test_report_is_json_serializable(self, tmp_path):
+        # Arrange
+        report = run_stages(tmp_path, runners=_Recorder().runners())
+        # Act
+        text = json.dumps(report)
+        # Assert
+        assert json.loads(text)["doc_type"] == "manuscript"
+
+    def test_skip_bib_also_skips_citation_style(self, tmp_path):
+        # Arrange
+        recorder = _Recorder()
+        # Act
+        report = run_stages(tmp_path, skip=["bib"], runners=recorder.runners())
+        # Assert
+        assert (
+            report["stages"]["bib"]["skipped"],
+            report["stages"]["citation_style"]["skipped"],
+            "bib" in recorder.spans,
+        ) == (True, True, False)
+
+    def test_required_stage_failure_fails_run(self, tmp_path):
+        # Arrange
+        recorder = _Recorder(results={"tables": {"success": False, "error": "bad"}})
+        # Act
+        report = run_stages(tmp_path, runners=recorder.runners())
+        # Assert
+        assert report["success"] is False
+
+    def test_bib_failure_is_only_a_warning(self, tmp_path):
+        # Arrange
+        recorder = _Recorder(results={"bib": {"success": False, "error": "bad"}})
+        # Act
+        report = run_stages(tmp_path, runners=recorder.runners())
+        # Assert
+        assert report["success"] is True
+
+    def test_runner_exception_is_reported_not_raised(self, tmp_path):
+        # Arrange
+        runners = _Recorder().runners()
+
+        def _boom(*args):
+            raise OSError("disk full")
+
+        runners["figures"] = _boom
+        # Act
+        report = run_stages(tmp_path, runners=runners)
+        # Assert
+        assert report["stages"]["figures"]["error"] == "OSError: disk full"
+
+
+class TestFormatReport:
+    """Human-readable report lines."""
+
+    def test_failed_stage_uses_cross_marker(self, tmp_path):
+        # Arrange
+        recorder = _Recorder(results={"tables": {"success": False, "error": "bad"}})
+        report = run_stages(tmp_path, runners=recorder.runners())
+        # Act
+        text = format_report(report)
+        # Assert
+        assert "  ✗ tables" in text
+
+    def test_figures_summary_keeps_compiled_wording(self, tmp_path):
+        # Arrange
+        results = {"figures": {"success": True, "figures_compiled": 3}}
+        report = run_stages(tmp_path, runners=_Recorder(results=results).runners())
+        # Act
+        text = format_report(report)
+        # Assert
+        assert "Compiled 3 figures" in text
+
+
+class TestSkipStagesFromEnv:
+    """SCITEX_WRITER_SKIP_STAGES parsing."""
+
+    def test_parses_comma_separated_names(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("SCITEX_WRITER_SKIP_STAGES", "bib, figures,")
+        # Act
+        skipped = skip_stages_from_env()
+        # Assert
+        assert skipped == ("bib", "figures")
+
+
+class TestDefaultRunners:
+    """The real stage runners against a fixture project."""
+
+    @pytest.fixture
+    def project(self, tmp_path) -> Path:
+        project = tmp_path / "paper"
+        tables = project / "01_manuscript" / "contents" / "tables" / "caption_and_media"
+        tables.mkdir(parents=True)
+        (tables / "01_demo.csv").write_text("Group,Value\nA,1\n", encoding="utf-8")
+        (project / "config").mkdir()
+        (project / "config" / "config_manuscript.yaml").write_text(
+            "tables:\n"
+            "  dir: ./01_manuscript/contents/tables\n"
+            "  caption_media_dir: ./01_manuscript/contents/tables/caption_and_media\n"
+            "  compiled_dir: ./01_manuscript/contents/tables/compiled\n"
+            "  compiled_file: ./01_manuscript/contents/tables/compiled/FINAL.tex\n",
+            encoding="utf-8",
+        )
+        return project
+
+    def test_tables_stage_renders_in_process(self, project):
+        # Arrange
+        pytest.importorskip("pandas")
+        compiled = project / "01_manuscript/contents/tables/compiled/01_demo.tex"
+        # Act
+        report = run_stages(project, stages=["tables"])
+        # Assert
+        assert report["stages"]["tables"]["success"] and compiled.exists()
+
+    def test_bib_stage_without_bib_files_warns(self, project):
+        # Arrange
+        # Act
+        report = run_stages(project, stages=["bib"])
+        # Assert
+        assert "No bibliography files found" in report["stages"]["bib"]["warnings"][0]
+
+    def test_bib_stage_clears_stale_bbl(self, project, monkeypatch):
+        # Arrange
+        bib_dir = project / "00_shared" / "bib_files"
+        bib_dir.mkdir(parents=True)
+        log_dir = project / "logs"
+        log_dir.mkdir()
+        bbl = log_dir / "manuscript.bbl"
+        bbl.write_text("old")
+        bib = bib_dir / "bibliography.bib"
+        bib.write_text("@article{a, title={A}}\n")
+        stamp = bbl.stat().st_mtime
+        os.utime(bib, (stamp + 10, stamp + 10))
+        monkeypatch.setenv("LOG_DIR", str(log_dir))
+        # Act
+        run_stages(project, stages=["bib"])
+        # Assert
+        assert not bbl.exists()
+
+    def test_root_bibliography_newer_than_bbl_clears_it(self, project, monkeypatch):
+        # Arrange
+        log_dir = project / "logs"
+        log_dir.mkdir()
+        bbl = log_dir / "manuscript.bbl"
+        bbl.write_text("old")
+        source = project / "00_shared" / "bib_files" / "refs.bib"
+        source.parent.mkdir(parents=True)
+        source.write_text("@article{a, title={A}}\n")
+        root_bib = project / "bibliography.bib"
+        root_bib.write_text("@article{b, title={B}}\n")
+        stamp = bbl.stat().st_mtime
+        os.utime(source, (stamp - 10, stamp - 10))
+        os.utime(root_bib, (stamp + 10, stamp + 10))
+        monkeypatch.setenv("LOG_DIR", str(log_dir))
+        # Act
+        note = _clear_stale_bbl(project, [source], "manuscript")
+        # Assert
+        assert "bibliography.bib" in note and not bbl.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__)])
+
+# EOF
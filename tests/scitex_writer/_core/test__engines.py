@@ -11,7 +11,7 @@ from scitex_writer._core._engines import (
     verify_engine,
 )
 
-_KNOWN_ENGINES = ("tectonic", "latexmk", "3pass")
+_KNOWN_ENGINES = ("tectonic", "latexmk", "3pass", "fmt")
 
 
 def test_verify_engine_rejects_unknown_engine():
@@ -78,7 +78,22 @@ def test_default_auto_order_matches_priority_doc():
     assert DEFAULT_AUTO_ORDER == ("latexmk", "tectonic", "3pass")
 
 
-def test_list_available_engines_returns_all_three():
+def test_fmt_engine_is_opt_in_only():
+    # Arrange
+    # Act
+    # Assert: auto-detection never picks the precompiled-preamble engine.
+    assert "fmt" not in DEFAULT_AUTO_ORDER
+
+
+def test_get_engine_version_fmt_is_native_or_none():
+    # Arrange
+    # Act
+    version = get_engine_version("fmt")
+    # Assert
+    assert version == ("native" if verify_engine("fmt") else None)
+
+
+def test_list_available_engines_returns_every_engine():
     # Arrange
     # Act
     engines = list_available_engines()
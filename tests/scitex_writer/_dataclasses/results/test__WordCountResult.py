@@ -28,6 +28,8 @@ class TestWordCountResultToDict:
             "counts": {"abstract": 120, "imrd": 3400},
             "total": 3400,
             "output_files": ["/p/abstract_count.txt"],
+            "changed_files": [],
+            "texcount_runs": 0,
             "error": None,
         }
 
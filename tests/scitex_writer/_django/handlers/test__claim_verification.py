@@ -0,0 +1,162 @@
+"""Tests for the cached, batched claim verification behind /api/claims-metadata.
+
+Real files and real threads. The verdict itself comes through the ``verify``
+seam of ``ClaimVerificationCache.states`` (the handler passes Clew's
+``_claim_verification_state``), so no Clew install is needed.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+from django.test import RequestFactory
+
+from scitex_writer._django.handlers._claim_verification import (
+    ClaimVerificationCache,
+)
+from scitex_writer._django.handlers.viewer import handle_claims_metadata
+from scitex_writer._django.services import ProjectState
+
+
+class _Verifier:
+    """Counts its calls and returns a state naming the call."""
+
+    def __init__(self, state: str = "VERIFIED"):
+        self.state = state
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, claim: dict) -> dict:
+        with self._lock:
+            self.calls.append(claim["claim_id"])
+            return {"state": self.state, "call": len(self.calls)}
+
+
+def _claim(claim_id: str, output_file: str = "out.json", **extra) -> dict:
+    return {"claim_id": claim_id, "output_file": output_file, **extra}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    (tmp_path / "out.json").write_text('{"p": 0.01}')
+    return ClaimVerificationCache([tmp_path])
+
+
+def test_second_request_is_served_from_the_cache(cache):
+    # Arrange
+    verify = _Verifier()
+    claims = [_claim("a"), _claim("b")]
+    cache.states(claims, verify)
+    # Act
+    states = cache.states(claims, verify)
+    # Assert
+    assert (len(verify.calls), states["a"]["state"]) == (2, "VERIFIED")
+
+
+def test_changed_output_content_is_re_verified(cache, tmp_path):
+    # Arrange
+    verify = _Verifier()
+    cache.states([_claim("a")], verify)
+    (tmp_path / "out.json").write_text('{"p": 0.2}')
+    # Act
+    cache.states([_claim("a")], verify)
+    # Assert
+    assert verify.calls == ["a", "a"]
+
+
+def test_changed_pointer_is_re_verified(cache):
+    # Arrange
+    verify = _Verifier()
+    cache.states([_claim("a")], verify)
+    # Act
+    cache.states([_claim("a", session_id="s2")], verify)
+    # Assert
+    assert verify.calls == ["a", "a"]
+
+
+def test_misses_are_verified_in_parallel(cache):
+    # Arrange: each verification waits for the other; a serial loop would time
+    # out on the barrier.
+    barrier = threading.Barrier(2, timeout=10)
+
+    def verify(claim):
+        barrier.wait()
+        return {"state": "VERIFIED"}
+
+    # Act
+    states = cache.states([_claim("a"), _claim("b")], verify)
+    # Assert
+    assert sorted(states) == ["a", "b"]
+
+
+def test_stale_hit_is_returned_and_refreshed_in_background(tmp_path):
+    # Arrange
+    (tmp_path / "out.json").write_text("{}")
+    cache = ClaimVerificationCache([tmp_path], ttl=0)
+    verify = _Verifier()
+    cache.states([_claim("a")], verify)
+    # Act
+    served = cache.states([_claim("a")], verify)["a"]["call"]
+    cache.wait()
+    refreshed = cache.states([_claim("a")], verify)["a"]["call"]
+    # Assert
+    assert (served, refreshed) == (1, 2)
+
+
+def test_error_state_is_retried_on_the_next_request(cache):
+    # Arrange
+    verify = _Verifier(state="ERROR")
+    cache.states([_claim("a")], verify)
+    verify.state = "VERIFIED"
+    # Act
+    cache.states([_claim("a")], verify)
+    cache.wait()
+    state = cache.states([_claim("a")], verify)["a"]["state"]
+    # Assert
+    assert state == "VERIFIED"
+
+
+def test_force_re_verifies_every_claim(cache):
+    # Arrange
+    verify = _Verifier()
+    cache.states([_claim("a"), _claim("b")], verify)
+    # Act
+    cache.states([_claim("a"), _claim("b")], verify, force=True)
+    # Assert
+    assert len(verify.calls) == 4
+
+
+def test_wiring_error_of_a_miss_propagates(cache):
+    # Arrange: a TypeError is the caller's bug, never a claim state
+    def verify(claim):
+        raise TypeError("verify_chain() got an unexpected keyword argument")
+
+    # Act
+    # Assert
+    with pytest.raises(TypeError):
+        cache.states([_claim("a")], verify)
+
+
+def test_handler_reports_a_state_per_claim(tmp_path):
+    # Arrange
+    shared = tmp_path / "00_shared"
+    shared.mkdir()
+    (shared / "claims.json").write_text(
+        json.dumps(
+            {
+                "version": "1.0",
+                "claims": {
+                    "n_subjects": {"type": "value", "value": {"value": 12}},
+                    "p_main": {"type": "value", "value": {"value": 0.01}},
+                },
+            }
+        )
+    )
+    project = ProjectState(project_dir=tmp_path)
+    # Act
+    resp = handle_claims_metadata(RequestFactory().get("/"), project)
+    # Assert
+    states = [c["verification"]["state"] for c in json.loads(resp.content)["claims"]]
+    assert states == ["NO_PROVENANCE", "NO_PROVENANCE"]
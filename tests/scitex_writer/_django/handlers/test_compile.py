@@ -0,0 +1,224 @@
+"""Tests for the debounced "compile latest" compile handlers.
+
+Real ``ProjectState`` objects and real requests via ``RequestFactory``; the
+build itself goes through the ``compile_fn`` seam of ``_compile_loop`` so no
+LaTeX toolchain is needed.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from django.test import RequestFactory
+
+from scitex_writer._django.handlers.compile import (
+    _compile_loop,
+    handle_compile,
+    handle_compile_events,
+    handle_compile_status,
+)
+from scitex_writer._django.services import ProjectState
+
+
+@pytest.fixture
+def project(tmp_path):
+    return ProjectState(project_dir=tmp_path)
+
+
+def _post(body: dict):
+    return RequestFactory().post(
+        "/api/compile", data=json.dumps(body), content_type="application/json"
+    )
+
+
+def _status(project) -> dict:
+    return json.loads(handle_compile_status(RequestFactory().get("/"), project).content)
+
+
+def test_request_during_running_build_is_queued_not_rejected(project):
+    # Arrange: a build is already running
+    project._compiling = True
+    # Act
+    resp = handle_compile(_post({"doc_type": "manuscript"}), project)
+    # Assert
+    assert resp.status_code == 202
+
+
+def test_queued_request_reports_its_generation(project):
+    # Arrange
+    project._compiling = True
+    # Act
+    first = json.loads(handle_compile(_post({}), project).content)
+    second = json.loads(handle_compile(_post({}), project).content)
+    # Assert
+    assert (first["generation"], second["generation"]) == (1, 2)
+
+
+def test_status_reports_queued_generation(project):
+    # Arrange
+    project._compiling = True
+    handle_compile(_post({}), project)
+    handle_compile(_post({}), project)
+    # Act
+    status = _status(project)
+    # Assert
+    assert status["queued_generation"] == 2
+
+
+def test_burst_during_build_runs_exactly_one_follow_up(project):
+    # Arrange: three requests land while the first build runs
+    builds = []
+
+    def compile_fn(project, **options):
+        if not builds:
+            for _ in range(3):
+                handle_compile(_post({"doc_type": "manuscript"}), project)
+        builds.append(options)
+
+    project._compiling = True
+    project._compile_generation = project._running_generation = 1
+    # Act
+    _compile_loop(project, {"doc_type": "manuscript"}, compile_fn=compile_fn)
+    # Assert
+    assert len(builds) == 2
+
+
+def test_follow_up_build_uses_latest_options(project):
+    # Arrange
+    builds = []
+
+    def compile_fn(project, **options):
+        if not builds:
+            handle_compile(_post({"doc_type": "supplementary"}), project)
+            handle_compile(_post({"doc_type": "revision"}), project)
+        builds.append(options["doc_type"])
+
+    project._compiling = True
+    # Act
+    _compile_loop(project, {"doc_type": "manuscript"}, compile_fn=compile_fn)
+    # Assert
+    assert builds == ["manuscript", "revision"]
+
+
+def test_loop_leaves_project_clean_and_fully_built(project):
+    # Arrange
+    def compile_fn(project, **options):
+        if project._built_generation == 0 and project._compile_pending is None:
+            handle_compile(_post({}), project)
+
+    project._compiling = True
+    project._compile_generation = project._running_generation = 1
+    # Act
+    _compile_loop(project, {"doc_type": "manuscript"}, compile_fn=compile_fn)
+    status = _status(project)
+    # Assert
+    assert (status["compiling"], status["built_generation"]) == (False, 2)
+
+
+def test_build_that_raises_still_runs_the_pending_follow_up(project):
+    # Arrange: the first build queues a follow-up, then raises
+    builds = []
+
+    def compile_fn(project, **options):
+        builds.append(options["doc_type"])
+        if len(builds) == 1:
+            handle_compile(_post({"doc_type": "revision"}), project)
+            raise RuntimeError("latexmk vanished")
+
+    project._compiling = True
+    project._compile_generation = project._running_generation = 1
+    # Act
+    _compile_loop(project, {"doc_type": "manuscript"}, compile_fn=compile_fn)
+    status = _status(project)
+    # Assert
+    assert (builds, status["compiling"], status["built_generation"]) == (
+        ["manuscript", "revision"],
+        False,
+        2,
+    )
+
+
+def test_build_that_raises_is_reported_as_failed(project):
+    # Arrange
+    def compile_fn(project, **options):
+        raise RuntimeError("latexmk vanished")
+
+    project._compiling = True
+    # Act
+    _compile_loop(project, {"doc_type": "manuscript"}, compile_fn=compile_fn)
+    # Assert
+    assert _status(project)["result"] == {
+        "success": False,
+        "error": "latexmk vanished",
+    }
+
+
+def test_follow_up_does_not_report_the_previous_result(project):
+    # Arrange: the follow-up build records nothing
+    results = []
+
+    def compile_fn(project, **options):
+        results.append(project._compile_result)
+        if len(results) == 1:
+            handle_compile(_post({}), project)
+            project._compile_result = {"success": True}
+
+    project._compiling = True
+    # Act
+    _compile_loop(project, {"doc_type": "manuscript"}, compile_fn=compile_fn)
+    # Assert
+    assert results[1] is None
+
+
+def test_loop_emits_build_start_and_build_end(project):
+    # Arrange
+    def compile_fn(project, **options):
+        project._compile_result = {"success": True}
+
+    project._compiling = True
+    project._compile_generation = project._running_generation = 1
+    # Act
+    _compile_loop(project, {"doc_type": "manuscript"}, compile_fn=compile_fn)
+    # Assert
+    events = project._compile_events.since(0)["events"]
+    assert [e.type for e in events] == ["build_start", "progress", "build_end"]
+
+
+def test_events_endpoint_returns_only_the_delta(project):
+    # Arrange
+    for i in range(3):
+        project._compile_events.emit("log", line=str(i))
+    # Act
+    resp = handle_compile_events(RequestFactory().get("/", {"since": 2}), project)
+    # Assert
+    assert [e["seq"] for e in json.loads(resp.content)["events"]] == [3]
+
+
+def test_events_endpoint_resumes_from_last_event_id(project):
+    # Arrange
+    for i in range(3):
+        project._compile_events.emit("log", line=str(i))
+    request = RequestFactory().get("/", HTTP_LAST_EVENT_ID="1")
+    # Act
+    resp = handle_compile_events(request, project)
+    # Assert
+    assert [e["seq"] for e in json.loads(resp.content)["events"]] == [2, 3]
+
+
+def test_events_endpoint_rejects_bad_since(project):
+    # Arrange
+    request = RequestFactory().get("/", {"since": "abc"})
+    # Act
+    resp = handle_compile_events(request, project)
+    # Assert
+    assert resp.status_code == 400
+
+
+def test_status_can_omit_the_log(project):
+    # Arrange
+    project._compile_log = "x" * 100
+    # Act
+    resp = handle_compile_status(RequestFactory().get("/", {"log": "0"}), project)
+    # Assert
+    assert "log" not in json.loads(resp.content)
@@ -8,7 +8,9 @@ Real image files under ``tmp_path`` throughout -- no mocks, no monkeypatch. Each
 class covers one stage of the shell cascade it replaces.
 """
 
+import os
 import shutil
+import sys
 
 import pytest
 from PIL import Image
@@ -54,6 +56,17 @@ class TestInitFigures:
         # Assert
         assert not stale.exists()
 
+    def test_compiled_tex_of_a_captioned_figure_is_kept(self, tmp_path):
+        # Arrange: compile_legends rewrites it only if the caption changed.
+        figure_dir, cam, jpg_dir, compiled = _dirs(tmp_path)
+        (cam / "01_overview.tex").write_text("\\caption{X}\n", encoding="utf-8")
+        legend = compiled / "01_overview.tex"
+        legend.write_text("legend", encoding="utf-8")
+        # Act
+        _figures_media.init_figures(figure_dir, cam, jpg_dir, compiled)
+        # Assert
+        assert legend.exists()
+
     def test_derived_symlink_is_dropped(self, tmp_path):
         # Arrange
         figure_dir, cam, jpg_dir, compiled = _dirs(tmp_path)
@@ -241,6 +254,148 @@ class TestConversionCascade:
             _figures_media.mmd_to_png(cam)
 
 
+# A stand-in for mmdc's Markdown mode: one PNG per ```mermaid block, written
+# as <output>-<n>.png, and each launch logged (one line per session).
+_FAKE_MMDC = """#!/usr/bin/env python3
+import sys
+from pathlib import Path
+from PIL import Image
+
+args = sys.argv[1:]
+src, out = Path(args[args.index("-i") + 1]), Path(args[args.index("-o") + 1])
+with open(Path(sys.argv[0]).with_name("sessions.log"), "a") as log:
+    log.write(src.name + "\\n")
+blocks = src.read_text().count("```mermaid")
+for n in range(1, blocks + 1):
+    Image.new("RGB", (10, 10)).save(out.with_name(f"{out.stem}-{n}.png"), "PNG")
+"""
+
+
+def _tifs(cam, count):
+    for n in range(1, count + 1):
+        Image.new("RGB", (20, 20), (0, 90, 0)).save(cam / f"{n:02d}_fig.tif", "TIFF")
+
+
+class TestConversionGraph:
+    def test_pooled_cascade_converts_every_figure(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        _tifs(cam, 4)
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=2)
+        # Assert
+        assert outcome["converted"] == 8 and all(
+            (cam / f"{n:02d}_fig.jpg").exists() for n in range(1, 5)
+        )
+
+    def test_each_converted_figure_is_timed(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        _tifs(cam, 2)
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=1)
+        # Assert
+        assert sorted(outcome["timings"]) == ["01_fig", "02_fig"]
+
+    def test_up_to_date_figures_are_not_reconverted(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        _tifs(cam, 3)
+        _figures_media.run_conversions(cam, workers=2)
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=2)
+        # Assert
+        assert outcome == {"converted": 0, "cropped": 0, "timings": {}}
+
+    def test_only_the_edited_figure_is_reconverted(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        _tifs(cam, 3)
+        _figures_media.run_conversions(cam, workers=1)
+        jpg = cam / "02_fig.jpg"
+        stamp = jpg.stat().st_mtime
+        Image.new("RGB", (20, 20), (9, 9, 9)).save(cam / "02_fig.tif", "TIFF")
+        os.utime(cam / "02_fig.tif", (stamp + 5, stamp + 5))
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=1)
+        # Assert
+        assert list(outcome["timings"]) == ["02_fig"]
+
+    def test_mermaid_sources_render_in_one_session(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        for name in ("01_flow", "02_tree", "03_seq"):
+            (cam / f"{name}.mmd").write_text("graph TD;\nA-->B;\n", encoding="utf-8")
+        mmdc = tmp_path / "bin" / "mmdc"
+        mmdc.parent.mkdir()
+        mmdc.write_text(_FAKE_MMDC.replace("python3", sys.executable, 1))
+        mmdc.chmod(0o755)
+        sources = _figures_media.numbered(cam, ".mmd")
+        # Act
+        rendered = _figures_media._mmd_batch(str(mmdc), sources, cam)
+        # Assert
+        sessions = (mmdc.parent / "sessions.log").read_text().split()
+        assert (len(rendered), len(sessions), (cam / "03_seq.png").exists()) == (
+            3,
+            1,
+            True,
+        )
+
+
+class TestContentFreshness:
+    """Staleness is decided by content hashes, not mtimes."""
+
+    def _shift_mtime(self, path, seconds):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 10**9))
+
+    def test_touched_source_is_not_reconverted(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        _tifs(cam, 1)
+        _figures_media.run_conversions(cam, workers=1)
+        self._shift_mtime(cam / "01_fig.tif", 3600)
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=1)
+        # Assert
+        assert outcome["converted"] == 0
+
+    def test_edited_source_with_an_older_mtime_is_reconverted(self, tmp_path):
+        # Arrange: a checkout can leave the edited source older than its JPG.
+        _, cam, _, _ = _dirs(tmp_path)
+        _tifs(cam, 1)
+        _figures_media.run_conversions(cam, workers=1)
+        Image.new("RGB", (20, 20), (9, 9, 9)).save(cam / "01_fig.tif", "TIFF")
+        self._shift_mtime(cam / "01_fig.tif", -3600)
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=1)
+        # Assert
+        assert outcome["converted"] == 2
+
+    def test_hand_edited_jpg_is_regenerated(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        _png(cam / "01_overview.png")
+        _figures_media.png_to_jpg(cam)
+        _jpg(cam / "01_overview.jpg", color=(0, 0, 255))
+        # Act
+        converted = _figures_media.png_to_jpg(cam)
+        # Assert
+        assert converted == 1
+
+    def test_copied_project_is_up_to_date(self, tmp_path):
+        # Arrange: copytree gives every file a new mtime, like a fresh clone.
+        _, cam, _, _ = _dirs(tmp_path / "a")
+        _tifs(cam, 2)
+        _figures_media.run_conversions(cam, workers=1)
+        shutil.copytree(tmp_path / "a", tmp_path / "b", copy_function=shutil.copy)
+        clone = tmp_path / "b" / "figures" / "caption_and_media"
+        # Act
+        outcome = _figures_media.run_conversions(clone, workers=1)
+        # Assert
+        assert outcome["converted"] == 0
+
+
 class TestComposePanels:
     def test_panels_are_tiled_into_a_numbered_composite(self, tmp_path):
         # Arrange
@@ -333,6 +488,49 @@ class TestLinkAndPlaceholders:
         assert created == 0
 
 
+class TestDraftProxies:
+    def test_each_compilation_jpg_gets_a_downscaled_proxy(self, tmp_path):
+        # Arrange
+        _, cam, jpg_dir, _ = _dirs(tmp_path)
+        _jpg(jpg_dir / "01_overview.jpg", size=(800, 400))
+        # Act
+        written = _figures_media.make_draft_proxies(cam, jpg_dir, max_edge=200)
+        # Assert
+        with Image.open(jpg_dir / "_draft" / "01_overview.jpg") as proxy:
+            assert (written, proxy.size) == (1, (200, 100))
+
+    def test_unchanged_jpg_keeps_its_proxy(self, tmp_path):
+        # Arrange
+        _, cam, jpg_dir, _ = _dirs(tmp_path)
+        _jpg(jpg_dir / "01_overview.jpg", size=(800, 400))
+        _figures_media.make_draft_proxies(cam, jpg_dir, max_edge=200)
+        # Act
+        written = _figures_media.make_draft_proxies(cam, jpg_dir, max_edge=200)
+        # Assert
+        assert written == 0
+
+    def test_new_max_edge_rebuilds_the_proxy(self, tmp_path):
+        # Arrange
+        _, cam, jpg_dir, _ = _dirs(tmp_path)
+        _jpg(jpg_dir / "01_overview.jpg", size=(800, 400))
+        _figures_media.make_draft_proxies(cam, jpg_dir, max_edge=200)
+        # Act
+        written = _figures_media.make_draft_proxies(cam, jpg_dir, max_edge=100)
+        # Assert
+        assert written == 1
+
+    def test_proxy_of_a_removed_figure_is_dropped(self, tmp_path):
+        # Arrange
+        _, cam, jpg_dir, _ = _dirs(tmp_path)
+        _jpg(jpg_dir / "01_overview.jpg")
+        _figures_media.make_draft_proxies(cam, jpg_dir)
+        (jpg_dir / "01_overview.jpg").unlink()
+        # Act
+        _figures_media.make_draft_proxies(cam, jpg_dir)
+        # Assert
+        assert not (jpg_dir / "_draft" / "01_overview.jpg").exists()
+
+
 class TestCrop:
     def test_padded_compilation_jpg_is_trimmed(self, tmp_path):
         # Arrange: the shell's crop silently did NOTHING without ImageMagick.
@@ -345,6 +543,56 @@ class TestCrop:
         # Assert
         assert cropped == 1
 
+    def test_second_cropped_build_converts_nothing(self, tmp_path):
+        # Arrange: the crop used to land after the manifest recorded the JPG,
+        # so every --crop build saw a stale JPG and reconverted it.
+        _, cam, jpg_dir, _ = _dirs(tmp_path)
+        canvas = Image.new("RGB", (60, 60), (255, 255, 255))
+        canvas.paste(Image.new("RGB", (20, 20), (255, 0, 0)), (20, 20))
+        canvas.save(cam / "01_overview.png", "PNG")
+        _figures_media.run_conversions(cam, workers=1, crop=True)
+        _figures_media.link_compilation_jpgs(cam, jpg_dir)
+        manifest = _figures_media.ArtifactManifest(cam)
+        recropped = _figures_media.crop_compilation_jpgs(jpg_dir, manifest)
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=1, crop=True)
+        # Assert
+        with Image.open(cam / "01_overview.jpg") as img:
+            width = img.width
+        assert (recropped, outcome["converted"], width < 60) == (0, 0, True)
+
+    def test_uncropped_build_reconverts_a_cropped_jpg(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        _png(cam / "01_overview.png")
+        _figures_media.run_conversions(cam, workers=1, crop=True)
+        # Act
+        outcome = _figures_media.run_conversions(cam, workers=1)
+        # Assert
+        assert outcome["converted"] == 1
+
+    def test_panel_jpg_is_not_trimmed_before_tiling(self, tmp_path):
+        # Arrange
+        _, cam, _, _ = _dirs(tmp_path)
+        canvas = Image.new("RGB", (60, 60), (255, 255, 255))
+        canvas.paste(Image.new("RGB", (20, 20), (255, 0, 0)), (20, 20))
+        canvas.save(cam / "01a_overview.png", "PNG")
+        # Act
+        _figures_media.run_conversions(cam, workers=1, crop=True)
+        # Assert
+        with Image.open(cam / "01a_overview.jpg") as img:
+            assert img.size == (60, 60)
+
+
+class TestConversionParams:
+    def test_png_params_name_the_rendering_tool(self):
+        # Arrange
+        tool = "mmdc=/usr/bin/mmdc"
+        # Act
+        params = _figures_media._params("png", tool)
+        # Assert
+        assert params.endswith(f";{tool}")
+
 
 if __name__ == "__main__":
     import sys
@@ -146,6 +146,46 @@ class TestNoFigsMode:
         assert result["figures_enabled"] is False
 
 
+class TestDraftMode:
+    def test_final_tex_points_at_the_proxies(self, tmp_path):
+        # Arrange
+        project, _ = _seed_project(tmp_path, caption=_CAPTION)
+        # Act
+        _figures_pipeline.process(str(project), "manuscript", draft=True)
+        # Assert
+        final = (_compiled_dir(project) / "FINAL.tex").read_text()
+        assert "jpg_for_compilation/_draft/01_overview.jpg" in final
+
+    def test_proxy_edge_comes_from_the_config(self, tmp_path):
+        # Arrange
+        project, _ = _seed_project(tmp_path, caption=_CAPTION)
+        config = project / "config" / "config_manuscript.yaml"
+        config.write_text(_CONFIG + "  draft_max_edge: 60\n", encoding="utf-8")
+        # Act
+        _figures_pipeline.process(str(project), "manuscript", draft=True)
+        # Assert
+        with Image.open(_jpg_dir(project) / "_draft" / "01_overview.jpg") as proxy:
+            assert max(proxy.size) == 60
+
+    def test_full_run_after_draft_uses_the_full_jpgs(self, tmp_path):
+        # Arrange
+        project, _ = _seed_project(tmp_path, caption=_CAPTION)
+        _figures_pipeline.process(str(project), "manuscript", draft=True)
+        # Act
+        result = _figures_pipeline.process(str(project), "manuscript")
+        # Assert
+        assert "/_draft/" not in result["figures"][0]["image"]
+
+    def test_second_draft_run_reuses_the_proxies(self, tmp_path):
+        # Arrange
+        project, _ = _seed_project(tmp_path, caption=_CAPTION)
+        _figures_pipeline.process(str(project), "manuscript", draft=True)
+        # Act
+        result = _figures_pipeline.process(str(project), "manuscript", draft=True)
+        # Assert
+        assert (result["draft"], result["draft_proxies"]) == (True, 0)
+
+
 class TestFullRun:
     def test_png_source_reaches_the_compilation_dir_as_jpg(self, tmp_path):
         # Arrange
@@ -155,6 +195,20 @@ class TestFullRun:
         # Assert
         assert (_jpg_dir(project) / "01_overview.jpg").exists()
 
+    def test_manifest_stays_out_of_the_figure_sources(self, tmp_path):
+        # Arrange
+        project, cam = _seed_project(tmp_path)
+        # Act
+        _figures_pipeline.process(str(project), "manuscript")
+        # Assert
+        manifests = project / ".scitex" / "writer" / "runtime" / "manifests"
+        assert (
+            not list(cam.glob(".scitex_manifest*"))
+            and (
+                manifests / "01_manuscript--contents--figures--caption_and_media.json"
+            ).exists()
+        )
+
     def test_default_caption_is_created(self, tmp_path):
         # Arrange
         project, cam = _seed_project(tmp_path)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: src/scitex_writer/_mcp/handlers/_index.py
+
+"""Tests for the project-index lookup handler."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from scitex_writer._mcp.handlers._index import query_index
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    contents = tmp_path / "01_manuscript" / "contents"
+    (contents / "figures" / "caption_and_media").mkdir(parents=True)
+    (contents / "results.tex").write_text(
+        "As shown in Fig.~\\ref{fig:01_main} \\citep{Lee2019}.\n", encoding="utf-8"
+    )
+    (contents / "figures" / "caption_and_media" / "01_main.tex").write_text(
+        "\\caption{Main}\n", encoding="utf-8"
+    )
+    return tmp_path
+
+
+class TestQueryIndex:
+    """query_index results and errors."""
+
+    def test_who_cites(self, project):
+        # Arrange
+        key = "Lee2019"
+        # Act
+        result = query_index(str(project), "cite", key)
+        # Assert
+        assert (result["count"], result["hits"][0]["line"]) == (1, 1)
+
+    def test_label_lookup_finds_caption_derived_float(self, project):
+        # Arrange
+        key = "fig:01_main"
+        # Act
+        result = query_index(str(project), "label", key)
+        # Assert
+        assert result["hits"][0]["path"].endswith("01_main.tex")
+
+    def test_second_query_reparses_nothing(self, project):
+        # Arrange
+        query_index(str(project), "cite")
+        # Act
+        result = query_index(str(project), "ref")
+        # Assert
+        assert result["index"]["parsed"] == 0
+
+    def test_unknown_kind_is_an_error_result(self, project):
+        # Arrange
+        kind = "footnote"
+        # Act
+        result = query_index(str(project), kind)
+        # Assert
+        assert result["success"] is False
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__), "-v"])
+
+# EOF
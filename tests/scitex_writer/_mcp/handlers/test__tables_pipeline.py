@@ -34,6 +34,7 @@ _PREAMBLE = (
     "\\documentclass{article}\n"
     "\\usepackage{graphicx}\n"
     "\\usepackage{booktabs}\n"
+    "\\usepackage{longtable}\n"
     "\\usepackage[table]{xcolor}\n"
     "\\usepackage{caption}\n"
     "\\usepackage{hyperref}\n"
@@ -59,6 +60,12 @@ def _compiled_dir(project):
     return project / "01_manuscript/contents/tables/compiled"
 
 
+def _set_full_length(project, enabled):
+    (project / "config" / "config_manuscript.yaml").write_text(
+        _CONFIG + f"  full_length: {str(enabled).lower()}\n", encoding="utf-8"
+    )
+
+
 class TestPipelineErrors:
     def test_invalid_doc_type_returns_actionable_error(self):
         # Arrange
@@ -152,6 +159,24 @@ class TestXlsxStage:
         # Assert
         assert (_compiled_dir(project) / "02_from_excel.tex").exists()
 
+    def test_recorded_csv_names_its_converters(self, tmp_path):
+        # Arrange
+        import pandas as pd
+
+        project, cam = _seed_project(tmp_path, csv_text=None)
+        pd.DataFrame({"patient": ["P1"], "count": [3]}).to_excel(
+            cam / "02_from_excel.xlsx", index=False
+        )
+        # Act
+        _tables_pipeline.process(str(project), "manuscript")
+        # Assert
+        manifest = _tables_pipeline.ArtifactManifest(cam)
+        csv_file, sources = cam / "02_from_excel.csv", [cam / "02_from_excel.xlsx"]
+        assert (
+            manifest.fresh(csv_file, sources, _tables_pipeline._csv_params()),
+            manifest.fresh(csv_file, sources, "csv"),
+        ) == (True, False)
+
 
 class TestRenderStage:
     def test_csv_is_rendered_to_compiled_tex(self, tmp_path):
@@ -189,6 +214,20 @@ class TestRenderStage:
         # Assert
         assert not stale.exists()
 
+    def test_unchanged_table_is_not_rerendered(self, tmp_path):
+        # Arrange
+        project, _ = _seed_project(tmp_path)
+        _tables_pipeline.process(str(project), "manuscript")
+        compiled = _compiled_dir(project) / "01_seizure_count.tex"
+        before = compiled.stat().st_mtime_ns
+        # Act
+        result = _tables_pipeline.process(str(project), "manuscript")
+        # Assert: the shape is served from the manifest too.
+        assert (compiled.stat().st_mtime_ns, result["tables"][0]["rows"]) == (
+            before,
+            2,
+        )
+
     def test_per_table_outcome_reports_shape(self, tmp_path):
         # Arrange
         project, _ = _seed_project(tmp_path)
@@ -198,6 +237,73 @@ class TestRenderStage:
         assert result["tables"][0]["rows"] == 2 and result["tables"][0]["columns"] == 3
 
 
+class TestFullLength:
+    """``tables.full_length``: long tables become untruncated longtables."""
+
+    _LONG_CSV = "patient,count\n" + "".join(f"P{i},{i}\n" for i in range(40))
+
+    def _seed(self, tmp_path, csv_text=_LONG_CSV, full_length=True):
+        project, _ = _seed_project(tmp_path, csv_text=csv_text)
+        _set_full_length(project, full_length)
+        return project
+
+    def test_long_table_is_streamed_into_a_longtable(self, tmp_path):
+        # Arrange
+        project = self._seed(tmp_path)
+        # Act
+        result = _tables_pipeline.process(str(project), "manuscript")
+        # Assert
+        entry = result["tables"][0]
+        assert (entry["rows"], entry["truncated"], entry["longtable"]) == (
+            40,
+            False,
+            True,
+        )
+
+    def test_longtable_keeps_every_row(self, tmp_path):
+        # Arrange
+        project = self._seed(tmp_path)
+        # Act
+        _tables_pipeline.process(str(project), "manuscript")
+        # Assert
+        tex = (_compiled_dir(project) / "01_seizure_count.tex").read_text()
+        assert "\\begin{longtable}" in tex and "P39 & 39" in tex
+
+    def test_short_table_stays_a_float(self, tmp_path):
+        # Arrange
+        project = self._seed(tmp_path, csv_text=_CSV)
+        # Act
+        _tables_pipeline.process(str(project), "manuscript")
+        # Assert
+        tex = (_compiled_dir(project) / "01_seizure_count.tex").read_text()
+        assert "\\begin{table}" in tex
+
+    def test_table_of_exactly_max_rows_stays_a_whole_float(self, tmp_path):
+        # Arrange: the head read that picks the path is this table's only parse
+        rows = _tables_pipeline.MAX_ROWS
+        csv_text = "patient,count\n" + "".join(f"P{i},{i}\n" for i in range(rows))
+        project = self._seed(tmp_path, csv_text=csv_text)
+        # Act
+        result = _tables_pipeline.process(str(project), "manuscript")
+        # Assert
+        entry = result["tables"][0]
+        assert (entry["rows"], entry["truncated"], entry["longtable"]) == (
+            rows,
+            False,
+            False,
+        )
+
+    def test_turning_it_off_rerenders_truncated(self, tmp_path):
+        # Arrange
+        project = self._seed(tmp_path)
+        _tables_pipeline.process(str(project), "manuscript")
+        _set_full_length(project, False)
+        # Act
+        result = _tables_pipeline.process(str(project), "manuscript")
+        # Assert
+        assert result["tables"][0]["truncated"] is True
+
+
 class TestGatherStage:
     def test_final_tex_guards_inline_placed_table(self, tmp_path):
         # Arrange
@@ -288,6 +394,29 @@ class TestPdflatexSmoke:
         # Assert
         assert (work / "doc.pdf").is_file()
 
+    def test_streamed_longtable_compiles_to_pdf(self, tmp_path):
+        # Arrange: a table long enough to break across pages.
+        rows = "".join(f"P{i},{i},{i / 7}\n" for i in range(120))
+        project, _ = _seed_project(tmp_path, csv_text="patient,count,score\n" + rows)
+        _set_full_length(project, True)
+        _tables_pipeline.process(str(project), "manuscript")
+        work = tmp_path / "build_long"
+        work.mkdir()
+        table = (_compiled_dir(project) / "01_seizure_count.tex").read_text()
+        (work / "doc.tex").write_text(
+            _PREAMBLE + "\\begin{document}\n" + table + "\n\\end{document}\n",
+            encoding="utf-8",
+        )
+        # Act
+        subprocess.run(
+            ["pdflatex", "-interaction=nonstopmode", "-halt-on-error", "doc.tex"],
+            cwd=str(work),
+            capture_output=True,
+            text=True,
+        )
+        # Assert
+        assert (work / "doc.pdf").is_file()
+
     def test_gathered_final_tex_compiles_to_pdf(self, tmp_path):
         # Arrange: compile the gathered FINAL.tex (the file the manuscript inputs),
         # exercising the guarded \input + \pdfbookmark path end to end.
@@ -6,6 +6,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from scitex_writer._mcp.handlers import _wordcount
 
 
@@ -64,21 +66,131 @@ class TestCountElementsHelper:
         assert n == 0
 
 
-class TestCountWordsTexcountHelper:
-    def test_missing_section_file_counts_zero(self, tmp_path):
+# A stand-in texcount: prints the word count of its first argument and logs
+# each invocation, so the tests see exactly which sections reached texcount.
+_FAKE_TEXCOUNT = """#!/bin/sh
+echo "$1" >> "$(dirname "$0")/calls.log"
+wc -w < "$1"
+"""
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    project = tmp_path / "paper"
+    contents = project / "01_manuscript" / "contents"
+    contents.mkdir(parents=True)
+    for sec, text in {
+        "abstract": "one two",
+        "introduction": "a b c",
+        "methods": "d e",
+        "results": "f",
+        "discussion": "g h i j",
+    }.items():
+        (contents / f"{sec}.tex").write_text(text + "\n", encoding="utf-8")
+    (project / "config").mkdir()
+    (project / "config" / "config_manuscript.yaml").write_text(
+        "paths:\n  doc_root_dir: ./01_manuscript\n"
+        "misc:\n  wordcount_dir: ./01_manuscript/contents/wordcounts\n",
+        encoding="utf-8",
+    )
+    return project
+
+
+@pytest.fixture
+def texcount(tmp_path) -> Path:
+    tool = tmp_path / "bin" / "texcount"
+    tool.parent.mkdir()
+    tool.write_text(_FAKE_TEXCOUNT)
+    tool.chmod(0o755)
+    return tool
+
+
+def _calls(texcount: Path) -> list:
+    log = texcount.parent / "calls.log"
+    return log.read_text().split() if log.exists() else []
+
+
+class TestIncrementalCounting:
+    def test_first_run_counts_every_section(self, project, texcount):
         # Arrange
-        absent = tmp_path / "abstract.tex"
         # Act
-        n = _wordcount._count_words_texcount("texcount", absent)
+        result = _wordcount.count_words(str(project), texcount=str(texcount))
         # Assert
-        assert n == 0
+        assert (result["total"], result["texcount_runs"]) == (10, 5)
+
+    def test_unchanged_rebuild_runs_no_texcount(self, project, texcount):
+        # Arrange
+        _wordcount.count_words(str(project), texcount=str(texcount))
+        # Act
+        result = _wordcount.count_words(str(project), texcount=str(texcount))
+        # Assert
+        assert (result["texcount_runs"], len(_calls(texcount))) == (0, 5)
+
+    def test_unchanged_rebuild_rewrites_no_count_file(self, project, texcount):
+        # Arrange
+        _wordcount.count_words(str(project), texcount=str(texcount))
+        # Act
+        result = _wordcount.count_words(str(project), texcount=str(texcount))
+        # Assert
+        assert result["changed_files"] == []
+
+    def test_one_edited_section_runs_texcount_once(self, project, texcount):
+        # Arrange
+        _wordcount.count_words(str(project), texcount=str(texcount))
+        discussion = project / "01_manuscript/contents/discussion.tex"
+        discussion.write_text("g h\n", encoding="utf-8")
+        # Act
+        result = _wordcount.count_words(str(project), texcount=str(texcount))
+        # Assert
+        assert (
+            result["texcount_runs"],
+            result["counts"]["discussion"],
+            sorted(Path(f).name for f in result["changed_files"]),
+        ) == (1, 2, ["discussion_count.txt", "imrd_count.txt"])
+
+    def test_edit_to_an_input_file_recounts_its_section(self, project, texcount):
+        # Arrange
+        contents = project / "01_manuscript/contents"
+        (contents / "extra.tex").write_text("x y z\n", encoding="utf-8")
+        (contents / "results.tex").write_text("f \\input{extra}\n", encoding="utf-8")
+        _wordcount.count_words(str(project), texcount=str(texcount))
+        (contents / "extra.tex").write_text("x\n", encoding="utf-8")
+        # Act
+        result = _wordcount.count_words(str(project), texcount=str(texcount))
+        # Assert
+        assert result["texcount_runs"] == 1
+
+    def test_missing_section_counts_zero(self, project, texcount):
+        # Arrange
+        (project / "01_manuscript/contents/methods.tex").unlink()
+        # Act
+        result = _wordcount.count_words(str(project), texcount=str(texcount))
+        # Assert
+        assert (result["counts"]["methods"], result["texcount_runs"]) == (0, 4)
+
+    def test_moved_project_keeps_its_cache(self, project, texcount, tmp_path):
+        # Arrange
+        _wordcount.count_words(str(project), texcount=str(texcount))
+        moved = project.rename(tmp_path / "paper_moved")
+        # Act
+        result = _wordcount.count_words(str(moved), texcount=str(texcount))
+        # Assert
+        assert result["texcount_runs"] == 0
+
+    def test_stale_count_files_are_removed(self, project, texcount):
+        # Arrange
+        wc_dir = project / "01_manuscript/contents/wordcounts"
+        wc_dir.mkdir()
+        (wc_dir / "old_count.txt").write_text("7\n")
+        # Act
+        _wordcount.count_words(str(project), texcount=str(texcount))
+        # Assert
+        assert not (wc_dir / "old_count.txt").exists()
 
 
 if __name__ == "__main__":
     import sys
 
-    import pytest
-
     sys.exit(pytest.main([__file__, "-v"]))
 
 # EOF
@@ -80,6 +80,79 @@ def test_metadata_for_doi_none_when_missing(tmp_path: Path):
     assert scholar.metadata_for_doi(tmp_path, "10.99/nope") is None
 
 
+def test_metadata_for_arxiv_id_ignores_prefix(tmp_path: Path):
+    # Arrange
+    _write_metadata(tmp_path, "AAA", arxiv_id="arXiv:2401.00001")
+    # Act
+    md = scholar.metadata_for_arxiv_id(tmp_path, "2401.00001")
+    # Assert
+    assert md["_paper_id"] == "AAA"
+
+
+def test_metadata_for_pmid(tmp_path: Path):
+    # Arrange
+    _write_metadata(tmp_path, "AAA", pmid="12345")
+    _write_metadata(tmp_path, "BBB", pmid="67890")
+    # Act
+    md = scholar.metadata_for_pmid(tmp_path, "67890")
+    # Assert
+    assert md["_paper_id"] == "BBB"
+
+
+def test_identifier_index_is_persisted_in_sidecar(tmp_path: Path):
+    # Arrange
+    _write_metadata(tmp_path, "AAA", doi="10.1/aaa")
+    # Act
+    scholar.metadata_for_doi(tmp_path, "10.1/aaa")
+    # Assert
+    assert (tmp_path / scholar._SIDECAR_DB_NAME).is_file()
+
+
+def test_identifier_index_rereads_only_changed_records(tmp_path: Path):
+    # Arrange
+    _write_metadata(tmp_path, "AAA", doi="10.1/aaa")
+    _write_metadata(tmp_path, "BBB", doi="10.2/bbb")
+    scholar._IdentifierIndex(tmp_path).refresh()
+    md_file = tmp_path / "MASTER" / "BBB" / "metadata.json"
+    md = json.loads(md_file.read_text())
+    md["metadata"]["id"]["doi"] = "10.2/bbb-v2"
+    md_file.write_text(json.dumps(md))
+    # Act: a fresh process reuses the sidecar
+    index = scholar._IdentifierIndex(tmp_path)
+    index.refresh()
+    # Assert
+    assert (index.reads, index.lookup("doi", "10.2/bbb-v2")) == (1, "BBB")
+
+
+def test_metadata_for_doi_sees_edit_to_existing_record(tmp_path: Path):
+    # Editing metadata.json in place leaves the MASTER dir mtime unchanged
+    # Arrange
+    _write_metadata(tmp_path, "AAA", doi="10.1/old")
+    assert scholar.metadata_for_doi(tmp_path, "10.1/old") is not None
+    md_file = tmp_path / "MASTER" / "AAA" / "metadata.json"
+    md = json.loads(md_file.read_text())
+    md["metadata"]["id"]["doi"] = "10.1/new"
+    md_file.write_text(json.dumps(md))
+    # Act
+    stale = scholar.metadata_for_doi(tmp_path, "10.1/old")
+    # Assert
+    assert stale is None
+
+
+def test_removed_record_leaves_the_index(tmp_path: Path):
+    # Arrange
+    import shutil
+
+    _write_metadata(tmp_path, "AAA", doi="10.1/aaa")
+    _write_metadata(tmp_path, "BBB", doi="10.2/bbb")
+    scholar.iter_library_cards(tmp_path)
+    shutil.rmtree(tmp_path / "MASTER" / "BBB")
+    # Act
+    cards = scholar.iter_library_cards(tmp_path)
+    # Assert
+    assert [c["paper_id"] for c in cards] == ["AAA"]
+
+
 def test_iter_library_cards_sorted_by_year_desc(tmp_path: Path):
     # Arrange
     _write_metadata(tmp_path, "OLD", doi="10.1/o", year=2010, title="old")
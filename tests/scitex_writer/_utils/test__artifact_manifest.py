@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: src/scitex_writer/_utils/_artifact_manifest.py
+
+"""Tests for the content-hash freshness manifest."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from scitex_writer._utils._artifact_manifest import (
+    MANIFEST_DIR,
+    MANIFEST_NAME,
+    ArtifactManifest,
+)
+
+
+def _write(root, rel, content):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _shift_mtime(path, seconds):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 10**9))
+
+
+@pytest.fixture
+def built(tmp_path) -> Path:
+    """A directory with src.txt -> out.txt recorded in a saved manifest."""
+    src = _write(tmp_path, "src.txt", "alpha")
+    out = _write(tmp_path, "out.txt", "ALPHA")
+    manifest = ArtifactManifest(tmp_path)
+    manifest.record(out, [src], "upper")
+    manifest.save()
+    return tmp_path
+
+
+def _fresh(directory, params="upper"):
+    manifest = ArtifactManifest(directory)
+    return manifest.fresh(directory / "out.txt", [directory / "src.txt"], params)
+
+
+class TestFresh:
+    """What makes a recorded output fresh or stale."""
+
+    def test_recorded_output_is_fresh(self, built):
+        # Arrange
+        # Act
+        fresh = _fresh(built)
+        # Assert
+        assert fresh is True
+
+    def test_unrecorded_output_is_stale(self, tmp_path):
+        # Arrange
+        _write(tmp_path, "src.txt", "alpha")
+        _write(tmp_path, "out.txt", "ALPHA")
+        # Act
+        fresh = _fresh(tmp_path)
+        # Assert
+        assert fresh is False
+
+    def test_source_edit_makes_it_stale_even_with_an_older_mtime(self, built):
+        # Arrange: a checkout can give an edited source an OLDER mtime.
+        _write(built, "src.txt", "beta")
+        _shift_mtime(built / "src.txt", -3600)
+        # Act
+        fresh = _fresh(built)
+        # Assert
+        assert fresh is False
+
+    def test_touched_source_with_same_content_stays_fresh(self, built):
+        # Arrange
+        _shift_mtime(built / "src.txt", 3600)
+        # Act
+        fresh = _fresh(built)
+        # Assert
+        assert fresh is True
+
+    def test_edited_output_is_stale(self, built):
+        # Arrange
+        _write(built, "out.txt", "hand edited")
+        # Act
+        fresh = _fresh(built)
+        # Assert
+        assert fresh is False
+
+    def test_changed_params_are_stale(self, built):
+        # Arrange
+        # Act
+        fresh = _fresh(built, params="lower")
+        # Assert
+        assert fresh is False
+
+    def test_missing_output_is_stale(self, built):
+        # Arrange
+        (built / "out.txt").unlink()
+        # Act
+        fresh = _fresh(built)
+        # Assert
+        assert fresh is False
+
+
+class TestPortability:
+    """The manifest is valid in another clone of the directory."""
+
+    def test_copied_tree_is_fresh(self, built, tmp_path_factory):
+        # Arrange: copy2 keeps mtimes; rewrite them as a checkout would.
+        clone = tmp_path_factory.mktemp("clone") / "project"
+        shutil.copytree(built, clone)
+        for name in ("src.txt", "out.txt"):
+            _shift_mtime(clone / name, 7200)
+        # Act
+        fresh = _fresh(clone)
+        # Assert
+        assert fresh is True
+
+
+class TestSave:
+    """Persistence and pruning."""
+
+    def test_meta_round_trips(self, tmp_path):
+        # Arrange
+        src = _write(tmp_path, "src.txt", "alpha")
+        out = _write(tmp_path, "out.txt", "ALPHA")
+        manifest = ArtifactManifest(tmp_path)
+        manifest.record(out, [src], meta={"rows": 2})
+        manifest.save()
+        # Act
+        meta = ArtifactManifest(tmp_path).meta(out)
+        # Assert
+        assert meta == {"rows": 2}
+
+    def test_entries_of_deleted_outputs_are_pruned(self, built):
+        # Arrange
+        (built / "out.txt").unlink()
+        manifest = ArtifactManifest(built)
+        # Act
+        manifest.save()
+        # Assert
+        assert "out.txt" not in manifest.path.read_text()
+
+
+class TestLocation:
+    """The manifest lives in the project's build cache, not beside the sources."""
+
+    def _project(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        cam = tmp_path / "01_manuscript" / "contents" / "figures" / "caption_and_media"
+        src = _write(cam, "src.txt", "alpha")
+        out = _write(cam, "out.txt", "ALPHA")
+        return cam, src, out
+
+    def test_project_manifest_is_written_under_the_runtime_cache(self, tmp_path):
+        # Arrange
+        cam, src, out = self._project(tmp_path)
+        manifest = ArtifactManifest(cam)
+        manifest.record(out, [src], "upper")
+        # Act
+        manifest.save()
+        # Assert
+        assert (
+            manifest.path.parent == tmp_path / MANIFEST_DIR
+            and manifest.path.exists()
+            and not (cam / MANIFEST_NAME).exists()
+        )
+
+    def test_manifest_left_in_the_sources_is_moved(self, tmp_path):
+        # Arrange: written beside the sources by an earlier version
+        cam, src, out = self._project(tmp_path)
+        legacy = ArtifactManifest(cam, root=cam)
+        legacy.record(out, [src], "upper")
+        legacy.save()
+        manifest = ArtifactManifest(cam)
+        # Act
+        fresh = manifest.fresh(out, [src], "upper")
+        manifest.forget(out)
+        manifest.save()
+        # Assert
+        assert (fresh, (cam / MANIFEST_NAME).exists()) == (True, False)
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__), "-v"])
+
+# EOF
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: src/scitex_writer/_utils/_bib_index.py
+
+"""Tests for the in-process, mtime-validated bibliography index."""
+
+import os
+
+import pytest
+
+from scitex_writer._utils._bib_index import (
+    BibIndex,
+    get_bib_index,
+    scan_entries,
+    split_entries,
+)
+
+LIBRARY = """% Shared library
+@string{nat = {Nature}}
+
+@article{Smith2020,
+  title = {The {DNA} of things},
+  note = {contact smith@example.org},
+  journal = nat,
+}
+
+% -- methods --
+@misc(Doe2021, title = {Draft (v2)})
+"""
+
+
+@pytest.fixture
+def bib_dir(tmp_path):
+    bib_dir = tmp_path / "bib_files"
+    bib_dir.mkdir()
+    (bib_dir / "library.bib").write_text(LIBRARY, encoding="utf-8")
+    (bib_dir / "custom.bib").write_text(
+        "@book{Custom2019,\n  title = {C}\n}\n", encoding="utf-8"
+    )
+    for path in bib_dir.iterdir():
+        _settle(path)
+    return bib_dir
+
+
+def _touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _settle(path):
+    """Date ``path`` back past the racy window, as a file edited a while ago."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 * 10**9))
+
+
+class TestScan:
+    """Entries are delimited by their own braces."""
+
+    def test_entries_skip_strings_and_emails(self):
+        # Arrange
+        # Act
+        keys = [e.citation_key for e in scan_entries(LIBRARY)]
+        # Assert
+        assert keys == ["Smith2020", "Doe2021"]
+
+    def test_span_ends_at_the_closing_delimiter(self):
+        # Arrange
+        entry = scan_entries(LIBRARY)[1]
+        # Act
+        text = LIBRARY[entry.start : entry.end]
+        # Assert
+        assert text == "@misc(Doe2021, title = {Draft (v2)})"
+
+    def test_unbalanced_entry_runs_to_the_next_item(self):
+        # Arrange
+        text = "@misc{a, title = {open\n@misc{b, title = {x}}\n"
+        # Act
+        spans = [text[e.start : e.end] for e in scan_entries(text)]
+        # Assert
+        assert spans == ["@misc{a, title = {open", "@misc{b, title = {x}}"]
+
+    def test_split_entries_yields_each_entry_text(self):
+        # Arrange
+        # Act
+        chunks = split_entries("@misc{a, t={1}}\n\n@misc{b, t={2}}")
+        # Assert
+        assert chunks == ["@misc{a, t={1}}", "@misc{b, t={2}}"]
+
+
+class TestLookup:
+    """Keys resolve from memory; files are re-read only when they change."""
+
+    def test_lookup_finds_the_entry_and_its_text(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        # Act
+        entry = index.lookup("Doe2021")
+        # Assert
+        assert (entry.bibfile, index.text_of(entry)) == (
+            "library.bib",
+            "@misc(Doe2021, title = {Draft (v2)})",
+        )
+
+    def test_entry_counts_are_exact(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        # Act
+        counts = index.files()
+        # Assert
+        assert counts == [("custom.bib", 1), ("library.bib", 2)]
+
+    def test_unchanged_files_are_not_read_again(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        index.refresh()
+        # Act
+        for _ in range(5):
+            index.lookup("Smith2020")
+        # Assert
+        assert index.reads == 2
+
+    def test_an_external_edit_is_picked_up(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        index.refresh()
+        path = bib_dir / "custom.bib"
+        path.write_text("@book{Renamed2019,\n  title = {C}\n}\n", encoding="utf-8")
+        _touch_later(path)
+        # Act
+        found = (index.lookup("Custom2019"), index.lookup("Renamed2019").bibfile)
+        # Assert
+        assert found == (None, "custom.bib")
+
+    def test_a_same_stamp_edit_of_a_fresh_file_is_picked_up(self, bib_dir):
+        # Arrange: rewritten within one mtime tick, same size
+        path = bib_dir / "custom.bib"
+        path.write_text("@book{Custom2019,\n  title = {C}\n}\n", encoding="utf-8")
+        index = BibIndex(bib_dir)
+        index.refresh()
+        stat = path.stat()
+        path.write_text("@book{Custom2020,\n  title = {C}\n}\n", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        # Act
+        found = (index.lookup("Custom2019"), index.lookup("Custom2020").bibfile)
+        # Assert
+        assert found == (None, "custom.bib")
+
+    def test_a_deleted_file_drops_out(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        index.refresh()
+        (bib_dir / "custom.bib").unlink()
+        # Act
+        entry = index.lookup("Custom2019")
+        # Assert
+        assert entry is None
+
+    def test_a_repeated_key_resolves_to_the_first_file_by_name(self, bib_dir):
+        # Arrange
+        (bib_dir / "zz_stubs.bib").write_text("@misc{Smith2020, t = {stub}}\n")
+        index = BibIndex(bib_dir)
+        # Act
+        entry = index.lookup("Smith2020")
+        # Assert
+        assert entry.bibfile == "library.bib"
+
+    def test_the_index_is_shared_per_directory(self, bib_dir):
+        # Arrange
+        # Act
+        first = get_bib_index(bib_dir)
+        second = get_bib_index(str(bib_dir / ".." / "bib_files"))
+        # Assert
+        assert first is second
+
+
+class TestAddMany:
+    """A batch is appended with one write and indexed without a re-read."""
+
+    def test_batch_is_appended_like_single_adds(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        # Act
+        index.add_many(["@misc{A, t = {1}}", "  @misc{B, t = {2}}\n"], "custom.bib")
+        # Assert
+        assert (bib_dir / "custom.bib").read_text() == (
+            "@book{Custom2019,\n  title = {C}\n}\n"
+            "\n@misc{A, t = {1}}\n\n@misc{B, t = {2}}\n"
+        )
+
+    def test_new_file_starts_with_the_first_entry(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        # Act
+        index.add_many(["@misc{A, t = {1}}", "@misc{B, t = {2}}"], "new.bib")
+        # Assert
+        assert (bib_dir / "new.bib").read_text() == (
+            "@misc{A, t = {1}}\n\n@misc{B, t = {2}}\n"
+        )
+
+    def test_duplicates_are_skipped_against_files_and_the_batch(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        # Act
+        added, skipped, invalid = index.add_many(
+            ["@misc{Smith2020, t={x}}", "@misc{A, t={1}}", "@misc{A, t={2}}", "junk"]
+        )
+        # Assert
+        assert (added, [s["citation_key"] for s in skipped], invalid) == (
+            ["A"],
+            ["Smith2020", "A"],
+            ["junk"],
+        )
+
+    def test_added_entries_are_indexed_without_rescanning_the_file(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        index.refresh()
+        # Act: the file just written is racy, so each lookup re-reads it
+        index.add_many("@misc{A, t = {1}}\n@misc{B, t = {2}}", "custom.bib")
+        entry = index.lookup("B")
+        again = index.lookup("B")
+        # Assert
+        assert (again is entry, index.text_of(entry)) == (True, "@misc{B, t = {2}}")
+
+    def test_a_text_holding_several_entries_is_split(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        # Act
+        added, _skipped, _invalid = index.add_many("@misc{A, t={1}}\n\n@misc{B, t={2}}")
+        # Assert
+        assert added == ["A", "B"]
+
+
+class TestRemoveMany:
+    """Each touched file is rewritten once; comments between entries stay."""
+
+    def test_entries_are_removed_and_comments_kept(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        # Act
+        removed, missing = index.remove_many(["Smith2020", "Doe2021", "Nope"])
+        # Assert
+        assert (
+            [r["citation_key"] for r in removed],
+            missing,
+            (bib_dir / "library.bib").read_text(),
+        ) == (
+            ["Smith2020", "Doe2021"],
+            ["Nope"],
+            "% Shared library\n@string{nat = {Nature}}\n\n% -- methods --\n",
+        )
+
+    def test_index_matches_a_fresh_scan_after_removal(self, bib_dir):
+        # Arrange
+        index = BibIndex(bib_dir)
+        index.remove_many(["Smith2020"])
+        # Act
+        fresh = BibIndex(bib_dir)
+        # Assert
+        assert index.entries() == fresh.entries()
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__), "-v"])
+
+# EOF
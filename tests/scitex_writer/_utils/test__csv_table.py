@@ -16,11 +16,18 @@ import subprocess
 import pytest
 
 from scitex_writer._utils._csv_table import (
+    _render_cell,
     caption_title,
+    column_precision,
+    format_column,
     is_verbatim,
     protect_verbatim,
+    read_csv_table,
     render_csv_table,
+    render_table,
+    scan_csv_table,
     split_table_name,
+    write_longtable,
 )
 
 _CAPTION_WITH_LABEL = (
@@ -189,6 +196,129 @@ class TestTruncation:
         # Assert
         assert "Note: Table truncated to 30 rows from 40 total rows" in latex
 
+    def test_long_numeric_column_stays_right_aligned(self, tmp_path):
+        # Arrange
+        rows = "\n".join(f"P{i},{i}" for i in range(40))
+        csv_file = _write_csv(tmp_path, f"patient,count\n{rows}\n")
+        # Act
+        latex = render_csv_table(csv_file)
+        # Assert
+        assert "\\begin{tabular}{lr}" in latex
+
+    def test_ellipsis_data_cell_is_not_an_omission_marker(self, tmp_path):
+        # Arrange
+        csv_file = _write_csv(tmp_path, "step,note\n1,...\n2,done\n")
+        # Act
+        latex = render_csv_table(csv_file)
+        # Assert
+        assert ("rows omitted" not in latex, "1 & ... \\\\" in latex) == (True, True)
+
+
+class TestColumnFormatting:
+    """The column-wise formatter agrees with the per-cell rules."""
+
+    _CSV = (
+        "score,small,count,mixed\n"
+        "0.5,0.001,3,$p<0.05$\n"
+        "1.25,,12,a_b\n"
+        ",0.0004,-7,0.75\n"
+        "inf,0,1e21,\n"
+    )
+
+    def test_format_column_matches_cell_by_cell_rendering(self, tmp_path):
+        # Arrange
+        frame = read_csv_table(_write_csv(tmp_path, self._CSV))
+        expected = {}
+        for col in frame.columns:
+            precision = column_precision(list(frame[col]))
+            expected[col] = [_render_cell(v, precision) for v in frame[col]]
+        # Act
+        actual = {col: format_column(frame[col]) for col in frame.columns}
+        # Assert
+        assert actual == expected
+
+    def test_numeric_column_precision_matches_scalar_rule(self, tmp_path):
+        # Arrange
+        frame = read_csv_table(_write_csv(tmp_path, self._CSV))
+        # Act
+        precision = column_precision(frame["score"])
+        # Assert
+        assert precision == column_precision(list(frame["score"])) == 2
+
+    def test_render_table_matches_render_csv_table(self, tmp_path):
+        # Arrange
+        csv_file = _write_csv(tmp_path, self._CSV)
+        frame = read_csv_table(csv_file)
+        # Act
+        latex = render_table(frame, csv_file.stem, caption=_CAPTION_NO_LABEL)
+        # Assert
+        assert latex == render_csv_table(csv_file, caption=_CAPTION_NO_LABEL)
+
+
+class TestLongtable:
+    """The streamed, untruncated longtable renderer."""
+
+    def _long_csv(self, tmp_path, rows=45):
+        body = "\n".join(f"P{i},{i},{i / 8}" for i in range(rows))
+        return _write_csv(tmp_path, f"patient,count,score\n{body}\n")
+
+    def test_every_row_is_written(self, tmp_path):
+        # Arrange
+        csv_file = self._long_csv(tmp_path)
+        out = tmp_path / "out.tex"
+        # Act
+        write_longtable(csv_file, out, chunk_rows=10)
+        # Assert
+        latex = out.read_text()
+        assert ("P44 & 44" in latex, "rows omitted" in latex) == (True, False)
+
+    def test_rows_match_the_in_memory_renderer(self, tmp_path):
+        # Arrange
+        csv_file = self._long_csv(tmp_path)
+        out = tmp_path / "out.tex"
+        full = render_table(read_csv_table(csv_file), "t", max_rows=1000)
+        # Act
+        write_longtable(csv_file, out, chunk_rows=7)
+        # Assert
+        rows = out.read_text().split("\\endlastfoot\n")[1].split("\\end{longtable}")
+        assert rows[0] == full.split("\\midrule\n", 1)[1].split("\\bottomrule")[0]
+
+    def test_precision_from_a_later_chunk_pads_earlier_rows(self, tmp_path):
+        # Arrange
+        csv_file = _write_csv(tmp_path, "x\n1\n2\n0.125\n")
+        out = tmp_path / "out.tex"
+        # Act
+        write_longtable(csv_file, out, chunk_rows=1)
+        # Assert
+        assert "1.000 \\\\" in out.read_text()
+
+    def test_text_in_a_later_chunk_left_aligns_the_column(self, tmp_path):
+        # Arrange
+        csv_file = _write_csv(tmp_path, "x,y\n1,2\n3,pending\n")
+        # Act
+        scan = scan_csv_table(csv_file, chunk_rows=1)
+        # Assert
+        assert (scan.rows, scan.alignments) == (2, "rl")
+
+    def test_caption_sits_in_the_first_head_with_its_label(self, tmp_path):
+        # Arrange
+        csv_file = self._long_csv(tmp_path)
+        out = tmp_path / "out.tex"
+        # Act
+        write_longtable(csv_file, out, caption=_CAPTION_NO_LABEL)
+        # Assert
+        head = out.read_text().split("\\endfirsthead")[0]
+        assert "Seizure counts" in head and "\\label{tab:01_seizure_count}" in head
+
+    def test_missing_csv_raises_file_not_found(self, tmp_path):
+        # Arrange
+        absent = tmp_path / "99_absent.csv"
+        # Act
+        scan = lambda: scan_csv_table(absent)  # noqa: E731
+        # Assert
+        with pytest.raises(FileNotFoundError, match="CSV file not found"):
+            scan()
+
 
 class TestMixedCellProtection:
     r"""A cell mixing prose and math is verbatim, but its ``%`` / ``&`` must
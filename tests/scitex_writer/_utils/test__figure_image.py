@@ -61,6 +61,27 @@ class TestToJpg:
             _figure_image.to_jpg(broken, tmp_path / "out.jpg")
 
 
+class TestToDraftJpg:
+    def test_longest_edge_is_capped_with_aspect_kept(self, tmp_path):
+        # Arrange
+        src = tmp_path / "big.jpg"
+        Image.new("RGB", (1600, 1200), (10, 120, 10)).save(src, "JPEG")
+        # Act
+        dst = _figure_image.to_draft_jpg(src, tmp_path / "proxy.jpg", max_edge=400)
+        # Assert
+        with Image.open(dst) as image:
+            assert image.size == (400, 300)
+
+    def test_small_image_is_not_upscaled(self, tmp_path):
+        # Arrange
+        src = _write_png(tmp_path / "small.png", size=(40, 30))
+        # Act
+        dst = _figure_image.to_draft_jpg(src, tmp_path / "proxy.jpg", max_edge=400)
+        # Assert
+        with Image.open(dst) as image:
+            assert image.size == (40, 30)
+
+
 class TestToPng:
     def test_tiff_is_converted_to_png(self, tmp_path):
         # Arrange
@@ -13,6 +13,7 @@ import shutil
 
 import pytest
 
+from scitex_writer._compile._preview import warm_engine_available
 from scitex_writer._utils import _latexmk
 
 _GOOD = "\\documentclass{article}\n\\begin{document}\nHello.\n\\end{document}\n"
@@ -81,6 +82,50 @@ class TestCompileTex:
         with pytest.raises(_latexmk.LatexmkFailedError, match="TeX source not found"):
             _latexmk.compile_tex(tex, tmp_path / "logs", project_root=tmp_path)
 
+    @pytest.mark.skipif(
+        not warm_engine_available(), reason="pdflatex + mylatexformat not installed"
+    )
+    def test_fmt_engine_builds_and_reuses_one_format(self, tmp_path):
+        # Arrange
+        tex = tmp_path / "doc.tex"
+        tex.write_text(_GOOD, encoding="utf-8")
+        formats = tmp_path / ".scitex" / "writer" / "runtime" / "formats"
+        _latexmk.compile_tex(
+            tex, tmp_path / "logs", project_root=tmp_path, preamble_format=True
+        )
+        # Act
+        pdf = _latexmk.compile_tex(
+            tex, tmp_path / "logs", project_root=tmp_path, preamble_format=True
+        )
+        # Assert
+        assert (pdf.is_file(), len(list(formats.glob("*.fmt")))) == (True, 1)
+
+
+class TestPreambleFormatKey:
+    def test_comment_lines_do_not_change_the_key(self):
+        # Arrange: the compiled manuscript's banner changes on every build.
+        stamped = "% Compiled: 2026-10-17 10:00\n" + _GOOD
+        # Act
+        keys = {_latexmk.preamble_format_key(d) for d in (_GOOD, stamped)}
+        # Assert
+        assert len(keys) == 1
+
+    def test_preamble_edit_changes_the_key(self):
+        # Arrange
+        styled = _GOOD.replace("\\begin", "\\usepackage{xcolor}\n\\begin")
+        # Act
+        keys = {_latexmk.preamble_format_key(d) for d in (_GOOD, styled)}
+        # Assert
+        assert len(keys) == 2
+
+    def test_body_edit_keeps_the_key(self):
+        # Arrange
+        edited = _GOOD.replace("Hello.", "Goodbye.")
+        # Act
+        keys = {_latexmk.preamble_format_key(d) for d in (_GOOD, edited)}
+        # Assert
+        assert len(keys) == 1
+
 
 class TestFailLoud:
     def test_missing_latexmk_raises_install_hint(self, empty_path):
@@ -6,7 +6,10 @@ from pathlib import Path
 import pytest
 
 from scitex_writer._dataclasses import LaTeXIssue
-from scitex_writer._utils._parse_latex_logs import parse_compilation_output
+from scitex_writer._utils._parse_latex_logs import (
+    parse_compilation_output,
+    parse_latex_log,
+)
 
 
 class TestParseCompilationOutputErrors:
@@ -154,8 +157,8 @@ class TestParseCompilationOutputLogFile:
         # Assert
         assert len(errors) == 1
 
-    def test_log_file_parameter_is_ignored(self):
-        """Verify log_file parameter is ignored (for compatibility)."""
+    def test_missing_log_file_falls_back_to_output(self):
+        """Verify a log_file that does not exist falls back to the output."""
         # Arrange
         output = "! Error"
         log_file = Path("/some/path/document.log")
@@ -210,6 +213,174 @@ class TestParseCompilationOutputIssueObjects:
         assert ('LaTeX Warning' in warnings[0].message) and ('fig:test' in warnings[0].message)
 
 
+_SAMPLE_LOG = r"""This is pdfTeX, Version 3.141592653-2.6-1.40.25 (TeX Live 2023)
+(./manuscript.tex
+(/usr/share/texlive/texmf-dist/tex/latex/base/article.cls
+Document Class: article 2022/07/02 v1.4n Standard LaTeX document class
+(/usr/share/texlive/texmf-dist/tex/latex/base/size10.clo))
+(./contents/introduction.tex
+
+LaTeX Warning: Reference `fig:missing' on page 1 undefined on input line 7.
+
+Overfull \hbox (12.3pt too wide) in paragraph at lines 9--11
+[]\OT1/cmr/m/n/10 Some (unbalanced text
+ []
+
+./contents/introduction.tex:14: Undefined control sequence.
+l.14 \badmacro
+
+)
+(./contents/methods.tex
+Package hyperref Warning: Token not allowed in a PDF string (Unicode):
+(hyperref)                removing `math shift' on input line 5.
+
+! LaTeX Error: File `missing.sty' not found.
+
+Type X to quit or <RETURN> to proceed,
+l.8 \usepackage
+)
+"""
+
+
+def _parse(text):
+    return parse_latex_log(text.splitlines())
+
+
+def _only(issues, category):
+    (issue,) = [i for i in issues if i.category == category]
+    return issue
+
+
+class TestParseLatexLog:
+    """Tests for the streaming .log parser."""
+
+    def test_issue_is_attributed_to_innermost_open_file(self):
+        # Arrange
+        # Act
+        issue = _only(_parse(_SAMPLE_LOG), "undefined_reference")
+        # Assert
+        assert (issue.file, issue.line) == ("./contents/introduction.tex", 7)
+
+    def test_parentheses_in_badbox_contents_do_not_shift_the_file_stack(self):
+        # Arrange
+        # Act
+        issue = _only(_parse(_SAMPLE_LOG), "missing_file")
+        # Assert
+        assert issue.file == "./contents/methods.tex"
+
+    def test_bang_error_takes_its_line_from_the_context_line(self):
+        # Arrange
+        # Act
+        issue = _only(_parse(_SAMPLE_LOG), "missing_file")
+        # Assert
+        assert issue.line == 8
+
+    def test_file_line_error_format_gives_file_and_line(self):
+        # Arrange
+        # Act
+        issue = _only(_parse(_SAMPLE_LOG), "undefined_control_sequence")
+        # Assert
+        assert (issue.file, issue.line) == ("./contents/introduction.tex", 14)
+
+    def test_package_warning_continuation_lines_are_joined(self):
+        # Arrange
+        # Act
+        issue = _only(_parse(_SAMPLE_LOG), "package")
+        # Assert
+        assert issue.message.endswith("removing `math shift' on input line 5.")
+        assert issue.line == 5
+
+    def test_badbox_gets_category_and_line(self):
+        # Arrange
+        # Act
+        issue = _only(_parse(_SAMPLE_LOG), "badbox")
+        # Assert
+        assert (issue.type, issue.line) == ("warning", 9)
+
+    def test_lines_wrapped_at_79_columns_are_joined(self):
+        # Arrange
+        first = "LaTeX Warning: Citation `a_rather_long_citation_key_2020' on page 3 undefin"
+        first = first.ljust(79, "x")
+        text = f"{first}\ned on input line 42.\n"
+        # Act
+        (issue,) = _parse(text)
+        # Assert
+        assert issue.line == 42 and issue.message.endswith("ed on input line 42.")
+
+    def test_repeated_warnings_across_passes_are_reported_once(self):
+        # Arrange
+        warning = "LaTeX Warning: Reference `x' on page 1 undefined on input line 3."
+        # Act
+        issues = _parse("\n".join([warning, "", warning, "", warning]))
+        # Assert
+        assert len(issues) == 1
+
+
+class TestParseCompilationOutputWithLogFile:
+    """parse_compilation_output prefers an existing .log over the output."""
+
+    def test_existing_log_file_is_parsed_instead_of_output(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "manuscript.log"
+        log_file.write_text(_SAMPLE_LOG)
+        # Act
+        errors, warnings = parse_compilation_output("! Stale error", log_file)
+        # Assert
+        assert {e.category for e in errors} == {
+            "undefined_control_sequence",
+            "missing_file",
+        }
+
+    def test_badboxes_are_excluded_unless_requested(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "manuscript.log"
+        log_file.write_text(_SAMPLE_LOG)
+        # Act
+        _, default = parse_compilation_output("", log_file)
+        _, with_boxes = parse_compilation_output("", log_file, include_badboxes=True)
+        # Assert
+        assert len(with_boxes) == len(default) + 1
+
+    def test_issue_string_includes_location(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "manuscript.log"
+        log_file.write_text(_SAMPLE_LOG)
+        # Act
+        errors, _ = parse_compilation_output("", log_file)
+        # Assert
+        assert str(errors[0]) == (
+            "ERROR: ./contents/introduction.tex:14: Undefined control sequence."
+        )
+
+    def test_shell_and_bibliography_messages_in_output_are_kept(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "manuscript.log"
+        log_file.write_text(_SAMPLE_LOG)
+        output = "\n".join(
+            [
+                "\x1b[0;31mERRO: Figure conversion failed\x1b[0m",
+                'Warning--I didn\'t find a database entry for "smith2020"',
+                "ERROR - BibTeX subsystem: bibliography.bib, line 4, syntax error",
+                "/bin/sh: 1: latexmk: not found",
+            ]
+        )
+        # Act
+        errors, warnings = parse_compilation_output(output, log_file)
+        # Assert
+        assert [e.category for e in errors][-3:] == ["shell", "biber", "missing_tool"]
+        assert warnings[-1].category == "bibtex"
+
+    def test_messages_repeated_in_output_are_reported_once(self, tmp_path):
+        # Arrange
+        log_file = tmp_path / "manuscript.log"
+        log_file.write_text(_SAMPLE_LOG)
+        line = 'Warning--I didn\'t find a database entry for "smith2020"'
+        # Act
+        _, warnings = parse_compilation_output(f"{line}\n{line}", log_file)
+        # Assert
+        assert [w.category for w in warnings].count("bibtex") == 1
+
+
 if __name__ == "__main__":
     import os
 
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: src/scitex_writer/_utils/_project_index.py
+
+"""Tests for the persistent, incremental project index."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from scitex_writer._utils import _project_index
+from scitex_writer._utils._project_index import (
+    INDEX_REL,
+    ProjectIndex,
+    tokenize_bib,
+    tokenize_tex,
+)
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+
+
+def _write(root, rel, content):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    _write(
+        tmp_path,
+        "01_manuscript/contents/introduction.tex",
+        "\\section{Introduction}\n"
+        "Prior work \\citep{Smith2020, Doe2021}.\n"
+        "See Fig.~\\ref{fig:01_overview}.\n",
+    )
+    _write(
+        tmp_path,
+        "01_manuscript/contents/methods.tex",
+        "\\subsection{Data}\\label{sec:data}\nAs \\cite{Smith2020} did.\n",
+    )
+    _write(
+        tmp_path,
+        "01_manuscript/contents/figures/caption_and_media/01_overview.tex",
+        "\\caption{Overview}\n",
+    )
+    _write(tmp_path, "01_manuscript/contents/methods_v2.tex", "\\cite{Old}\n")
+    _write(
+        tmp_path,
+        "00_shared/bib_files/bibliography.bib",
+        "@article{Smith2020,\n  title={A}\n}\n\n@book{Doe2021,\n  title={B}\n}\n",
+    )
+    return tmp_path
+
+
+class TestTokenize:
+    """The checks' tokenization rules."""
+
+    def test_cite_keys_are_split_and_stripped(self):
+        # Arrange
+        text = "\\citep{A, B,}\n"
+        # Act
+        tokens = tokenize_tex(text)
+        # Assert
+        assert tokens == [("cite", "A", 1), ("cite", "B", 1)]
+
+    def test_commented_tokens_are_ignored(self):
+        # Arrange
+        text = "% \\label{gone}\nkeep \\label{kept} % \\ref{gone}\n"
+        # Act
+        tokens = tokenize_tex(text)
+        # Assert
+        assert tokens == [("label", "kept", 2)]
+
+    def test_bib_entries_carry_line_numbers(self):
+        # Arrange
+        text = "@article{A,\n}\n@book{B,\n}\n"
+        # Act
+        tokens = tokenize_bib(text)
+        # Assert
+        assert tokens == [("bibentry", "A", 1), ("bibentry", "B", 3)]
+
+    def test_matches_the_vendored_checks_tokenizer(self):
+        # Arrange
+        sys.path.insert(0, str(ROOT_DIR / "scripts" / "python"))
+        import _lint_model
+
+        text = (
+            "\\section{S}\\label{a} \\ref{b} \\citet{c, d}\n"
+            "\\vclaim[f]{ n } % \\label{x}\n\\subsection*{T}\\cite{e}\n"
+        )
+        scan = _lint_model._tokenize(text)
+        # Act
+        tokens = tokenize_tex(text)
+        # Assert
+        by_kind = {
+            attr: [(k, line) for kind, k, line in tokens if kind == name]
+            for name, attr in _lint_model._INDEX_KINDS.items()
+        }
+        assert by_kind == {a: getattr(scan, a) for a in by_kind}
+
+    def test_regexes_are_the_vendored_checks_regexes(self):
+        # Arrange
+        sys.path.insert(0, str(ROOT_DIR / "scripts" / "python"))
+        import _lint_model
+
+        ours_to_theirs = {
+            "_LABEL_RE": "LABEL_RE",
+            "_REF_RE": "REF_RE",
+            "_CITE_RE": "CITE_RE",
+            "_HEADING_RE": "HEADING_RE",
+            "_VCLAIM_RE": "VCLAIM_RE",
+            "_BIB_ENTRY_RE": "BIB_KEY_RE",
+            "_SKIP_SOURCE_RE": "_SKIP_SOURCE_RE",
+            "_PANEL_RE": "_PANEL_RE",
+        }
+        # Act
+        differing = [
+            ours
+            for ours, theirs in ours_to_theirs.items()
+            if getattr(_project_index, ours).pattern
+            != getattr(_lint_model, theirs).pattern
+        ]
+        # Assert
+        assert differing == []
+        assert _project_index.DOC_DIRS == _lint_model.DOC_DIRS
+
+
+class TestRefresh:
+    """Incremental updates of the SQLite index."""
+
+    def test_first_refresh_parses_every_source(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        # Act
+        stats = index.refresh()
+        # Assert
+        assert (stats["files"], stats["parsed"]) == (4, 4)
+
+    def test_index_lives_under_runtime_dir(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        # Act
+        index.refresh()
+        # Assert
+        assert (project / INDEX_REL).is_file()
+
+    def test_unchanged_sources_are_not_reparsed(self, project):
+        # Arrange
+        ProjectIndex(project).refresh()
+        # Act
+        stats = ProjectIndex(project).refresh()
+        # Assert
+        assert (stats["parsed"], stats["touched"]) == (0, 0)
+
+    def test_only_the_edited_file_is_reparsed(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        index.refresh()
+        _write(
+            project,
+            "01_manuscript/contents/methods.tex",
+            "\\subsection{Data}\\label{sec:data}\nAs \\cite{Doe2021} did.\n",
+        )
+        # Act
+        stats = index.refresh()
+        # Assert
+        assert stats["parsed"] == 1 and index.who_cites("Doe2021")[-1]["path"] == (
+            "01_manuscript/contents/methods.tex"
+        )
+
+    def test_touch_without_content_change_keeps_tokens(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        index.refresh()
+        methods = project / "01_manuscript/contents/methods.tex"
+        st = methods.stat()
+        os.utime(methods, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        # Act
+        stats = index.refresh()
+        # Assert
+        assert (stats["parsed"], stats["touched"]) == (0, 1)
+
+    def test_deleted_file_drops_out(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        index.refresh()
+        (project / "01_manuscript/contents/methods.tex").unlink()
+        # Act
+        stats = index.refresh()
+        # Assert
+        assert stats["removed"] == 1 and index.where_label("sec:data") == []
+
+
+class TestQueries:
+    """Lookups answered from the index."""
+
+    def test_who_cites_lists_every_site(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        index.refresh()
+        # Act
+        hits = index.who_cites("Smith2020")
+        # Assert
+        assert [(h["path"].rsplit("/", 1)[-1], h["line"]) for h in hits] == [
+            ("introduction.tex", 2),
+            ("methods.tex", 2),
+        ]
+
+    def test_where_label_includes_caption_derived_floats(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        index.refresh()
+        # Act
+        hits = index.where_label("fig:01_overview")
+        # Assert
+        assert hits[0]["path"].endswith("caption_and_media/01_overview.tex")
+
+    def test_archived_versions_are_not_indexed(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        index.refresh()
+        # Act
+        hits = index.who_cites("Old")
+        # Assert
+        assert hits == []
+
+    def test_keys_counts_by_document(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        index.refresh()
+        # Act
+        cited = index.keys("cite", doc_type="manuscript")
+        # Assert
+        assert cited == {"Smith2020": 2, "Doe2021": 1}
+
+    def test_unknown_kind_raises(self, project):
+        # Arrange
+        index = ProjectIndex(project)
+        # Act / Assert
+        with pytest.raises(ValueError):
+            index.find("footnote")
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__), "-v"])
+
+# EOF
@@ -1,253 +1,539 @@
 #!/usr/bin/env python3
 """Tests for scitex_writer._utils._watch."""
 
+import os
 import subprocess
 
-from scitex_writer._utils._watch import watch_manuscript
+import pytest
 
+from scitex_writer._utils._watch import (
+    PollingSource,
+    RebuildPlan,
+    WatchdogSource,
+    classify_path,
+    collect_changes,
+    plan_rebuild,
+    watch_manuscript,
+)
 
-class _FakeStdout:
-    """Real iterable stdout stand-in driven by a fixed list of lines."""
 
-    def __init__(self, lines):
-        self._lines = list(lines)
+class _ScriptedSource:
+    """Change source replaying a fixed sequence of ``get()`` results.
 
-    def readline(self):
-        # iter(readline, "") stops at the first "" -> append "" to end.
-        return self._lines.pop(0) if self._lines else ""
+    Injected via the watch_manuscript ``source=`` seam; an exhausted script
+    returns nothing, which (with a short ``timeout``) ends the watch loop.
+    """
 
+    def __init__(self, batches):
+        self._batches = list(batches)
+        self.started = False
+        self.stopped = False
 
-class _FakeProcess:
-    """Hand-rolled stand-in for the subprocess.Popen object.
+    def start(self):
+        self.started = True
 
-    Records terminate/kill/wait calls so tests can assert on them, and
-    streams a fixed set of stdout lines. ``readline_raises`` lets a test
-    drive the KeyboardInterrupt / generic-exception code paths.
-    """
+    def get(self, timeout):
+        return self._batches.pop(0) if self._batches else []
 
-    def __init__(self, lines=None, readline_raises=None):
-        if readline_raises is not None:
-            self.stdout = _RaisingStdout(readline_raises)
-        else:
-            self.stdout = _FakeStdout((lines or []) + [""])
-        self.wait_calls = []
-        self.terminate_count = 0
-        self.kill_count = 0
+    def stop(self):
+        self.stopped = True
 
-    def wait(self, timeout=None):
-        self.wait_calls.append(timeout)
 
-    def terminate(self):
-        self.terminate_count += 1
+class _RecordingCompile:
+    """Build runner recording the skip_stages of every call."""
 
-    def kill(self):
-        self.kill_count += 1
+    def __init__(self, results=None):
+        self._results = list(results or [])
+        self.skipped = []
 
+    def __call__(self, project_dir, doc_type, skip_stages, log_callback):
+        self.skipped.append(tuple(skip_stages))
+        log_callback("\x1b[0;34m▸\x1b[0m \x1b[1mPDF Generation\x1b[0m")
+        return self._results.pop(0) if self._results else {"success": True}
 
-class _RaisingStdout:
-    def __init__(self, exc):
-        self._exc = exc
 
-    def readline(self):
-        raise self._exc
+def _project(tmp_path):
+    for rel in (
+        "01_manuscript/contents/figures/caption_and_media",
+        "01_manuscript/contents/tables/caption_and_media",
+        "00_shared/bib_files",
+        "config",
+    ):
+        (tmp_path / rel).mkdir(parents=True)
+    return tmp_path
 
 
-class _RecordingPopen:
-    """Real callable matching subprocess.Popen's call shape.
+def _write(path, text="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
 
-    Records the positional command and keyword settings, and returns a
-    pre-seeded _FakeProcess. Injected via the watch_manuscript ``popen=``
-    seam — no patching of subprocess.Popen.
-    """
 
-    def __init__(self, process):
-        self._process = process
-        self.calls = []
+class TestClassifyPath:
+    """Tests for classify_path."""
 
-    def __call__(self, cmd, **kwargs):
-        self.calls.append((cmd, kwargs))
-        return self._process
+    def test_section_tex_is_section(self, tmp_path):
+        # Arrange
+        path = tmp_path / "01_manuscript/contents/introduction.tex"
+        # Act / Assert
+        assert classify_path(path, tmp_path) == "section"
+
+    def test_bib_file_is_bib(self, tmp_path):
+        # Arrange
+        path = tmp_path / "00_shared/bib_files/extra.bib"
+        # Act / Assert
+        assert classify_path(path, tmp_path) == "bib"
 
+    def test_figure_source_is_figure(self, tmp_path):
+        # Arrange
+        path = tmp_path / "01_manuscript/contents/figures/caption_and_media/01_a.png"
+        # Act / Assert
+        assert classify_path(path, tmp_path) == "figure"
 
-def _make_compile_script(tmp_path):
-    compile_script = tmp_path / "compile"
-    compile_script.write_text("#!/bin/bash\necho 'compiling'")
-    return compile_script
+    def test_table_csv_is_table(self, tmp_path):
+        # Arrange
+        path = tmp_path / "01_manuscript/contents/tables/caption_and_media/01_t.csv"
+        # Act / Assert
+        assert classify_path(path, tmp_path) == "table"
 
+    def test_config_yaml_is_style(self, tmp_path):
+        # Arrange
+        path = tmp_path / "config/config_manuscript.yaml"
+        # Act / Assert
+        assert classify_path(path, tmp_path) == "style"
 
-class TestWatchManuscriptCompileScript:
-    """Tests for watch_manuscript compile script handling."""
+    def test_latex_styles_tex_is_style(self, tmp_path):
+        # Arrange
+        path = tmp_path / "00_shared/latex_styles/packages.tex"
+        # Act / Assert
+        assert classify_path(path, tmp_path) == "style"
 
-    def test_does_not_launch_process_when_compile_script_missing(self, tmp_path):
+    def test_build_outputs_are_ignored(self, tmp_path):
         # Arrange
-        popen = _RecordingPopen(_FakeProcess())
+        outputs = [
+            "01_manuscript/manuscript.tex",
+            "01_manuscript/logs/manuscript.log",
+            "01_manuscript/contents/figures/compiled/01_a.tex",
+            "01_manuscript/contents/wordcount.tex",
+            "00_shared/claims_rendered.tex",
+        ]
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        categories = {classify_path(tmp_path / rel, tmp_path) for rel in outputs}
         # Assert
-        assert popen.calls == []
+        assert categories == {None}
 
-    def test_builds_watch_command_from_compile_script(self, tmp_path):
+    def test_editor_temp_files_are_ignored(self, tmp_path):
         # Arrange
-        compile_script = _make_compile_script(tmp_path)
-        popen = _RecordingPopen(_FakeProcess())
+        names = [".introduction.tex.swp", "introduction.tex~", "#intro.tex#"]
+        contents = tmp_path / "01_manuscript/contents"
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        categories = {classify_path(contents / n, tmp_path) for n in names}
         # Assert
-        assert popen.calls[0][0] == [str(compile_script), "-m", "-w"]
+        assert categories == {None}
 
+    def test_other_document_is_ignored(self, tmp_path):
+        # Arrange
+        path = tmp_path / "02_supplementary/contents/methods.tex"
+        # Act / Assert
+        assert classify_path(path, tmp_path, "manuscript") is None
 
-class TestWatchManuscriptProcess:
-    """Tests for watch_manuscript process handling."""
+    def test_converted_jpg_with_source_is_ignored(self, tmp_path):
+        # Arrange
+        media = tmp_path / "01_manuscript/contents/figures/caption_and_media"
+        _write(media / "01_a.png")
+        jpg = _write(media / "01_a.jpg")
+        # Act / Assert
+        assert classify_path(jpg, tmp_path) is None
 
-    def test_runs_process_in_project_dir(self, tmp_path):
+    def test_path_outside_project_is_ignored(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        popen = _RecordingPopen(_FakeProcess())
+        path = tmp_path.parent / "elsewhere.tex"
+        # Act / Assert
+        assert classify_path(path, tmp_path) is None
+
+
+class TestPlanRebuild:
+    """Tests for plan_rebuild."""
+
+    def test_section_edit_skips_bib_figures_and_tables(self, tmp_path):
+        # Arrange
+        paths = [tmp_path / "01_manuscript/contents/methods.tex"]
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        plan = plan_rebuild(paths, tmp_path)
         # Assert
-        assert popen.calls[0][1]["cwd"] == tmp_path
+        assert plan.skipped == ("bib", "figures", "tables")
 
-    def test_runs_process_capturing_stdout_pipe(self, tmp_path):
+    def test_section_edit_runs_structure_and_engine(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        popen = _RecordingPopen(_FakeProcess())
+        paths = [tmp_path / "01_manuscript/contents/methods.tex"]
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        plan = plan_rebuild(paths, tmp_path)
         # Assert
-        assert popen.calls[0][1]["stdout"] == subprocess.PIPE
+        assert plan.stages == ("structure", "engine")
 
-    def test_runs_process_merging_stderr_into_stdout(self, tmp_path):
+    def test_bib_edit_reruns_bib_only(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        popen = _RecordingPopen(_FakeProcess())
+        paths = [tmp_path / "00_shared/bib_files/extra.bib"]
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        plan = plan_rebuild(paths, tmp_path)
         # Assert
-        assert popen.calls[0][1]["stderr"] == subprocess.STDOUT
+        assert plan.skipped == ("figures", "tables")
 
-    def test_runs_process_in_text_mode(self, tmp_path):
+    def test_mixed_changes_union_their_stages(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        popen = _RecordingPopen(_FakeProcess())
+        media = "01_manuscript/contents/figures/caption_and_media"
+        paths = [
+            tmp_path / f"{media}/01_a.png",
+            tmp_path / "01_manuscript/contents/tables/caption_and_media/01_t.csv",
+        ]
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        plan = plan_rebuild(paths, tmp_path)
         # Assert
-        assert popen.calls[0][1]["text"] is True
+        assert plan.skipped == ("bib",)
 
-    def test_runs_process_line_buffered(self, tmp_path):
+    def test_changes_are_grouped_by_category(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        popen = _RecordingPopen(_FakeProcess())
+        path = tmp_path / "01_manuscript/contents/methods.tex"
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        plan = plan_rebuild([path], tmp_path)
         # Assert
-        assert popen.calls[0][1]["bufsize"] == 1
+        assert plan.changes == {"section": [str(path)]}
 
-    def test_waits_for_process_with_supplied_timeout(self, tmp_path):
+    def test_ignored_paths_yield_empty_plan(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess()
-        popen = _RecordingPopen(process)
+        paths = [tmp_path / "01_manuscript/logs/manuscript.log"]
         # Act
-        watch_manuscript(tmp_path, timeout=30, popen=popen)
+        plan = plan_rebuild(paths, tmp_path)
         # Assert
-        assert process.wait_calls == [30]
+        assert not plan
+
+    def test_extra_stages_are_kept(self, tmp_path):
+        # Arrange
+        paths = [tmp_path / "01_manuscript/contents/methods.tex"]
+        # Act
+        plan = plan_rebuild(paths, tmp_path, extra_stages=("figures",))
+        # Assert
+        assert plan.skipped == ("bib", "tables")
 
 
-class TestWatchManuscriptCallback:
-    """Tests for watch_manuscript callback handling."""
+class TestCollectChanges:
+    """Tests for collect_changes debouncing."""
 
-    def test_callback_fires_once_on_compilation_line(self, tmp_path):
+    def test_burst_is_merged_into_one_batch(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess(["Starting...\n", "Compilation complete\n"])
-        popen = _RecordingPopen(process)
-        calls = []
+        a, b, c = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+        source = _ScriptedSource([[a], [b], [c, a], []])
         # Act
-        watch_manuscript(tmp_path, on_compile=lambda: calls.append(1), popen=popen)
+        changes = collect_changes(source, debounce=0.01, timeout=1)
         # Assert
-        assert calls == [1]
+        assert changes == {a, b, c}
 
-    def test_callback_not_fired_without_compilation_line(self, tmp_path):
+    def test_quiet_source_returns_empty(self):
+        # Arrange
+        source = _ScriptedSource([])
+        # Act
+        changes = collect_changes(source, debounce=0.01, timeout=0)
+        # Assert
+        assert changes == set()
+
+
+class TestPollingSource:
+    """Tests for PollingSource."""
+
+    def test_reports_modified_file(self, tmp_path):
+        # Arrange
+        path = _write(tmp_path / "a.tex", "one")
+        source = PollingSource([tmp_path], interval=0)
+        source.start()
+        _write(path, "two, longer")
+        os.utime(path, ns=(1, 1))
+        # Act
+        changed = source.get(0)
+        # Assert
+        assert changed == [path]
+
+    def test_reports_created_and_deleted_files(self, tmp_path):
+        # Arrange
+        old = _write(tmp_path / "old.tex")
+        source = PollingSource([tmp_path], interval=0)
+        source.start()
+        old.unlink()
+        new = _write(tmp_path / "new.tex")
+        # Act
+        changed = source.get(0)
+        # Assert
+        assert sorted(changed) == sorted([new, old])
+
+    def test_skips_ignored_directories(self, tmp_path):
+        # Arrange
+        source = PollingSource([tmp_path], interval=0)
+        source.start()
+        _write(tmp_path / "logs" / "manuscript.log")
+        # Act
+        changed = source.get(0)
+        # Assert
+        assert changed == []
+
+
+class TestWatchManuscript:
+    """Tests for watch_manuscript."""
+
+    def test_missing_compile_script_does_not_start_source(self, tmp_path):
+        # Arrange
+        source = _ScriptedSource([])
+        # Act
+        watch_manuscript(tmp_path, timeout=0, source=source)
+        # Assert
+        assert source.started is False
+
+    def test_initial_build_skips_nothing(self, tmp_path):
+        # Arrange
+        compile_fn = _RecordingCompile()
+        # Act
+        watch_manuscript(
+            tmp_path, timeout=0, source=_ScriptedSource([]), compile_fn=compile_fn
+        )
+        # Assert
+        assert compile_fn.skipped == [()]
+
+    def test_section_edit_rebuilds_without_bib_figures_tables(self, tmp_path):
+        # Arrange
+        project = _project(tmp_path)
+        section = _write(project / "01_manuscript/contents/methods.tex")
+        compile_fn = _RecordingCompile()
+        # Act
+        watch_manuscript(
+            project,
+            timeout=0.2,
+            debounce=0,
+            initial_build=False,
+            source=_ScriptedSource([[section]]),
+            compile_fn=compile_fn,
+        )
+        # Assert
+        assert compile_fn.skipped == [("bib", "figures", "tables")]
+
+    def test_ignored_change_triggers_no_build(self, tmp_path):
+        # Arrange
+        project = _project(tmp_path)
+        log = _write(project / "01_manuscript/logs/manuscript.log")
+        compile_fn = _RecordingCompile()
+        # Act
+        watch_manuscript(
+            project,
+            timeout=0.2,
+            debounce=0,
+            initial_build=False,
+            source=_ScriptedSource([[log]]),
+            compile_fn=compile_fn,
+        )
+        # Assert
+        assert compile_fn.skipped == []
+
+    def test_unchanged_content_triggers_no_second_build(self, tmp_path):
+        # Arrange
+        project = _project(tmp_path)
+        section = _write(project / "01_manuscript/contents/methods.tex")
+        compile_fn = _RecordingCompile()
+        # Act
+        watch_manuscript(
+            project,
+            timeout=0.2,
+            debounce=0,
+            initial_build=False,
+            source=_ScriptedSource([[section], [], [section]]),
+            compile_fn=compile_fn,
+        )
+        # Assert
+        assert len(compile_fn.skipped) == 1
+
+    def test_failed_stages_rerun_on_next_build(self, tmp_path):
+        # Arrange
+        project = _project(tmp_path)
+        figure = _write(
+            project / "01_manuscript/contents/figures/caption_and_media/01_a.png"
+        )
+        section = _write(project / "01_manuscript/contents/methods.tex")
+        compile_fn = _RecordingCompile([{"success": False}, {"success": True}])
+        # Act
+        watch_manuscript(
+            project,
+            timeout=0.2,
+            debounce=0,
+            initial_build=False,
+            source=_ScriptedSource([[figure], [], [section]]),
+            compile_fn=compile_fn,
+        )
+        # Assert
+        assert compile_fn.skipped[1] == ("bib", "tables")
+
+    def test_callback_receives_structured_events(self, tmp_path):
+        # Arrange
+        project = _project(tmp_path)
+        section = _write(project / "01_manuscript/contents/methods.tex")
+        events = []
+        # Act
+        watch_manuscript(
+            project,
+            timeout=0.2,
+            debounce=0,
+            initial_build=False,
+            on_compile=events.append,
+            source=_ScriptedSource([[section]]),
+            compile_fn=_RecordingCompile(),
+        )
+        # Assert
+        assert [e.type for e in events if e.type != "log"] == [
+            "changes",
+            "build_start",
+            "stage_start",
+            "build_end",
+        ]
+
+    def test_build_end_event_reports_stages(self, tmp_path):
+        # Arrange
+        events = []
+        # Act
+        watch_manuscript(
+            tmp_path,
+            timeout=0,
+            on_compile=events.append,
+            source=_ScriptedSource([]),
+            compile_fn=_RecordingCompile(),
+        )
+        # Assert
+        end = [e for e in events if e.type == "build_end"][0]
+        assert (end.data["success"], end.data["skipped"]) == (True, [])
+
+    def test_zero_argument_callback_fires_once_per_build(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess(["Starting...\n", "Processing files...\n"])
-        popen = _RecordingPopen(process)
         calls = []
         # Act
-        watch_manuscript(tmp_path, on_compile=lambda: calls.append(1), popen=popen)
+        watch_manuscript(
+            tmp_path,
+            timeout=0,
+            on_compile=lambda: calls.append(1),
+            source=_ScriptedSource([]),
+            compile_fn=_RecordingCompile(),
+        )
         # Assert
-        assert calls == []
+        assert calls == [1]
 
     def test_callback_exception_does_not_propagate(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess(["Compilation complete\n"])
-        popen = _RecordingPopen(process)
+        source = _ScriptedSource([])
 
-        def _boom():
+        def _boom(event):
             raise RuntimeError("Callback failed")
 
-        completed = False
         # Act
-        watch_manuscript(tmp_path, on_compile=_boom, popen=popen)
-        completed = True
+        watch_manuscript(
+            tmp_path,
+            timeout=0,
+            on_compile=_boom,
+            source=source,
+            compile_fn=_RecordingCompile(),
+        )
         # Assert
-        assert completed is True
+        assert source.stopped is True
 
+    def test_compile_exception_is_reported_as_failed_build(self, tmp_path):
+        # Arrange
+        events = []
 
-class TestWatchManuscriptExceptions:
-    """Tests for watch_manuscript exception handling."""
+        def _raising(*args):
+            raise OSError("bash not found")
 
-    def test_keyboard_interrupt_terminates_process(self, tmp_path):
-        # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess(readline_raises=KeyboardInterrupt())
-        popen = _RecordingPopen(process)
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        watch_manuscript(
+            tmp_path,
+            timeout=0,
+            on_compile=events.append,
+            source=_ScriptedSource([]),
+            compile_fn=_raising,
+        )
         # Assert
-        assert process.terminate_count == 1
+        end = [e for e in events if e.type == "build_end"][0]
+        assert end.data["error"] == "bash not found"
 
-    def test_generic_exception_terminates_process(self, tmp_path):
+    def test_keyboard_interrupt_stops_source(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess(readline_raises=RuntimeError("Connection lost"))
-        popen = _RecordingPopen(process)
+        source = _ScriptedSource([])
+
+        def _interrupt(*args):
+            raise KeyboardInterrupt
+
+        source.get = _interrupt
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        watch_manuscript(
+            tmp_path,
+            initial_build=False,
+            source=source,
+            compile_fn=_RecordingCompile(),
+        )
         # Assert
-        assert process.terminate_count == 1
+        assert source.stopped is True
 
 
-class TestWatchManuscriptParameters:
-    """Tests for watch_manuscript parameter defaults."""
+class TestDeprecatedPopen:
+    """The deprecated popen= launcher still runs compile.sh for each build."""
 
-    def test_runs_with_default_parameters(self, tmp_path):
+    def test_popen_launcher_runs_compile_script(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess()
-        popen = _RecordingPopen(process)
+        _write(tmp_path / "compile.sh", 'echo "built $1"\n')
+        calls, lines = [], []
+
+        def popen(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.Popen(cmd, **kwargs)
+
+        def on_compile(event):
+            if event.type == "log":
+                lines.append(event.data.get("line"))
+
         # Act
-        watch_manuscript(tmp_path, popen=popen)
+        with pytest.warns(DeprecationWarning):
+            watch_manuscript(
+                tmp_path,
+                timeout=0,
+                on_compile=on_compile,
+                source=_ScriptedSource([]),
+                popen=popen,
+            )
         # Assert
-        assert len(popen.calls) == 1
+        assert calls[0][1:] == [str(tmp_path / "compile.sh"), "manuscript", "--no_diff"]
+        assert "built manuscript" in lines
 
-    def test_default_timeout_is_none(self, tmp_path):
+
+class TestWatchdogSource:
+    """Tests for the native-notification change source."""
+
+    def test_reports_a_written_file(self, tmp_path):
         # Arrange
-        _make_compile_script(tmp_path)
-        process = _FakeProcess()
-        popen = _RecordingPopen(process)
-        # Act
-        watch_manuscript(tmp_path, popen=popen)
+        pytest.importorskip("watchdog")
+        source = WatchdogSource([tmp_path])
+        source.start()
+        try:
+            path = _write(tmp_path / "a.tex")
+            # Act
+            changed = source.get(5)
+        finally:
+            source.stop()
         # Assert
-        assert process.wait_calls == [None]
+        assert path in changed
 
 
-if __name__ == "__main__":
-    import os
+class TestRebuildPlan:
+    """Tests for RebuildPlan."""
+
+    def test_full_plan_skips_nothing(self):
+        # Arrange
+        plan = RebuildPlan({}, ("bib", "figures", "tables", "structure", "engine"))
+        # Act / Assert
+        assert plan.skipped == ()
 
+
+if __name__ == "__main__":
     import pytest
 
     pytest.main([os.path.abspath(__file__)])
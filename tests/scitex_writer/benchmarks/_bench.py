@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/_bench.py
+
+"""Shared harness of the ``bench_*.py`` scripts in this directory.
+
+The scripts are not collected by pytest (``python_files`` is ``test_*.py``).
+Each builds its synthetic input in a temporary directory; run one from the
+repository root, e.g.::
+
+    PYTHONPATH=src python tests/scitex_writer/benchmarks/bench_execute.py --help
+
+Every measured step goes through :func:`timed`, which prints one aligned line
+per step.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+SCRIPTS_DIR = ROOT_DIR / "scripts" / "python"
+
+LABEL_WIDTH = 18
+
+
+class Timing(NamedTuple):
+    """One measured call: its return value, wall and CPU seconds, peak bytes."""
+
+    result: object
+    wall: float
+    cpu: float
+    peak: Optional[int] = None
+
+
+def parser(doc: str) -> argparse.ArgumentParser:
+    """An argument parser described by the first line of a script's docstring."""
+    return argparse.ArgumentParser(description=doc.splitlines()[0])
+
+
+def measure(run: Callable[[], object], trace_memory: bool = False) -> Timing:
+    """Time ``run()``; with ``trace_memory``, also its ``tracemalloc`` peak.
+
+    The peak comes from a second run: tracing slows a run severalfold, so the
+    timed run is never the traced one.
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = run()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            run()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return Timing(result, wall, cpu, peak)
+
+
+def timed(
+    label: str,
+    run: Callable[[], object],
+    detail: Optional[Callable[[Timing], str]] = None,
+    trace_memory: bool = False,
+) -> Timing:
+    """Measure ``run()`` and print ``label``, its wall time and ``detail``."""
+    timing = measure(run, trace_memory=trace_memory)
+    line = f"{label:<{LABEL_WIDTH}} {timing.wall:7.3f}s"
+    if timing.peak is not None:
+        line += f"  {timing.peak / 1e6:7.1f} MB peak"
+    if detail is not None:
+        line += f"  {detail(timing)}"
+    print(line)
+    return timing
+
+
+# EOF
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_bib_api.py
+
+"""Benchmark the sw.bib calls an agent makes in a loop.
+
+Creates a project whose ``00_shared/bib_files/bibliography.bib`` holds
+``--entries`` entries, then times ``--refs`` single ``sw.bib.add`` calls (each
+checks for a duplicate key first), as many ``sw.bib.get`` lookups and one
+``list_files``, followed by the batch ``add_many`` / ``remove_many`` of the
+same references. Also reports how many times the index read a file from disk.
+"""
+
+import tempfile
+from pathlib import Path
+
+from _bench import parser, timed
+
+from scitex_writer import bib
+from scitex_writer._utils._bib_index import get_bib_index
+
+
+def _entry(key: str, i: int) -> str:
+    return (
+        f"@article{{{key},\n"
+        f"  author = {{Smith, J. and Doe, {i}}},\n"
+        f"  title = {{The {{DNA}} of item {i}}},\n"
+        f"  year = {{{1990 + i % 35}}},\n"
+        f"  doi = {{10.1000/synthetic.{i}}},\n"
+        f"}}"
+    )
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--entries", type=int, default=5_000)
+    cli.add_argument("--refs", type=int, default=200)
+    args = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = str(tmp)
+        bib_dir = Path(tmp) / "00_shared" / "bib_files"
+        bib_dir.mkdir(parents=True)
+        (bib_dir / "bibliography.bib").write_text(
+            "\n\n".join(_entry(f"Lib{i}", i) for i in range(args.entries)) + "\n",
+            encoding="utf-8",
+        )
+        print(f"{args.entries} library entries, {args.refs} references")
+        refs = [_entry(f"Ref{i}", i) for i in range(args.refs)]
+        keys = [f"Ref{i}" for i in range(args.refs)]
+
+        def add_each():
+            for text in refs:
+                assert bib.add(project, text)["success"]
+
+        def get_each():
+            for key in keys:
+                assert bib.get(project, key)["success"]
+
+        timed(f"{args.refs} x add", add_each)
+        timed(f"{args.refs} x get", get_each)
+        timed("list_files", lambda: bib.list_files(project))
+        timed("remove_many", lambda: bib.remove_many(project, keys))
+        timed("add_many", lambda: bib.add_many(project, refs))
+        print(f"files read from disk: {get_bib_index(bib_dir).reads}")
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
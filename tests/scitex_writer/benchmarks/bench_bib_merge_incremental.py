@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_bib_merge_incremental.py
+
+"""Benchmark the incremental bibliography merge after a stub-sidecar change.
+
+Lays out a bib_files/ directory the way a scholar-managed project has it: a
+consumer-owned ``bibliography.bib`` of ``--entries`` entries, a topical
+``related_work.bib`` and a ``_stubs_pending_scholar.bib`` sidecar of
+``--stubs`` entries, half of them stubs of references the library already
+has. The compile path's merge (``--include-output``) runs once to warm the
+per-file entry cache; then the sidecar is rewritten and merged again, as after
+a scholar run. Reports that incremental merge against a from-scratch one
+(``force=True``) and whether the two outputs are byte-identical.
+"""
+
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from _bench import SCRIPTS_DIR, parser, timed
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from merge_bibliographies import merge_bibtex_files  # noqa: E402
+
+
+def _entry(key: str, i: int, rng: random.Random) -> str:
+    return (
+        f"@article{{{key},\n"
+        f"  author = {{Smith, J. and Doe, {i}}},\n"
+        f"  title = {{The {{DNA}} of item {i}}},\n"
+        f"  journal = {{Journal {rng.randint(1, 50)}}},\n"
+        f"  year = {{{1990 + i % 35}}},\n"
+        f"  doi = {{10.1000/synthetic.{i}}},\n"
+        f"}}\n\n"
+    )
+
+
+def _stub(key: str, i: int) -> str:
+    return (
+        f"@article{{{key},\n"
+        f"  title = {{The {{DNA}} of item {i}}},\n"
+        f"  journal = {{Pending scitex-scholar metadata lookup}},\n"
+        f"  note = {{Auto-generated stub}},\n"
+        f"  year = {{{1990 + i % 35}}},\n"
+        f"}}\n\n"
+    )
+
+
+def _write_stubs(path: Path, stubs: int, entries: int, seed: int) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for n in range(stubs):
+            if n % 2:
+                i = rng.randrange(entries)  # a reference the library already has
+                f.write(_stub(f"Author{i}", i))
+            else:
+                f.write(_stub(f"Pending{seed}_{n}", entries + n))
+
+
+def _layout(bib_dir: Path, entries: int, stubs: int) -> None:
+    rng = random.Random(0)
+    bib_dir.mkdir()
+    with open(bib_dir / "bibliography.bib", "w", encoding="utf-8") as f:
+        for i in range(entries):
+            f.write(_entry(f"Author{i}", i, rng))
+    with open(bib_dir / "related_work.bib", "w", encoding="utf-8") as f:
+        for i in range(0, entries, 10):
+            f.write(_entry(f"Related{i}", i, rng))
+    _write_stubs(bib_dir / "_stubs_pending_scholar.bib", stubs, entries, seed=1)
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--entries", type=int, default=20_000)
+    cli.add_argument("--stubs", type=int, default=40)
+    args = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        incremental_dir = Path(tmp) / "incremental"
+        _layout(incremental_dir, args.entries, args.stubs)
+        full_dir = Path(tmp) / "full"
+        shutil.copytree(incremental_dir, full_dir)
+        print(f"{args.entries} library entries, {args.stubs} stub-sidecar entries")
+
+        def merge(bib_dir: Path, force: bool = False):
+            return lambda: merge_bibtex_files(
+                bib_dir, verbose=False, force=force, include_output=True
+            )
+
+        timed("cold", merge(incremental_dir))
+        merge(full_dir)()
+        for bib_dir in (incremental_dir, full_dir):
+            _write_stubs(
+                bib_dir / "_stubs_pending_scholar.bib", args.stubs, args.entries, 2
+            )
+        timed("incremental", merge(incremental_dir))
+        timed("full", merge(full_dir, force=True))
+
+        same = (incremental_dir / "bibliography.bib").read_bytes() == (
+            full_dir / "bibliography.bib"
+        ).read_bytes()
+        print(f"byte-identical output: {same}")
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
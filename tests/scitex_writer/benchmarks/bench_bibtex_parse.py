@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_bibtex_parse.py
+
+"""Benchmark the merge's BibTeX tokenizer against bibtexparser v1.
+
+Writes a synthetic shared bibliography of ``--entries`` entries (with
+``@string`` macros, ``#`` concatenation, quoted and nested-brace values,
+multi-line fields and comments), then parses and writes it the way
+``merge_bibliographies.py`` does: with ``_bibtex.py`` and, when it is
+installed, with ``bibtexparser`` (``BibTexParser(common_strings=True)`` +
+``BibTexWriter``). Reports throughput for each and whether the two outputs are
+byte-identical.
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+from _bench import SCRIPTS_DIR, parser, timed
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from _bibtex import parse_file, write_entries  # noqa: E402
+
+_JOURNALS = ("nat", "neuron", 'nat # " Neuroscience"', "{J. Neurosci.}")
+
+
+def _write_bib(path: Path, entries: int) -> None:
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("% Synthetic shared bibliography\n")
+        f.write('@string{nat = {Nature}}\n@string{neuron = "Neuron"}\n\n')
+        for i in range(entries):
+            if i % 500 == 0:
+                f.write(f"@comment{{section {i // 500}}}\n\n")
+            f.write(
+                f"@article{{Author{i}_{rng.randint(1990, 2025)},\n"
+                f'  author = {{Smith, J. and M{{\\"u}}ller, A. and Doe, {i}}},\n'
+                f'  title = "The {{DNA}} of item {i}: a {{Nested {{deep}}}} study",\n'
+                f"  journal = {rng.choice(_JOURNALS)},\n"
+                f"  year = {rng.randint(1990, 2025)},\n"
+                f"  month = {rng.choice(('jan', 'jun', '{Sep}'))},\n"
+                f"  volume = {{{rng.randint(1, 99)}}},\n"
+                f"  pages = {{{i}--{i + 9}}},\n"
+                f"  doi = {{10.1000/synthetic.{i}}},\n"
+                f"  abstract = {{First line of the abstract\n"
+                f"              and a second line, 50\\% longer}},\n"
+                f"}}\n\n"
+            )
+
+
+def _bibtexparser_path(path: Path) -> str:
+    import bibtexparser
+    from bibtexparser.bibdatabase import BibDatabase
+    from bibtexparser.bwriter import BibTexWriter
+
+    with open(path, "r", encoding="utf-8") as f:
+        bib_parser = bibtexparser.bparser.BibTexParser(
+            common_strings=True, ignore_nonstandard_types=False
+        )
+        entries = bibtexparser.load(f, parser=bib_parser).entries
+    output_db = BibDatabase()
+    output_db.entries = entries
+    writer = BibTexWriter()
+    writer.indent = "  "
+    writer.order_entries_by = "ID"
+    return writer.write(output_db)
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--entries", type=int, default=20_000)
+    args = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "shared.bib"
+        _write_bib(path, args.entries)
+        print(f"{args.entries} entries, {path.stat().st_size / 1e6:.1f} MB .bib")
+
+        def throughput(t):
+            return f"{args.entries / t.wall:10.0f} entries/s"
+
+        native = timed(
+            "_bibtex",
+            lambda: write_entries(parse_file(path), indent="  "),
+            throughput,
+        )
+        try:
+            import bibtexparser  # noqa: F401
+        except ImportError:
+            print("bibtexparser    not installed; skipped")
+            return
+        reference = timed("bibtexparser", lambda: _bibtexparser_path(path), throughput)
+        print(f"byte-identical output: {native.result == reference.result}")
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_claims_metadata.py
+
+"""Benchmark claim verification for the claims-metadata endpoint.
+
+Writes ``--claims`` claim outputs of ``--mb`` MB each and verifies them with a
+stand-in for Clew that re-hashes the output, as ``verify_chain`` does, plus
+``--latency`` seconds of I/O wait per call. Times the old serial loop, a cold
+``ClaimVerificationCache`` (every claim a miss, verified on the thread pool)
+and a warm one (every claim served from the cache).
+"""
+
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+from _bench import parser, timed
+
+from scitex_writer._django.handlers._claim_verification import (
+    ClaimVerificationCache,
+)
+
+
+def _verifier(root: Path, latency: float):
+    def verify(claim: dict) -> dict:
+        digest = hashlib.sha256((root / claim["output_file"]).read_bytes())
+        time.sleep(latency)
+        return {"state": "VERIFIED", "sha256": digest.hexdigest()}
+
+    return verify
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--claims", type=int, default=50)
+    cli.add_argument("--mb", type=float, default=2.0)
+    cli.add_argument("--latency", type=float, default=0.02)
+    args = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        claims = []
+        for i in range(args.claims):
+            name = f"data/claim_{i}.json"
+            (root / "data").mkdir(exist_ok=True)
+            (root / name).write_bytes(bytes([i % 256]) * int(args.mb * 1e6))
+            claims.append({"claim_id": f"claim_{i}", "output_file": name})
+        verify = _verifier(root, args.latency)
+        cache = ClaimVerificationCache([root])
+        print(f"{args.claims} claims, {args.mb} MB outputs")
+        timed("serial", lambda: [verify(claim) for claim in claims])
+        timed("cold", lambda: cache.states(claims, verify))
+        timed("warm", lambda: cache.states(claims, verify))
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_csv_longtable.py
+
+"""Benchmark streaming a long CSV into a longtable against the pandas path.
+
+The pandas path reads the whole CSV into one DataFrame and renders every row
+into one string (``render_table`` with ``max_rows`` at least the row count).
+The streaming path is ``write_longtable``. For each, the script reports the
+wall time of an untraced run and the peak Python-tracked memory of a second
+run (``tracemalloc``, which includes numpy buffers). The streaming peak should
+stay flat as ``--rows`` grows.
+"""
+
+import random
+import tempfile
+from pathlib import Path
+
+from _bench import parser, timed
+
+from scitex_writer._utils._csv_table import (
+    read_csv_table,
+    render_table,
+    write_longtable,
+)
+
+
+def _write_csv(path: Path, rows: int) -> None:
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("subject,session,condition,rt_ms,accuracy,p_value,note\n")
+        for i in range(rows):
+            f.write(
+                f"S{i // 40:04d},{i % 40},{rng.choice(['A', 'B', 'C_1'])},"
+                f"{rng.uniform(200, 900):.1f},{rng.random():.3f},"
+                f"{rng.random() * 0.02:.5f},{rng.choice(['ok', 'r&d', '5%'])}\n"
+            )
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--rows", type=int, default=50_000)
+    args = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "S01_trials.csv"
+        _write_csv(csv_path, args.rows)
+        print(f"{args.rows} rows, {csv_path.stat().st_size / 1e6:.1f} MB CSV")
+
+        def pandas_path():
+            frame = read_csv_table(csv_path)
+            latex = render_table(frame, csv_path.stem, max_rows=len(frame))
+            (Path(tmp) / "pandas.tex").write_text(latex + "\n", encoding="utf-8")
+
+        def streaming_path():
+            write_longtable(csv_path, Path(tmp) / "stream.tex")
+
+        timed("pandas", pandas_path, trace_memory=True)
+        timed("streaming", streaming_path, trace_memory=True)
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
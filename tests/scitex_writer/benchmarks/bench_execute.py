@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_execute.py
+
+"""Benchmark the streaming compile executor on a latexmk-sized log.
+
+Reports wall time and parent CPU time of ``_execute_with_callbacks`` for a
+child printing ``--lines`` lines, and the cost of framing one large chunk with
+the old split-per-line loop versus ``_LineFramer``.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from _bench import parser, timed
+
+from scitex_writer._compile._execute import _execute_with_callbacks, _LineFramer
+
+
+def _split_per_line(chunk: bytes) -> int:
+    """The framing loop the executor used to run on every chunk."""
+    buffer, count = chunk, 0
+    while b"\n" in buffer:
+        _line, buffer = buffer.split(b"\n", 1)
+        count += 1
+    return count
+
+
+def bench_executor(n_lines: int) -> None:
+    script = (
+        "import sys\n"
+        f"for i in range({n_lines}):\n"
+        "    sys.stdout.write(f'(./00_shared/section_{i}.tex) Overfull hbox\\n')\n"
+    )
+    seen = [0]
+
+    def callback(_line):
+        seen[0] += 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timed(
+            "executor",
+            lambda: _execute_with_callbacks(
+                [sys.executable, "-c", script],
+                cwd=Path(tmp),
+                timeout=300,
+                log_callback=callback,
+            ),
+            lambda t: f"{seen[0]} lines, {t.cpu:.3f}s parent CPU",
+        )
+
+
+def bench_framing(n_lines: int) -> None:
+    chunk = b"".join(b"line %d of a verbose latexmk log\n" % i for i in range(n_lines))
+    print(f"framing {len(chunk) / 1e6:.1f} MB")
+    old = timed("split-per-line", lambda: _split_per_line(chunk))
+    timed(
+        "_LineFramer",
+        lambda: _LineFramer().feed(chunk),
+        lambda t: f"({old.wall / max(t.wall, 1e-9):.0f}x)",
+    )
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--lines", type=int, default=50_000)
+    args = cli.parse_args()
+    bench_executor(args.lines)
+    bench_framing(args.lines)
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
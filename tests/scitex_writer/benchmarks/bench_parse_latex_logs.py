@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_parse_latex_logs.py
+
+"""Benchmark the LaTeX log parser on a synthetic multi-MB log.
+
+The log interleaves file opens/closes, wrapped warnings, badboxes with
+parenthesised box contents and ``l.<n>`` errors -- every path of the parser.
+The target is well under a second for a few MB.
+"""
+
+import tempfile
+from pathlib import Path
+
+from _bench import parser, timed
+
+from scitex_writer._utils._parse_latex_logs import parse_compilation_output
+
+_BLOCK = """(./contents/section_{i}.tex
+LaTeX Warning: Reference `fig:{i}' on page {i} undefined on input line {i}.
+
+Package natbib Warning: Citation `key{i}' on page {i} undefined on input line {i}
+.
+
+Overfull \\hbox ({i}.3pt too wide) in paragraph at lines {i}--{j}
+[]\\OT1/cmr/m/n/10 Some (unbalanced text in box {i}
+ []
+
+<./figures/fig_{i}.png, id={i}, 433.62pt x 289.08pt>
+File: ./figures/fig_{i}.png Graphic file (type png)
+<use ./figures/fig_{i}.png> [{i}]
+./contents/section_{i}.tex:{j}: Undefined control sequence.
+l.{j} \\badmacro{i}
+
+)
+"""
+
+
+def build_log(path: Path, megabytes: float) -> int:
+    target = int(megabytes * 1024 * 1024)
+    size, i = 0, 0
+    with open(path, "w") as f:
+        f.write("This is pdfTeX, Version 3.141592653-2.6-1.40.25\n(./manuscript.tex\n")
+        while size < target:
+            block = _BLOCK.format(i=i, j=i + 2)
+            f.write(block)
+            size += len(block)
+            i += 1
+        f.write(")\n")
+    return i
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--mb", type=float, default=5.0)
+    args = cli.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "manuscript.log"
+        blocks = build_log(log, args.mb)
+        timed(
+            f"parse {args.mb:.1f} MB",
+            lambda: parse_compilation_output("", log, include_badboxes=True),
+            lambda t: (
+                f"{blocks} sections, {len(t.result[0])} errors, "
+                f"{len(t.result[1])} warnings"
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File: tests/scitex_writer/benchmarks/bench_scholar_lookup.py
+
+"""Benchmark resolving citation DOIs against a scholar library without index.db.
+
+Writes a synthetic ``MASTER/*/metadata.json`` library of ``--papers`` records
+and times ``--refs`` ``metadata_for_doi`` calls (what ``handle_bib_entries``
+does for one manuscript) three times: against a cold library (the sidecar
+identifier index is built), from a fresh process state over the persisted
+sidecar, and again in the same process. Also reports how many metadata.json
+files each pass parsed into the index.
+"""
+
+import json
+import random
+import tempfile
+from pathlib import Path
+
+from _bench import parser, timed
+
+from scitex_writer._ports import scholar
+
+
+def _write_library(root: Path, papers: int) -> None:
+    for i in range(papers):
+        entry = root / "MASTER" / f"{i:08X}"
+        entry.mkdir(parents=True)
+        md = {
+            "metadata": {
+                "id": {"doi": f"10.1000/Synthetic.{i}", "pmid": str(30000000 + i)},
+                "basic": {"title": f"Item {i}", "year": 1990 + i % 35},
+                "publication": {"journal": "Journal of Synthetic Results"},
+            }
+        }
+        (entry / "metadata.json").write_text(json.dumps(md))
+
+
+def _pass(label: str, root: Path, dois: list) -> None:
+    timed(
+        label,
+        lambda: sum(scholar.metadata_for_doi(root, doi) is not None for doi in dois),
+        lambda t: (
+            f"{t.result} found  "
+            f"{scholar._identifier_index(root).reads} metadata.json parsed"
+        ),
+    )
+
+
+def main() -> None:
+    cli = parser(__doc__)
+    cli.add_argument("--papers", type=int, default=5_000)
+    cli.add_argument("--refs", type=int, default=300)
+    args = cli.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_library(root, args.papers)
+        dois = [
+            f"10.1000/synthetic.{rng.randrange(args.papers * 2)}"
+            for _ in range(args.refs)
+        ]
+        print(f"{args.papers} papers, {args.refs} lookups")
+        _pass("cold", root, dois)
+        scholar._IDENTIFIER_INDEXES.clear()
+        _pass("sidecar reused", root, dois)
+        _pass("warm", root, dois)
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
@@ -9,3 +9,63 @@ def test_module_exposes_merge():
     module = importlib.import_module("scitex_writer.bib")
     # Assert
     assert hasattr(module, "merge")
+
+
+def _project(tmp_path):
+    bib_dir = tmp_path / "00_shared" / "bib_files"
+    bib_dir.mkdir(parents=True)
+    (bib_dir / "bibliography.bib").write_text(
+        "@string{nat = {Nature}}\n\n"
+        "@article{Smith2020,\n  journal = nat,\n  note = {smith@example.org}\n}\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_list_files_counts_entries_not_at_signs(tmp_path):
+    # Arrange
+    from scitex_writer import bib
+
+    project = _project(tmp_path)
+    # Act
+    result = bib.list_files(str(project))
+    # Assert
+    assert result["bibfiles"][0]["entry_count"] == 1
+
+
+def test_add_then_get_returns_the_entry(tmp_path):
+    # Arrange
+    from scitex_writer import bib
+
+    project = _project(tmp_path)
+    bib.add(str(project), "@misc{Doe2021,\n  title = {Draft}\n}")
+    # Act
+    result = bib.get(str(project), "Doe2021")
+    # Assert
+    assert result["entry"] == "@misc{Doe2021,\n  title = {Draft}\n}"
+
+
+def test_add_rejects_a_duplicate_key(tmp_path):
+    # Arrange
+    from scitex_writer import bib
+
+    project = _project(tmp_path)
+    # Act
+    result = bib.add(str(project), "@misc{Smith2020, title = {Again}}")
+    # Assert
+    assert not result["success"]
+    assert result["existing_file"].endswith("bibliography.bib")
+
+
+def test_add_many_and_remove_many_round_trip(tmp_path):
+    # Arrange
+    from scitex_writer import bib
+
+    project = _project(tmp_path)
+    entries = [f"@misc{{Ref{i}, title = {{T{i}}}}}" for i in range(50)]
+    bib.add_many(str(project), entries)
+    # Act
+    result = bib.remove_many(str(project), [f"Ref{i}" for i in range(50)] + ["None"])
+    # Assert
+    remaining = bib.list_entries(str(project))["count"]
+    assert (result["count"], result["not_found"], remaining) == (50, ["None"], 1)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: scripts/python/_bibtex.py
+#
+# The hand-written BibTeX tokenizer + writer behind merge_bibliographies.py.
+# Real .bib sources only -- no mocks.
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT_DIR / "scripts" / "python"))
+
+from _bibtex import (  # noqa: E402
+    BibtexSyntaxError,
+    format_entry,
+    iter_blocks,
+    parse_entries,
+    write_entries,
+)
+
+SAMPLE = b"""% Shared bibliography
+@string{nat = {Nature}}
+@STRING(neuro = nat # " Neuroscience")
+
+@comment{generated by hand}
+
+@Article{Smith2020,
+  Title = {The {DNA} of "quoted" things},
+  author = "Smith, John and {M{\\"u}ller}, Anna",
+  journal = neuro,
+  month = jan,
+  year = 2020,
+  note = {First line
+          second line},
+}
+
+@misc(Doe2021, title = {Draft}, title = {Ignored}, howpublished = {})
+"""
+
+
+def _entry(key):
+    return next(e for e in parse_entries(SAMPLE) if e["ID"] == key)
+
+
+class TestParse:
+    """Entries as bibtexparser v1 read them."""
+
+    def test_entries_are_read_in_order(self):
+        # Arrange
+        # Act
+        keys = [e["ID"] for e in parse_entries(SAMPLE)]
+        # Assert
+        assert keys == ["Smith2020", "Doe2021"]
+
+    def test_type_and_field_names_are_lower_cased(self):
+        # Arrange
+        # Act
+        entry = _entry("Smith2020")
+        # Assert
+        assert (entry["ENTRYTYPE"], "title" in entry) == ("article", True)
+
+    def test_outer_delimiters_go_and_the_inside_is_kept(self):
+        # Arrange
+        # Act
+        entry = _entry("Smith2020")
+        # Assert
+        assert (entry["title"], entry["author"]) == (
+            'The {DNA} of "quoted" things',
+            'Smith, John and {M{\\"u}ller}, Anna',
+        )
+
+    def test_string_macros_and_concatenation_are_expanded(self):
+        # Arrange
+        # Act
+        entry = _entry("Smith2020")
+        # Assert
+        assert (entry["journal"], entry["month"]) == ("Nature Neuroscience", "January")
+
+    def test_bare_numbers_are_kept(self):
+        # Arrange
+        # Act
+        entry = _entry("Smith2020")
+        # Assert
+        assert entry["year"] == "2020"
+
+    def test_continuation_lines_are_left_stripped(self):
+        # Arrange
+        # Act
+        entry = _entry("Smith2020")
+        # Assert
+        assert entry["note"] == "First line\nsecond line"
+
+    def test_a_repeated_field_keeps_its_first_value(self):
+        # Arrange
+        # Act
+        entry = _entry("Doe2021")
+        # Assert
+        assert (entry["title"], entry["howpublished"]) == ("Draft", "")
+
+    def test_malformed_entry_is_skipped_up_to_the_next_item(self):
+        # Arrange
+        data = b"@misc{broken, title = {open\n@misc{ok, title = {Fine}}\n"
+        # Act
+        keys = [e["ID"] for e in parse_entries(data)]
+        # Assert
+        assert keys == ["ok"]
+
+    def test_undefined_macro_fails_loud(self):
+        # Arrange
+        data = b"@misc{a, journal = nosuchmacro}"
+        # Act
+        # Assert
+        with pytest.raises(BibtexSyntaxError, match="nosuchmacro"):
+            parse_entries(data)
+
+    def test_byte_order_mark_is_ignored(self):
+        # Arrange
+        data = b"\xef\xbb\xbf@misc{a, title = {x}}"
+        # Act
+        entries = parse_entries(data)
+        # Assert
+        assert entries[0]["ID"] == "a"
+
+
+class TestBlocks:
+    """Top-level items and their byte ranges."""
+
+    def test_kinds_in_source_order(self):
+        # Arrange
+        # Act
+        kinds = [b.kind for b in iter_blocks(SAMPLE)]
+        # Assert
+        assert kinds == ["comment", "string", "string", "comment", "entry", "entry"]
+
+    def test_byte_range_covers_exactly_the_entry(self):
+        # Arrange
+        block = [b for b in iter_blocks(SAMPLE) if b.kind == "entry"][1]
+        # Act
+        source = SAMPLE[block.start : block.end]
+        # Assert
+        assert source.startswith(b"@misc(Doe2021") and source.endswith(b"{})")
+
+
+class TestWrite:
+    """The BibTexWriter layout."""
+
+    def test_format_entry_sorts_fields(self):
+        # Arrange
+        entry = {"ENTRYTYPE": "article", "ID": "k", "year": "2020", "author": "A"}
+        # Act
+        text = format_entry(entry)
+        # Assert
+        assert text == "@article{k,\n  author = {A},\n  year = {2020}\n}\n"
+
+    def test_entries_keep_the_given_order(self):
+        # Arrange
+        entries = [{"ENTRYTYPE": "misc", "ID": k} for k in ("b", "A", "c")]
+        # Act
+        text = write_entries(entries)
+        # Assert
+        assert text == "@misc{b\n}\n\n@misc{A\n}\n\n@misc{c\n}\n"
+
+    def test_written_entries_read_back_unchanged(self):
+        # Arrange: the merge caches its output as the entries it wrote
+        entries = parse_entries(SAMPLE)
+        # Act
+        reread = parse_entries(write_entries(entries).encode("utf-8"))
+        # Assert
+        assert reread == entries
+
+
+class TestBibtexparserParity:
+    """Same entries and same output bytes as the bibtexparser v1 path."""
+
+    def test_entries_and_output_match(self):
+        # Arrange
+        bibtexparser = pytest.importorskip("bibtexparser")
+        from bibtexparser.bibdatabase import BibDatabase
+        from bibtexparser.bwriter import BibTexWriter
+
+        parser = bibtexparser.bparser.BibTexParser(
+            common_strings=True, ignore_nonstandard_types=False
+        )
+        expected = bibtexparser.load(io.StringIO(SAMPLE.decode()), parser=parser)
+        output_db = BibDatabase()  # the merge writes the entries alone
+        output_db.entries = expected.entries
+        writer = BibTexWriter()
+        writer.indent = "  "
+        writer.order_entries_by = "ID"
+        # Act
+        entries = parse_entries(SAMPLE)
+        # Assert
+        assert (entries, write_entries(entries)) == (
+            expected.entries,
+            writer.write(output_db),
+        )
+
+
+if __name__ == "__main__":
+    import os
+
+    pytest.main([os.path.abspath(__file__), "-v"])
+
+# EOF
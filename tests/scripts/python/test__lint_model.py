@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: _lint_model.py (shared, load-once model for the checks)
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "scripts" / "python"))
+
+import _lint_model  # noqa: E402
+from _lint_model import (  # noqa: E402
+    ProjectModel,
+    clear_cache,
+    read_text,
+    scan_tex,
+)
+
+# ============================================================================
+# helpers / fixtures
+# ============================================================================
+
+
+def _write(root, rel, content):
+    p = root / rel
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(content, encoding="utf-8")
+    return p
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@pytest.fixture
+def project(tmp_path):
+    _write(
+        tmp_path,
+        "01_manuscript/contents/introduction.tex",
+        "\\section{Introduction}\n"
+        "As in Fig.~\\ref{fig:01_demo} \\citep{Smith2020, Doe2021}.\n"
+        "% \\ref{fig:commented}\n",
+    )
+    _write(
+        tmp_path,
+        "01_manuscript/contents/figures/caption_and_media/01_demo.tex",
+        "\\caption{Demo}\n",
+    )
+    _write(
+        tmp_path,
+        "00_shared/bib_files/bibliography.bib",
+        "@article{Smith2020, title={A}}\n@book{Doe2021, title={B}}\n",
+    )
+    return tmp_path
+
+
+# ============================================================================
+# read_text / scan_tex
+# ============================================================================
+
+
+def test_read_text_reads_each_version_once(tmp_path):
+    """Test that a second lookup of an unchanged file is served from cache."""
+    # Arrange
+    tex = _write(tmp_path, "a.tex", "x")
+    first = read_text(tex)
+    # Act
+    second = read_text(tex)
+    # Assert
+    assert second is first
+
+
+def test_read_text_rereads_an_edited_file(tmp_path):
+    """Test that an edit (new size / mtime) invalidates the cached text."""
+    # Arrange
+    tex = _write(tmp_path, "a.tex", "old")
+    read_text(tex)
+    tex.write_text("newer", encoding="utf-8")
+    # Act
+    text = read_text(tex)
+    # Assert
+    assert text == "newer"
+
+
+def test_read_text_missing_file_raises_oserror(tmp_path):
+    """Test that unreadable files raise like Path.read_text."""
+    # Arrange
+    missing = tmp_path / "nope.tex"
+    # Act / Assert
+    with pytest.raises(OSError):
+        read_text(missing)
+
+
+def test_scan_tex_tokenizes_every_kind_in_one_pass(project):
+    """Test that one scan yields refs, cites and headings with line numbers."""
+    # Arrange
+    tex = project / "01_manuscript/contents/introduction.tex"
+    # Act
+    scan = scan_tex(tex)
+    # Assert
+    assert (scan.refs, scan.cites, scan.headings) == (
+        [("fig:01_demo", 2)],
+        [("Smith2020", 2), ("Doe2021", 2)],
+        [("Introduction", 1)],
+    )
+
+
+def test_scan_tex_collects_vclaims(tmp_path):
+    """Test that \\vclaim ids (with an optional [...] argument) are tokens."""
+    # Arrange
+    tex = _write(tmp_path, "a.tex", "n=\\vclaim[fmt]{ n_subjects }\n")
+    # Act
+    scan = scan_tex(tex)
+    # Assert
+    assert scan.vclaims == [("n_subjects", 1)]
+
+
+def test_scan_tex_is_cached_until_the_file_changes(tmp_path):
+    """Test that the scan is reused for the same content version."""
+    # Arrange
+    tex = _write(tmp_path, "a.tex", "\\label{a}\n")
+    first = scan_tex(tex)
+    # Act
+    second = scan_tex(tex)
+    # Assert
+    assert second is first
+
+
+# ============================================================================
+# ProjectModel
+# ============================================================================
+
+
+def test_model_indexes_labels_refs_cites_and_floats(project):
+    """Test the per-document views a check asks for."""
+    # Arrange
+    model = ProjectModel(project)
+    # Act
+    views = (
+        set(model.refs("manuscript")),
+        set(model.cites("manuscript")),
+        set(model.floats("manuscript")),
+        set(model.bib_entries()),
+    )
+    # Assert
+    assert views == (
+        {"fig:01_demo"},
+        {"Smith2020", "Doe2021"},
+        {"fig:01_demo"},
+        {"Smith2020", "Doe2021"},
+    )
+
+
+def test_model_load_reports_counts(project):
+    """Test that load() tokenizes everything and returns what it found."""
+    # Arrange
+    model = ProjectModel(project)
+    # Act
+    counts = model.load()
+    # Assert
+    assert (counts["tex_files"], counts["cites"], counts["captions"]) == (2, 2, 1)
+
+
+def test_load_leaves_every_source_scanned_for_the_checks(project):
+    """Test that after load() the checks' token lookups are all cache hits."""
+    # Arrange
+    model = ProjectModel(project)
+    files = model.tex_files("manuscript")
+    # Act
+    model.load()
+    # Assert
+    assert set(_lint_model._scans) == {os.fspath(f) for f in files}
+
+
+def test_load_seeds_scans_from_the_persistent_index(project):
+    """Test that a second model load serves the scans from the SQLite index."""
+    # Arrange
+    pytest.importorskip("scitex_writer._utils._project_index")
+    ProjectModel(project).load()
+    clear_cache()
+    tex = project / "01_manuscript/contents/introduction.tex"
+    # Act
+    counts = ProjectModel(project).load()
+    # Assert
+    assert (counts["from_index"], scan_tex(tex).cites) == (
+        2,
+        [("Smith2020", 2), ("Doe2021", 2)],
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__), "-v"])
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Test file for: lint_engine.py (one-process runner for the pre-compile checks)
+#
+# Plugins are real check_<name>.py files written into a tmp script dir (the
+# engine's ``script_dir=`` seam), so no mocks are needed.
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "scripts" / "python"))
+
+from lint_engine import CHECKS, format_timings, run_checks  # noqa: E402
+
+_SCRIPT = ROOT_DIR / "scripts" / "python" / "lint_engine.py"
+_RUNNER = ROOT_DIR / "scripts" / "shell" / "modules" / "run_provenance_checks.sh"
+
+
+# ============================================================================
+# helpers / fixtures
+# ============================================================================
+
+
+def _plugin(script_dir, name, body):
+    """Write check_<name>.py whose main(argv) runs ``body``."""
+    lines = ["import time", "COUNT = 0", "def main(argv=None):", "    global COUNT"]
+    lines += [f"    {line}" for line in body.splitlines()]
+    (script_dir / f"check_{name}.py").write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def script_dir(tmp_path):
+    d = tmp_path / "scripts"
+    d.mkdir()
+    return d
+
+
+@pytest.fixture
+def project(tmp_path):
+    p = tmp_path / "project"
+    (p / "01_manuscript" / "contents").mkdir(parents=True)
+    return p
+
+
+# ============================================================================
+# run_checks
+# ============================================================================
+
+
+def test_runs_present_plugins_in_checks_order(script_dir, project):
+    """Test that missing plugins are skipped and order follows CHECKS."""
+    # Arrange
+    _plugin(script_dir, "citations", "return 0")
+    _plugin(script_dir, "paper_symlink", "return 0")
+    # Act
+    report = run_checks(project, script_dir=script_dir)
+    # Assert
+    assert [c["name"] for c in report["checks"]] == ["paper_symlink", "citations"]
+
+
+def test_exit_code_is_the_worst_plugin_exit_code(script_dir, project):
+    """Test that one error-level check fails the whole gate."""
+    # Arrange
+    _plugin(script_dir, "figure_media", "return 0")
+    _plugin(script_dir, "ref_integrity", "return 1")
+    # Act
+    report = run_checks(project, script_dir=script_dir)
+    # Assert
+    assert report["exit_code"] == 1
+
+
+def test_plugin_crash_counts_as_failure_not_abort(script_dir, project, capsys):
+    """Test that an exception is reported and the remaining checks still run."""
+    # Arrange
+    _plugin(script_dir, "figure_media", "raise RuntimeError('boom')")
+    _plugin(script_dir, "citations", "print('citations ran')\nreturn 0")
+    # Act
+    report = run_checks(project, script_dir=script_dir)
+    # Assert
+    out = capsys.readouterr()
+    assert (report["exit_code"], "citations ran" in out.out, "boom" in out.err) == (
+        1,
+        True,
+        True,
+    )
+
+
+def test_sys_exit_inside_plugin_is_its_exit_code(script_dir, project):
+    """Test that a plugin calling sys.exit(2) reports 2 and does not exit us."""
+    # Arrange
+    _plugin(script_dir, "citations", "import sys\nsys.exit(2)")
+    # Act
+    report = run_checks(project, script_dir=script_dir)
+    # Assert
+    assert report["checks"][0]["exit_code"] == 2
+
+
+def test_plugins_are_loaded_fresh_each_run(script_dir, project):
+    """Test that module-level counters start at zero on every run."""
+    # Arrange
+    _plugin(script_dir, "citations", "COUNT += 1\nreturn COUNT")
+    run_checks(project, script_dir=script_dir)
+    # Act
+    report = run_checks(project, script_dir=script_dir)
+    # Assert
+    assert report["checks"][0]["exit_code"] == 1
+
+
+def test_parallel_output_keeps_checks_order(script_dir, project, capsys):
+    """Test that buffered parallel output prints in CHECKS order."""
+    # Arrange
+    _plugin(script_dir, "media_provenance", "time.sleep(0.2)\nprint('first')")
+    _plugin(script_dir, "figure_media", "print('second')")
+    # Act
+    run_checks(project, jobs=4, script_dir=script_dir)
+    # Assert
+    assert capsys.readouterr().out.split() == ["first", "second"]
+
+
+def test_parallel_plugins_overlap(script_dir, project):
+    """Test that --jobs actually runs independent checks concurrently."""
+    # Arrange
+    for name in CHECKS[1:5]:
+        _plugin(script_dir, name, "time.sleep(0.2)\nreturn 0")
+    # Act
+    report = run_checks(project, jobs=4, script_dir=script_dir)
+    # Assert
+    assert report["elapsed"] < 0.6
+
+
+def test_every_check_is_timed(script_dir, project):
+    """Test the per-check timings in the report and the printed table."""
+    # Arrange
+    _plugin(script_dir, "citations", "time.sleep(0.05)\nreturn 0")
+    # Act
+    report = run_checks(project, script_dir=script_dir)
+    # Assert
+    assert report["checks"][0]["elapsed"] >= 0.05 and "citations" in format_timings(
+        report
+    )
+
+
+# ============================================================================
+# CLI / shell entry point (real checks)
+# ============================================================================
+
+
+def test_cli_writes_timings_json(project, tmp_path):
+    """Test that --timings writes one entry per real check."""
+    # Arrange
+    timings = tmp_path / "logs" / "lint_timings.json"
+    # Act
+    subprocess.run(
+        [sys.executable, str(_SCRIPT), str(project), "--timings", str(timings)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    # Assert
+    names = [c["name"] for c in json.loads(timings.read_text())["checks"]]
+    assert names == list(CHECKS)
+
+
+def test_shell_runner_delegates_to_engine_once():
+    """Test that run_provenance_checks.sh launches the engine, not 11 pythons."""
+    # Arrange
+    text = _RUNNER.read_text()
+    # Act
+    launches_engine = 'ENGINE="$THIS_DIR/../../python/lint_engine.py"' in text
+    # Assert
+    assert launches_engine
+
+
+if __name__ == "__main__":
+    pytest.main([os.path.abspath(__file__), "-v"])
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # Test file for: merge_bibliographies.py
 
+import json
 import os
 import sys
 from pathlib import Path
@@ -17,15 +18,16 @@ import pytest
 ROOT_DIR = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(ROOT_DIR / "scripts" / "python"))
 
-pytest.importorskip("bibtexparser")
-
-# Imported at module scope, NOT inside a try/except: bibtexparser is already
-# handled by importorskip above, so any OTHER import failure here is a real
-# breakage of the module under test and must FAIL loudly, never skip.
+# Imported at module scope, NOT inside a try/except: the merge is stdlib-only
+# (its parser is _bibtex.py), so any import failure here is a real breakage of
+# the module under test and must FAIL loudly, never skip.
 from merge_bibliographies import (  # noqa: E402
+    ENTRY_CACHE_NAME,
+    DedupIndex,
     deduplicate_entries,
     get_doi,
     is_stub,
+    load_source,
     merge_bibtex_files,
     merge_entries,
     normalize_title,
@@ -50,8 +52,6 @@ REAL_ENTRY = {
     "doi": "10.1234/jrs.2023.101",
 }
 
-# (bibtexparser availability is handled by the importorskip above.)
-
 
 class TestNormalizeTitle:
     """Test title normalization."""
@@ -779,5 +779,140 @@ class TestMergeIncludesOutputFile:
         assert (bib_dir / "bibliography.bib").read_text().count("@article{Dup2023") == 1
 
 
+class TestDedupIndex:
+    """deduplicate_entries, incrementally: sources added one at a time."""
+
+    LIBRARY = [
+        dict(REAL_ENTRY),
+        {"ID": "Other2020", "ENTRYTYPE": "misc", "title": "Other", "year": "2020"},
+    ]
+    RELATED = [
+        {"ID": "Related2020", "ENTRYTYPE": "misc", "title": "OTHER", "year": "2020"},
+        {"ID": "New2021", "ENTRYTYPE": "misc", "doi": "10.1/new"},
+    ]
+    STUBS = [
+        dict(STUB_ENTRY, note="Auto-generated stub, see the long note"),
+        {"ID": "Pending2024", "ENTRYTYPE": "misc", "doi": "https://doi.org/10.1/new"},
+    ]
+
+    def _index(self, *sources):
+        index = DedupIndex()
+        for entries in sources:
+            index.add(entries)
+        return index
+
+    def test_sources_added_one_by_one_match_one_pass(self):
+        # Arrange
+        index = self._index(self.LIBRARY, self.RELATED, self.STUBS)
+        # Act
+        expected = deduplicate_entries(self.LIBRARY + self.RELATED + self.STUBS)
+        # Assert
+        assert (index.entries(), index.stats()) == expected
+
+
+class TestIncrementalMerge:
+    """Only the .bib files that changed are parsed again; the output is the same."""
+
+    def _bib_dir(self, tmp_path):
+        bib_dir = tmp_path / "bib_files"
+        bib_dir.mkdir()
+        (bib_dir / "bibliography.bib").write_text(
+            "@article{Real2023,\n  title = {Dup},\n  author = {Real},\n"
+            "  journal = {Nature},\n  year = {2023},\n}\n"
+        )
+        (bib_dir / "related_work.bib").write_text(
+            "@article{Related2020,\n  title = {Related},\n  year = {2020},\n}\n"
+        )
+        (bib_dir / "_stubs_pending_scholar.bib").write_text(
+            "@article{Real2023,\n  title = {Dup},\n"
+            "  journal = {Pending scitex-scholar metadata lookup},\n"
+            "  note = {Auto-generated stub},\n  year = {2023},\n}\n"
+        )
+        return bib_dir
+
+    def _change_stubs(self, bib_dir):
+        (bib_dir / "_stubs_pending_scholar.bib").write_text(
+            "@article{Pending2024,\n  title = {Not yet resolved},\n"
+            "  journal = {Pending scitex-scholar metadata lookup},\n"
+            "  note = {Auto-generated stub},\n  year = {2024},\n}\n"
+        )
+
+    def test_only_the_changed_sidecar_is_parsed_again(self, tmp_path, capsys):
+        # Arrange
+        bib_dir = self._bib_dir(tmp_path)
+        merge_bibtex_files(bib_dir, verbose=False, include_output=True)
+        self._change_stubs(bib_dir)
+        # Act
+        merge_bibtex_files(bib_dir, include_output=True)
+        # Assert
+        loaded = [
+            line.strip()
+            for line in capsys.readouterr().out.splitlines()
+            if line.strip().startswith(("Loaded:", "Cached:"))
+        ]
+        assert loaded == [
+            "Cached: 2 entries from bibliography.bib",
+            "Cached: 1 entries from related_work.bib",
+            "Loaded: 1 entries from _stubs_pending_scholar.bib",
+        ]
+
+    def test_incremental_output_matches_a_full_rebuild(self, tmp_path):
+        # Arrange
+        bib_dir = self._bib_dir(tmp_path)
+        merge_bibtex_files(bib_dir, verbose=False, include_output=True)
+        self._change_stubs(bib_dir)
+        merge_bibtex_files(bib_dir, verbose=False, include_output=True)
+        incremental = (bib_dir / "bibliography.bib").read_text()
+        # Act
+        merge_bibtex_files(bib_dir, verbose=False, force=True, include_output=True)
+        # Assert
+        assert (bib_dir / "bibliography.bib").read_text() == incremental
+
+    def test_removed_input_leaves_the_derived_output(self, tmp_path):
+        # Arrange: without --include-output the output is regenerated
+        bib_dir = self._bib_dir(tmp_path)
+        merge_bibtex_files(bib_dir, "merged.bib", verbose=False)
+        (bib_dir / "related_work.bib").unlink()
+        # Act
+        merge_bibtex_files(bib_dir, "merged.bib", verbose=False)
+        # Assert
+        assert "Related2020" not in (bib_dir / "merged.bib").read_text()
+
+    def test_the_output_is_cached_as_the_entries_written(self, tmp_path):
+        # Arrange
+        bib_dir = self._bib_dir(tmp_path)
+        merge_bibtex_files(bib_dir, verbose=False, include_output=True)
+        record = json.loads((bib_dir / ENTRY_CACHE_NAME).read_text())["files"][
+            "bibliography.bib"
+        ]
+        # Act
+        reread, _parsed = load_source(bib_dir / "bibliography.bib", None)
+        # Assert
+        assert (reread["entries"], reread["keys"]) == (
+            record["entries"],
+            record["keys"],
+        )
+
+    def test_unchanged_file_is_not_parsed(self, tmp_path):
+        # Arrange
+        bib_file = self._bib_dir(tmp_path) / "related_work.bib"
+        record, _parsed = load_source(bib_file, None)
+        bib_file.touch()  # new mtime, same content: hashed, not parsed
+        # Act
+        again, parsed = load_source(bib_file, record)
+        # Assert
+        assert (parsed, again["entries"]) == (False, record["entries"])
+
+    def test_changed_file_is_parsed(self, tmp_path):
+        # Arrange
+        bib_dir = self._bib_dir(tmp_path)
+        record, _parsed = load_source(bib_dir / "_stubs_pending_scholar.bib", None)
+        self._change_stubs(bib_dir)
+        # Act
+        again, parsed = load_source(bib_dir / "_stubs_pending_scholar.bib", record)
+        # Assert
+        assert (parsed, again["entries"][0]["ID"]) == (True, "Pending2024")
+
+
 if __name__ == "__main__":
     pytest.main([os.path.abspath(__file__), "-v"])